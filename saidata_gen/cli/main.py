@@ -11,7 +11,9 @@ import yaml
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
+from rich.live import Live
 from rich.panel import Panel
+from rich.spinner import Spinner
 from rich.syntax import Syntax
 
 from ..core.engine import SaidataEngine
@@ -85,6 +87,11 @@ def display_search_results(matches: List, query: str):
         console.print(f"[yellow]No packages found for:[/yellow] {query}")
         return
     
+    console.print(build_search_results_table(matches, query))
+
+
+def build_search_results_table(matches: List, query: str) -> Table:
+    """Build the table of search results."""
     table = Table(title=f"Search Results for '{query}'")
     table.add_column("Name", style="cyan", no_wrap=True)
     table.add_column("Provider", style="magenta")
@@ -101,7 +108,7 @@ def display_search_results(matches: List, query: str):
             f"{match.score:.2f}"
         )
     
-    console.print(table)
+    return table
 
 
 def display_batch_results(results, show_details: bool = False):
@@ -529,24 +536,16 @@ def search(ctx, query, providers, limit, min_score):
       saidata-gen search python --limit 10 --min-score 0.5
     """
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Searching for '{query}'...", total=None)
-            
-            engine = SaidataEngine(config_path=ctx.obj['config'])
-            matches = engine.search_software(query)
-            progress.update(task, completed=True)
-        
-        # Filter results
-        if providers:
-            provider_list = providers.split(',')
-            matches = [m for m in matches if m.provider in provider_list]
+        engine = SaidataEngine(config_path=ctx.obj['config'])
+        provider_list = providers.split(',') if providers else None
         
-        matches = [m for m in matches if m.score >= min_score]
-        matches = matches[:limit]
+        # Render the results found so far while slower providers are still searched
+        matches = []
+        with Live(Spinner("dots", text=f"Searching for '{query}'..."), console=console, transient=True) as live:
+            for update in engine.iter_search_software(query, max_results=limit, providers=provider_list):
+                matches = [m for m in update if m.score >= min_score][:limit]
+                if matches:
+                    live.update(build_search_results_table(matches, query))
         
         display_search_results(matches, query)
         
@@ -757,7 +756,17 @@ def batch(ctx, input, output, providers, ai, ai_provider, no_validate, format, m
             }
             print(json.dumps(progress_data))
             
-            results = engine.batch_process(software_list, options)
+            def report_progress(item):
+                progress_data["processed"] += 1
+                progress_data["successful" if item.success else "failed"] += 1
+                print(json.dumps({
+                    **progress_data,
+                    "status": "progress",
+                    "software": item.software_name,
+                    "result": "success" if item.success else item.error
+                }))
+            
+            results = engine.batch_process(software_list, options, progress_callback=report_progress)
             
             # Final JSON output
             successful = sum(1 for r in results.results.values() if not isinstance(r, Exception))
@@ -793,7 +802,11 @@ def batch(ctx, input, output, providers, ai, ai_provider, no_validate, format, m
             ) as progress:
                 task = progress.add_task("Processing packages...", total=len(software_list))
                 
-                results = engine.batch_process(software_list, options)
+                results = engine.batch_process(
+                    software_list,
+                    options,
+                    progress_callback=lambda item: progress.advance(task)
+                )
                 progress.update(task, completed=len(software_list))
         
         if progress_format != 'json':
@@ -908,8 +921,10 @@ def list_providers(ctx, show_templates, show_fetchers, format):
 @click.option('--cache-dir', type=click.Path(), help='Cache directory for repository data')
 @click.option('--force-refresh', is_flag=True, help='Force refresh of cached data')
 @click.option('--show-stats', is_flag=True, help='Show detailed statistics')
+@click.option('--equivalence-map', is_flag=True,
+              help='Build the cross-provider package equivalence map from the fetched data')
 @click.pass_context
-def fetch(ctx, providers, cache_dir, force_refresh, show_stats):
+def fetch(ctx, providers, cache_dir, force_refresh, show_stats, equivalence_map):
     """
     Fetch repository data from package managers.
     
@@ -929,6 +944,9 @@ def fetch(ctx, providers, cache_dir, force_refresh, show_stats):
       
       # Show detailed statistics
       saidata-gen fetch --show-stats
+      
+      # Precompute package names across providers for faster generation
+      saidata-gen fetch --equivalence-map
     """
     try:
         provider_list = providers.split(',') if providers else []
@@ -942,6 +960,10 @@ def fetch(ctx, providers, cache_dir, force_refresh, show_stats):
             
             engine = SaidataEngine(config_path=ctx.obj['config'])
             results = engine.fetch_repository_data(provider_list)
+            
+            if equivalence_map:
+                progress.update(task, description="Building package equivalence map...")
+                built_map = engine.build_equivalence_map(provider_list or None)
             progress.update(task, completed=True)
         
         # Display results
@@ -964,6 +986,10 @@ def fetch(ctx, providers, cache_dir, force_refresh, show_stats):
         
         console.print(table)
         
+        if equivalence_map:
+            console.print(f"Package equivalence map: {len(built_map)} packages across "
+                          f"{len(built_map.providers)} providers")
+        
         if show_stats:
             console.print(f"\n[bold]Statistics:[/bold]")
             console.print(f"Total providers: {len(results.providers)}")
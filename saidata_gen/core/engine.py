@@ -7,10 +7,14 @@ and provides the main API.
 
 import logging
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
 from saidata_gen.core.interfaces import (
+    BatchItemResult,
     BatchOptions,
     BatchResult,
     FetchResult,
@@ -21,9 +25,12 @@ from saidata_gen.core.interfaces import (
     FetcherConfig,
     PackageInfo,
 )
+from saidata_gen.core.graceful_degradation import GracefulDegradationManager
 from saidata_gen.generator.core import MetadataGenerator
 from saidata_gen.search.engine import SoftwareSearchEngine
+from saidata_gen.search.equivalence import EquivalenceMap
 from saidata_gen.validation.schema import SchemaValidator
+from saidata_gen.fetcher.base import RepositoryFetcher
 from saidata_gen.fetcher.factory import fetcher_factory
 from saidata_gen.fetcher.apt import APTFetcher
 from saidata_gen.fetcher.brew import BrewFetcher
@@ -62,6 +69,26 @@ class SaidataEngine:
         
         # Default fetcher configuration
         self.fetcher_config = FetcherConfig()
+        
+        # Precomputed package names of each software package per provider, rebuilt
+        # when the repository data it was built from changes
+        self.equivalence_map = EquivalenceMap(self.fetcher_config.cache_dir)
+        self._equivalence_lock = threading.Lock()
+        self._equivalence_rebuild: Optional[threading.Thread] = None
+        self._equivalence_rebuild_versions: Optional[Dict[str, Any]] = None
+        
+        # Provider lookups run concurrently on a long-lived executor; providers that
+        # miss their deadline or fail are tracked by the degradation manager
+        self.provider_workers = 32
+        self._provider_executor: Optional[ThreadPoolExecutor] = None
+        self._provider_executor_lock = threading.Lock()
+        
+        # Lookups that missed their deadline keep a worker until they return; a provider
+        # with this many of them is skipped so that it cannot occupy the whole executor
+        self.max_abandoned_lookups = 2
+        self._abandoned_lookups: Dict[str, Set[Future]] = {}
+        self.degradation_manager = GracefulDegradationManager()
+        self._degradation_lock = threading.Lock()
     
     def _register_fetchers(self):
         """Register all available fetchers with the factory."""
@@ -91,25 +118,144 @@ class SaidataEngine:
         providers = options.providers if options.providers else self.get_default_providers()
         
         # Collect package information from all providers
-        package_sources = []
+        package_sources = self._collect_package_sources(software_name, providers, options)
+        
+        # Generate metadata using the metadata generator
+        result = self.metadata_generator.generate_from_sources(
+            software_name=software_name,
+            sources=package_sources,
+            providers=providers
+        )
+        
+        logger.info(f"Generated metadata for {software_name} with {len(package_sources)} sources")
+        return result
+    
+    def _collect_package_sources(
+        self,
+        software_name: str,
+        providers: List[str],
+        options: Optional[GenerationOptions] = None
+    ) -> List[PackageInfo]:
+        """
+        Collect package information for a software package from all providers.
+
+        Providers are queried concurrently. Each provider first loads its repository
+        index (warms up); the lookup then has to finish within the provider's deadline
+        (``options.provider_timeouts`` or ``options.provider_timeout``), which starts
+        once the provider is warm, so loading repository data on a cold start does not
+        count as a missed deadline. Providers that miss their deadline or fail are
+        skipped and recorded with the
+        degradation manager, and providers it currently considers unavailable are not
+        queried until their recovery timeout has passed. Providers with
+        ``max_abandoned_lookups`` lookups still running after missing their deadline
+        are skipped as well.
+
+        If the software package is in the equivalence map, providers look up the package
+        name it records instead of searching; providers without a recorded package are
+        searched. A map built from older repository data is still used, and rebuilt in
+        the background; packages it no longer names are searched.
+
+        Args:
+            software_name: Name of the software package.
+            providers: Providers to search.
+            options: Generation options holding the provider deadlines.
+
+        Returns:
+            List of PackageInfo objects, one per provider that found the package, in
+            provider order. If no provider found it, a single minimal PackageInfo for
+            template generation.
+        """
+        options = options or GenerationOptions()
+        
+        equivalents = self.equivalence_map.resolve(software_name)
+        if equivalents:
+            self._refresh_equivalence_map()
+        
+        fetchers = {}
         for provider in providers:
-            try:
-                fetcher = fetcher_factory.create_fetcher(provider, self.fetcher_config)
-                if fetcher:
-                    logger.debug(f"Searching for {software_name} in {provider}")
-                    packages = fetcher.search_packages(software_name)
-                    if packages:
-                        # Take the first (best) match
-                        package_info = packages[0]
-                        package_sources.append(package_info)
-                        logger.debug(f"Found {software_name} in {provider}: {package_info.name}")
-                    else:
-                        logger.debug(f"No packages found for {software_name} in {provider}")
-                else:
-                    logger.warning(f"Could not create fetcher for provider: {provider}")
-            except Exception as e:
-                logger.warning(f"Error fetching from {provider}: {e}")
+            if not self._is_provider_usable(provider):
+                logger.debug(f"Skipping degraded provider {provider} for {software_name}")
                 continue
+            
+            if self._count_abandoned_lookups(provider) >= self.max_abandoned_lookups:
+                logger.warning(
+                    f"Skipping provider {provider} for {software_name}: "
+                    f"{self.max_abandoned_lookups} earlier lookups are still running"
+                )
+                continue
+            
+            fetcher = fetcher_factory.get_fetcher(provider, self.fetcher_config)
+            if fetcher:
+                fetchers[provider] = fetcher
+            else:
+                logger.warning(f"Could not create fetcher for provider: {provider}")
+        
+        found: Dict[str, PackageInfo] = {}
+        if fetchers:
+            executor = self._get_provider_executor()
+            
+            timeouts = {
+                provider: options.provider_timeouts.get(provider, options.provider_timeout)
+                for provider in fetchers
+            }
+            warming = {
+                executor.submit(self._warm_up_provider, provider, fetcher): provider
+                for provider, fetcher in fetchers.items()
+            }
+            pending: Dict[Future, str] = {}
+            started: Dict[str, float] = {}
+            
+            while warming or pending:
+                timeout = None
+                if pending:
+                    next_deadline = min(started[provider] + timeouts[provider] for provider in pending.values())
+                    timeout = max(0.0, next_deadline - time.monotonic())
+                done, _ = wait(
+                    list(warming) + list(pending),
+                    timeout=timeout,
+                    return_when=FIRST_COMPLETED
+                )
+                
+                for future in done:
+                    if future in warming:
+                        # The deadline starts once the repository data is loaded
+                        provider = warming.pop(future)
+                        started[provider] = time.monotonic()
+                        lookup = executor.submit(
+                            self._search_provider, software_name, provider, fetchers[provider],
+                            equivalents.get(provider)
+                        )
+                        pending[lookup] = provider
+                        continue
+                    
+                    provider = pending.pop(future)
+                    try:
+                        package_info = future.result()
+                    except Exception as e:
+                        logger.warning(f"Error fetching from {provider}: {e}")
+                        self._record_provider_failure(provider, str(e), "fetch")
+                        continue
+                    
+                    self._record_provider_success(provider)
+                    if package_info:
+                        found[provider] = package_info
+                
+                now = time.monotonic()
+                for future, provider in list(pending.items()):
+                    if started[provider] + timeouts[provider] <= now:
+                        # The lookup keeps running in the background; its result is discarded
+                        del pending[future]
+                        if not future.cancel():
+                            self._abandon_lookup(provider, future)
+                        timeout = timeouts[provider]
+                        logger.warning(
+                            f"Provider {provider} missed its {timeout:.1f}s deadline for {software_name}"
+                        )
+                        self._record_provider_failure(
+                            provider, f"Lookup for {software_name} exceeded {timeout:.1f}s deadline", "timeout"
+                        )
+        
+        package_sources = [found[provider] for provider in providers if provider in found]
         
         if not package_sources:
             logger.warning(f"No package information found for {software_name}")
@@ -122,15 +268,191 @@ class SaidataEngine:
                 details={}
             )]
         
-        # Generate metadata using the metadata generator
-        result = self.metadata_generator.generate_from_sources(
-            software_name=software_name,
-            sources=package_sources,
-            providers=providers
-        )
+        return package_sources
+    
+    def _refresh_equivalence_map(self) -> None:
+        """
+        Start a background rebuild of the equivalence map if it is stale.
+
+        The map is stale when a provider in it has loaded different repository
+        data than the map was built from. Only one rebuild runs at a time, and
+        the same repository data does not trigger a second rebuild.
+        """
+        index_versions = {}
+        for provider in self.equivalence_map.providers:
+            fetcher = fetcher_factory.get_fetcher(provider, self.fetcher_config)
+            if fetcher:
+                index_versions[provider] = fetcher.get_index_version()
         
-        logger.info(f"Generated metadata for {software_name} with {len(package_sources)} sources")
-        return result
+        if self.equivalence_map.is_current(index_versions):
+            return
+        
+        with self._equivalence_lock:
+            if self._equivalence_rebuild is not None and self._equivalence_rebuild.is_alive():
+                return
+            if self._equivalence_rebuild_versions == index_versions:
+                return
+            
+            logger.info("Repository data changed, rebuilding package equivalence map in the background")
+            self._equivalence_rebuild_versions = index_versions
+            self._equivalence_rebuild = threading.Thread(
+                target=self._rebuild_equivalence_map,
+                args=(list(self.equivalence_map.providers),),
+                name="equivalence-map-rebuild",
+                daemon=True
+            )
+            self._equivalence_rebuild.start()
+    
+    def _rebuild_equivalence_map(self, providers: List[str]) -> None:
+        """
+        Rebuild the equivalence map, logging failures.
+
+        Args:
+            providers: Providers to include.
+        """
+        try:
+            self.build_equivalence_map(providers)
+        except Exception as e:
+            logger.warning(f"Failed to rebuild package equivalence map: {e}")
+    
+    def _warm_up_provider(self, provider: str, fetcher: RepositoryFetcher) -> None:
+        """
+        Load a provider's repository data before it is searched.
+
+        Failures are logged; the provider is still searched, since fetchers
+        fall back to their cached or partially loaded data.
+
+        Args:
+            provider: Provider name.
+            fetcher: Fetcher for the provider.
+        """
+        try:
+            fetcher.warm_up()
+        except Exception as e:
+            logger.warning(f"Error loading repository data for {provider}: {e}")
+    
+    def _search_provider(
+        self,
+        software_name: str,
+        provider: str,
+        fetcher: RepositoryFetcher,
+        package_name: Optional[str] = None
+    ) -> Optional[PackageInfo]:
+        """
+        Search a single provider for the best match of a software package.
+
+        Args:
+            software_name: Name of the software package.
+            provider: Provider name.
+            fetcher: Fetcher for the provider.
+            package_name: Package name known from the equivalence map. It is looked
+                up directly; the provider is only searched if it is not found.
+
+        Returns:
+            PackageInfo of the best match, or None if the provider has no match.
+        """
+        if package_name:
+            package_info = fetcher.get_package_info(package_name)
+            if package_info:
+                logger.debug(f"Found {software_name} in {provider} via equivalence map: {package_name}")
+                return package_info
+            logger.debug(f"Equivalent package {package_name} not found in {provider}, searching")
+        
+        logger.debug(f"Searching for {software_name} in {provider}")
+        packages = fetcher.search_packages(software_name)
+        if not packages:
+            logger.debug(f"No packages found for {software_name} in {provider}")
+            return None
+        
+        # Take the first (best) match
+        package_info = packages[0]
+        logger.debug(f"Found {software_name} in {provider}: {package_info.name}")
+        return package_info
+    
+    def _get_provider_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the long-lived executor used for provider lookups.
+
+        Returns:
+            Thread pool shared by all provider lookups of this engine.
+        """
+        with self._provider_executor_lock:
+            if self._provider_executor is None:
+                self._provider_executor = ThreadPoolExecutor(
+                    max_workers=self.provider_workers,
+                    thread_name_prefix="saidata-provider"
+                )
+            return self._provider_executor
+    
+    def _abandon_lookup(self, provider: str, future: Future) -> None:
+        """
+        Track a lookup that missed its deadline until it returns.
+
+        Args:
+            provider: Provider name.
+            future: Future of the running lookup.
+        """
+        with self._provider_executor_lock:
+            lookups = self._abandoned_lookups.setdefault(provider, set())
+            lookups.add(future)
+        
+        def _lookup_done(done_future: Future) -> None:
+            with self._provider_executor_lock:
+                lookups.discard(done_future)
+        
+        future.add_done_callback(_lookup_done)
+    
+    def _count_abandoned_lookups(self, provider: str) -> int:
+        """
+        Count a provider's lookups that missed their deadline and are still running.
+
+        Args:
+            provider: Provider name.
+
+        Returns:
+            Number of abandoned lookups of the provider.
+        """
+        with self._provider_executor_lock:
+            return len(self._abandoned_lookups.get(provider, ()))
+    
+    def _is_provider_usable(self, provider: str) -> bool:
+        """
+        Check whether a provider should be queried.
+
+        Args:
+            provider: Provider name.
+
+        Returns:
+            True if the provider is available or due for a recovery attempt.
+        """
+        with self._degradation_lock:
+            return (
+                self.degradation_manager.is_provider_available(provider)
+                or self.degradation_manager.attempt_provider_recovery(provider)
+            )
+    
+    def _record_provider_failure(self, provider: str, reason: str, error_type: str) -> None:
+        """
+        Record a failed or late provider lookup with the degradation manager.
+
+        Args:
+            provider: Provider name.
+            reason: Reason for the failure.
+            error_type: Type of error (timeout, fetch).
+        """
+        with self._degradation_lock:
+            self.degradation_manager.mark_provider_unavailable(provider, reason, error_type=error_type)
+    
+    def _record_provider_success(self, provider: str) -> None:
+        """
+        Record a successful provider lookup, recovering the provider if it was degraded.
+
+        Args:
+            provider: Provider name.
+        """
+        with self._degradation_lock:
+            if not self.degradation_manager.is_provider_available(provider):
+                self.degradation_manager.mark_provider_recovered(provider)
     
     def generate_metadata_with_directory_structure(
         self, 
@@ -163,36 +485,7 @@ class SaidataEngine:
         providers = options.providers if options.providers else self.get_default_providers()
         
         # Collect package information from all providers
-        package_sources = []
-        for provider in providers:
-            try:
-                fetcher = fetcher_factory.create_fetcher(provider, self.fetcher_config)
-                if fetcher:
-                    logger.debug(f"Searching for {software_name} in {provider}")
-                    packages = fetcher.search_packages(software_name)
-                    if packages:
-                        # Take the first (best) match
-                        package_info = packages[0]
-                        package_sources.append(package_info)
-                        logger.debug(f"Found {software_name} in {provider}: {package_info.name}")
-                    else:
-                        logger.debug(f"No packages found for {software_name} in {provider}")
-                else:
-                    logger.warning(f"Could not create fetcher for provider: {provider}")
-            except Exception as e:
-                logger.warning(f"Error fetching from {provider}: {e}")
-                continue
-        
-        if not package_sources:
-            logger.warning(f"No package information found for {software_name}")
-            # Create a minimal package info for template generation
-            package_sources = [PackageInfo(
-                name=software_name,
-                version="latest",
-                description=f"Software package: {software_name}",
-                provider="default",
-                details={}
-            )]
+        package_sources = self._collect_package_sources(software_name, providers, options)
         
         # Generate directory structure using the metadata generator
         ai_provider = getattr(options, 'ai_provider', None) if getattr(options, 'use_ai', False) else None
@@ -231,36 +524,7 @@ class SaidataEngine:
         providers = options.providers if options.providers else self.get_default_providers()
         
         # Collect package information from all providers
-        package_sources = []
-        for provider in providers:
-            try:
-                fetcher = fetcher_factory.create_fetcher(provider, self.fetcher_config)
-                if fetcher:
-                    logger.debug(f"Searching for {software_name} in {provider}")
-                    packages = fetcher.search_packages(software_name)
-                    if packages:
-                        # Take the first (best) match
-                        package_info = packages[0]
-                        package_sources.append(package_info)
-                        logger.debug(f"Found {software_name} in {provider}: {package_info.name}")
-                    else:
-                        logger.debug(f"No packages found for {software_name} in {provider}")
-                else:
-                    logger.warning(f"Could not create fetcher for provider: {provider}")
-            except Exception as e:
-                logger.warning(f"Error fetching from {provider}: {e}")
-                continue
-        
-        if not package_sources:
-            logger.warning(f"No package information found for {software_name}")
-            # Create a minimal package info for template generation
-            package_sources = [PackageInfo(
-                name=software_name,
-                version="latest",
-                description=f"Software package: {software_name}",
-                provider="default",
-                details={}
-            )]
+        package_sources = self._collect_package_sources(software_name, providers, options)
         
         # Generate comprehensive metadata file using the metadata generator
         ai_provider = getattr(options, 'ai_provider', None) if getattr(options, 'use_ai', False) else None
@@ -339,71 +603,175 @@ class SaidataEngine:
                 file_path=file_path
             )
 
-    def batch_process(self, software_list: List[str], options: BatchOptions) -> BatchResult:
+    def batch_process(
+        self,
+        software_list: List[str],
+        options: BatchOptions,
+        progress_callback: Optional[Callable[[BatchItemResult], None]] = None
+    ) -> BatchResult:
         """
         Process multiple software packages in batch.
 
+        Packages are processed concurrently by up to ``options.max_concurrent``
+        workers (see ``iter_batch_process``).
+
         Args:
             software_list: List of software package names.
             options: Options for batch processing.
+            progress_callback: Optional callable invoked with each BatchItemResult
+                as soon as the package has been processed.
 
         Returns:
             BatchResult: Result of the batch processing.
         """
         logger.info(f"Starting batch processing for {len(software_list)} packages")
         
-        results = {}
+        completed: Dict[str, Optional[MetadataResult]] = {}
         successful = 0
         failed = 0
         errors = []
         
-        for software_name in software_list:
-            try:
-                # Convert BatchOptions to GenerationOptions
-                gen_options = GenerationOptions(
-                    providers=getattr(options, 'providers', []),
-                    use_ai=getattr(options, 'use_ai', False),
-                    ai_provider=getattr(options, 'ai_provider', 'openai'),
-                    confidence_threshold=getattr(options, 'confidence_threshold', 0.7)
-                )
-                
-                result = self.generate_metadata(software_name, gen_options)
-                results[software_name] = result
-                
-                if result.validation_result.valid:
-                    successful += 1
-                    logger.debug(f"Successfully processed {software_name}")
-                else:
-                    failed += 1
-                    error_msg = f"Generated metadata for {software_name} has validation issues"
-                    logger.warning(error_msg)
-                    if result.error_message:
-                        errors.append(f"{software_name}: {result.error_message}")
-                    else:
-                        errors.append(f"{software_name}: validation failed")
-                    
-            except Exception as e:
+        for item in self.iter_batch_process(software_list, options):
+            completed[item.software_name] = item.result
+            if item.success:
+                successful += 1
+            else:
                 failed += 1
-                error_msg = f"Failed to process {software_name}: {e}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-                results[software_name] = None
+                errors.append(f"{item.software_name}: {item.error}")
+            
+            if progress_callback:
+                progress_callback(item)
+        
+        # Report results in input order rather than completion order
+        results = {name: completed[name] for name in software_list if name in completed}
+        processed = successful + failed
         
         logger.info(f"Batch processing completed: {successful} successful, {failed} failed")
         
+        summary = {
+            "total": len(software_list),
+            "successful": successful,
+            "failed": failed
+        }
+        if processed < len(software_list):
+            summary["skipped"] = len(software_list) - processed
+        
         return BatchResult(
             results=results,
-            summary={
-                "total": len(software_list),
-                "successful": successful,
-                "failed": failed
-            },
-            total_processed=len(software_list),
+            summary=summary,
+            total_processed=processed,
             successful=successful,
             failed=failed,
             errors=errors
         )
 
+    def iter_batch_process(
+        self,
+        software_list: List[str],
+        options: BatchOptions
+    ) -> Iterator[BatchItemResult]:
+        """
+        Process multiple software packages concurrently, yielding results as they complete.
+
+        Packages are fanned out over a bounded thread pool of ``options.max_concurrent``
+        workers. All workers share the pooled provider fetchers, so each repository
+        index is loaded once for the whole batch. When ``options.continue_on_error`` is
+        False, no new packages are started after the first failure and queued ones are
+        cancelled.
+
+        Args:
+            software_list: List of software package names.
+            options: Options for batch processing.
+
+        Yields:
+            BatchItemResult for each processed package, in completion order.
+        """
+        if not software_list:
+            return
+        
+        providers = options.providers if options.providers else self.get_default_providers()
+        gen_options = GenerationOptions(
+            providers=providers,
+            use_ai=getattr(options, 'use_ai', False),
+            ai_provider=getattr(options, 'ai_provider', 'openai'),
+            confidence_threshold=getattr(options, 'confidence_threshold', 0.7),
+            provider_timeout=options.provider_timeout,
+            provider_timeouts=options.provider_timeouts
+        )
+        
+        max_workers = max(1, min(options.max_concurrent, len(software_list)))
+        # Keep a small backlog of queued work so workers never idle, without
+        # materializing futures for the whole list up front.
+        max_in_flight = max_workers * 2
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="saidata-batch") as executor:
+            pending: Dict[Future, str] = {}
+            remaining = iter(software_list)
+            stop_submitting = False
+            
+            def submit_next() -> None:
+                while not stop_submitting and len(pending) < max_in_flight:
+                    software_name = next(remaining, None)
+                    if software_name is None:
+                        return
+                    future = executor.submit(self.generate_metadata, software_name, gen_options)
+                    pending[future] = software_name
+            
+            submit_next()
+            
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    
+                    for future in done:
+                        software_name = pending.pop(future)
+                        if future.cancelled():
+                            continue
+                        
+                        item = self._build_batch_item(software_name, future)
+                        yield item
+                        
+                        if not item.success and not options.continue_on_error and not stop_submitting:
+                            logger.warning(f"Stopping batch after failure of {software_name} (fail-fast)")
+                            stop_submitting = True
+                            for queued in pending:
+                                queued.cancel()
+                    
+                    submit_next()
+            finally:
+                # Don't start queued work if the consumer stops iterating early
+                for queued in pending:
+                    queued.cancel()
+
+    def _build_batch_item(self, software_name: str, future: Future) -> BatchItemResult:
+        """
+        Convert a completed generation future into a BatchItemResult.
+
+        Args:
+            software_name: Name of the software package.
+            future: Completed future returned by generate_metadata.
+
+        Returns:
+            BatchItemResult for the package.
+        """
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Failed to process {software_name}: {e}")
+            return BatchItemResult(software_name=software_name, error=str(e))
+        
+        validation_result = result.validation_result
+        if result.success and (validation_result is None or validation_result.valid):
+            logger.debug(f"Successfully processed {software_name}")
+            return BatchItemResult(software_name=software_name, result=result, success=True)
+        
+        logger.warning(f"Generated metadata for {software_name} has validation issues")
+        return BatchItemResult(
+            software_name=software_name,
+            result=result,
+            error=result.error_message or "validation failed"
+        )
+
     def search_software(self, query: str) -> List[SoftwareMatch]:
         """
         Search for software packages across multiple repositories.
@@ -424,50 +792,122 @@ class SaidataEngine:
             logger.error(f"Error searching for {query}: {e}")
             return []
 
+    def iter_search_software(
+        self,
+        query: str,
+        max_results: int = 20,
+        providers: Optional[List[str]] = None
+    ) -> Iterator[List[SoftwareMatch]]:
+        """
+        Search for software packages, yielding provisional results as providers answer.
+
+        The search ends once enough high-confidence matches are found, see
+        ``SoftwareSearchEngine.iter_search``.
+
+        Args:
+            query: Search query.
+            max_results: Maximum number of results per update.
+            providers: Providers to search. If None, all providers are searched.
+
+        Yields:
+            List[SoftwareMatch]: Ranked matches found so far.
+        """
+        logger.info(f"Searching for software: {query}")
+        
+        try:
+            yield from self.search_engine.iter_search(query, max_results=max_results, providers=providers)
+        except Exception as e:
+            logger.error(f"Error searching for {query}: {e}")
+
     def fetch_repository_data(self, providers: List[str]) -> FetchResult:
         """
         Fetch data from package repositories.
 
         Args:
-            providers: List of provider names.
+            providers: List of provider names. If empty, the default providers are used.
 
         Returns:
-            FetchResult: Result of the repository data fetching.
+            FetchResult: Result of the repository data fetching, with one entry per provider.
         """
+        providers = providers or self.get_default_providers()
         logger.info(f"Fetching repository data for providers: {providers}")
         
-        results = {}
-        successful = 0
-        failed = 0
+        result = FetchResult(success=True)
         
         for provider in providers:
             try:
-                fetcher = fetcher_factory.create_fetcher(provider, self.fetcher_config)
-                if fetcher:
-                    # Fetch repository data (this would typically cache repository metadata)
-                    repository_data = fetcher.fetch_repository_data()
-                    results[provider] = repository_data
-                    successful += 1
-                    logger.debug(f"Successfully fetched data from {provider}")
-                else:
-                    failed += 1
+                fetcher = fetcher_factory.get_fetcher(provider, self.fetcher_config)
+                if not fetcher:
                     logger.warning(f"Could not create fetcher for provider: {provider}")
-                    results[provider] = None
+                    result.providers[provider] = False
+                    result.errors[provider] = "No fetcher available"
+                    result.success = False
+                    continue
+                
+                provider_result = fetcher.fetch_repository_data()
+                success = getattr(provider_result, "success", True)
+                result.providers[provider] = success
+                cache_hits = getattr(provider_result, "cache_hits", None) or {}
+                result.cache_hits[provider] = bool(cache_hits) and all(cache_hits.values())
+                if not success:
+                    errors = getattr(provider_result, "errors", None) or {}
+                    result.errors[provider] = "; ".join(
+                        f"{part}: {error}" for part, error in errors.items()
+                    ) or "Failed to fetch repository data"
+                    result.success = False
+                logger.debug(f"Fetched data from {provider}")
             except Exception as e:
-                failed += 1
                 logger.error(f"Failed to fetch data from {provider}: {e}")
-                results[provider] = None
-        
-        logger.info(f"Repository data fetching completed: {successful} successful, {failed} failed")
+                result.providers[provider] = False
+                result.errors[provider] = str(e)
+                result.success = False
         
-        return FetchResult(
-            results=results,
-            summary={
-                "total": len(providers),
-                "successful": successful,
-                "failed": failed
-            }
+        successful = sum(result.providers.values())
+        logger.info(
+            f"Repository data fetching completed: {successful} successful, "
+            f"{len(result.providers) - successful} failed"
         )
+        return result
+
+    def build_equivalence_map(self, providers: Optional[List[str]] = None) -> EquivalenceMap:
+        """
+        Build and save the package equivalence map from the repository data of providers.
+
+        Args:
+            providers: Providers to include. If None, the default providers are used.
+
+        Returns:
+            EquivalenceMap: The rebuilt equivalence map.
+        """
+        providers = providers or self.get_default_providers()
+        logger.info(f"Building package equivalence map for providers: {providers}")
+        
+        fetchers = {}
+        for provider in providers:
+            fetcher = fetcher_factory.get_fetcher(provider, self.fetcher_config)
+            if fetcher:
+                fetchers[provider] = fetcher
+            else:
+                logger.warning(f"Could not create fetcher for provider: {provider}")
+        
+        executor = self._get_provider_executor()
+        futures = {
+            executor.submit(lambda fetcher=fetcher: list(fetcher.iter_package_summaries())): provider
+            for provider, fetcher in fetchers.items()
+        }
+        
+        records = {}
+        for future in as_completed(futures):
+            provider = futures[future]
+            try:
+                records[provider] = future.result()
+            except Exception as e:
+                logger.warning(f"Error collecting packages from {provider}: {e}")
+        
+        index_versions = {provider: fetchers[provider].get_index_version() for provider in records}
+        self.equivalence_map.build(records, index_versions)
+        self.equivalence_map.save()
+        return self.equivalence_map
 
     def get_available_providers(self) -> Dict[str, Dict[str, any]]:
         """
@@ -131,6 +131,8 @@ class GenerationOptions:
     confidence_threshold: float = 0.7
     output_format: str = "yaml"
     validate_schema: bool = True
+    provider_timeout: float = 30.0  # Deadline in seconds for a single provider lookup
+    provider_timeouts: Dict[str, float] = field(default_factory=dict)  # Per-provider overrides
 
 
 @dataclass
@@ -148,6 +150,8 @@ class BatchOptions:
     validate_schema: bool = True
     max_concurrent: int = 5
     continue_on_error: bool = True
+    provider_timeout: float = 30.0
+    provider_timeouts: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -173,6 +177,9 @@ class FetcherConfig:
     concurrent_requests: int = 5
     request_timeout: int = 30
     retry_count: int = 3
+    parse_workers: Optional[int] = None  # Parse worker processes; None for one per CPU, 0 to parse inline
+    git_sparse_checkout: bool = True  # Partially clone Git repositories, checking out only the parsed paths
+    git_worktree: bool = True  # False to keep bare clones and read files from the Git object database
 
 
 class ValidationLevel(Enum):
@@ -241,6 +248,17 @@ class BatchResult:
     errors: List[str] = field(default_factory=list)
 
 
+@dataclass
+class BatchItemResult:
+    """
+    Result of processing a single package within a batch.
+    """
+    software_name: str
+    result: Optional[MetadataResult] = None
+    success: bool = False
+    error: Optional[str] = None
+
+
 @dataclass
 class SoftwareMatch:
     """
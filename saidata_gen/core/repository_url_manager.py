@@ -10,6 +10,7 @@ import os
 import platform
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
+from urllib.parse import urlsplit
 import yaml
 
 from saidata_gen.core.interfaces import FetcherConfig
@@ -414,6 +415,61 @@ class RepositoryUrlManager:
         """
         return self._url_config.get(provider, {})
     
+    def get_rate_limits(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the request rate limits configured for repository hosts.
+        
+        A provider's ``rate_limit`` section applies to the hosts listed in its
+        ``hosts`` key, or to the hosts of all the provider's URLs if no hosts are
+        listed. When several providers limit the same host, the lowest rate wins.
+        
+        Returns:
+            Dictionary mapping host names to rate limit settings
+            (``requests_per_second``, ``burst_size``, ``max_connections``).
+        """
+        rate_limits: Dict[str, Dict[str, Any]] = {}
+        
+        for provider, provider_config in self._url_config.items():
+            if not isinstance(provider_config, dict) or not isinstance(provider_config.get('rate_limit'), dict):
+                continue
+            
+            rate_limit = dict(provider_config['rate_limit'])
+            hosts = rate_limit.pop('hosts', None) or self._collect_hosts(provider_config)
+            
+            for host in hosts:
+                current = rate_limits.get(host)
+                if (current is None or
+                    rate_limit.get('requests_per_second', float('inf')) <
+                    current.get('requests_per_second', float('inf'))):
+                    rate_limits[host] = rate_limit
+        
+        return rate_limits
+    
+    def _collect_hosts(self, config: Any) -> List[str]:
+        """
+        Collect the hosts of all HTTP URLs in a configuration section.
+        
+        Args:
+            config: Configuration value (dictionary, list or string).
+        
+        Returns:
+            List of host names. URLs whose host contains template variables are skipped.
+        """
+        hosts = []
+        if isinstance(config, dict):
+            for key, value in config.items():
+                if key != 'rate_limit':
+                    hosts.extend(self._collect_hosts(value))
+        elif isinstance(config, list):
+            for value in config:
+                hosts.extend(self._collect_hosts(value))
+        elif isinstance(config, str) and config.startswith(('http://', 'https://')):
+            host = urlsplit(config).netloc
+            if host and '{' not in host:
+                hosts.append(host)
+        
+        return list(dict.fromkeys(hosts))
+    
     def reload_configuration(self):
         """Reload the repository URL configuration from file."""
         self._load_configuration()
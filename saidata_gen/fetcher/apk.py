@@ -10,8 +10,9 @@ import io
 import logging
 import os
 import re
+import tarfile
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
@@ -41,6 +42,8 @@ class ApkFetcher(HttpRepositoryFetcher):
     by downloading and parsing APKINDEX files.
     """
     
+    index_text_fields = ("T",)
+    
     def __init__(
         self,
         repositories: Optional[List[ApkRepository]] = None,
@@ -69,7 +72,7 @@ class ApkFetcher(HttpRepositoryFetcher):
         ]
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -89,32 +92,40 @@ class ApkFetcher(HttpRepositoryFetcher):
         """
         result = FetchResult(success=True)
         
+        # Collect the repositories without a valid cache
+        repositories = []
         for repo in self.repositories:
             repo_key = f"{repo.name}_{repo.version}_{repo.architecture}"
-            try:
-                # Check if we have a valid cache
-                cached_data = self._get_from_cache(repo_key)
-                if cached_data:
-                    self._package_cache[repo_key] = cached_data
-                    result.cache_hits[repo_key] = True
-                    continue
-                
-                # Fetch and parse APKINDEX
-                packages_data = self._fetch_apkindex(repo)
-                if packages_data:
-                    self._package_cache[repo_key] = packages_data
-                    self._save_to_cache(repo_key, packages_data)
-                    result.providers[repo_key] = True
-                else:
-                    result.success = False
-                    result.providers[repo_key] = False
-                    result.errors[repo_key] = "Failed to fetch APKINDEX"
             
-            except Exception as e:
-                logger.error(f"Failed to fetch repository data for {repo_key}: {e}")
-                result.errors[repo_key] = str(e)
+            # Check if we have a valid cache
+            cached_data = self._get_from_cache(repo_key)
+            if cached_data:
+                self._set_package_cache_entry(repo_key, cached_data)
+                result.cache_hits[repo_key] = True
+                continue
+            
+            repositories.append((repo, repo_key))
+        
+        # Fetch and parse the APKINDEX files concurrently
+        for (repo, repo_key), packages_data, error in self._run_concurrently(
+            lambda item: self._fetch_apkindex(*item), repositories
+        ):
+            if error is not None:
+                logger.error(f"Failed to fetch repository data for {repo_key}: {error}")
+                result.errors[repo_key] = str(error)
                 result.providers[repo_key] = False
                 result.success = False
+            elif packages_data:
+                self._set_package_cache_entry(repo_key, packages_data)
+                self._save_to_cache(repo_key, packages_data, snapshot=True)
+                result.providers[repo_key] = True
+            else:
+                result.success = False
+                result.providers[repo_key] = False
+                result.errors[repo_key] = "Failed to fetch APKINDEX"
+        
+        # Index the fetched packages for lookups and searches
+        self._build_package_index()
         
         return result
     
@@ -128,23 +139,7 @@ class ApkFetcher(HttpRepositoryFetcher):
         Returns:
             PackageInfo if the package is found, None otherwise.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        # Look for the package in all repositories
-        for repo_key, packages in self._package_cache.items():
-            if package_name in packages:
-                pkg_data = packages[package_name]
-                return PackageInfo(
-                    name=package_name,
-                    provider=self.get_repository_name(),
-                    version=pkg_data.get("V"),
-                    description=pkg_data.get("T"),
-                    details=pkg_data
-                )
-        
-        return None
+        return self._get_indexed_package_info(package_name)
     
     def search_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
         """
@@ -157,38 +152,26 @@ class ApkFetcher(HttpRepositoryFetcher):
         Returns:
             List of PackageInfo objects matching the query.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Search in all repositories
-        for repo_key, packages in self._package_cache.items():
-            for pkg_name, pkg_data in packages.items():
-                # Check if the package name or description contains the query
-                if (query_lower in pkg_name.lower() or 
-                    (pkg_data.get("T") and query_lower in pkg_data["T"].lower())):
-                    
-                    # Create PackageInfo object
-                    pkg_info = PackageInfo(
-                        name=pkg_name,
-                        provider=self.get_repository_name(),
-                        version=pkg_data.get("V"),
-                        description=pkg_data.get("T"),
-                        details=pkg_data
-                    )
-                    
-                    # Add to results if not already present
-                    if not any(r.name == pkg_name for r in results):
-                        results.append(pkg_info)
-                    
-                    # Stop if we have enough results
-                    if len(results) >= max_results:
-                        return results
+        return self._search_indexed_packages(query, max_results)
+    
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
+        """
+        Create a PackageInfo object from package data.
         
-        return results
+        Args:
+            package_name: Name of the package.
+            package_data: Package data.
+            
+        Returns:
+            PackageInfo object.
+        """
+        return PackageInfo(
+            name=package_name,
+            provider=self.get_repository_name(),
+            version=package_data.get("V"),
+            description=package_data.get("T"),
+            details=package_data
+        )
     
     def get_package_details(self, package_name: str, repository: Optional[str] = None) -> Optional[PackageDetails]:
         """
@@ -240,48 +223,31 @@ class ApkFetcher(HttpRepositoryFetcher):
         
         return None
     
-    def _fetch_apkindex(self, repo: ApkRepository) -> Dict[str, Dict[str, any]]:
+    def _fetch_apkindex(self, repo: ApkRepository, cache_key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse an APKINDEX file from an APK repository.
         
         Args:
             repo: Repository configuration.
+            cache_key: Optional cache key a parse worker writes the packages to.
             
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        # Save the current base_url
-        original_base_url = self.base_url
+        apkindex_path = f"{repo.architecture}/APKINDEX.tar.gz"
         
         try:
-            # Set the base_url for this request
-            self.base_url = repo.url
-            
             # Fetch the APKINDEX.tar.gz file
-            apkindex_path = f"{repo.architecture}/APKINDEX.tar.gz"
             response = self._fetch_url(f"{repo.url}/{apkindex_path}")
             
-            # Extract the APKINDEX file from the tar.gz archive
-            import tarfile
-            import io
-            
-            with tarfile.open(fileobj=io.BytesIO(response.content), mode="r:gz") as tar:
-                for member in tar.getmembers():
-                    if member.name == "APKINDEX":
-                        apkindex_content = tar.extractfile(member).read().decode("utf-8")
-                        return self._parse_apkindex(apkindex_content)
-            
-            logger.warning(f"APKINDEX file not found in {apkindex_path}")
-            return {}
+            # Extract and parse the APKINDEX file, in a worker process if it is large
+            return self._parse_content(parse_apkindex_archive, response.content, snapshot_key=cache_key)
             
         except Exception as e:
             logger.warning(f"Failed to fetch APKINDEX for {repo.name}: {e}")
             return {}
-        finally:
-            # Restore the original base_url
-            self.base_url = original_base_url
     
-    def _parse_apkindex(self, apkindex_content: str) -> Dict[str, Dict[str, any]]:
+    def _parse_apkindex(self, apkindex_content: str) -> Dict[str, Dict[str, Any]]:
         """
         Parse an APKINDEX file from an APK repository.
         
@@ -291,30 +257,65 @@ class ApkFetcher(HttpRepositoryFetcher):
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        result = {}
-        current_package = None
-        current_data = {}
+        return parse_apkindex(apkindex_content)
+
+
+def parse_apkindex_archive(content: bytes) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract and parse the APKINDEX file from an APKINDEX.tar.gz archive.
+    
+    This is a module-level function so that it can run in a parse worker process.
+    
+    Args:
+        content: Content of the APKINDEX.tar.gz archive.
         
-        for line in apkindex_content.splitlines():
-            if not line:
-                # Empty line indicates end of a package entry
-                if current_package and current_data:
-                    result[current_package] = current_data
-                current_package = None
-                current_data = {}
-                continue
-            
-            # Each line is a key-value pair
-            if ":" in line:
-                key, value = line.split(":", 1)
-                current_data[key] = value.strip()
-                
-                # If this is the package name field, set the current package
-                if key == "P":
-                    current_package = value.strip()
+    Returns:
+        Dictionary mapping package names to their metadata, or an empty
+        dictionary if the archive has no APKINDEX file.
+    """
+    with tarfile.open(fileobj=io.BytesIO(content), mode="r:gz") as tar:
+        for member in tar.getmembers():
+            if member.name == "APKINDEX":
+                return parse_apkindex(tar.extractfile(member).read().decode("utf-8"))
+    
+    logger.warning("APKINDEX file not found in APKINDEX.tar.gz")
+    return {}
+
+
+def parse_apkindex(apkindex_content: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse the content of an APKINDEX file.
+    
+    Args:
+        apkindex_content: Content of the APKINDEX file.
         
-        # Add the last package (handle case where file doesn't end with empty line)
-        if current_package and current_data:
-            result[current_package] = current_data
+    Returns:
+        Dictionary mapping package names to their metadata.
+    """
+    result = {}
+    current_package = None
+    current_data = {}
+    
+    for line in apkindex_content.splitlines():
+        if not line:
+            # Empty line indicates end of a package entry
+            if current_package and current_data:
+                result[current_package] = current_data
+            current_package = None
+            current_data = {}
+            continue
         
-        return result
\ No newline at end of file
+        # Each line is a key-value pair
+        if ":" in line:
+            key, value = line.split(":", 1)
+            current_data[key] = value.strip()
+            
+            # If this is the package name field, set the current package
+            if key == "P":
+                current_package = value.strip()
+    
+    # Add the last package (handle case where file doesn't end with empty line)
+    if current_package and current_data:
+        result[current_package] = current_data
+    
+    return result
@@ -6,17 +6,22 @@ repositories, including Debian and Ubuntu.
 """
 
 import gzip
-import io
+import hashlib
 import logging
 import os
 import re
+import tempfile
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Collection, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
 )
 from saidata_gen.fetcher.base import HttpRepositoryFetcher
+from saidata_gen.fetcher.deb_utils import (
+    apply_ed_patch, as_lines, parse_control_index, parse_packages_content, parse_pdiff_index,
+    parse_release_file
+)
 from saidata_gen.core.repository_url_manager import get_repository_url_manager
 
 
@@ -43,10 +48,14 @@ class APTFetcher(HttpRepositoryFetcher):
     including Debian and Ubuntu.
     """
     
+    index_text_fields = ("Description",)
+    
     def __init__(
         self,
         distributions: Optional[List[APTDistribution]] = None,
-        config: Optional[FetcherConfig] = None
+        config: Optional[FetcherConfig] = None,
+        package_fields: Optional[Collection[str]] = None,
+        use_pdiffs: bool = True
     ):
         """
         Initialize the APT fetcher.
@@ -54,6 +63,10 @@ class APTFetcher(HttpRepositoryFetcher):
         Args:
             distributions: List of APT distributions to fetch. If None, uses default distributions from URL manager.
             config: Configuration for the fetcher.
+            package_fields: Optional whitelist of Packages fields to keep. If None, all fields are kept.
+            use_pdiffs: Whether to update changed Packages files with pdiffs when the
+                repository provides them. This keeps a compressed copy of each
+                Packages file in the cache.
         """
         # Initialize with a dummy base_url, we'll use distribution-specific URLs
         super().__init__(base_url="https://example.com", config=config)
@@ -67,6 +80,9 @@ class APTFetcher(HttpRepositoryFetcher):
         else:
             self.distributions = self._load_distributions_from_url_manager()
         
+        self.package_fields = package_fields
+        self.use_pdiffs = use_pdiffs
+        
         # Initialize package cache
         self._package_cache: Dict[str, Dict[str, PackageInfo]] = {}
     
@@ -147,55 +163,128 @@ class APTFetcher(HttpRepositoryFetcher):
         """
         Fetch repository data from APT repositories.
         
+        The Packages indexes of all distributions, components and architectures
+        are downloaded and parsed concurrently, up to ``config.concurrent_requests``
+        at a time.
+        
         Returns:
             FetchResult with the result of the fetch operation.
         """
         result = FetchResult(success=True)
+        release_files: Dict[str, Dict[str, Any]] = {}
         
+        # Fetch Release files to get component and architecture info if not specified
+        unresolved = [dist for dist in self.distributions if not dist.components or not dist.architectures]
+        for dist, release_data, error in self._run_concurrently(
+            lambda dist: self._fetch_release_file(dist.url), unresolved
+        ):
+            dist_key = f"{dist.name}_{dist.version}"
+            if error is not None:
+                logger.error(f"Failed to fetch repository data for {dist_key}: {error}")
+                result.errors[dist_key] = str(error)
+                result.providers[dist_key] = False
+                result.success = False
+                continue
+            
+            release_files[dist_key] = release_data
+            if not dist.components:
+                dist.components = release_data.get("components", ["main"])
+            if not dist.architectures:
+                dist.architectures = release_data.get("architectures", ["amd64"])
+        
+        # Collect the Packages files of each component and architecture without a valid cache
+        indexes = []
         for dist in self.distributions:
             dist_key = f"{dist.name}_{dist.version}"
-            try:
-                # Fetch Release file to get component and architecture info if not specified
-                if not dist.components or not dist.architectures:
-                    release_data = self._fetch_release_file(dist.url)
-                    if not dist.components:
-                        dist.components = release_data.get("components", ["main"])
-                    if not dist.architectures:
-                        dist.architectures = release_data.get("architectures", ["amd64"])
-                
-                # Fetch Packages files for each component and architecture
-                for component in dist.components:
-                    for arch in dist.architectures:
-                        packages_url = f"{component}/binary-{arch}/Packages.gz"
-                        cache_key = f"{dist_key}_{component}_{arch}"
-                        
-                        # Check if we have a valid cache
-                        cached_data = self._get_from_cache(cache_key)
-                        if cached_data:
-                            self._package_cache[cache_key] = cached_data
-                            result.cache_hits[cache_key] = True
-                            continue
-                        
-                        # Fetch and parse Packages.gz
-                        try:
-                            packages_data = self._fetch_packages_file(dist.url, packages_url)
-                            self._package_cache[cache_key] = packages_data
-                            self._save_to_cache(cache_key, packages_data)
-                            result.providers[cache_key] = True
-                        except Exception as e:
-                            logger.error(f"Failed to fetch Packages file for {cache_key}: {e}")
-                            result.errors[cache_key] = str(e)
-                            result.providers[cache_key] = False
-                            result.success = False
+            if dist_key in result.errors:
+                continue
             
-            except Exception as e:
-                logger.error(f"Failed to fetch repository data for {dist_key}: {e}")
-                result.errors[dist_key] = str(e)
-                result.providers[dist_key] = False
+            for component in dist.components:
+                for arch in dist.architectures:
+                    cache_key = f"{dist_key}_{component}_{arch}"
+                    
+                    # Check if we have a valid cache
+                    cached_data = self._get_from_cache(cache_key)
+                    if cached_data:
+                        self._set_package_cache_entry(cache_key, cached_data)
+                        result.cache_hits[cache_key] = True
+                        continue
+                    
+                    indexes.append((dist, component, arch, cache_key))
+        
+        # The checksums in the Release file tell which expired indexes changed
+        outdated = {}
+        for dist, component, arch, cache_key in indexes:
+            dist_key = f"{dist.name}_{dist.version}"
+            if dist_key not in release_files and self._has_cache_entry(cache_key):
+                outdated[dist_key] = dist
+        
+        for dist, release_data, error in self._run_concurrently(
+            lambda dist: self._fetch_release_file(dist.url), list(outdated.values())
+        ):
+            dist_key = f"{dist.name}_{dist.version}"
+            if error is not None:
+                logger.warning(f"Failed to fetch Release file for {dist_key}: {error}")
+                release_data = {}
+            release_files[dist_key] = release_data
+        
+        # Fetch and parse the Packages files, revalidating expired cache entries
+        for (dist, component, arch, cache_key), fetched, error in self._run_concurrently(
+            lambda index: self._fetch_index(
+                *index, release_files.get(f"{index[0].name}_{index[0].version}") or {}
+            ),
+            indexes
+        ):
+            if error is not None:
+                logger.error(f"Failed to fetch Packages file for {cache_key}: {error}")
+                result.errors[cache_key] = str(error)
+                result.providers[cache_key] = False
                 result.success = False
+                continue
+            
+            packages_data, cached_data = fetched
+            if cached_data is not None:
+                self._set_package_cache_entry(cache_key, cached_data)
+                result.cache_hits[cache_key] = True
+                continue
+            
+            self._set_package_cache_entry(cache_key, packages_data)
+            result.providers[cache_key] = True
+        
+        # Index the fetched packages for lookups and searches
+        self._build_package_index()
         
         return result
     
+    def _fetch_index(
+        self,
+        dist: APTDistribution,
+        component: str,
+        arch: str,
+        cache_key: str,
+        release_data: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Dict[str, Any]]], Optional[Dict[str, Dict[str, Any]]]]:
+        """
+        Fetch, parse and cache the Packages index of a component and architecture.
+        
+        Args:
+            dist: Distribution of the index.
+            component: Repository component.
+            arch: Architecture.
+            cache_key: Cache key of the index.
+            release_data: Parsed Release file, or an empty dictionary.
+            
+        Returns:
+            Tuple of (fetched data, cached data) as returned by ``_fetch_with_revalidation``.
+        """
+        packages_data, cached_data = self._fetch_with_revalidation(
+            cache_key,
+            lambda: self._fetch_packages_index(dist.url, component, arch, cache_key, release_data)
+        )
+        if cached_data is None:
+            self._save_to_cache(cache_key, packages_data, snapshot=True)
+        return packages_data, cached_data
+    
     def get_package_info(self, package_name: str) -> Optional[PackageInfo]:
         """
         Get information about a specific package.
@@ -206,23 +295,7 @@ class APTFetcher(HttpRepositoryFetcher):
         Returns:
             PackageInfo if the package is found, None otherwise.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        # Look for the package in all distributions
-        for cache_key, packages in self._package_cache.items():
-            if package_name in packages:
-                pkg_data = packages[package_name]
-                return PackageInfo(
-                    name=package_name,
-                    provider=self.get_repository_name(),
-                    version=pkg_data.get("Version"),
-                    description=pkg_data.get("Description", "").split("\\n")[0] if pkg_data.get("Description") else None,
-                    details=pkg_data
-                )
-        
-        return None
+        return self._get_indexed_package_info(package_name)
     
     def search_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
         """
@@ -235,38 +308,26 @@ class APTFetcher(HttpRepositoryFetcher):
         Returns:
             List of PackageInfo objects matching the query.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Search in all distributions
-        for cache_key, packages in self._package_cache.items():
-            for pkg_name, pkg_data in packages.items():
-                # Check if the package name or description contains the query
-                if (query_lower in pkg_name.lower() or 
-                    (pkg_data.get("Description") and query_lower in pkg_data["Description"].lower())):
-                    
-                    # Create PackageInfo object
-                    pkg_info = PackageInfo(
-                        name=pkg_name,
-                        provider=self.get_repository_name(),
-                        version=pkg_data.get("Version"),
-                        description=pkg_data.get("Description", "").split("\\n")[0] if pkg_data.get("Description") else None,
-                        details=pkg_data
-                    )
-                    
-                    # Add to results if not already present
-                    if not any(r.name == pkg_name for r in results):
-                        results.append(pkg_info)
-                    
-                    # Stop if we have enough results
-                    if len(results) >= max_results:
-                        return results
+        return self._search_indexed_packages(query, max_results)
+    
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
+        """
+        Create a PackageInfo object from package data.
         
-        return results
+        Args:
+            package_name: Name of the package.
+            package_data: Package data.
+            
+        Returns:
+            PackageInfo object.
+        """
+        return PackageInfo(
+            name=package_name,
+            provider=self.get_repository_name(),
+            version=package_data.get("Version"),
+            description=package_data.get("Description", "").split("\\n")[0] if package_data.get("Description") else None,
+            details=package_data
+        )
     
     def get_package_details(self, package_name: str, distribution: Optional[str] = None) -> Optional[PackageDetails]:
         """
@@ -323,7 +384,7 @@ class APTFetcher(HttpRepositoryFetcher):
         
         return None
     
-    def _fetch_release_file(self, base_url: str) -> Dict[str, any]:
+    def _fetch_release_file(self, base_url: str) -> Dict[str, Any]:
         """
         Fetch and parse the Release file from an APT repository.
         
@@ -331,142 +392,240 @@ class APTFetcher(HttpRepositoryFetcher):
             base_url: Base URL of the repository.
             
         Returns:
-            Dictionary with parsed Release file data.
+            Dictionary with parsed Release file data, including the SHA256
+            checksums of the index files under "sha256".
+        """
+        # Fetch and parse the Release file (RFC822-style format)
+        release_text = self._fetch_text(f"{base_url}/Release")
+        return parse_release_file(release_text)
+    
+    def _fetch_packages_index(
+        self,
+        base_url: str,
+        component: str,
+        arch: str,
+        cache_key: str,
+        release_data: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch the Packages index of a component and architecture.
+        
+        When Release file data is available, the SHA256 checksum of the index is
+        compared with the one the cached entry was built from, a changed index is
+        updated with pdiffs if possible, and full downloads use by-hash paths on
+        repositories that support them.
+        
+        Args:
+            base_url: Base URL of the repository.
+            component: Repository component.
+            arch: Architecture.
+            cache_key: Cache key of the index.
+            release_data: Parsed Release file, or an empty dictionary.
+            
+        Returns:
+            Dictionary mapping package names to their metadata.
+            
+        Raises:
+            NotModifiedError: If the index has the same checksum as the cached entry.
         """
-        # Save the current base_url
-        original_base_url = self.base_url
+        index_dir = f"{component}/binary-{arch}"
+        packages_path = f"{index_dir}/Packages.gz"
+        checksums = release_data.get("sha256", {})
         
-        try:
-            # Set the base_url for this request
-            self.base_url = base_url
+        # Prefer the checksum of the uncompressed file, which pdiffs are verified against
+        listed_path = f"{index_dir}/Packages" if f"{index_dir}/Packages" in checksums else packages_path
+        listed = checksums.get(listed_path)
+        pdiffs_available = (
+            self.use_pdiffs and listed_path.endswith("/Packages")
+            and f"{index_dir}/Packages.diff/Index" in checksums
+        )
+        
+        if listed:
+            self._revalidate_checksum(cache_key, f"{base_url}/{listed_path}", f"sha256:{listed['sha256']}")
             
-            # Fetch the Release file
-            release_text = self._fetch_text("Release")
+            if pdiffs_available:
+                packages_data = self._update_with_pdiffs(base_url, index_dir, cache_key, listed["sha256"])
+                if packages_data is not None:
+                    return packages_data
+        
+        if release_data.get("acquire_by_hash") and packages_path in checksums:
+            packages_path = f"{index_dir}/by-hash/SHA256/{checksums[packages_path]['sha256']}"
+        
+        if pdiffs_available:
+            return self._fetch_packages_file(
+                base_url, packages_path, raw_path=self._get_raw_packages_path(cache_key), cache_key=cache_key
+            )
+        return self._fetch_packages_file(base_url, packages_path, cache_key=cache_key)
+    
+    def _get_raw_packages_path(self, key: str) -> str:
+        """
+        Get the path of the compressed Packages file kept for pdiff updates.
+        
+        Args:
+            key: Cache key of the index.
             
-            # Parse the Release file (RFC822-style format)
-            result = {}
-            current_key = None
-            current_value = []
+        Returns:
+            Path to the Packages.gz copy.
+        """
+        return os.path.splitext(self._get_cache_path(key))[0] + ".Packages.gz"
+    
+    def _update_with_pdiffs(
+        self,
+        base_url: str,
+        index_dir: str,
+        cache_key: str,
+        target_sha256: str
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Update the kept copy of a Packages file with the pdiffs from Packages.diff/Index.
+        
+        Args:
+            base_url: Base URL of the repository.
+            index_dir: Directory of the Packages file, e.g. "main/binary-amd64".
+            cache_key: Cache key of the index.
+            target_sha256: SHA256 checksum of the current Packages file from the Release file.
             
-            for line in release_text.splitlines():
-                if not line.strip():
-                    continue
+        Returns:
+            Dictionary mapping package names to their metadata, or None if the
+            file cannot be updated with pdiffs and has to be fetched in full.
+        """
+        raw_path = self._get_raw_packages_path(cache_key)
+        if not os.path.exists(raw_path):
+            return None
+        
+        try:
+            with gzip.open(raw_path, "rb") as f:
+                content = f.read()
+            
+            digest = hashlib.sha256(content).hexdigest()
+            if digest != target_sha256:
+                # The pdiff files are not part of the cache entry being revalidated
+                with self._revalidating(None):
+                    index_url = f"{base_url}/{index_dir}/Packages.diff/Index"
+                    pdiff_index = parse_pdiff_index(self._fetch_url(index_url, headers=self.headers).text)
                     
-                if line.startswith(" "):
-                    # Continuation of previous value
-                    if current_key:
-                        current_value.append(line.strip())
-                else:
-                    # New key-value pair
-                    if current_key:
-                        result[current_key] = " ".join(current_value)
-                        current_value = []
+                    if not pdiff_index["current"] or pdiff_index["current"]["sha256"] != target_sha256:
+                        logger.debug(f"Packages.diff/Index for {index_dir} does not match the Release file")
+                        return None
                     
-                    parts = line.split(":", 1)
-                    if len(parts) == 2:
-                        current_key = parts[0].strip()
-                        current_value = [parts[1].strip()]
-            
-            # Add the last key-value pair
-            if current_key:
-                result[current_key] = " ".join(current_value)
+                    history = [checksum for checksum, _ in pdiff_index["history"]]
+                    if digest not in history:
+                        logger.debug(f"Cached Packages file for {index_dir} is too old for pdiffs")
+                        return None
+                    
+                    start = history.index(digest)
+                    names = [name for _, name in pdiff_index["history"]]
+                    patch_names = [names[start]] if pdiff_index["merged"] else names[start:]
+                    
+                    lines = content.splitlines(keepends=True)
+                    for name in patch_names:
+                        patch = self._fetch_pdiff(base_url, index_dir, name, pdiff_index)
+                        lines = apply_ed_patch(lines, patch)
+                    content = b"".join(lines)
+                
+                if hashlib.sha256(content).hexdigest() != target_sha256:
+                    logger.warning(f"Checksum mismatch after applying pdiffs to {index_dir}")
+                    return None
+                
+                self._write_raw_packages(raw_path, content)
+                logger.info(f"Updated {index_dir} with {len(patch_names)} pdiff(s)")
             
-            # Parse components and architectures
-            if "Components" in result:
-                result["components"] = result["Components"].split()
-            if "Architectures" in result:
-                result["architectures"] = result["Architectures"].split()
+            return self._parse_content(
+                parse_packages_content, content, False, self.package_fields, snapshot_key=cache_key
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update {index_dir} with pdiffs, fetching the full index: {e}")
+            return None
+    
+    def _fetch_pdiff(self, base_url: str, index_dir: str, name: str, pdiff_index: Dict[str, Any]) -> bytes:
+        """
+        Fetch and verify a pdiff patch.
+        
+        Args:
+            base_url: Base URL of the repository.
+            index_dir: Directory of the Packages file.
+            name: Patch name from Packages.diff/Index.
+            pdiff_index: Parsed Packages.diff/Index file.
             
-            return result
+        Returns:
+            Uncompressed patch content.
             
-        finally:
-            # Restore the original base_url
-            self.base_url = original_base_url
+        Raises:
+            ValueError: If the patch does not match its checksum.
+        """
+        response = self._fetch_url(f"{base_url}/{index_dir}/Packages.diff/{name}.gz", headers=self.headers)
+        
+        expected = pdiff_index["downloads"].get(f"{name}.gz")
+        if expected and hashlib.sha256(response.content).hexdigest() != expected:
+            raise ValueError(f"Checksum mismatch for pdiff {name}.gz")
+        
+        patch = gzip.decompress(response.content)
+        expected = pdiff_index["patches"].get(name)
+        if expected and hashlib.sha256(patch).hexdigest() != expected:
+            raise ValueError(f"Checksum mismatch for pdiff {name}")
+        
+        return patch
     
-    def _fetch_packages_file(self, base_url: str, packages_path: str) -> Dict[str, Dict[str, any]]:
+    def _write_raw_packages(self, raw_path: str, content: bytes, compressed: bool = False) -> None:
+        """
+        Atomically write the kept copy of a Packages file.
+        
+        Args:
+            raw_path: Path of the Packages.gz copy.
+            content: Packages file content.
+            compressed: Whether the content is already gzipped.
+        """
+        if not compressed:
+            content = gzip.compress(content, compresslevel=1)
+        
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(raw_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, raw_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    
+    def _fetch_packages_file(
+        self,
+        base_url: str,
+        packages_path: str,
+        raw_path: Optional[str] = None,
+        cache_key: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse a Packages.gz file from an APT repository.
         
         Args:
             base_url: Base URL of the repository.
             packages_path: Path to the Packages.gz file.
+            raw_path: Optional path to keep a copy of the downloaded file at.
+            cache_key: Optional cache key a parse worker writes the packages to.
             
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        # Save the current base_url
-        original_base_url = self.base_url
+        # Fetch the Packages.gz file
+        response = self._fetch_url(f"{base_url}/{packages_path}")
         
-        try:
-            # Set the base_url for this request
-            self.base_url = base_url
-            
-            # Fetch the Packages.gz file
-            response = self._fetch_url(f"{base_url}/{packages_path}")
-            
-            # Decompress the gzipped content
-            with gzip.GzipFile(fileobj=io.BytesIO(response.content)) as f:
-                packages_text = f.read().decode("utf-8")
-            
-            # Parse the Packages file
-            return self._parse_packages_file(packages_text)
-            
-        finally:
-            # Restore the original base_url
-            self.base_url = original_base_url
+        if raw_path:
+            self._write_raw_packages(raw_path, response.content, compressed=True)
+        
+        # Decompress and parse the gzipped content, in a worker process if it is large
+        return self._parse_content(
+            parse_packages_content, response.content, True, self.package_fields, snapshot_key=cache_key
+        )
     
-    def _parse_packages_file(self, packages_text: str) -> Dict[str, Dict[str, any]]:
+    def _parse_packages_file(self, packages_text: Union[str, Iterable[str]]) -> Dict[str, Dict[str, Any]]:
         """
         Parse a Packages file from an APT repository.
         
         Args:
-            packages_text: Content of the Packages file.
+            packages_text: Content of the Packages file, or an iterable of its lines.
             
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        result = {}
-        current_package = None
-        current_data = {}
-        current_key = None
-        current_value = []
-        
-        for line in packages_text.splitlines():
-            if not line.strip():
-                # Empty line indicates end of a package entry
-                if current_key and current_package:
-                    current_data[current_key] = "\\n".join(current_value)
-                if current_package and current_data:
-                    result[current_package] = current_data
-                current_package = None
-                current_data = {}
-                current_key = None
-                current_value = []
-                continue
-                
-            if line.startswith(" "):
-                # Continuation of previous value
-                if current_key:
-                    current_value.append(line.strip())
-            else:
-                # New key-value pair
-                if current_key:
-                    current_data[current_key] = "\\n".join(current_value)
-                    current_value = []
-                
-                parts = line.split(":", 1)
-                if len(parts) == 2:
-                    current_key = parts[0].strip()
-                    current_value = [parts[1].strip()]
-                    
-                    # If this is the Package field, set the current package
-                    if current_key == "Package":
-                        current_package = current_value[0]
-        
-        # Add the last package (handle case where file doesn't end with empty line)
-        if current_key and current_package:
-            current_data[current_key] = "\\n".join(current_value)
-        if current_package and current_data:
-            result[current_package] = current_data
-        
-        return result
\ No newline at end of file
+        return parse_control_index(as_lines(packages_text), fields=self.package_fields)
\ No newline at end of file
@@ -0,0 +1,328 @@
+"""
+Asynchronous HTTP fetch engine for saidata-gen.
+
+Registry fetchers (PyPI, NPM, Cargo, NuGet, Docker, Snap and Flatpak) look up
+package details with one small JSON request per package. This module runs
+such requests concurrently on a shared event loop, so a fetcher can submit
+thousands of lookups at once instead of waiting for each request in turn.
+
+Requests go through a keep-alive connection pool with a global connection
+limit and a per-host concurrency limit, and honor the per-host rate limits of
+the shared fetcher transport. aiohttp is used when it is installed; otherwise
+requests are sent through the fetcher transport's pooled sessions on a thread
+pool driven by the same event loop.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Awaitable, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+# Try to import aiohttp, but don't fail if it's not available
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Try to import requests, but don't fail if it's not available
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+from saidata_gen.fetcher.transport import FetcherTransport, get_fetcher_transport
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFetchEngine:
+    """
+    Concurrent JSON fetcher running on a background event loop.
+    
+    The engine owns an event loop in a daemon thread and a connection pool
+    that is reused for all requests. Coroutines can be awaited on that loop
+    through ``submit``, and ``fetch_json_batch`` provides a blocking entry
+    point for the synchronous fetchers.
+    """
+    
+    def __init__(
+        self,
+        max_connections: int = 64,
+        max_connections_per_host: int = 8,
+        timeout: float = 30.0,
+        use_aiohttp: Optional[bool] = None,
+        transport: Optional[FetcherTransport] = None
+    ):
+        """
+        Initialize the fetch engine.
+        
+        Args:
+            max_connections: Maximum number of concurrent requests overall.
+            max_connections_per_host: Maximum number of concurrent requests per host.
+            timeout: Request timeout in seconds.
+            use_aiohttp: Whether to use aiohttp. If None, aiohttp is used when installed.
+            transport: Fetcher transport providing rate limits, metrics and, without
+                aiohttp, the connection pools. If None, the shared transport is used.
+        """
+        if use_aiohttp is None:
+            use_aiohttp = AIOHTTP_AVAILABLE
+        if use_aiohttp and not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for use_aiohttp=True")
+        if not use_aiohttp and not REQUESTS_AVAILABLE:
+            raise ImportError("Either aiohttp or requests is required for the async fetch engine")
+        
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.use_aiohttp = use_aiohttp
+        self._transport = transport
+        
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        
+        # Only accessed from the event loop thread
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._aiohttp_session = None
+        
+        # Runs blocking requests when aiohttp is not available
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    
+    @property
+    def transport(self) -> FetcherTransport:
+        """Fetcher transport used for rate limits and metrics."""
+        return self._transport or get_fetcher_transport()
+    
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the event loop thread if it is not running yet.
+        
+        Returns:
+            The engine's event loop.
+        """
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="saidata-async-fetch", daemon=True
+                )
+                thread.start()
+                
+                if not self.use_aiohttp:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.max_connections, thread_name_prefix="saidata-async-fetch"
+                    )
+                
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+    
+    def submit(self, coroutine: Awaitable[Any]) -> concurrent.futures.Future:
+        """
+        Run a coroutine on the engine's event loop.
+        
+        Args:
+            coroutine: Coroutine to run, e.g. ``engine.fetch_json_many(urls)``.
+        
+        Returns:
+            Future with the result of the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_started())
+    
+    def fetch_json_batch(
+        self,
+        urls: Iterable[str],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Union[Any, Exception]]:
+        """
+        Fetch JSON documents concurrently and wait for all of them.
+        
+        Args:
+            urls: URLs to fetch. Duplicates are fetched once.
+            headers: Optional headers to include in all requests.
+        
+        Returns:
+            Dictionary mapping each URL to its parsed JSON, or to the exception
+            raised while fetching it.
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        return self.submit(self.fetch_json_many(urls, headers)).result()
+    
+    async def fetch_json_many(
+        self,
+        urls: Iterable[str],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Union[Any, Exception]]:
+        """
+        Fetch JSON documents concurrently.
+        
+        Must be awaited on the engine's event loop (see ``submit``).
+        
+        Args:
+            urls: URLs to fetch.
+            headers: Optional headers to include in all requests.
+        
+        Returns:
+            Dictionary mapping each URL to its parsed JSON, or to the exception
+            raised while fetching it.
+        """
+        urls = list(urls)
+        results = await asyncio.gather(
+            *(self.fetch_json(url, headers) for url in urls), return_exceptions=True
+        )
+        return dict(zip(urls, results))
+    
+    async def fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Any:
+        """
+        Fetch a JSON document.
+        
+        Must be awaited on the engine's event loop (see ``submit``).
+        
+        Args:
+            url: URL to fetch.
+            headers: Optional headers to include in the request.
+        
+        Returns:
+            Parsed JSON data.
+        
+        Raises:
+            Exception: If the request fails or the response is not valid JSON.
+        """
+        async with self._host_semaphore(url):
+            await self._acquire_rate_limit(url)
+            
+            if self.use_aiohttp:
+                host = urlsplit(url).netloc
+                with self.transport.monitor.timer("http_request", {"method": "GET", "host": host}):
+                    session = self._get_aiohttp_session()
+                    async with session.get(url, headers=headers) as response:
+                        self.transport.monitor.increment_counter(
+                            "http_requests_total", 1.0,
+                            {"method": "GET", "host": host, "status_code": str(response.status)}
+                        )
+                        response.raise_for_status()
+                        return await response.json(content_type=None)
+            
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._blocking_fetch_json, url, headers)
+    
+    async def _acquire_rate_limit(self, url: str) -> None:
+        """
+        Wait for a rate limit token of the URL's host without blocking the event loop.
+        
+        Args:
+            url: Request URL.
+        """
+        rate_limiter = self.transport.get_rate_limiter(url)
+        if rate_limiter is None:
+            return
+        
+        while not rate_limiter.acquire(timeout=0):
+            await asyncio.sleep(max(0.01, 1.0 / rate_limiter.requests_per_second / 2))
+    
+    def _blocking_fetch_json(self, url: str, headers: Optional[Dict[str, str]]) -> Any:
+        """
+        Fetch a JSON document through the fetcher transport.
+        
+        Args:
+            url: URL to fetch.
+            headers: Optional headers to include in the request.
+            
+        Returns:
+            Parsed JSON data.
+        """
+        response = self.transport.get(url, headers=headers, timeout=self.timeout, rate_limit=False)
+        response.raise_for_status()
+        return response.json()
+    
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting concurrent requests to the host of a URL.
+        
+        Args:
+            url: Request URL.
+        
+        Returns:
+            Semaphore for the host.
+        """
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+    
+    def _get_aiohttp_session(self) -> "aiohttp.ClientSession":
+        """
+        Get the aiohttp session, creating it on first use.
+        
+        Returns:
+            Session with a keep-alive connection pool.
+        """
+        if self._aiohttp_session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host
+            )
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._aiohttp_session
+    
+    def close(self) -> None:
+        """Close the connection pool and stop the event loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        
+        if loop is None:
+            return
+        
+        if self._aiohttp_session is not None:
+            asyncio.run_coroutine_threadsafe(self._aiohttp_session.close(), loop).result()
+            self._aiohttp_session = None
+        
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        self._host_semaphores.clear()
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# Shared engines, one per connection settings
+_engines: Dict[Tuple[int, float], AsyncFetchEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_async_fetch_engine(max_connections_per_host: int = 8, timeout: float = 30.0) -> AsyncFetchEngine:
+    """
+    Get the shared fetch engine for the given connection settings.
+    
+    Args:
+        max_connections_per_host: Maximum number of concurrent requests per host.
+        timeout: Request timeout in seconds.
+    
+    Returns:
+        AsyncFetchEngine instance.
+    """
+    key = (max_connections_per_host, timeout)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = AsyncFetchEngine(
+                max_connections_per_host=max_connections_per_host,
+                timeout=timeout
+            )
+            _engines[key] = engine
+        return engine
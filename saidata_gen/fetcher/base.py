@@ -10,10 +10,14 @@ import hashlib
 import json
 import logging
 import os
+import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 # Try to import requests, but don't fail if it's not available
 try:
@@ -81,11 +85,32 @@ except ImportError:
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageInfo, RepositoryData
 )
+from saidata_gen.fetcher.async_http import get_async_fetch_engine
+from saidata_gen.fetcher.command_batch import CommandBatcher
+from saidata_gen.fetcher.git_objects import GitObjectReader
+from saidata_gen.fetcher.index import PackageIndex, package_texts
+from saidata_gen.fetcher.parse_pool import parse_to_snapshot, run_parse, should_parse_in_worker
+from saidata_gen.fetcher.snapshot import PackageSnapshot, write_snapshot
+from saidata_gen.fetcher.transport import TransportSession, get_fetcher_transport
 
 
 logger = logging.getLogger(__name__)
 
 
+class NotModifiedError(Exception):
+    """
+    Raised when a conditional request is answered with 304 Not Modified.
+    
+    The stale cache entry being revalidated is still current and only its
+    TTL needs to be refreshed.
+    """
+    
+    def __init__(self, url: str, cache_key: str):
+        super().__init__(f"Not modified since last fetch: {url}")
+        self.url = url
+        self.cache_key = cache_key
+
+
 class RepositoryFetcher(abc.ABC):
     """
     Abstract base class for repository fetchers.
@@ -94,6 +119,22 @@ class RepositoryFetcher(abc.ABC):
     different package repositories.
     """
     
+    # Package data fields searched besides the package name. Fetchers that keep
+    # their packages in ``_package_cache`` set this to use the package index.
+    index_text_fields: Tuple[str, ...] = ()
+    
+    # Whether ``_package_cache`` maps cache keys (e.g. repositories) to packages,
+    # rather than package names directly to package data
+    nested_package_cache: bool = True
+    
+    # Package data fields that may hold the homepage of a package
+    homepage_fields: Tuple[str, ...] = ("homepage", "Homepage", "home_page", "url", "URL", "www", "U")
+    
+    # Seconds before parts of the repository that failed to load are retried;
+    # the delay doubles with every failed attempt up to the maximum
+    warm_up_retry_delay: float = 30.0
+    max_warm_up_retry_delay: float = 900.0
+    
     def __init__(self, config: Optional[FetcherConfig] = None):
         """
         Initialize the repository fetcher.
@@ -111,6 +152,483 @@ class RepositoryFetcher(abc.ABC):
         # Track SSL issues for fallback handling
         self._ssl_failed_urls = set()
         self._fallback_urls = {}
+        
+        # Guards the initial repository load when the fetcher is shared between threads
+        self._warm_up_lock = threading.RLock()
+        self._warmed_up = False
+        
+        # Parts of the repository that failed to load, and when to retry them
+        self._warm_up_errors: Dict[str, str] = {}
+        self._warm_up_attempts = 0
+        self._warm_up_retry_at = 0.0
+        self._warm_up_retrying = False
+        self._warm_up_retry_lock = threading.Lock()
+        
+        # Inverted index over the package cache, built after repository data is fetched
+        self._package_index: Optional[PackageIndex] = None
+        self._package_index_lock = threading.Lock()
+        
+        # Content digests of package cache entries, reported by get_index_version
+        self._packages_digests: Dict[str, Tuple[Any, str]] = {}
+        
+        # Conditional request state: the cache key being revalidated by the current
+        # thread, and validators of fetched responses waiting to be saved with their entry
+        self._revalidation = threading.local()
+        self._pending_validators: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self._validators_lock = threading.Lock()
+    
+    def warm_up(self) -> Optional[FetchResult]:
+        """
+        Load repository data once so the fetcher can be shared between threads.
+        
+        Fetchers load their repository indexes lazily on the first lookup. When
+        several worker threads share one fetcher, calling this method first
+        makes sure the index is loaded exactly once instead of concurrently by
+        every worker.
+        
+        The fetcher is warm once any repository data has loaded. Parts that
+        failed to load are retried in the background after a backoff delay,
+        so lookups never wait for a repeated load. A load that raises or
+        loads nothing is retried by the first call after the delay.
+        
+        Returns:
+            FetchResult of the repository load, or None if the fetcher was
+            already warm or the retry delay has not passed.
+        """
+        if self._warmed_up:
+            self._schedule_warm_up_retry()
+            return None
+        
+        with self._warm_up_lock:
+            if self._warmed_up or time.monotonic() < self._warm_up_retry_at:
+                return None
+            
+            try:
+                result = self.fetch_repository_data()
+            except Exception as e:
+                self._record_warm_up(FetchResult(success=False, errors={"repository": str(e)}))
+                raise
+            
+            self._record_warm_up(result)
+            return result
+    
+    def get_warm_up_errors(self) -> Dict[str, str]:
+        """
+        Get the parts of the repository that failed to load during warm-up.
+        
+        Returns:
+            Dictionary mapping each failed part to its error message.
+        """
+        return dict(self._warm_up_errors)
+    
+    def _record_warm_up(self, result: Optional[FetchResult]) -> None:
+        """
+        Record the outcome of a repository load and schedule retries of failed parts.
+        
+        Args:
+            result: Result of ``fetch_repository_data``.
+        """
+        if getattr(result, "success", True):
+            self._warmed_up = True
+            self._warm_up_errors = {}
+            self._warm_up_attempts = 0
+            return
+        
+        if any(result.providers.values()) or any(result.cache_hits.values()):
+            self._warmed_up = True
+        
+        errors = dict(result.errors)
+        for part, loaded in result.providers.items():
+            if not loaded:
+                errors.setdefault(part, "failed to load")
+        
+        self._warm_up_errors = errors
+        self._warm_up_attempts += 1
+        delay = min(
+            self.warm_up_retry_delay * 2 ** (self._warm_up_attempts - 1),
+            self.max_warm_up_retry_delay
+        )
+        self._warm_up_retry_at = time.monotonic() + delay
+        logger.warning(
+            f"Failed to load {', '.join(sorted(errors)) or 'repository data'} for "
+            f"{self.get_repository_name()}, retrying in {delay:.0f}s"
+        )
+    
+    def _schedule_warm_up_retry(self) -> None:
+        """Start a background retry of failed repository parts if one is due."""
+        with self._warm_up_retry_lock:
+            if (not self._warm_up_errors or self._warm_up_retrying
+                    or time.monotonic() < self._warm_up_retry_at):
+                return
+            self._warm_up_retrying = True
+        
+        thread = threading.Thread(
+            target=self._retry_warm_up,
+            name=f"warm-up-retry-{self.get_repository_name()}",
+            daemon=True
+        )
+        thread.start()
+    
+    def _retry_warm_up(self) -> None:
+        """
+        Reload the repository data to retry the parts that failed to load.
+        
+        Parts that loaded before are served from the cache; unchanged
+        snapshots and the package index built on them are kept.
+        """
+        try:
+            with self._warm_up_lock:
+                try:
+                    result = self.fetch_repository_data()
+                except Exception as e:
+                    result = FetchResult(success=False, errors={"repository": str(e)})
+                self._record_warm_up(result)
+        finally:
+            with self._warm_up_retry_lock:
+                self._warm_up_retrying = False
+    
+    def _build_package_index(self) -> PackageIndex:
+        """
+        Build the package index from the current package cache.
+        
+        Fetchers call this once ``fetch_repository_data`` has filled the cache.
+        
+        Returns:
+            The new package index.
+        """
+        package_cache = getattr(self, "_package_cache", {})
+        index = self._package_index
+        if (index is not None and index.text_fields == tuple(self.index_text_fields)
+                and index.signature == PackageIndex.cache_signature(package_cache)):
+            return index
+        
+        index = PackageIndex(package_cache, self.index_text_fields)
+        with self._package_index_lock:
+            self._package_index = index
+        logger.debug(f"Indexed {len(index)} packages for {self.get_repository_name()}")
+        return index
+    
+    def _set_package_cache_entry(self, cache_key: str, packages: Mapping[str, Any]) -> None:
+        """
+        Store the packages of a repository in the package cache.
+        
+        A memory-mapped snapshot replaced by the new packages is closed. A
+        newly opened snapshot of the unchanged file is closed instead, so
+        readers of the current one and the package index built on it are
+        not disturbed.
+        
+        Args:
+            cache_key: Package cache key of the repository.
+            packages: Packages of the repository.
+        """
+        previous = self._package_cache.get(cache_key)
+        if previous is packages:
+            return
+        
+        if (isinstance(previous, PackageSnapshot) and isinstance(packages, PackageSnapshot)
+                and not previous.closed and previous.path == packages.path
+                and previous.file_version == packages.file_version):
+            packages.close()
+            return
+        
+        self._package_cache[cache_key] = packages
+        if isinstance(previous, PackageSnapshot):
+            previous.close()
+    
+    def _get_package_index(self) -> PackageIndex:
+        """
+        Get the package index, rebuilding it if the package cache has changed.
+        
+        Returns:
+            Package index matching the current package cache.
+        """
+        package_cache = getattr(self, "_package_cache", {})
+        index = self._package_index
+        if index is None or index.signature != PackageIndex.cache_signature(package_cache):
+            index = self._build_package_index()
+        return index
+    
+    def _get_indexed_package_info(self, package_name: str) -> Optional[PackageInfo]:
+        """
+        Get information about a package through the package index.
+        
+        The PackageInfo is created by the fetcher's
+        ``_create_package_info(package_name, package_data)``.
+        
+        Args:
+            package_name: Name of the package to get information for.
+            
+        Returns:
+            PackageInfo if the package is found, None otherwise.
+        """
+        # Ensure we have loaded repository data
+        if not self._package_cache:
+            self.warm_up()
+        
+        cache_key = self._get_package_index().lookup(package_name)
+        if cache_key is None:
+            return None
+        
+        return self._create_package_info(package_name, self._package_cache[cache_key][package_name])
+    
+    def _search_indexed_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
+        """
+        Search for packages through the package index.
+        
+        Packages found in several repositories are returned once, in cache
+        order, as created by the fetcher's ``_create_package_info``.
+        
+        Args:
+            query: Search query.
+            max_results: Maximum number of results to return.
+            
+        Returns:
+            List of PackageInfo objects matching the query.
+        """
+        # Ensure we have loaded repository data
+        if not self._package_cache:
+            self.warm_up()
+        
+        results = []
+        seen = set()
+        
+        for cache_key, pkg_name in self._get_package_index().search(query):
+            if pkg_name in seen:
+                continue
+            
+            seen.add(pkg_name)
+            results.append(self._create_package_info(pkg_name, self._package_cache[cache_key][pkg_name]))
+            if len(results) >= max_results:
+                break
+        
+        return results
+    
+    def get_all_package_names(self) -> List[str]:
+        """
+        Get the names of all packages in the loaded repository data.
+        
+        The repository data is loaded first if necessary. Names come from the
+        package index when it is up to date, and from the keys of the package
+        cache otherwise, so package data is not decoded.
+        
+        Returns:
+            Sorted list of unique package names.
+        """
+        if not getattr(self, "_package_cache", None):
+            self.warm_up()
+        return self._collect_package_names(getattr(self, "_package_cache", None) or {})
+    
+    def _collect_package_names(self, package_cache: Mapping[str, Any]) -> List[str]:
+        """
+        Collect the package names of a package cache.
+        
+        Args:
+            package_cache: Package cache, laid out as described by ``nested_package_cache``.
+            
+        Returns:
+            Sorted list of unique package names.
+        """
+        if not self.nested_package_cache:
+            return sorted(package_cache)
+        
+        index = self._package_index
+        if index is not None and index.signature == PackageIndex.cache_signature(package_cache):
+            return index.names()
+        
+        names: Set[str] = set()
+        for packages in package_cache.values():
+            if isinstance(packages, Mapping):
+                names.update(packages)
+        return sorted(names)
+    
+    def get_index_version(self) -> Tuple[Any, ...]:
+        """
+        Get a token identifying the loaded repository data.
+        
+        The token is derived from the package data, so it is the same in every
+        process that loads the same data and changes when the data changes.
+        Snapshot-backed entries use the content digest stored in the snapshot;
+        other entries are hashed once per loaded object.
+        
+        Returns:
+            Tuple of (cache key, digest) for each entry of the package cache;
+            empty if no repository data is loaded.
+        """
+        package_cache = getattr(self, "_package_cache", None)
+        if not isinstance(package_cache, Mapping):
+            return ()
+        
+        entries = package_cache.items() if self.nested_package_cache else [("", package_cache)]
+        return tuple(
+            (cache_key, self._get_packages_digest(cache_key, packages))
+            for cache_key, packages in list(entries)
+        )
+    
+    def _get_packages_digest(self, cache_key: str, packages: Any) -> str:
+        """
+        Get the content digest of a package cache entry.
+        
+        Args:
+            cache_key: Package cache key of the entry.
+            packages: Packages of the entry.
+        
+        Returns:
+            Hex digest of the package names and data.
+        """
+        if isinstance(packages, PackageSnapshot):
+            if packages.digest:
+                return packages.digest
+            try:
+                stat = os.stat(packages.path)
+                return f"{packages.path}:{stat.st_mtime_ns}:{stat.st_size}"
+            except OSError:
+                pass
+        
+        digests = self._packages_digests
+        known = digests.get(cache_key)
+        if known is not None and known[0] is packages:
+            return known[1]
+        
+        content_digest = hashlib.blake2b(digest_size=16)
+        if isinstance(packages, Mapping):
+            for name, pkg_data in packages.items():
+                content_digest.update(str(name).encode("utf-8", "surrogatepass") + b"\x00")
+                content_digest.update(
+                    json.dumps(pkg_data, sort_keys=True, default=str).encode("utf-8", "surrogatepass") + b"\x00"
+                )
+        digest = content_digest.hexdigest()
+        
+        # Keeps a reference to the hashed entry so its identity cannot be reused
+        digests[cache_key] = (packages, digest)
+        return digest
+    
+    def iter_package_summaries(self) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        """
+        Iterate over the description and homepage of all packages in the loaded repository data.
+        
+        Descriptions come from ``index_text_fields`` (or a "description" field)
+        and homepages from the first ``homepage_fields`` value that is an HTTP URL.
+        
+        Returns:
+            Iterator of (package name, description, homepage) for every name of
+            ``get_all_package_names``; description and homepage may be None.
+        """
+        names = set(self.get_all_package_names())
+        package_cache = getattr(self, "_package_cache", None) or {}
+        entries = package_cache.values() if self.nested_package_cache else [package_cache]
+        
+        for packages in entries:
+            if not isinstance(packages, Mapping):
+                continue
+            for pkg_name, pkg_data in packages.items():
+                if pkg_name not in names or not isinstance(pkg_data, Mapping):
+                    continue
+                names.discard(pkg_name)
+                
+                texts = package_texts(pkg_data, self.index_text_fields or ("description",))
+                homepages = [
+                    value for value in package_texts(pkg_data, self.homepage_fields)
+                    if value.startswith(("http://", "https://"))
+                ]
+                yield pkg_name, texts[0] if texts else None, homepages[0] if homepages else None
+        
+        for pkg_name in sorted(names):
+            yield pkg_name, None, None
+    
+    def _run_concurrently(self, func: Callable[[Any], Any], items: List[Any]) -> List[Tuple[Any, Any, Optional[Exception]]]:
+        """
+        Run a function for independent items on a bounded thread pool.
+        
+        Fetchers use this to download and parse several repository indexes at
+        once. At most ``config.concurrent_requests`` items run at the same time.
+        
+        Args:
+            func: Function called with each item.
+            items: Items to process.
+            
+        Returns:
+            List of (item, result, error) tuples in the order of the items. The
+            error is the exception raised for the item, or None.
+        """
+        def run(item: Any) -> Tuple[Any, Optional[Exception]]:
+            try:
+                return func(item), None
+            except Exception as e:
+                return None, e
+        
+        max_workers = max(1, min(self.config.concurrent_requests, len(items)))
+        if max_workers == 1:
+            outcomes = [run(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(run, items))
+        
+        return [(item, outcome, error) for item, (outcome, error) in zip(items, outcomes)]
+    
+    def _parse_content(
+        self,
+        func: Callable[..., Any],
+        content: bytes,
+        *args: Any,
+        snapshot_key: Optional[str] = None
+    ) -> Any:
+        """
+        Parse the raw content of a repository index, in a worker process if it is large.
+        
+        Args:
+            func: Module-level parse function called as ``func(content, *args)``.
+            content: Raw content of the index.
+            *args: Additional arguments for the parse function.
+            snapshot_key: Cache key of the parsed packages. If given, a worker writes
+                the packages as the snapshot of this key instead of sending them back,
+                and the memory-mapped snapshot is returned. ``_save_to_cache`` does
+                not write such a snapshot again.
+            
+        Returns:
+            Result of the parse function.
+        """
+        workers = self.config.parse_workers
+        if snapshot_key is None or not should_parse_in_worker(content, workers):
+            return run_parse(func, content, *args, max_workers=workers)
+        
+        snapshot_path = self._get_snapshot_path(snapshot_key)
+        packages = run_parse(
+            parse_to_snapshot, content, snapshot_path, self.index_text_fields, func, *args,
+            max_workers=workers
+        )
+        return PackageSnapshot(snapshot_path) if packages is None else packages
+    
+    def _create_command_batcher(
+        self,
+        name: str,
+        run_batch: Callable[[List[str]], Dict[str, Any]],
+        batch_size: int = 50,
+        persist: bool = True
+    ) -> CommandBatcher:
+        """
+        Create a batcher resolving package lookups with bulk commands.
+        
+        Args:
+            name: Name of the lookup, used for the cache key.
+            run_batch: Function running one bulk command for a list of keys and
+                returning the parsed result of each key found.
+            batch_size: Maximum number of keys passed to one command.
+            persist: Whether results are saved to and restored from the cache.
+            
+        Returns:
+            CommandBatcher instance.
+        """
+        if not persist:
+            return CommandBatcher(run_batch, batch_size)
+        
+        cache_key = f"{self.get_repository_name()}_{name}"
+        cached_results = self._get_from_cache(cache_key)
+        return CommandBatcher(
+            run_batch,
+            batch_size,
+            cached_results=cached_results if isinstance(cached_results, dict) else None,
+            save_results=lambda results: self._save_to_cache(cache_key, results)
+        )
     
     def register_fallback_urls(self, primary_url: str, fallback_urls: List[str]) -> None:
         """
@@ -137,31 +655,17 @@ class RepositoryFetcher(abc.ABC):
     
     def _create_session(self) -> requests.Session:
         """
-        Create a requests session with enhanced retry logic and SSL handling.
+        Create the session used for the fetcher's requests.
+        
+        Requests go through the shared fetcher transport, which keeps pooled
+        sessions per host with per-host connection limits and the rate limits
+        configured in repository_urls.yaml. Failed requests are retried
+        ``config.retry_count`` times.
         
         Returns:
-            A configured requests session.
+            A session backed by the shared transport.
         """
-        session = requests.Session()
-        
-        # Configure retry strategy - don't retry on SSL errors initially
-        retry_strategy = Retry(
-            total=self.config.retry_count,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD"],
-            # Don't retry on SSL errors in the adapter - we'll handle them manually
-            raise_on_status=False
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Set reasonable timeout
-        session.timeout = 30
-        
-        return session
+        return TransportSession(get_fetcher_transport(), max_retries=self.config.retry_count)
     
     def _create_session_with_ssl_fallback(self, verify_ssl: bool = True) -> requests.Session:
         """
@@ -265,6 +769,30 @@ class RepositoryFetcher(abc.ABC):
         os.makedirs(cache_dir, exist_ok=True)
         return os.path.join(cache_dir, f"{key_hash}.json")
     
+    def _get_snapshot_path(self, key: str) -> str:
+        """
+        Get the snapshot path for a given key.
+        
+        Args:
+            key: Cache key.
+            
+        Returns:
+            Path to the binary snapshot file.
+        """
+        return os.path.splitext(self._get_cache_path(key))[0] + ".snap"
+    
+    def _get_validators_path(self, key: str) -> str:
+        """
+        Get the path of the HTTP validators stored alongside a cache entry.
+        
+        Args:
+            key: Cache key.
+            
+        Returns:
+            Path to the validators file.
+        """
+        return os.path.splitext(self._get_cache_path(key))[0] + ".validators.json"
+    
     def _is_cache_valid(self, cache_path: str) -> bool:
         """
         Check if the cache is valid.
@@ -287,12 +815,22 @@ class RepositoryFetcher(abc.ABC):
         """
         Get data from the cache.
         
+        Package maps saved as snapshots are returned as a memory-mapped
+        PackageSnapshot, which is read like a dictionary.
+        
         Args:
             key: Cache key.
             
         Returns:
             Cached data if available and valid, None otherwise.
         """
+        snapshot_path = self._get_snapshot_path(key)
+        if self._is_cache_valid(snapshot_path):
+            try:
+                return PackageSnapshot(snapshot_path)
+            except Exception as e:
+                logger.warning(f"Failed to read snapshot for {key}: {e}")
+        
         cache_path = self._get_cache_path(key)
         
         if not self._is_cache_valid(cache_path):
@@ -305,27 +843,251 @@ class RepositoryFetcher(abc.ABC):
             logger.warning(f"Failed to read cache for {key}: {e}")
             return None
     
-    def _save_to_cache(self, key: str, data: Dict[str, Any]) -> None:
+    def _save_to_cache(self, key: str, data: Dict[str, Any], snapshot: bool = False) -> None:
         """
         Save data to the cache.
         
         Args:
             key: Cache key.
             data: Data to cache.
+            snapshot: Whether to save the data as a binary package snapshot instead
+                of JSON. Use this for mappings of package names to package data.
         """
+        if snapshot:
+            snapshot_path = self._get_snapshot_path(key)
+            if isinstance(data, PackageSnapshot) and os.path.abspath(data.path) == os.path.abspath(snapshot_path):
+                # Already written, e.g. by a parse worker
+                os.utime(snapshot_path, None)
+                self._save_validators(key)
+                return
+            
+            try:
+                write_snapshot(snapshot_path, data, self.index_text_fields)
+                self._save_validators(key)
+                return
+            except Exception as e:
+                logger.warning(f"Failed to write snapshot for {key}, falling back to JSON: {e}")
+        
         cache_path = self._get_cache_path(key)
         
         try:
             with open(cache_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
+            self._save_validators(key)
         except Exception as e:
             logger.warning(f"Failed to write cache for {key}: {e}")
     
+    def _has_cache_entry(self, key: str) -> bool:
+        """
+        Check if a cache entry exists, whether or not it has expired.
+        
+        Args:
+            key: Cache key.
+            
+        Returns:
+            True if a snapshot or JSON cache file exists for the key.
+        """
+        return os.path.exists(self._get_snapshot_path(key)) or os.path.exists(self._get_cache_path(key))
+    
+    def _refresh_cache(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Mark an expired cache entry as fresh again and return it.
+        
+        Used after the server confirmed with 304 Not Modified that the cached
+        data is still current.
+        
+        Args:
+            key: Cache key.
+            
+        Returns:
+            Cached data, or None if the entry could not be read.
+        """
+        for path in (self._get_snapshot_path(key), self._get_cache_path(key)):
+            if os.path.exists(path):
+                try:
+                    os.utime(path, None)
+                except OSError as e:
+                    logger.warning(f"Failed to refresh cache file {path}: {e}")
+        
+        self._save_validators(key, merge=True)
+        return self._get_from_cache(key)
+    
+    def _load_validators(self, key: str) -> Dict[str, Dict[str, str]]:
+        """
+        Load the HTTP validators stored for a cache entry.
+        
+        Args:
+            key: Cache key.
+            
+        Returns:
+            Dictionary mapping URLs to their ETag, Last-Modified and published checksum values.
+        """
+        validators_path = self._get_validators_path(key)
+        if not os.path.exists(validators_path):
+            return {}
+        
+        try:
+            with open(validators_path, 'r', encoding='utf-8') as f:
+                validators = json.load(f)
+            return validators if isinstance(validators, dict) else {}
+        except Exception as e:
+            logger.warning(f"Failed to read validators for {key}: {e}")
+            return {}
+    
+    def _save_validators(self, key: str, merge: bool = False) -> None:
+        """
+        Save the validators of the responses fetched for a cache entry.
+        
+        Args:
+            key: Cache key.
+            merge: Whether to merge the new validators into the stored ones. If
+                False, the stored validators are replaced, and removed when the
+                entry was fetched without any.
+        """
+        with self._validators_lock:
+            pending = self._pending_validators.pop(key, {})
+        
+        validators = self._load_validators(key) if merge else {}
+        validators.update(pending)
+        
+        validators_path = self._get_validators_path(key)
+        try:
+            if validators:
+                with open(validators_path, 'w', encoding='utf-8') as f:
+                    json.dump(validators, f, indent=2)
+            elif os.path.exists(validators_path):
+                os.remove(validators_path)
+        except Exception as e:
+            logger.warning(f"Failed to write validators for {key}: {e}")
+    
+    @contextmanager
+    def _revalidating(self, key: Optional[str], conditional: bool = True) -> Iterator[None]:
+        """
+        Associate the URL fetches in this block with a cache entry.
+        
+        Validators of the responses are kept until the entry is saved. When the
+        block is conditional, requests for URLs with stored validators send
+        If-None-Match and If-Modified-Since headers, and a 304 response raises
+        NotModifiedError.
+        
+        Args:
+            key: Cache key of the entry being fetched, or None for plain fetches.
+            conditional: Whether to send conditional requests. Only pass True
+                when the entry the validators describe still exists.
+        """
+        previous = getattr(self._revalidation, "state", None)
+        self._revalidation.state = (key, conditional) if key is not None else None
+        try:
+            yield
+        finally:
+            self._revalidation.state = previous
+    
+    def _fetch_with_revalidation(self, key: str, fetch: Callable[[], Any]) -> Tuple[Optional[Any], Optional[Any]]:
+        """
+        Fetch the data for a cache entry, revalidating an expired entry if there is one.
+        
+        Args:
+            key: Cache key.
+            fetch: Function fetching the data.
+            
+        Returns:
+            Tuple of (fetched data, cached data). The fetched data is None when
+            the server reported the expired entry unchanged; the cached data is
+            then the refreshed entry.
+        """
+        try:
+            with self._revalidating(key, conditional=self._has_cache_entry(key)):
+                return fetch(), None
+        except NotModifiedError:
+            cached_data = self._refresh_cache(key)
+            if cached_data is not None:
+                logger.debug(f"Cache entry {key} is unchanged, refreshed its TTL")
+                return None, cached_data
+        except Exception:
+            # Validators of a failed fetch must not be saved with a later entry
+            with self._validators_lock:
+                self._pending_validators.pop(key, None)
+            raise
+        
+        # The entry disappeared or is unreadable, so fetch it again unconditionally
+        with self._revalidating(key, conditional=False):
+            return fetch(), None
+    
+    def _conditional_headers(self, key: str, url: str) -> Dict[str, str]:
+        """
+        Get the conditional request headers for a URL.
+        
+        Args:
+            key: Cache key being revalidated.
+            url: URL to fetch.
+            
+        Returns:
+            If-None-Match and If-Modified-Since headers, if validators are stored.
+        """
+        validators = self._load_validators(key).get(url, {})
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+    
+    def _remember_validators(self, key: str, url: str, response: requests.Response) -> None:
+        """
+        Keep the validators of a response until its cache entry is saved.
+        
+        Args:
+            key: Cache key the response belongs to.
+            url: Requested URL.
+            response: Response object.
+        """
+        response_headers = getattr(response, "headers", None) or {}
+        validators = {}
+        for header, name in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+            value = response_headers.get(header)
+            if isinstance(value, str) and value:
+                validators[name] = value
+        
+        if validators:
+            with self._validators_lock:
+                self._pending_validators.setdefault(key, {}).setdefault(url, {}).update(validators)
+    
+    def _revalidate_checksum(self, key: str, url: str, checksum: Optional[str]) -> None:
+        """
+        Check a file against the checksum published for it by the repository metadata.
+        
+        Repository metadata such as APT Release files and repomd.xml lists the
+        checksums of the index files. If the checksum of a file matches the one
+        stored with the cache entry built from it, the file does not have to be
+        downloaded again. Otherwise the checksum is kept and saved with the new
+        entry, like the HTTP validators.
+        
+        Args:
+            key: Cache key of the entry built from the file.
+            url: URL of the file.
+            checksum: Published checksum, e.g. "sha256:<hex digest>", or None if unknown.
+            
+        Raises:
+            NotModifiedError: If the cached entry was built from a file with the same checksum.
+        """
+        if not checksum:
+            return
+        
+        if self._has_cache_entry(key) and self._load_validators(key).get(url, {}).get("checksum") == checksum:
+            raise NotModifiedError(url, key)
+        
+        with self._validators_lock:
+            self._pending_validators.setdefault(key, {}).setdefault(url, {})["checksum"] = checksum
+    
     def _fetch_url(self, url: str, headers: Optional[Dict[str, str]] = None, 
                    fallback_urls: Optional[List[str]] = None) -> requests.Response:
         """
         Fetch data from a URL with enhanced retry logic and SSL fallback handling.
         
+        Inside a ``_revalidating`` block the response validators are recorded
+        for the cache entry, and the request may be conditional on the
+        validators stored for it.
+        
         Args:
             url: URL to fetch.
             headers: Optional headers to include in the request.
@@ -336,13 +1098,42 @@ class RepositoryFetcher(abc.ABC):
             
         Raises:
             requests.exceptions.RequestException: If the request fails after retries.
+            NotModifiedError: If a conditional request is answered with 304 Not Modified.
         """
         headers = headers or {}
         fallback_urls = fallback_urls or []
         
-        # Try the primary URL first
-        urls_to_try = [url] + fallback_urls
+        revalidation = getattr(self._revalidation, "state", None)
+        if revalidation is None:
+            return self._fetch_url_with_fallbacks([url] + fallback_urls, headers)
+        
+        revalidation_key, conditional = revalidation
+        conditional_headers = self._conditional_headers(revalidation_key, url) if conditional else {}
+        response = self._fetch_url_with_fallbacks(
+            [url] + fallback_urls, {**headers, **conditional_headers}
+        )
+        
+        if conditional_headers and response.status_code == 304:
+            raise NotModifiedError(url, revalidation_key)
         
+        self._remember_validators(revalidation_key, url, response)
+        return response
+    
+    def _fetch_url_with_fallbacks(self, urls_to_try: List[str], 
+                                  headers: Dict[str, str]) -> requests.Response:
+        """
+        Fetch the first URL that succeeds, falling back to the next URL on errors.
+        
+        Args:
+            urls_to_try: URLs to try, primary URL first.
+            headers: Headers to include in the request.
+            
+        Returns:
+            Response object.
+            
+        Raises:
+            requests.exceptions.RequestException: If all URLs fail.
+        """
         for attempt, current_url in enumerate(urls_to_try):
             try:
                 return self._fetch_url_with_retries(current_url, headers, attempt + 1)
@@ -476,11 +1267,14 @@ class HttpRepositoryFetcher(RepositoryFetcher):
         Get the full URL for a path.
         
         Args:
-            path: Path to append to the base URL.
+            path: Path to append to the base URL, or an absolute URL.
             
         Returns:
             Full URL.
         """
+        if "://" in path:
+            return path
+        
         path = path.lstrip('/')
         return f"{self.base_url}/{path}"
     
@@ -511,25 +1305,128 @@ class HttpRepositoryFetcher(RepositoryFetcher):
         
         # Combine provided fallback URLs with base URL fallbacks
         all_fallback_urls = fallback_urls or []
-        if self.fallback_base_urls:
+        if self.fallback_base_urls and "://" not in path:
             for fallback_base in self.fallback_base_urls:
                 fallback_url = f"{fallback_base}/{path.lstrip('/')}"
                 all_fallback_urls.append(fallback_url)
         
-        response = self._fetch_url(url, headers=self.headers, fallback_urls=all_fallback_urls)
+        def fetch() -> Dict[str, Any]:
+            response = self._fetch_url(url, headers=self.headers, fallback_urls=all_fallback_urls)
+            
+            try:
+                return response.json()
+            except ValueError as e:
+                logger.error(f"Failed to parse JSON from {url}: {e}")
+                # Try to provide more context about the response
+                logger.debug(f"Response content (first 500 chars): {response.text[:500]}")
+                raise
+        
+        if not use_cache:
+            return fetch()
+        
+        # Revalidate an expired cache entry instead of downloading it again
+        data, cached_data = self._fetch_with_revalidation(cache_key, fetch)
+        if cached_data is not None:
+            return cached_data
+        
+        self._save_to_cache(cache_key, data)
+        return data
+    
+    def _fetch_json_many(self, paths: List[str], use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Fetch JSON data for many paths concurrently.
         
-        try:
-            data = response.json()
-        except ValueError as e:
-            logger.error(f"Failed to parse JSON from {url}: {e}")
-            # Try to provide more context about the response
-            logger.debug(f"Response content (first 500 chars): {response.text[:500]}")
-            raise
+        Cached responses are served from the cache; the remaining paths are
+        fetched together through the shared async fetch engine, which limits
+        concurrent requests per host and keeps connections alive between them.
+        Requests that fail for other reasons than a client error (such as 404
+        Not Found) are retried through ``_fetch_json``, with its retries,
+        SSL fallback and fallback URLs.
         
-        if use_cache:
-            self._save_to_cache(cache_key, data)
+        Args:
+            paths: Paths to append to the base URL.
+            use_cache: Whether to use the cache.
+            
+        Returns:
+            Dictionary mapping each path to its parsed JSON data. Paths that
+            could not be fetched are omitted.
+        """
+        results: Dict[str, Any] = {}
+        urls: Dict[str, str] = {}
+        
+        for path in dict.fromkeys(paths):
+            url = self._get_url(path)
+            if use_cache:
+                cached_data = self._get_from_cache(f"json:{url}")
+                if cached_data is not None:
+                    results[path] = cached_data
+                    continue
+            urls[url] = path
         
-        return data
+        if not urls:
+            return results
+        
+        engine = get_async_fetch_engine(
+            max_connections_per_host=self.config.concurrent_requests,
+            timeout=self.config.request_timeout
+        )
+        responses = engine.fetch_json_batch(urls, headers=self.headers)
+        
+        retry_paths = []
+        for url, data in responses.items():
+            if isinstance(data, Exception):
+                if self._is_client_error(data):
+                    logger.debug(f"Failed to fetch {url}: {data}")
+                else:
+                    retry_paths.append(urls[url])
+                continue
+            
+            results[urls[url]] = data
+            if use_cache:
+                self._save_to_cache(f"json:{url}", data)
+        
+        if retry_paths:
+            logger.info(f"Retrying {len(retry_paths)} failed requests of {len(urls)} from {self.base_url}")
+            
+            def fetch(path: str) -> Any:
+                try:
+                    return self._fetch_json(path, use_cache=use_cache)
+                except Exception as e:
+                    return e
+            
+            with ThreadPoolExecutor(max_workers=max(1, self.config.concurrent_requests)) as executor:
+                retried = dict(zip(retry_paths, executor.map(fetch, retry_paths)))
+            
+            dropped = []
+            for path, data in retried.items():
+                if isinstance(data, Exception):
+                    logger.warning(f"Failed to fetch {self._get_url(path)}: {data}")
+                    dropped.append(path)
+                else:
+                    results[path] = data
+            if dropped:
+                logger.warning(
+                    f"Dropped {len(dropped)} of {len(urls)} requests from {self.base_url} after retries: "
+                    f"{', '.join(dropped[:10])}{' ...' if len(dropped) > 10 else ''}"
+                )
+        
+        return results
+    
+    @staticmethod
+    def _is_client_error(error: Exception) -> bool:
+        """
+        Check whether a request failed with a client error that retrying cannot fix.
+        
+        Args:
+            error: Exception raised by the request.
+            
+        Returns:
+            True for 4xx responses other than 408 Request Timeout and 429 Too Many Requests.
+        """
+        status = getattr(error, "status", None)
+        if status is None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+        return isinstance(status, int) and 400 <= status < 500 and status not in (408, 429)
     
     def _fetch_text(self, path: str, use_cache: bool = True, 
                     fallback_urls: Optional[List[str]] = None) -> str:
@@ -557,17 +1454,25 @@ class HttpRepositoryFetcher(RepositoryFetcher):
         
         # Combine provided fallback URLs with base URL fallbacks
         all_fallback_urls = fallback_urls or []
-        if self.fallback_base_urls:
+        if self.fallback_base_urls and "://" not in path:
             for fallback_base in self.fallback_base_urls:
                 fallback_url = f"{fallback_base}/{path.lstrip('/')}"
                 all_fallback_urls.append(fallback_url)
         
-        response = self._fetch_url(url, headers=self.headers, fallback_urls=all_fallback_urls)
-        text = response.text
+        def fetch() -> str:
+            return self._fetch_url(url, headers=self.headers, fallback_urls=all_fallback_urls).text
         
-        if use_cache:
-            self._save_to_cache(cache_key, {"text": text})
+        if not use_cache:
+            return fetch()
         
+        # Revalidate an expired cache entry instead of downloading it again
+        text, cached_data = self._fetch_with_revalidation(cache_key, fetch)
+        if cached_data is not None and "text" in cached_data:
+            return cached_data["text"]
+        if text is None:
+            text = fetch()
+        
+        self._save_to_cache(cache_key, {"text": text})
         return text
     
     def _fetch_binary(self, path: str, output_path: str, use_cache: bool = True, 
@@ -600,18 +1505,29 @@ class HttpRepositoryFetcher(RepositoryFetcher):
         
         # Combine provided fallback URLs with base URL fallbacks
         all_fallback_urls = fallback_urls or []
-        if self.fallback_base_urls:
+        if self.fallback_base_urls and "://" not in path:
             for fallback_base in self.fallback_base_urls:
                 fallback_url = f"{fallback_base}/{path.lstrip('/')}"
                 all_fallback_urls.append(fallback_url)
         
-        # Fetch the data
-        response = self._fetch_url(url, headers=self.headers, fallback_urls=all_fallback_urls)
+        # Fetch the data, revalidating an expired file instead of downloading it again
+        cache_key = f"binary:{url}"
+        try:
+            with self._revalidating(cache_key if use_cache else None,
+                                    conditional=os.path.exists(output_path)):
+                response = self._fetch_url(url, headers=self.headers, fallback_urls=all_fallback_urls)
+        except NotModifiedError:
+            os.utime(output_path, None)
+            self._save_validators(cache_key, merge=True)
+            return output_path
         
         # Save the data to the file
         with open(output_path, 'wb') as f:
             f.write(response.content)
         
+        if use_cache:
+            self._save_validators(cache_key)
+        
         return output_path
 
 
@@ -620,9 +1536,26 @@ class GitRepositoryFetcher(RepositoryFetcher):
     Base class for repository fetchers that use Git.
     
     This class provides common functionality for fetchers that retrieve
-    data from Git repositories.
+    data from Git repositories. With ``FetcherConfig.git_worktree`` disabled,
+    repositories are kept as bare clones and ``_get_file_content``,
+    ``_list_files`` and ``_is_directory`` read the object database instead
+    of a working tree.
     """
     
+    # Paths checked out in sparse clones, relative to the repository root.
+    # Empty to always check out the whole tree.
+    SPARSE_PATHS: Tuple[str, ...] = ()
+    
+    # Whether SPARSE_PATHS are gitignore-style patterns rather than directories
+    SPARSE_PATTERNS = False
+    
+    # Version of the package data parsed from the repository; increase it when
+    # parsing changes so that incremental state of the previous parser is discarded
+    PARSER_VERSION = 1
+    
+    # Format version of the incremental processing state file
+    REPOSITORY_STATE_FORMAT = 1
+    
     def __init__(
         self,
         repository_url: str,
@@ -645,38 +1578,376 @@ class GitRepositoryFetcher(RepositoryFetcher):
             self.get_repository_name(),
             hashlib.md5(repository_url.encode()).hexdigest()
         )
+        self._object_reader: Optional[GitObjectReader] = None
+    
+    def _uses_object_database(self) -> bool:
+        """
+        Check whether files are read from the object database of a bare clone.
+        
+        Returns:
+            True if the fetcher is configured without working trees.
+        """
+        return not getattr(self.config, "git_worktree", True)
+    
+    def _is_git_repository(self) -> bool:
+        """
+        Check whether the repository directory is a Git checkout or bare repository.
+        
+        Returns:
+            True if git commands can be run in the repository directory.
+        """
+        if os.path.exists(os.path.join(self.repo_dir, ".git")):
+            return True
+        return (
+            os.path.isfile(os.path.join(self.repo_dir, "HEAD"))
+            and os.path.isdir(os.path.join(self.repo_dir, "objects"))
+        )
+    
+    def _get_object_reader(self) -> Optional[GitObjectReader]:
+        """
+        Get the object database reader for the current commit of the repository.
+        
+        Returns:
+            GitObjectReader, or None if files are read from the working tree or
+            the repository directory is not a Git repository.
+        """
+        if not self._uses_object_database():
+            return None
+        
+        reader = self._object_reader
+        if reader is not None and reader.git_dir == self.repo_dir:
+            return reader
+        
+        self._close_object_reader()
+        if not self._is_git_repository():
+            return None
+        
+        try:
+            self._object_reader = GitObjectReader(self.repo_dir)
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.warning(f"Failed to read Git objects in {self.repo_dir}: {e}")
+            return None
+        return self._object_reader
+    
+    def _close_object_reader(self) -> None:
+        """Close the object database reader, e.g. after the repository was updated."""
+        if self._object_reader is not None:
+            self._object_reader.close()
+            self._object_reader = None
+    
+    def _get_sparse_checkout_args(self) -> Optional[List[str]]:
+        """
+        Get the ``git sparse-checkout set`` arguments for the repository.
+        
+        Returns:
+            Arguments listing the paths to check out, or None to check out the
+            whole tree.
+        """
+        if not self.SPARSE_PATHS or not getattr(self.config, "git_sparse_checkout", True):
+            return None
+        
+        if self.SPARSE_PATTERNS:
+            return ["--no-cone", *self.SPARSE_PATHS]
+        return ["--cone", *self.SPARSE_PATHS]
     
     def _clone_or_pull_repository(self) -> bool:
         """
-        Clone the repository if it doesn't exist, or pull if it does.
+        Clone the repository if it doesn't exist, or update it if it does.
+        
+        Repositories are cloned with a depth of 1. Fetchers declaring
+        ``SPARSE_PATHS`` get a blobless partial clone with a sparse checkout
+        of those paths, so only the files they parse are downloaded. Without
+        working trees, a bare clone is made instead. Updates fetch the latest
+        commit of the branch with a depth of 1 and reset the checkout to it,
+        instead of pulling the history in between.
         
         Returns:
             True if successful, False otherwise.
         """
-        import subprocess
+        sparse_args = self._get_sparse_checkout_args()
+        
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], check=True, capture_output=True)
+        
+        # Readers are pinned to a commit, so the next read starts a new one
+        self._close_object_reader()
         
         try:
             if not os.path.exists(self.repo_dir):
                 # Clone the repository
                 os.makedirs(os.path.dirname(self.repo_dir), exist_ok=True)
-                subprocess.run(
-                    ["git", "clone", "--depth", "1", "-b", self.branch, self.repository_url, self.repo_dir],
-                    check=True,
-                    capture_output=True
+                if self._uses_object_database():
+                    git("clone", "--bare", "--depth", "1", "-b", self.branch, self.repository_url, self.repo_dir)
+                    return True
+                
+                if sparse_args is None:
+                    git("clone", "--depth", "1", "-b", self.branch, self.repository_url, self.repo_dir)
+                    return True
+                
+                git(
+                    "clone", "--depth", "1", "--filter=blob:none", "--sparse",
+                    "-b", self.branch, self.repository_url, self.repo_dir
                 )
+                git("-C", self.repo_dir, "sparse-checkout", "set", *sparse_args)
                 return True
-            else:
-                # Pull the latest changes
-                subprocess.run(
-                    ["git", "-C", self.repo_dir, "pull", "origin", self.branch],
-                    check=True,
-                    capture_output=True
+            
+            if self._is_git_repository() and not os.path.exists(os.path.join(self.repo_dir, ".git")):
+                # Update the branch of a bare clone; HEAD points to it
+                git(
+                    "-C", self.repo_dir, "fetch", "--depth", "1", "origin",
+                    f"+refs/heads/{self.branch}:refs/heads/{self.branch}"
                 )
                 return True
-        except subprocess.SubprocessError as e:
-            logger.error(f"Failed to clone or pull repository: {e}")
+            
+            # Update the checkout to the latest commit of the branch
+            if sparse_args is not None:
+                git("-C", self.repo_dir, "sparse-checkout", "set", *sparse_args)
+            elif os.path.exists(os.path.join(self.repo_dir, ".git", "info", "sparse-checkout")):
+                git("-C", self.repo_dir, "sparse-checkout", "disable")
+            
+            git("-C", self.repo_dir, "fetch", "--depth", "1", "origin", self.branch)
+            git("-C", self.repo_dir, "reset", "--hard", "FETCH_HEAD")
+            return True
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.error(f"Failed to clone or update repository: {e}")
             return False
     
+    def _run_git(self, *args: str) -> Optional[str]:
+        """
+        Run a git command in the repository.
+        
+        Args:
+            *args: Git arguments.
+            
+        Returns:
+            Standard output of the command, or None if it failed.
+        """
+        if not self._is_git_repository():
+            return None
+        
+        try:
+            completed = subprocess.run(
+                ["git", "-C", self.repo_dir, *args],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+            return completed.stdout
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.debug(f"git {' '.join(args)} failed in {self.repo_dir}: {e}")
+            return None
+    
+    def _get_head_commit(self) -> Optional[str]:
+        """
+        Get the commit the repository checkout is at.
+        
+        Returns:
+            Commit hash, or None if the repository is not a Git checkout.
+        """
+        output = self._run_git("rev-parse", "HEAD")
+        return output.strip() if output else None
+    
+    def _get_changed_paths(self, since_commit: str) -> Optional[List[str]]:
+        """
+        Get the files changed between a commit and the current checkout.
+        
+        Args:
+            since_commit: Commit to compare against.
+            
+        Returns:
+            Changed file paths relative to the repository root, or None if the
+            commit is not available, e.g. after a history rewrite.
+        """
+        output = self._run_git("diff", "--name-only", "--no-renames", since_commit, "HEAD", "--")
+        if output is None:
+            return None
+        return [line for line in output.splitlines() if line]
+    
+    def _get_repository_state_path(self, key: str) -> str:
+        """
+        Get the path of the incremental processing state for a cache key.
+        
+        Args:
+            key: State key.
+            
+        Returns:
+            Path to the state file.
+        """
+        return os.path.splitext(self._get_cache_path(key))[0] + ".state.json"
+    
+    def _get_repository_state_version(self) -> str:
+        """
+        Get the version identifying the state format and the parser that built it.
+        
+        Returns:
+            Version string of the state file format, fetcher class and parser version.
+        """
+        return f"{self.REPOSITORY_STATE_FORMAT}:{type(self).__name__}:{self.PARSER_VERSION}"
+    
+    def _load_repository_state(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the incremental processing state of a repository.
+        
+        Unlike cache entries, the state does not expire, but state written in
+        another format or by another parser version is discarded.
+        
+        Args:
+            key: State key.
+            
+        Returns:
+            State dictionary, or None if there is no usable state.
+        """
+        state_path = self._get_repository_state_path(key)
+        if not os.path.exists(state_path):
+            return None
+        
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to read repository state for {key}: {e}")
+            return None
+        
+        if not isinstance(state, dict) or not all(field in state for field in ("commit", "units", "packages")):
+            return None
+        if state.get("version") != self._get_repository_state_version():
+            logger.info(f"Discarding repository state for {key} written by another parser version")
+            return None
+        return state
+    
+    def _save_repository_state(self, key: str, state: Dict[str, Any]) -> None:
+        """
+        Atomically save the incremental processing state of a repository.
+        
+        Args:
+            key: State key.
+            state: State dictionary.
+        """
+        import tempfile
+        
+        state_path = self._get_repository_state_path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(state_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(tmp_path, state_path)
+        except Exception as e:
+            logger.warning(f"Failed to write repository state for {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    def _process_repository_incrementally(
+        self,
+        list_units: Callable[[], List[str]],
+        unit_for_path: Callable[[str], Optional[str]],
+        parse_unit: Callable[[str], Dict[str, Dict[str, Any]]],
+        state_key: Optional[str] = None,
+        prefetch_units: Optional[Callable[[List[str]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Process the packages of the repository, re-parsing only what changed.
+        
+        The repository is divided into units, e.g. a manifest file or a package
+        directory, each contributing data for one or more packages. The commit
+        the packages were built from, the packages of each unit and the package
+        data are kept in a persisted state. On the next run, ``git diff`` lists
+        the files changed since that commit, and only the affected units are
+        parsed again. Packages contributed by several units are merged in unit
+        order, so all units of a changed package are parsed again.
+        
+        Without a Git checkout or usable state, all units are parsed.
+        
+        Args:
+            list_units: Function listing all units of the repository.
+            unit_for_path: Function mapping a changed file path (relative to the
+                repository root, with "/" separators) to its unit, or None if the
+                file is not part of any unit.
+            parse_unit: Function parsing a unit into a mapping of package names to
+                data. Units that no longer exist parse to an empty mapping.
+            state_key: Key of the persisted state. Defaults to one per checkout.
+            prefetch_units: Function called with the units about to be parsed,
+                e.g. to look them up with batched commands.
+            
+        Returns:
+            Dictionary mapping package names to their metadata.
+        """
+        state_key = state_key or f"git_state:{self.repo_dir}"
+        head = self._get_head_commit()
+        state = self._load_repository_state(state_key) if head else None
+        
+        changed_paths = None
+        if state is not None:
+            if state["commit"] == head:
+                return state["packages"]
+            changed_paths = self._get_changed_paths(state["commit"])
+        
+        if changed_paths is None:
+            # Parse every unit
+            units: Dict[str, List[str]] = {}
+            packages: Dict[str, Dict[str, Any]] = {}
+            all_units = sorted(list_units())
+            if prefetch_units:
+                prefetch_units(all_units)
+            for unit in all_units:
+                unit_packages = parse_unit(unit)
+                if unit_packages:
+                    units[unit] = list(unit_packages)
+                for name, data in unit_packages.items():
+                    packages.setdefault(name, {}).update(data)
+            
+            logger.info(f"Processed {len(units)} units of {self.repository_url}")
+        else:
+            units = state["units"]
+            packages = state["packages"]
+            
+            changed_units = {unit for unit in map(unit_for_path, changed_paths) if unit}
+            if prefetch_units:
+                prefetch_units(sorted(changed_units))
+            parsed = {unit: parse_unit(unit) for unit in changed_units}
+            
+            # Packages of changed units are rebuilt from all of their units
+            affected = set()
+            for unit, unit_packages in parsed.items():
+                affected.update(units.get(unit, ()))
+                affected.update(unit_packages)
+                if unit_packages:
+                    units[unit] = list(unit_packages)
+                else:
+                    units.pop(unit, None)
+            
+            package_units: Dict[str, List[str]] = {}
+            for unit in sorted(units):
+                for name in units[unit]:
+                    if name in affected:
+                        package_units.setdefault(name, []).append(unit)
+            
+            for name in affected:
+                data: Dict[str, Any] = {}
+                for unit in package_units.get(name, ()):
+                    if unit not in parsed:
+                        parsed[unit] = parse_unit(unit)
+                    data.update(parsed[unit].get(name, {}))
+                
+                if data:
+                    packages[name] = data
+                else:
+                    packages.pop(name, None)
+            
+            logger.info(
+                f"Updated {len(affected)} packages from {len(changed_paths)} changed files "
+                f"of {self.repository_url}"
+            )
+        
+        if head:
+            self._save_repository_state(state_key, {
+                "version": self._get_repository_state_version(),
+                "commit": head,
+                "units": units,
+                "packages": packages
+            })
+        
+        return packages
+    
     def _get_file_content(self, file_path: str) -> Optional[str]:
         """
         Get the content of a file from the repository.
@@ -687,6 +1958,17 @@ class GitRepositoryFetcher(RepositoryFetcher):
         Returns:
             Content of the file if it exists, None otherwise.
         """
+        reader = self._get_object_reader()
+        if reader is not None:
+            content = reader.read(Path(file_path).as_posix())
+            if content is None:
+                return None
+            try:
+                return content.decode("utf-8")
+            except UnicodeDecodeError as e:
+                logger.warning(f"Failed to read file {file_path}: {e}")
+                return None
+        
         full_path = os.path.join(self.repo_dir, file_path)
         
         if not os.path.exists(full_path):
@@ -699,6 +1981,22 @@ class GitRepositoryFetcher(RepositoryFetcher):
             logger.warning(f"Failed to read file {file_path}: {e}")
             return None
     
+    def _is_directory(self, directory: str) -> bool:
+        """
+        Check whether a directory exists in the repository.
+        
+        Args:
+            directory: Directory relative to the repository root.
+            
+        Returns:
+            True if the directory exists.
+        """
+        reader = self._get_object_reader()
+        if reader is not None:
+            return reader.is_dir(Path(directory).as_posix() if directory else "")
+        
+        return os.path.isdir(os.path.join(self.repo_dir, directory))
+    
     def _list_files(self, directory: str = "", pattern: str = "*") -> List[str]:
         """
         List files in a directory in the repository.
@@ -712,6 +2010,10 @@ class GitRepositoryFetcher(RepositoryFetcher):
         """
         import glob
         
+        reader = self._get_object_reader()
+        if reader is not None:
+            return reader.list_files(Path(directory).as_posix() if directory else "", pattern)
+        
         full_dir = os.path.join(self.repo_dir, directory)
         
         if not os.path.exists(full_dir):
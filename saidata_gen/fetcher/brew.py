@@ -16,7 +16,7 @@ from urllib.parse import urljoin
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
 )
-from saidata_gen.fetcher.base import HttpRepositoryFetcher, REQUESTS_AVAILABLE
+from saidata_gen.fetcher.base import HttpRepositoryFetcher, NotModifiedError, REQUESTS_AVAILABLE
 from saidata_gen.fetcher.error_handler import FetcherErrorHandler, ErrorContext
 from saidata_gen.core.system_dependency_checker import SystemDependencyChecker
 from saidata_gen.core.repository_url_manager import get_repository_url_manager
@@ -195,8 +195,14 @@ class BrewFetcher(HttpRepositoryFetcher):
                 result.cache_hits[repo_key] = True
                 continue
             
-            # Fetch the repository data with enhanced error handling
-            fetch_result = self._fetch_repository_with_retries(repo, repo_key)
+            # Fetch the repository data with enhanced error handling, revalidating an expired cache entry
+            fetch_result, cached_data = self._fetch_with_revalidation(
+                repo_key, lambda: self._fetch_repository_with_retries(repo, repo_key)
+            )
+            if cached_data is not None:
+                self._package_cache[repo_key] = cached_data
+                result.cache_hits[repo_key] = True
+                continue
             
             if fetch_result.success:
                 result.providers[repo_key] = True
@@ -553,6 +559,10 @@ class BrewFetcher(HttpRepositoryFetcher):
                     # Restore the original base_url
                     self.base_url = original_base_url
                     
+            except NotModifiedError:
+                # The cached data is still current, let the caller refresh it
+                raise
+                
             except (requests.exceptions.SSLError, ssl.SSLError) as e:
                 # Handle SSL errors with fallback
                 context = ErrorContext(
@@ -284,36 +284,7 @@ class CargoFetcher(HttpRepositoryFetcher):
                 # Fetch crate details from crates.io
                 response = self._fetch_json(f"crates/{crate_name}")
                 
-                if "crate" in response:
-                    crate = response["crate"]
-                    versions = response.get("versions", [])
-                    
-                    # Get the latest version
-                    latest_version = None
-                    if versions:
-                        latest_version = versions[0]
-                    
-                    # Combine metadata
-                    return {
-                        "name": crate.get("name"),
-                        "id": crate.get("id"),
-                        "description": crate.get("description"),
-                        "max_version": crate.get("max_version"),
-                        "newest_version": crate.get("newest_version"),
-                        "downloads": crate.get("downloads"),
-                        "recent_downloads": crate.get("recent_downloads"),
-                        "categories": crate.get("categories", []),
-                        "keywords": crate.get("keywords", []),
-                        "created_at": crate.get("created_at"),
-                        "updated_at": crate.get("updated_at"),
-                        "homepage": crate.get("homepage"),
-                        "documentation": crate.get("documentation"),
-                        "repository": crate.get("repository"),
-                        "license": crate.get("license"),
-                        "versions": versions,
-                        "latest_version": latest_version,
-                        "registry": registry_name
-                    }
+                return self._parse_crate_details(response, registry_name)
             
             except Exception as e:
                 logger.warning(f"Failed to fetch crate details for {crate_name} from {registry_name}: {e}")
@@ -322,6 +293,76 @@ class CargoFetcher(HttpRepositoryFetcher):
             logger.warning(f"Fetching crate details from {registry_name} is not supported")
             return None
     
+    def _fetch_crate_details_batch(self, crate_names: List[str], registry_name: str) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch detailed information about many crates concurrently.
+        
+        Args:
+            crate_names: Names of the crates.
+            registry_name: Name of the registry.
+            
+        Returns:
+            Dictionary mapping the names of the crates found to their metadata.
+        """
+        if registry_name != "crates-io":
+            logger.warning(f"Fetching crate details from {registry_name} is not supported")
+            return {}
+        
+        paths = {f"crates/{name}": name for name in crate_names}
+        responses = self._fetch_json_many(list(paths))
+        
+        crates = {}
+        for path, response in responses.items():
+            crate_data = self._parse_crate_details(response, registry_name)
+            if crate_data:
+                crates[paths[path]] = crate_data
+        
+        return crates
+    
+    def _parse_crate_details(self, response: Dict[str, any], registry_name: str) -> Optional[Dict[str, any]]:
+        """
+        Extract crate metadata from a crates.io crate response.
+        
+        Args:
+            response: Response of the crate endpoint.
+            registry_name: Name of the registry.
+            
+        Returns:
+            Crate metadata, or None if the response has no crate.
+        """
+        if "crate" not in response:
+            return None
+        
+        crate = response["crate"]
+        versions = response.get("versions", [])
+        
+        # Get the latest version
+        latest_version = None
+        if versions:
+            latest_version = versions[0]
+        
+        # Combine metadata
+        return {
+            "name": crate.get("name"),
+            "id": crate.get("id"),
+            "description": crate.get("description"),
+            "max_version": crate.get("max_version"),
+            "newest_version": crate.get("newest_version"),
+            "downloads": crate.get("downloads"),
+            "recent_downloads": crate.get("recent_downloads"),
+            "categories": crate.get("categories", []),
+            "keywords": crate.get("keywords", []),
+            "created_at": crate.get("created_at"),
+            "updated_at": crate.get("updated_at"),
+            "homepage": crate.get("homepage"),
+            "documentation": crate.get("documentation"),
+            "repository": crate.get("repository"),
+            "license": crate.get("license"),
+            "versions": versions,
+            "latest_version": latest_version,
+            "registry": registry_name
+        }
+    
     def _search_crates_in_registry(self, query: str, registry_name: str, max_results: int = 10) -> Dict[str, Dict[str, any]]:
         """
         Search for crates in a registry.
@@ -0,0 +1,234 @@
+"""
+Batched command execution for CLI-backed fetchers.
+
+Fetchers such as Nix, Guix, Emerge and Spack look up package details by
+running a command, and starting a process per package dominates their run
+time in batch runs. ``CommandBatcher`` collects lookups, including lookups
+made at the same time from several threads, and resolves them with one bulk
+command per batch. Parsed results are kept in memory and can be persisted
+through the fetcher cache.
+"""
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CommandBatcher:
+    """
+    Resolves keyed lookups with bulk commands.
+    
+    ``run_batch`` receives a list of keys and returns a dictionary with the
+    parsed result for each key it found; keys missing from the result are
+    recorded as not found (None). A caller that finds no batch running waits
+    ``linger`` seconds for lookups from other threads before running the
+    batch, so concurrent lookups share one command.
+    
+    Saving rewrites all results, so results are saved once the unsaved ones
+    reach ``SAVE_GROWTH`` times the saved ones. This keeps the total amount
+    written linear in the number of results; the rest is saved by ``flush``,
+    which also runs at interpreter exit.
+    """
+    
+    SAVE_GROWTH = 0.25
+    
+    def __init__(
+        self,
+        run_batch: Callable[[List[str]], Dict[str, Any]],
+        batch_size: int = 50,
+        linger: float = 0.01,
+        cached_results: Optional[Dict[str, Any]] = None,
+        save_results: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Initialize the batcher.
+        
+        Args:
+            run_batch: Function running one bulk command for a list of keys.
+            batch_size: Maximum number of keys passed to one command.
+            linger: Seconds to wait for more lookups before running a batch.
+            cached_results: Previously saved results to start from.
+            save_results: Function called with all results when enough new
+                results have been collected, e.g. to save them to the fetcher
+                cache.
+        """
+        self.run_batch = run_batch
+        self.batch_size = max(1, batch_size)
+        self.linger = linger
+        self.save_results = save_results
+        
+        self._results: Dict[str, Any] = dict(cached_results or {})
+        self._failed: Dict[str, int] = {}
+        self._pending: Dict[str, None] = {}
+        self._running = False
+        self._condition = threading.Condition()
+        self._saved_count = len(self._results)
+        self._unsaved_count = 0
+        self._save_lock = threading.Lock()
+        self.commands_run = 0
+        
+        if save_results:
+            atexit.register(_flush_at_exit, weakref.ref(self))
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a single key.
+        
+        Args:
+            key: Key to look up.
+        
+        Returns:
+            Result for the key, or None if it was not found or the command failed.
+        """
+        return self.get_many([key]).get(key)
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[Any]]:
+        """
+        Look up several keys, running bulk commands for the missing ones.
+        
+        Args:
+            keys: Keys to look up.
+        
+        Returns:
+            Dictionary mapping each key to its result, or None if it was not
+            found or the command failed.
+        """
+        keys = list(dict.fromkeys(keys))
+        
+        with self._condition:
+            # Failures are only reported to the lookups waiting for them
+            generations = {key: self._failed.get(key, 0) for key in keys}
+            for key in keys:
+                if key not in self._results:
+                    self._pending[key] = None
+            
+            while True:
+                unresolved = [
+                    key for key in keys
+                    if key not in self._results and self._failed.get(key, 0) == generations[key]
+                ]
+                if not unresolved:
+                    return {key: self._results.get(key) for key in keys}
+                
+                if self._running:
+                    self._condition.wait()
+                    continue
+                
+                # Re-queue keys whose batch was taken by a runner that has since finished
+                for key in unresolved:
+                    self._pending[key] = None
+                
+                self._running = True
+                self._condition.release()
+                try:
+                    if self.linger > 0:
+                        time.sleep(self.linger)
+                    self._run_pending()
+                finally:
+                    self._condition.acquire()
+                    self._running = False
+                    self._condition.notify_all()
+    
+    def prefetch(self, keys: Iterable[str]) -> None:
+        """
+        Resolve keys ahead of individual lookups.
+        
+        Args:
+            keys: Keys that will be looked up.
+        """
+        self.get_many(keys)
+    
+    def flush(self) -> None:
+        """Save results that have not been saved yet."""
+        self._save_results(force=True)
+    
+    def _save_results(self, force: bool = False) -> None:
+        """
+        Save all results if enough of them are unsaved.
+        
+        Args:
+            force: Save whenever any result is unsaved.
+        """
+        if not self.save_results:
+            return
+        
+        with self._save_lock:
+            with self._condition:
+                if not self._unsaved_count:
+                    return
+                if not force and self._unsaved_count < max(1, self._saved_count * self.SAVE_GROWTH):
+                    return
+                snapshot = dict(self._results)
+                self._saved_count = len(snapshot)
+                self._unsaved_count = 0
+            
+            try:
+                self.save_results(snapshot)
+            except Exception as e:
+                logger.warning(f"Failed to save batched command results: {e}")
+    
+    def _run_pending(self) -> None:
+        """Run bulk commands for all pending keys. Called without the lock held."""
+        while True:
+            with self._condition:
+                batch = list(self._pending)[:self.batch_size]
+                for key in batch:
+                    del self._pending[key]
+            
+            if not batch:
+                self._save_results()
+                return
+            
+            results, failed = self._run_batch_splitting(batch)
+            
+            with self._condition:
+                for key in batch:
+                    if key in failed:
+                        self._failed[key] = self._failed.get(key, 0) + 1
+                    else:
+                        if key not in self._results:
+                            self._unsaved_count += 1
+                        self._results[key] = results.get(key)
+                self._condition.notify_all()
+    
+    def _run_batch_splitting(self, batch: List[str]) -> Tuple[Dict[str, Any], Set[str]]:
+        """
+        Run a bulk command, splitting the batch when the command fails.
+        
+        Commands such as ``nix-env -A`` fail as a whole when a single key is
+        invalid, so a failed batch is retried in halves until the failing keys
+        are isolated.
+        
+        Args:
+            batch: Keys to look up.
+            
+        Returns:
+            Tuple of the results and the keys whose lookup failed.
+        """
+        try:
+            self.commands_run += 1
+            return self.run_batch(batch) or {}, set()
+        except Exception as e:
+            if len(batch) == 1:
+                logger.warning(f"Batched command failed for {batch[0]}: {e}")
+                return {}, set(batch)
+            
+            logger.debug(f"Batched command failed for {len(batch)} keys, splitting the batch: {e}")
+        
+        middle = len(batch) // 2
+        results, failed = self._run_batch_splitting(batch[:middle])
+        other_results, other_failed = self._run_batch_splitting(batch[middle:])
+        results.update(other_results)
+        return results, failed | other_failed
+
+
+def _flush_at_exit(batcher_ref: "weakref.ref[CommandBatcher]") -> None:
+    """Save the unsaved results of a batcher that is still alive at exit."""
+    batcher = batcher_ref()
+    if batcher is not None:
+        batcher.flush()
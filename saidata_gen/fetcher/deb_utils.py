@@ -0,0 +1,387 @@
+"""
+Utility functions for Debian-style repository index files.
+
+This module provides a streaming parser for Debian control files (the format
+of APT and OPKG Packages indexes) and for other blank-line separated index
+files such as Slackware's PACKAGES.TXT. Compressed indexes are decompressed
+incrementally and parsed line by line, so the whole decoded index is never
+held in memory at once.
+
+It also parses the metadata used for incremental updates: the checksum lists
+of Release/InRelease files, Packages.diff/Index files and the ed-style
+patches they reference.
+"""
+
+import gzip
+import io
+import logging
+import re
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+def iter_lines(content: bytes, compressed: bool = False, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Iterate over the lines of an index file without decoding it all at once.
+    
+    Args:
+        content: Raw content of the file.
+        compressed: Whether the content is gzipped.
+        encoding: Text encoding of the file.
+    
+    Yields:
+        Lines without their trailing newline.
+    """
+    stream = io.BytesIO(content)
+    if compressed:
+        stream = gzip.GzipFile(fileobj=stream)
+    
+    with io.TextIOWrapper(stream, encoding=encoding, errors="replace") as text:
+        for line in text:
+            yield line.rstrip("\r\n")
+
+
+def iter_stanzas(lines: Iterable[str]) -> Iterator[List[str]]:
+    """
+    Group lines into stanzas separated by blank lines.
+    
+    Args:
+        lines: Lines of the file.
+    
+    Yields:
+        Non-empty lists of the lines in each stanza.
+    """
+    stanza: List[str] = []
+    for line in lines:
+        if not line.strip():
+            if stanza:
+                yield stanza
+                stanza = []
+        else:
+            stanza.append(line)
+    
+    if stanza:
+        yield stanza
+
+
+def iter_control_stanzas(
+    lines: Iterable[str],
+    fields: Optional[Collection[str]] = None,
+    continuation_separator: Optional[str] = "\\n"
+) -> Iterator[Dict[str, str]]:
+    """
+    Parse Debian control file stanzas from a stream of lines.
+    
+    Args:
+        lines: Lines of the control file.
+        fields: Optional whitelist of fields to keep. If None, all fields are kept.
+        continuation_separator: Separator used to join continuation lines onto the
+            field value. If None, continuation lines are ignored.
+    
+    Yields:
+        Dictionary of field names to values for each stanza.
+    """
+    keep = None if fields is None else frozenset(fields)
+    current_data: Dict[str, str] = {}
+    current_key: Optional[str] = None
+    current_value: List[str] = []
+    
+    def finish_field() -> None:
+        if current_key is not None:
+            current_data[current_key] = (
+                current_value[0] if len(current_value) == 1
+                else continuation_separator.join(current_value)
+            )
+    
+    for line in lines:
+        if not line.strip():
+            # Empty line indicates end of a stanza
+            finish_field()
+            if current_data:
+                yield current_data
+            current_data = {}
+            current_key = None
+            current_value = []
+            continue
+        
+        if line[0] in " \t":
+            # Continuation of the previous value
+            if current_key is not None and continuation_separator is not None:
+                current_value.append(line.strip())
+            continue
+        
+        finish_field()
+        current_key = None
+        
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        
+        key = key.strip()
+        if keep is None or key in keep:
+            current_key = key
+            current_value = [value.strip()]
+    
+    # Handle files that do not end with an empty line
+    finish_field()
+    if current_data:
+        yield current_data
+
+
+def parse_control_index(
+    lines: Iterable[str],
+    fields: Optional[Collection[str]] = None,
+    continuation_separator: Optional[str] = "\\n",
+    key_field: str = "Package"
+) -> Dict[str, Dict[str, str]]:
+    """
+    Parse a Packages index into a dictionary keyed by package name.
+    
+    Args:
+        lines: Lines of the Packages file.
+        fields: Optional whitelist of fields to keep. The key field is always kept.
+        continuation_separator: Separator used to join continuation lines. If None,
+            continuation lines are ignored.
+        key_field: Field holding the package name.
+    
+    Returns:
+        Dictionary mapping package names to their metadata.
+    """
+    if fields is not None:
+        fields = set(fields)
+        fields.add(key_field)
+    
+    result = {}
+    for stanza in iter_control_stanzas(lines, fields, continuation_separator):
+        name = stanza.get(key_field)
+        if name:
+            result[name] = stanza
+    
+    return result
+
+
+def parse_packages_content(
+    content: bytes,
+    compressed: bool = False,
+    fields: Optional[Collection[str]] = None
+) -> Dict[str, Dict[str, str]]:
+    """
+    Parse the raw content of a Packages index.
+    
+    This is a module-level function so that it can run in a parse worker process.
+    
+    Args:
+        content: Raw content of the Packages file.
+        compressed: Whether the content is gzipped.
+        fields: Optional whitelist of fields to keep.
+    
+    Returns:
+        Dictionary mapping package names to their metadata.
+    """
+    return parse_control_index(iter_lines(content, compressed=compressed), fields=fields)
+
+
+def as_lines(packages_text: Union[str, Iterable[str]]) -> Iterable[str]:
+    """
+    Accept either the text of an index file or an iterable of its lines.
+    
+    Args:
+        packages_text: File content or lines.
+    
+    Returns:
+        Iterable of lines.
+    """
+    if isinstance(packages_text, str):
+        return packages_text.splitlines()
+    return packages_text
+
+
+def strip_pgp_signature(text: str) -> str:
+    """
+    Remove the OpenPGP clearsign armor from an InRelease file.
+    
+    The signature is not verified; only the signed content is returned.
+    
+    Args:
+        text: Content of an InRelease or Release file.
+    
+    Returns:
+        The signed content, or the text unchanged if it is not clearsigned.
+    """
+    if not text.lstrip().startswith("-----BEGIN PGP SIGNED MESSAGE-----"):
+        return text
+    
+    lines = text.lstrip().splitlines()
+    # Skip the armor header lines up to the first empty line
+    start = 1
+    while start < len(lines) and lines[start].strip():
+        start += 1
+    
+    content = []
+    for line in lines[start + 1:]:
+        if line.startswith("-----BEGIN PGP SIGNATURE-----"):
+            break
+        # Dash-escaped lines start with "- "
+        content.append(line[2:] if line.startswith("- ") else line)
+    return "\n".join(content) + "\n"
+
+
+def parse_checksum_lines(lines: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse the lines of a checksum field such as SHA256 in a Release file.
+    
+    Args:
+        lines: Lines of the form "<checksum> <size> <path>".
+    
+    Returns:
+        Dictionary mapping paths to {"sha256": checksum, "size": size}.
+    """
+    checksums = {}
+    for line in lines:
+        parts = line.split()
+        if len(parts) == 3 and parts[1].isdigit():
+            checksums[parts[2]] = {"sha256": parts[0], "size": int(parts[1])}
+    return checksums
+
+
+def parse_release_file(release_text: str) -> Dict[str, Any]:
+    """
+    Parse a Release or InRelease file.
+    
+    Field values are returned as strings with continuation lines joined by
+    spaces. The parsed SHA256 file list is added under "sha256", and the
+    "components", "architectures" and "acquire_by_hash" keys are added when
+    the corresponding fields are present.
+    
+    Args:
+        release_text: Content of the Release or InRelease file.
+    
+    Returns:
+        Dictionary with the parsed Release file data.
+    """
+    result: Dict[str, Any] = {}
+    field_lines: Dict[str, List[str]] = {}
+    current_key = None
+    
+    for line in strip_pgp_signature(release_text).splitlines():
+        if not line.strip():
+            continue
+        
+        if line[0] in " \t":
+            # Continuation of previous value
+            if current_key:
+                field_lines[current_key].append(line.strip())
+            continue
+        
+        key, sep, value = line.partition(":")
+        if sep:
+            current_key = key.strip()
+            field_lines[current_key] = [value.strip()]
+    
+    for key, lines in field_lines.items():
+        result[key] = " ".join(line for line in lines if line)
+    
+    result["sha256"] = parse_checksum_lines(field_lines.get("SHA256", [])[1:])
+    if "Components" in result:
+        result["components"] = result["Components"].split()
+    if "Architectures" in result:
+        result["architectures"] = result["Architectures"].split()
+    result["acquire_by_hash"] = result.get("Acquire-By-Hash", "").lower() == "yes"
+    
+    return result
+
+
+def parse_pdiff_index(index_text: str) -> Dict[str, Any]:
+    """
+    Parse a Packages.diff/Index file.
+    
+    Args:
+        index_text: Content of the Index file.
+    
+    Returns:
+        Dictionary with "current" (checksum and size of the current Packages
+        file), "history" (list of (checksum, patch name) pairs, where the
+        checksum is that of the Packages file the patch applies to), "patches"
+        and "downloads" (checksums of the uncompressed and compressed patches
+        by name) and "merged" (whether each patch leads directly to the
+        current file).
+    """
+    fields: Dict[str, List[str]] = {}
+    current_key = None
+    for line in index_text.splitlines():
+        if not line.strip():
+            continue
+        if line[0] in " \t":
+            if current_key:
+                fields[current_key].append(line.strip())
+            continue
+        key, sep, value = line.partition(":")
+        if sep:
+            current_key = key.strip()
+            fields[current_key] = [value.strip()]
+    
+    current = fields.get("SHA256-Current", [""])[0].split()
+    
+    def entries(field_name: str) -> List[List[str]]:
+        return [line.split() for line in fields.get(field_name, [])[1:] if len(line.split()) == 3]
+    
+    return {
+        "current": {"sha256": current[0], "size": int(current[1])} if len(current) == 2 else None,
+        "history": [(checksum, name) for checksum, _, name in entries("SHA256-History")],
+        "patches": {name: checksum for checksum, _, name in entries("SHA256-Patches")},
+        "downloads": {name: checksum for checksum, _, name in entries("SHA256-Download")},
+        "merged": fields.get("X-Patch-Precedence", [""])[0] == "merged",
+    }
+
+
+_ED_COMMAND = re.compile(rb"^(\d+)(?:,(\d+))?([acd])$")
+
+
+def apply_ed_patch(lines: List[bytes], patch: bytes) -> List[bytes]:
+    """
+    Apply an ed-style patch, as used by APT pdiffs, to a list of lines.
+    
+    pdiff patches list their commands from the end of the file to the start,
+    so each command can be applied to the lines as they are.
+    
+    Args:
+        lines: Lines of the file, including their line endings. The list is
+            modified in place.
+        patch: Uncompressed patch content.
+    
+    Returns:
+        The patched list of lines.
+    
+    Raises:
+        ValueError: If the patch contains an unsupported command.
+    """
+    patch_lines = patch.splitlines(keepends=True)
+    position = 0
+    while position < len(patch_lines):
+        command = patch_lines[position].rstrip(b"\r\n")
+        position += 1
+        if not command:
+            continue
+        
+        match = _ED_COMMAND.match(command)
+        if not match:
+            raise ValueError(f"Unsupported ed command: {command!r}")
+        
+        first = int(match.group(1))
+        last = int(match.group(2) or first)
+        action = match.group(3)
+        
+        new_lines = []
+        if action in (b"a", b"c"):
+            while position < len(patch_lines) and patch_lines[position].rstrip(b"\r\n") != b".":
+                new_lines.append(patch_lines[position])
+                position += 1
+            position += 1
+        
+        if action == b"a":
+            lines[first:first] = new_lines
+        else:
+            lines[first - 1:last] = new_lines
+    
+    return lines
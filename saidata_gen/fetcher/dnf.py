@@ -8,17 +8,18 @@ repositories, including Fedora, CentOS, AlmaLinux, Rocky Linux, and RHEL.
 import logging
 import os
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
 )
-from saidata_gen.fetcher.base import HttpRepositoryFetcher, REQUESTS_AVAILABLE
+from saidata_gen.fetcher.base import HttpRepositoryFetcher, NotModifiedError, REQUESTS_AVAILABLE
 from saidata_gen.fetcher.error_handler import FetcherErrorHandler, ErrorContext
 from saidata_gen.core.system_dependency_checker import SystemDependencyChecker
 from saidata_gen.core.repository_url_manager import get_repository_url_manager
 from saidata_gen.fetcher.rpm_utils import (
-    fetch_primary_location, decompress_gzip_content, parse_primary_xml, parse_metalink_xml
+    fetch_primary_checksum, fetch_primary_location, open_decompressed_stream, parse_metalink_xml,
+    parse_primary_content, parse_primary_xml
 )
 
 # Try to import requests for error handling
@@ -51,6 +52,8 @@ class DNFFetcher(HttpRepositoryFetcher):
     including Fedora, CentOS, and RHEL.
     """
     
+    index_text_fields = ("summary", "description")
+    
     def __init__(
         self,
         distributions: Optional[List[DNFDistribution]] = None,
@@ -97,6 +100,9 @@ class DNFFetcher(HttpRepositoryFetcher):
         
         # Initialize package cache
         self._package_cache: Dict[str, Dict[str, PackageInfo]] = {}
+        
+        # Checksums of primary.xml listed in the last fetched repomd.xml, by repomd.xml URL
+        self._primary_checksums: Dict[str, Optional[str]] = {}
         self._mirror_urls: Dict[str, str] = {}
     
     def _load_distributions_from_url_manager(self) -> List[DNFDistribution]:
@@ -178,11 +184,16 @@ class DNFFetcher(HttpRepositoryFetcher):
         """
         Fetch repository data from DNF repositories.
         
+        The repositories of all distributions and architectures are fetched
+        concurrently, up to ``config.concurrent_requests`` at a time.
+        
         Returns:
             FetchResult with the result of the fetch operation.
         """
         result = FetchResult(success=True)
         
+        # Collect the repositories of each architecture without a valid cache
+        repositories = []
         for dist in self.distributions:
             dist_key = f"{dist.name}_{dist.version}"
             
@@ -193,19 +204,41 @@ class DNFFetcher(HttpRepositoryFetcher):
                 # Check if we have a valid cache
                 cached_data = self._get_from_cache(cache_key)
                 if cached_data:
-                    self._package_cache[cache_key] = cached_data
+                    self._set_package_cache_entry(cache_key, cached_data)
                     result.cache_hits[cache_key] = True
                     continue
                 
-                # Fetch repository data with enhanced error handling
-                fetch_result = self._fetch_distribution_with_retries(dist, arch, cache_key)
-                
-                if fetch_result.success:
-                    result.providers[cache_key] = True
-                else:
-                    result.errors[cache_key] = fetch_result.errors.get(cache_key, "Unknown error")
-                    result.providers[cache_key] = False
-                    result.success = False
+                repositories.append((dist, arch, cache_key))
+        
+        # Fetch repository data with enhanced error handling, revalidating expired cache entries
+        for (dist, arch, cache_key), fetched, error in self._run_concurrently(
+            lambda repository: self._fetch_with_revalidation(
+                repository[2], lambda: self._fetch_distribution_with_retries(*repository)
+            ),
+            repositories
+        ):
+            if error is not None:
+                logger.error(f"Failed to fetch repository data for {cache_key}: {error}")
+                result.errors[cache_key] = str(error)
+                result.providers[cache_key] = False
+                result.success = False
+                continue
+            
+            fetch_result, cached_data = fetched
+            if cached_data is not None:
+                self._set_package_cache_entry(cache_key, cached_data)
+                result.cache_hits[cache_key] = True
+                continue
+            
+            if fetch_result.success:
+                result.providers[cache_key] = True
+            else:
+                result.errors[cache_key] = fetch_result.errors.get(cache_key, "Unknown error")
+                result.providers[cache_key] = False
+                result.success = False
+        
+        # Index the fetched packages for lookups and searches
+        self._build_package_index()
         
         return result
     
@@ -219,23 +252,7 @@ class DNFFetcher(HttpRepositoryFetcher):
         Returns:
             PackageInfo if the package is found, None otherwise.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        # Look for the package in all distributions
-        for cache_key, packages in self._package_cache.items():
-            if package_name in packages:
-                pkg_data = packages[package_name]
-                return PackageInfo(
-                    name=package_name,
-                    provider=self.get_repository_name(),
-                    version=pkg_data.get("version"),
-                    description=pkg_data.get("summary"),
-                    details=pkg_data
-                )
-        
-        return None
+        return self._get_indexed_package_info(package_name)
     
     def search_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
         """
@@ -248,39 +265,26 @@ class DNFFetcher(HttpRepositoryFetcher):
         Returns:
             List of PackageInfo objects matching the query.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Search in all distributions
-        for cache_key, packages in self._package_cache.items():
-            for pkg_name, pkg_data in packages.items():
-                # Check if the package name or description contains the query
-                if (query_lower in pkg_name.lower() or 
-                    (pkg_data.get("summary") and query_lower in pkg_data["summary"].lower()) or
-                    (pkg_data.get("description") and query_lower in pkg_data["description"].lower())):
-                    
-                    # Create PackageInfo object
-                    pkg_info = PackageInfo(
-                        name=pkg_name,
-                        provider=self.get_repository_name(),
-                        version=pkg_data.get("version"),
-                        description=pkg_data.get("summary"),
-                        details=pkg_data
-                    )
-                    
-                    # Add to results if not already present
-                    if not any(r.name == pkg_name for r in results):
-                        results.append(pkg_info)
-                    
-                    # Stop if we have enough results
-                    if len(results) >= max_results:
-                        return results
+        return self._search_indexed_packages(query, max_results)
+    
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
+        """
+        Create a PackageInfo object from package data.
         
-        return results
+        Args:
+            package_name: Name of the package.
+            package_data: Package data.
+            
+        Returns:
+            PackageInfo object.
+        """
+        return PackageInfo(
+            name=package_name,
+            provider=self.get_repository_name(),
+            version=package_data.get("version"),
+            description=package_data.get("summary"),
+            details=package_data
+        )
     
     def get_package_details(self, package_name: str, distribution: Optional[str] = None) -> Optional[PackageDetails]:
         """
@@ -385,6 +389,7 @@ class DNFFetcher(HttpRepositoryFetcher):
             # Fetch the repomd.xml file
             response = self._fetch_url(repomd_url)
             repomd_xml = response.text
+            self._primary_checksums[repomd_url] = fetch_primary_checksum(repomd_xml)
             
             # Use the common utility to parse the XML
             return fetch_primary_location(repomd_xml)
@@ -393,12 +398,13 @@ class DNFFetcher(HttpRepositoryFetcher):
             # Restore the original base_url
             self.base_url = original_base_url
     
-    def _fetch_primary_xml(self, primary_url: str) -> Dict[str, Dict[str, any]]:
+    def _fetch_primary_xml(self, primary_url: str, cache_key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse the primary.xml file.
         
         Args:
             primary_url: URL to the primary.xml file.
+            cache_key: Optional cache key a parse worker writes the packages to.
             
         Returns:
             Dictionary mapping package names to their metadata.
@@ -413,13 +419,10 @@ class DNFFetcher(HttpRepositoryFetcher):
             # Fetch the primary.xml file
             response = self._fetch_url(primary_url)
             
-            # Check if the file is gzipped
-            content = response.content
-            if primary_url.endswith(".gz"):
-                content = decompress_gzip_content(content)
-            
-            # Parse the XML using the common utility
-            return parse_primary_xml(content.decode("utf-8"))
+            # Decompress and parse the XML, in a worker process if it is large
+            return self._parse_content(
+                parse_primary_content, response.content, primary_url, snapshot_key=cache_key
+            )
             
         finally:
             # Restore the original base_url
@@ -457,12 +460,15 @@ class DNFFetcher(HttpRepositoryFetcher):
                 repomd_url = f"{base_url}/repodata/repomd.xml"
                 primary_location = self._fetch_primary_location_with_retries(repomd_url, context)
                 
-                # Fetch and parse primary.xml
+                # Skip primary.xml if repomd.xml lists the checksum of the cached one
                 primary_url = f"{base_url}/{primary_location}"
-                packages_data = self._fetch_primary_xml_with_retries(primary_url, context)
+                self._revalidate_checksum(cache_key, primary_url, self._primary_checksums.get(repomd_url))
+                
+                # Fetch and parse primary.xml
+                packages_data = self._fetch_primary_xml_with_retries(primary_url, context, cache_key)
                 
-                self._package_cache[cache_key] = packages_data
-                self._save_to_cache(cache_key, packages_data)
+                self._set_package_cache_entry(cache_key, packages_data)
+                self._save_to_cache(cache_key, packages_data, snapshot=True)
                 
                 return FetchResult(
                     success=True,
@@ -471,6 +477,10 @@ class DNFFetcher(HttpRepositoryFetcher):
                     cache_hits={}
                 )
                 
+            except NotModifiedError:
+                # The cached data is still current, let the caller refresh it
+                raise
+                
             except (requests.exceptions.SSLError, ssl.SSLError) as e:
                 # Handle SSL errors with fallback
                 context = ErrorContext(
@@ -588,6 +598,8 @@ class DNFFetcher(HttpRepositoryFetcher):
         """
         try:
             return self._fetch_primary_location(repomd_url)
+        except NotModifiedError:
+            raise
         except (requests.exceptions.SSLError, ssl.SSLError) as e:
             # Try SSL fallback
             fallback_response = self.error_handler.handle_ssl_error(e, context)
@@ -609,27 +621,34 @@ class DNFFetcher(HttpRepositoryFetcher):
                     pass
             raise
     
-    def _fetch_primary_xml_with_retries(self, primary_url: str, context: ErrorContext) -> Dict[str, Dict[str, any]]:
+    def _fetch_primary_xml_with_retries(
+        self,
+        primary_url: str,
+        context: ErrorContext,
+        cache_key: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Fetch primary XML with retry logic.
         
         Args:
             primary_url: URL to primary.xml.
             context: Error context.
+            cache_key: Optional cache key a parse worker writes the packages to.
             
         Returns:
             Parsed package data.
         """
         try:
-            return self._fetch_primary_xml(primary_url)
+            return self._fetch_primary_xml(primary_url, cache_key)
+        except NotModifiedError:
+            raise
         except (requests.exceptions.SSLError, ssl.SSLError) as e:
             # Try SSL fallback
             fallback_response = self.error_handler.handle_ssl_error(e, context)
             if fallback_response:
-                content = fallback_response.content
-                if primary_url.endswith(".gz"):
-                    content = decompress_gzip_content(content)
-                return parse_primary_xml(content.decode("utf-8"))
+                return parse_primary_xml(
+                    open_decompressed_stream(fallback_response.content, primary_url)
+                )
             raise
         except Exception as e:
             # Handle malformed XML
@@ -646,7 +665,7 @@ class DNFFetcher(HttpRepositoryFetcher):
                     pass
             raise
     
-    def _extract_primary_location_from_dict(self, parsed_data: Dict[str, any]) -> str:
+    def _extract_primary_location_from_dict(self, parsed_data: Dict[str, Any]) -> str:
         """
         Extract primary location from parsed repomd XML data.
         
@@ -660,7 +679,7 @@ class DNFFetcher(HttpRepositoryFetcher):
         # For now, return a reasonable default
         return "repodata/primary.xml.gz"
     
-    def _convert_xml_dict_to_packages(self, parsed_data: Dict[str, any]) -> Dict[str, Dict[str, any]]:
+    def _convert_xml_dict_to_packages(self, parsed_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
         Convert parsed XML dictionary to package format.
         
@@ -79,6 +79,17 @@ class DockerFetcher(HttpRepositoryFetcher):
         """
         return "docker"
     
+    def get_all_package_names(self) -> List[str]:
+        """
+        Get the names of all container images in the loaded repository data.
+        
+        Returns:
+            Sorted list of unique image names.
+        """
+        if not self._container_cache:
+            self.warm_up()
+        return self._collect_package_names(self._container_cache)
+    
     def fetch_repository_data(self) -> FetchResult:
         """
         Fetch repository data from Docker registries.
@@ -273,11 +284,7 @@ class DockerFetcher(HttpRepositoryFetcher):
         """
         if registry_name == "docker-hub":
             try:
-                # Split namespace and repository name
-                if "/" in image_name:
-                    namespace, repo_name = image_name.split("/", 1)
-                else:
-                    namespace, repo_name = "library", image_name
+                namespace, repo_name = self._split_image_name(image_name)
                 
                 # Fetch repository details
                 response = self._fetch_json(f"repositories/{namespace}/{repo_name}")
@@ -285,19 +292,7 @@ class DockerFetcher(HttpRepositoryFetcher):
                 if "name" in response:
                     # Fetch tags
                     tags_response = self._fetch_json(f"repositories/{namespace}/{repo_name}/tags")
-                    tags = [tag.get("name") for tag in tags_response.get("results", [])]
-                    
-                    return {
-                        "name": response.get("name"),
-                        "namespace": response.get("namespace", namespace),
-                        "description": response.get("description", ""),
-                        "star_count": response.get("star_count", 0),
-                        "pull_count": response.get("pull_count", 0),
-                        "is_official": response.get("is_official", False),
-                        "is_automated": response.get("is_automated", False),
-                        "tags": tags,
-                        "registry": registry_name
-                    }
+                    return self._parse_image_details(response, tags_response, namespace, registry_name)
             
             except Exception as e:
                 logger.warning(f"Failed to fetch image details for {image_name} from Docker Hub: {e}")
@@ -306,6 +301,93 @@ class DockerFetcher(HttpRepositoryFetcher):
             logger.warning(f"Fetching image details from {registry_name} is not supported")
             return None
     
+    def _fetch_image_details_batch(self, image_names: List[str], registry_name: str) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch detailed information about many container images concurrently.
+        
+        Repository details are fetched for all images first, then the tags of
+        the images that were found.
+        
+        Args:
+            image_names: Names of the images.
+            registry_name: Name of the registry.
+            
+        Returns:
+            Dictionary mapping the names of the images found to their metadata.
+        """
+        if registry_name != "docker-hub":
+            logger.warning(f"Fetching image details from {registry_name} is not supported")
+            return {}
+        
+        paths = {}
+        for image_name in image_names:
+            namespace, repo_name = self._split_image_name(image_name)
+            paths[f"repositories/{namespace}/{repo_name}"] = (image_name, namespace)
+        
+        responses = self._fetch_json_many(list(paths))
+        found = {path: response for path, response in responses.items() if "name" in response}
+        tags_responses = self._fetch_json_many([f"{path}/tags" for path in found])
+        
+        images = {}
+        for path, response in found.items():
+            tags_response = tags_responses.get(f"{path}/tags")
+            if tags_response is None:
+                continue
+            
+            image_name, namespace = paths[path]
+            images[image_name] = self._parse_image_details(response, tags_response, namespace, registry_name)
+        
+        return images
+    
+    def _split_image_name(self, image_name: str) -> Tuple[str, str]:
+        """
+        Split an image name into namespace and repository name.
+        
+        Args:
+            image_name: Name of the image, e.g. "nginx" or "bitnami/nginx".
+            
+        Returns:
+            Tuple of (namespace, repository name). Official images use the "library" namespace.
+        """
+        if "/" in image_name:
+            namespace, repo_name = image_name.split("/", 1)
+        else:
+            namespace, repo_name = "library", image_name
+        return namespace, repo_name
+    
+    def _parse_image_details(
+        self,
+        response: Dict[str, any],
+        tags_response: Dict[str, any],
+        namespace: str,
+        registry_name: str
+    ) -> Dict[str, any]:
+        """
+        Extract image metadata from Docker Hub repository and tags responses.
+        
+        Args:
+            response: Response of the repository endpoint.
+            tags_response: Response of the repository's tags endpoint.
+            namespace: Namespace of the image.
+            registry_name: Name of the registry.
+            
+        Returns:
+            Image metadata.
+        """
+        tags = [tag.get("name") for tag in tags_response.get("results", [])]
+        
+        return {
+            "name": response.get("name"),
+            "namespace": response.get("namespace", namespace),
+            "description": response.get("description", ""),
+            "star_count": response.get("star_count", 0),
+            "pull_count": response.get("pull_count", 0),
+            "is_official": response.get("is_official", False),
+            "is_automated": response.get("is_automated", False),
+            "tags": tags,
+            "registry": registry_name
+        }
+    
     def _search_images_in_registry(self, query: str, registry_name: str, max_results: int = 10) -> Dict[str, Dict[str, any]]:
         """
         Search for images in a registry.
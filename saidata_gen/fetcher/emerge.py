@@ -33,6 +33,12 @@ class EmergeFetcher(RepositoryFetcher):
     command to be available on the system.
     """
     
+    # Packages are cached by name, without repository keys
+    nested_package_cache = False
+    
+    # Number of categories searched with one emerge call
+    CATEGORY_BATCH_SIZE = 50
+    
     def __init__(self, config: Optional[FetcherConfig] = None):
         """
         Initialize the Emerge fetcher.
@@ -54,6 +60,7 @@ class EmergeFetcher(RepositoryFetcher):
         # Initialize package cache
         self._package_cache: Dict[str, Dict[str, any]] = {}
         self._category_cache: List[str] = []
+        self._package_info_batcher = self._create_command_batcher("package_info", self._fetch_package_info_batch)
     
     def get_repository_name(self) -> str:
         """
@@ -337,67 +344,111 @@ class EmergeFetcher(RepositoryFetcher):
         """
         Fetch information about a specific package.
         
+        Lookups are batched with concurrent lookups of other packages (see
+        ``_fetch_package_info_batch``) and their results are cached.
+        
         Args:
             package_name: Name of the package to get information for.
             
         Returns:
             Dictionary with package metadata if found, None otherwise.
         """
-        try:
-            # Run emerge --pretend --verbose to get package info
-            cmd_result = subprocess.run(
-                ["emerge", "--pretend", "--verbose", package_name],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            
-            # Parse the output
-            pkg_data = {}
+        return self._package_info_batcher.get(package_name)
+    
+    def _fetch_package_info_batch(self, package_names: List[str]) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch information about several packages with one call of each emerge command.
+        
+        Args:
+            package_names: Names of the packages to get information for.
             
+        Returns:
+            Dictionary mapping the names of the packages found to their metadata.
+        """
+        result = {package_name: {} for package_name in package_names}
+        
+        # Run emerge --pretend --verbose to get package info
+        cmd_result = subprocess.run(
+            ["emerge", "--pretend", "--verbose", *package_names],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        
+        # Parse the output, one line per package to be merged (including dependencies)
+        for line in cmd_result.stdout.splitlines():
             # Extract package name and version
-            pkg_match = re.search(r'\[ebuild[^\]]*\]\s+([a-z0-9_-]+/[a-z0-9_-]+-[0-9][0-9a-z_.-]*)', cmd_result.stdout)
-            if pkg_match:
-                full_name = pkg_match.group(1)
-                
-                # Extract version
-                version_match = re.search(r'-([0-9][0-9a-z_.-]*)$', full_name)
-                if version_match:
-                    pkg_data["version"] = version_match.group(1)
+            pkg_match = re.search(r'\[ebuild[^\]]*\]\s+(([a-z0-9_-]+/[a-z0-9_-]+)-([0-9][0-9a-z_.-]*))', line)
+            if not pkg_match:
+                continue
+            
+            package_name = self._match_requested_package(pkg_match.group(2), package_names)
+            if package_name is None or "version" in result[package_name]:
+                continue
+            
+            pkg_data = result[package_name]
+            pkg_data["version"] = pkg_match.group(3)
             
             # Extract USE flags
-            use_match = re.search(r'USE="([^"]*)"', cmd_result.stdout)
+            use_match = re.search(r'USE="([^"]*)"', line)
             if use_match:
                 pkg_data["use_flags"] = use_match.group(1)
-            
-            # Run emerge --info to get more details
-            cmd_result = subprocess.run(
-                ["emerge", "--info", package_name],
-                check=True,
-                capture_output=True,
-                text=True
-            )
+        
+        # Run emerge --info to get more details
+        cmd_result = subprocess.run(
+            ["emerge", "--info", *package_names],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        
+        # Split the output into the sections of the packages
+        sections = {}
+        if len(package_names) == 1:
+            sections[package_names[0]] = cmd_result.stdout
+        else:
+            parts = re.split(r'^([a-z0-9_-]+/[a-z0-9_-]+)-[0-9][0-9a-z_.-]*\S* was built with', cmd_result.stdout, flags=re.MULTILINE)
+            for full_name, section in zip(parts[1::2], parts[2::2]):
+                package_name = self._match_requested_package(full_name, package_names)
+                if package_name is not None:
+                    sections.setdefault(package_name, section)
+        
+        for package_name, section in sections.items():
+            pkg_data = result[package_name]
             
             # Extract description
-            desc_match = re.search(r'DESCRIPTION="([^"]*)"', cmd_result.stdout)
+            desc_match = re.search(r'DESCRIPTION="([^"]*)"', section)
             if desc_match:
                 pkg_data["description"] = desc_match.group(1)
             
             # Extract homepage
-            homepage_match = re.search(r'HOMEPAGE="([^"]*)"', cmd_result.stdout)
+            homepage_match = re.search(r'HOMEPAGE="([^"]*)"', section)
             if homepage_match:
                 pkg_data["homepage"] = homepage_match.group(1)
             
             # Extract license
-            license_match = re.search(r'LICENSE="([^"]*)"', cmd_result.stdout)
+            license_match = re.search(r'LICENSE="([^"]*)"', section)
             if license_match:
                 pkg_data["license"] = license_match.group(1)
+        
+        return result
+    
+    def _match_requested_package(self, full_name: str, package_names: List[str]) -> Optional[str]:
+        """
+        Find the requested package name matching a package of emerge output.
+        
+        Args:
+            full_name: Package name with category, e.g. "app-misc/foo".
+            package_names: Requested package names, with or without category.
             
-            return pkg_data
-            
-        except Exception as e:
-            logger.warning(f"Failed to fetch package info for {package_name}: {e}")
-            return None
+        Returns:
+            The matching requested name, or None if the package was not requested.
+        """
+        if full_name in package_names:
+            return full_name
+        
+        name = full_name.split("/", 1)[-1]
+        return name if name in package_names else None
     
     def _search_packages(self, query: str, max_results: int = 10) -> Dict[str, Dict[str, any]]:
         """
@@ -519,13 +570,14 @@ class EmergeFetcher(RepositoryFetcher):
                 packages_data = {}
                 failed_categories = []
                 
-                for category in categories:
+                for i in range(0, len(categories), self.CATEGORY_BATCH_SIZE):
+                    batch = categories[i:i + self.CATEGORY_BATCH_SIZE]
                     try:
-                        category_packages = self._fetch_category_packages_with_retries(category)
+                        category_packages = self._fetch_categories_packages_with_retries(batch)
                         packages_data.update(category_packages)
                     except Exception as e:
-                        failed_categories.append(category)
-                        logger.warning(f"Failed to fetch packages for category {category}: {e}")
+                        failed_categories.extend(batch)
+                        logger.warning(f"Failed to fetch packages for categories {', '.join(batch)}: {e}")
                 
                 if packages_data:
                     self._package_cache = packages_data
@@ -599,34 +651,49 @@ class EmergeFetcher(RepositoryFetcher):
         Returns:
             Dictionary mapping package names to their metadata.
         """
+        return self._fetch_categories_packages_with_retries([category])
+    
+    def _fetch_categories_packages_with_retries(self, categories: List[str]) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch the packages of several categories with one emerge search and retry logic.
+        
+        Args:
+            categories: Package categories.
+            
+        Returns:
+            Dictionary mapping package names to their metadata.
+        """
+        label = ", ".join(categories)
+        # "%@" makes emerge match a regular expression against "category/name"
+        pattern = "%@^(?:" + "|".join(re.escape(category) for category in categories) + ")/"
         max_attempts = 2
         
         for attempt in range(1, max_attempts + 1):
             try:
                 # Execute emerge command safely
                 result = self.dependency_checker.execute_command_safely(
-                    ["emerge", "--search", f"^{category}/"],
+                    ["emerge", "--search", pattern],
                     "emerge",
                     timeout=60  # Longer timeout for emerge operations
                 )
                 
                 if result is None:
                     if attempt == max_attempts:
-                        logger.warning(f"Failed to execute emerge command for category {category}")
+                        logger.warning(f"Failed to execute emerge command for categories {label}")
                         return {}
                     continue
                 
                 if result.returncode != 0:
-                    logger.warning(f"Emerge search returned non-zero exit code for {category}: {result.returncode}")
+                    logger.warning(f"Emerge search returned non-zero exit code for {label}: {result.returncode}")
                     if attempt == max_attempts:
                         return {}
                     continue
                 
                 # Parse the output
-                return self._parse_emerge_search_output(result.stdout, category)
+                return self._parse_emerge_search_output(result.stdout, label)
                 
             except Exception as e:
-                logger.warning(f"Failed to fetch packages for category {category} on attempt {attempt}: {e}")
+                logger.warning(f"Failed to fetch packages for categories {label} on attempt {attempt}: {e}")
                 if attempt == max_attempts:
                     return {}
         
@@ -2,11 +2,15 @@
 Factory for creating repository fetchers.
 
 This module provides a factory for creating repository fetchers for different
-package managers.
+package managers, along with a process-wide pool that keeps warm fetcher
+instances around so repository indexes are loaded once and reused.
 """
 
 import logging
-from typing import Dict, List, Optional, Type
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Type
 
 from saidata_gen.core.interfaces import FetcherConfig
 from saidata_gen.fetcher.base import RepositoryFetcher
@@ -15,27 +19,58 @@ from saidata_gen.fetcher.base import RepositoryFetcher
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PooledFetcher:
+    """A fetcher instance held by the fetcher pool."""
+    fetcher: RepositoryFetcher
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    use_count: int = 0
+
+
 class FetcherFactory:
     """
     Factory for creating repository fetchers.
     
     This class provides methods for creating and managing repository fetchers
-    for different package managers.
+    for different package managers. Besides creating fresh instances with
+    ``create_fetcher``, it keeps a thread-safe pool of long-lived fetchers
+    (``get_fetcher``) keyed by provider, configuration and constructor
+    arguments. Pooled fetchers that have not been used for ``idle_timeout``
+    seconds are evicted and their HTTP sessions closed.
     """
     
-    def __init__(self):
-        """Initialize the fetcher factory."""
+    def __init__(self, idle_timeout: float = 1800.0, max_pool_size: int = 64):
+        """
+        Initialize the fetcher factory.
+        
+        Args:
+            idle_timeout: Seconds a pooled fetcher may stay unused before it is evicted.
+                A value <= 0 disables idle eviction.
+            max_pool_size: Maximum number of pooled fetchers. When the pool is full,
+                the least recently used fetcher is evicted.
+        """
         self._fetcher_classes: Dict[str, Type[RepositoryFetcher]] = {}
+        self.idle_timeout = idle_timeout
+        self.max_pool_size = max_pool_size
+        self._pool: Dict[Tuple[Hashable, ...], PooledFetcher] = {}
+        self._pool_lock = threading.RLock()
     
     def register_fetcher(self, name: str, fetcher_class: Type[RepositoryFetcher]) -> None:
         """
         Register a fetcher class.
         
+        Re-registering a name with a different class drops any pooled
+        instances of the previous class.
+        
         Args:
             name: Name of the fetcher.
             fetcher_class: Fetcher class to register.
         """
+        previous_class = self._fetcher_classes.get(name)
         self._fetcher_classes[name] = fetcher_class
+        if previous_class is not None and previous_class is not fetcher_class:
+            self.evict_fetchers(name)
         logger.debug(f"Registered fetcher: {name}")
     
     def create_fetcher(
@@ -66,6 +101,114 @@ class FetcherFactory:
             logger.error(f"Failed to create fetcher {name}: {e}")
             return None
     
+    def get_fetcher(
+        self,
+        name: str,
+        config: Optional[FetcherConfig] = None,
+        **kwargs
+    ) -> Optional[RepositoryFetcher]:
+        """
+        Get a pooled fetcher instance, creating it on first use.
+        
+        Fetchers returned by this method are shared between callers (and
+        threads), so their in-memory package indexes and HTTP sessions stay
+        warm across generate calls.
+        
+        Args:
+            name: Name of the fetcher to get.
+            config: Configuration for the fetcher.
+            **kwargs: Additional arguments to pass to the fetcher constructor.
+            
+        Returns:
+            Fetcher instance if the fetcher is registered, None otherwise.
+        """
+        if name not in self._fetcher_classes:
+            logger.warning(f"Fetcher not registered: {name}")
+            return None
+        
+        key = self._make_pool_key(name, config, kwargs)
+        
+        with self._pool_lock:
+            self.evict_idle_fetchers()
+            
+            entry = self._pool.get(key)
+            if entry is None:
+                fetcher = self.create_fetcher(name, config, **kwargs)
+                if fetcher is None:
+                    return None
+                
+                if self.max_pool_size > 0 and len(self._pool) >= self.max_pool_size:
+                    self._evict_least_recently_used()
+                
+                entry = PooledFetcher(fetcher=fetcher)
+                self._pool[key] = entry
+                logger.debug(f"Added fetcher to pool: {name}")
+            
+            entry.last_used = time.time()
+            entry.use_count += 1
+            return entry.fetcher
+    
+    def evict_idle_fetchers(self, idle_timeout: Optional[float] = None) -> int:
+        """
+        Evict pooled fetchers that have been idle for too long.
+        
+        Args:
+            idle_timeout: Idle time in seconds. If None, uses the factory's idle_timeout.
+            
+        Returns:
+            Number of evicted fetchers.
+        """
+        timeout = self.idle_timeout if idle_timeout is None else idle_timeout
+        if timeout <= 0:
+            return 0
+        
+        cutoff = time.time() - timeout
+        with self._pool_lock:
+            expired_keys = [key for key, entry in self._pool.items() if entry.last_used < cutoff]
+            for key in expired_keys:
+                self._close_entry(self._pool.pop(key))
+        
+        if expired_keys:
+            logger.debug(f"Evicted {len(expired_keys)} idle fetchers from pool")
+        return len(expired_keys)
+    
+    def evict_fetchers(self, name: Optional[str] = None) -> int:
+        """
+        Evict pooled fetchers.
+        
+        Args:
+            name: Name of the fetcher to evict. If None, the whole pool is cleared.
+            
+        Returns:
+            Number of evicted fetchers.
+        """
+        with self._pool_lock:
+            keys = [key for key in self._pool if name is None or key[0] == name]
+            for key in keys:
+                self._close_entry(self._pool.pop(key))
+        return len(keys)
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the fetcher pool.
+        
+        Returns:
+            Dictionary with the pool size and per-provider instance and use counts.
+        """
+        with self._pool_lock:
+            providers: Dict[str, Dict[str, int]] = {}
+            for key, entry in self._pool.items():
+                stats = providers.setdefault(key[0], {"instances": 0, "uses": 0})
+                stats["instances"] += 1
+                stats["uses"] += entry.use_count
+            
+            return {
+                "size": len(self._pool),
+                "max_size": self.max_pool_size,
+                "idle_timeout": self.idle_timeout,
+                "providers": providers,
+            }
+    
     def get_available_fetchers(self) -> List[str]:
         """
         Get a list of available fetcher names.
@@ -95,7 +238,53 @@ class FetcherFactory:
             Dictionary mapping fetcher names to their classes.
         """
         return self._fetcher_classes.copy()
+    
+    def _make_pool_key(
+        self,
+        name: str,
+        config: Optional[FetcherConfig],
+        kwargs: Dict[str, Any]
+    ) -> Tuple[Hashable, ...]:
+        """
+        Build the pool key for a fetcher request.
+        
+        Args:
+            name: Name of the fetcher.
+            config: Configuration for the fetcher.
+            kwargs: Additional constructor arguments.
+            
+        Returns:
+            Hashable key identifying an equivalent fetcher instance.
+        """
+        config_key = tuple(sorted(asdict(config or FetcherConfig()).items()))
+        # Constructor arguments may be unhashable (e.g. lists of distributions),
+        # so their repr is used as a stable stand-in.
+        kwargs_key = tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+        return (name, config_key, kwargs_key)
+    
+    def _evict_least_recently_used(self) -> None:
+        """Evict the least recently used pooled fetcher."""
+        if not self._pool:
+            return
+        
+        key = min(self._pool, key=lambda k: self._pool[k].last_used)
+        self._close_entry(self._pool.pop(key))
+        logger.debug(f"Evicted least recently used fetcher from pool: {key[0]}")
+    
+    def _close_entry(self, entry: PooledFetcher) -> None:
+        """
+        Release the resources held by a pooled fetcher.
+        
+        Args:
+            entry: Pooled fetcher entry to close.
+        """
+        session = getattr(entry.fetcher, "session", None)
+        if session is not None and hasattr(session, "close"):
+            try:
+                session.close()
+            except Exception as e:
+                logger.debug(f"Failed to close fetcher session: {e}")
 
 
 # Create a singleton instance
-fetcher_factory = FetcherFactory()
\ No newline at end of file
+fetcher_factory = FetcherFactory()
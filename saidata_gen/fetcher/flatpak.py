@@ -285,25 +285,66 @@ class FlatpakFetcher(HttpRepositoryFetcher):
                 # Fetch application details from Flathub
                 response = self._fetch_json(f"apps/{app_id}")
                 
-                if "flatpakAppId" in response:
-                    return {
-                        "id": response.get("flatpakAppId"),
-                        "name": response.get("name"),
-                        "summary": response.get("summary"),
-                        "description": response.get("description"),
-                        "version": response.get("currentReleaseVersion"),
-                        "developer_name": response.get("developerName"),
-                        "project_license": response.get("projectLicense"),
-                        "icon_url": response.get("iconDesktopUrl"),
-                        "download_size": response.get("downloadSize"),
-                        "installed_size": response.get("installedSize"),
-                        "categories": response.get("categories", []),
-                        "repository": repo_name
-                    }
+                return self._parse_application_details(response, repo_name)
             
             except Exception as e:
                 logger.warning(f"Failed to fetch application details for {app_id} from Flathub: {e}")
                 return None
         else:
             logger.warning(f"Fetching application details from {repo_name} is not supported")
-            return None
\ No newline at end of file
+            return None
+    
+    def _fetch_application_details_batch(self, app_ids: List[str], repo_name: str) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch detailed information about many Flatpak applications concurrently.
+        
+        Args:
+            app_ids: IDs of the applications.
+            repo_name: Name of the repository.
+            
+        Returns:
+            Dictionary mapping the IDs of the applications found to their metadata.
+        """
+        if repo_name != "flathub":
+            logger.warning(f"Fetching application details from {repo_name} is not supported")
+            return {}
+        
+        paths = {f"apps/{app_id}": app_id for app_id in app_ids}
+        responses = self._fetch_json_many(list(paths))
+        
+        apps = {}
+        for path, response in responses.items():
+            app_data = self._parse_application_details(response, repo_name)
+            if app_data:
+                apps[paths[path]] = app_data
+        
+        return apps
+    
+    def _parse_application_details(self, response: Dict[str, any], repo_name: str) -> Optional[Dict[str, any]]:
+        """
+        Extract application metadata from a Flathub application response.
+        
+        Args:
+            response: Response of the application endpoint.
+            repo_name: Name of the repository.
+            
+        Returns:
+            Application metadata, or None if the response has no application ID.
+        """
+        if "flatpakAppId" not in response:
+            return None
+        
+        return {
+            "id": response.get("flatpakAppId"),
+            "name": response.get("name"),
+            "summary": response.get("summary"),
+            "description": response.get("description"),
+            "version": response.get("currentReleaseVersion"),
+            "developer_name": response.get("developerName"),
+            "project_license": response.get("projectLicense"),
+            "icon_url": response.get("iconDesktopUrl"),
+            "download_size": response.get("downloadSize"),
+            "installed_size": response.get("installedSize"),
+            "categories": response.get("categories", []),
+            "repository": repo_name
+        }
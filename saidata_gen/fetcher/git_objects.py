@@ -0,0 +1,243 @@
+"""
+Read files of a Git repository from its object database.
+
+``GitObjectReader`` serves file contents and directory listings of one commit
+without a working tree: contents come from a single long-lived
+``git cat-file --batch`` process, and the tree of the commit is listed once
+with ``git ls-tree``. Because a reader is pinned to a commit, several
+fetchers (or processes) can read the same bare repository while it is being
+updated.
+"""
+
+import logging
+import re
+import subprocess
+import threading
+from typing import Dict, List, Optional, Pattern
+
+logger = logging.getLogger(__name__)
+
+
+class GitObjectReader:
+    """
+    Reader for the files of one commit of a Git repository.
+    """
+    
+    def __init__(self, git_dir: str, revision: str = "HEAD"):
+        """
+        Initialize the reader.
+        
+        Args:
+            git_dir: Path of the repository (a bare repository or a checkout).
+            revision: Revision to read; resolved to a commit once.
+        
+        Raises:
+            subprocess.SubprocessError: If the revision cannot be resolved.
+            OSError: If git cannot be run.
+        """
+        self.git_dir = git_dir
+        self.commit = subprocess.run(
+            ["git", "-C", git_dir, "rev-parse", "--verify", f"{revision}^{{commit}}"],
+            check=True,
+            capture_output=True,
+            text=True
+        ).stdout.strip()
+        
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, str]] = None
+    
+    def _get_entries(self) -> Dict[str, str]:
+        """
+        Get the paths of the commit's tree, listing it on first use.
+        
+        Returns:
+            Dictionary mapping paths (with "/" separators) to their object type,
+            "blob" or "tree".
+        """
+        with self._lock:
+            if self._entries is None:
+                output = subprocess.run(
+                    ["git", "-C", self.git_dir, "ls-tree", "-r", "-t", "-z", "--full-tree", self.commit],
+                    check=True,
+                    capture_output=True
+                ).stdout
+                
+                entries = {}
+                for record in output.split(b"\0"):
+                    if not record:
+                        continue
+                    info, path = record.split(b"\t", 1)
+                    entries[path.decode("utf-8", errors="surrogateescape")] = info.split()[1].decode()
+                self._entries = entries
+            
+            return self._entries
+    
+    def read(self, path: str) -> Optional[bytes]:
+        """
+        Read the content of a file.
+        
+        Args:
+            path: File path relative to the repository root, with "/" separators.
+        
+        Returns:
+            Content of the file, or None if the path is missing or not a file.
+        """
+        if "\n" in path:
+            return None
+        
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._process = subprocess.Popen(
+                    ["git", "-C", self.git_dir, "cat-file", "--batch"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+            
+            process = self._process
+            try:
+                process.stdin.write(f"{self.commit}:{path}\n".encode("utf-8", errors="surrogateescape"))
+                process.stdin.flush()
+                
+                header = process.stdout.readline().split()
+                if len(header) != 3:
+                    # "<object> missing" or "<object> ambiguous"
+                    return None
+                
+                size = int(header[2])
+                content = process.stdout.read(size)
+                process.stdout.read(1)  # Trailing newline
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to read {path} from {self.git_dir}: {e}")
+                self._close_process()
+                return None
+            
+            return content if header[1] == b"blob" else None
+    
+    def is_dir(self, path: str) -> bool:
+        """
+        Check whether a path is a directory of the commit's tree.
+        
+        Args:
+            path: Path relative to the repository root, with "/" separators.
+        
+        Returns:
+            True if the path is a directory (the root is always one).
+        """
+        path = path.strip("/")
+        return not path or self._get_entries().get(path) == "tree"
+    
+    def exists(self, path: str) -> bool:
+        """
+        Check whether a path exists in the commit's tree.
+        
+        Args:
+            path: Path relative to the repository root, with "/" separators.
+        
+        Returns:
+            True if the path is a file or a directory.
+        """
+        path = path.strip("/")
+        return not path or path in self._get_entries()
+    
+    def list_files(self, directory: str = "", pattern: str = "*") -> List[str]:
+        """
+        List the paths below a directory matching a glob pattern.
+        
+        The pattern has the semantics of ``glob.glob(..., recursive=True)``:
+        ``*`` does not cross directories, ``**`` matches any number of
+        directories, and wildcards do not match hidden names.
+        
+        Args:
+            directory: Directory relative to the repository root.
+            pattern: Glob pattern, relative to the directory.
+        
+        Returns:
+            Sorted matching paths relative to the repository root.
+        """
+        directory = directory.strip("/")
+        prefix = f"{directory}/" if directory else ""
+        regex = _glob_to_regex(pattern)
+        
+        return sorted(
+            path for path in self._get_entries()
+            if path.startswith(prefix) and regex.match(path[len(prefix):])
+        )
+    
+    def _close_process(self) -> None:
+        """Terminate the cat-file process. Must be called with the lock held."""
+        if self._process is not None:
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except (OSError, subprocess.SubprocessError):
+                self._process.kill()
+            self._process = None
+    
+    def close(self) -> None:
+        """Stop the cat-file process of the reader."""
+        with self._lock:
+            self._close_process()
+
+
+def _glob_to_regex(pattern: str) -> Pattern[str]:
+    """
+    Translate a recursive glob pattern into a regular expression.
+    
+    Args:
+        pattern: Glob pattern with "/" separators.
+    
+    Returns:
+        Compiled regular expression matching whole paths.
+    """
+    parts = []
+    components = pattern.strip("/").split("/")
+    for i, component in enumerate(components):
+        last = i == len(components) - 1
+        if component == "**":
+            # Any number of (non-hidden) directories, or any path at the end
+            parts.append(r"(?:(?!\.)[^/]+(?:/(?!\.)[^/]+)*)?" if last else r"(?:(?!\.)[^/]+/)*")
+            continue
+        
+        translated = _translate_component(component)
+        if component[:1] in ("*", "?", "["):
+            translated = r"(?!\.)" + translated
+        parts.append(translated + ("" if last else "/"))
+    
+    return re.compile("".join(parts) + r"\Z")
+
+
+def _translate_component(component: str) -> str:
+    """
+    Translate one path component of a glob pattern into a regular expression.
+    
+    Args:
+        component: Path component without "/".
+    
+    Returns:
+        Regular expression source matching the component.
+    """
+    translated = []
+    i = 0
+    while i < len(component):
+        char = component[i]
+        i += 1
+        if char == "*":
+            translated.append("[^/]*")
+        elif char == "?":
+            translated.append("[^/]")
+        elif char == "[":
+            end = component.find("]", i + 1 if component[i:i + 1] in ("!", "]") else i)
+            if end == -1:
+                translated.append(re.escape(char))
+                continue
+            chars = component[i:end].replace("\\", "\\\\")
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            translated.append(f"[{chars}]")
+            i = end + 1
+        else:
+            translated.append(re.escape(char))
+    
+    return "".join(translated)
@@ -32,6 +32,9 @@ class GuixFetcher(RepositoryFetcher):
     available on the system.
     """
     
+    # Packages are cached by name, without repository keys
+    nested_package_cache = False
+    
     def __init__(self, config: Optional[FetcherConfig] = None):
         """
         Initialize the Guix fetcher.
@@ -56,6 +59,7 @@ class GuixFetcher(RepositoryFetcher):
         
         # Initialize package cache
         self._package_cache: Dict[str, Dict[str, any]] = {}
+        self._package_info_batcher = self._create_command_batcher("package_info", self._fetch_package_info_batch)
     
     def get_repository_name(self) -> str:
         """
@@ -312,85 +316,125 @@ class GuixFetcher(RepositoryFetcher):
         """
         Fetch information about a specific package.
         
+        Lookups are batched with concurrent lookups of other packages (see
+        ``_fetch_package_info_batch``) and their results are cached.
+        
         Args:
             package_name: Name of the package to get information for.
             
         Returns:
             Dictionary with package metadata if found, None otherwise.
         """
+        return self._package_info_batcher.get(package_name)
+    
+    def _fetch_package_info_batch(self, package_names: List[str]) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch information about several packages with one guix show call.
+        
+        Args:
+            package_names: Names of the packages to get information for.
+            
+        Returns:
+            Dictionary mapping the names of the packages found to their metadata.
+        """
         try:
             # Run guix show in JSON format
             cmd_result = subprocess.run(
-                ["guix", "show", "--format=json", package_name],
+                ["guix", "show", "--format=json", *package_names],
                 check=True,
                 capture_output=True,
                 text=True
             )
             
-            # Parse the JSON output
-            pkg_data = json.loads(cmd_result.stdout)
+            # Parse the JSON output, one object per package
+            packages = json.loads(cmd_result.stdout)
+            if isinstance(packages, dict):
+                packages = [packages]
             
-            # Extract relevant fields
-            return {
-                "version": pkg_data.get("version"),
-                "description": pkg_data.get("description"),
-                "synopsis": pkg_data.get("synopsis"),
-                "license": pkg_data.get("license"),
-                "homepage": pkg_data.get("home-page"),
-                "location": pkg_data.get("location"),
-                "dependencies": pkg_data.get("dependencies", []),
-                "inputs": pkg_data.get("inputs", [])
-            }
+            result = {}
+            for pkg_data in packages:
+                name = pkg_data.get("name")
+                if len(package_names) == 1:
+                    name = package_names[0]
+                if name in package_names and name not in result:
+                    # Extract relevant fields
+                    result[name] = {
+                        "version": pkg_data.get("version"),
+                        "description": pkg_data.get("description"),
+                        "synopsis": pkg_data.get("synopsis"),
+                        "license": pkg_data.get("license"),
+                        "homepage": pkg_data.get("home-page"),
+                        "location": pkg_data.get("location"),
+                        "dependencies": pkg_data.get("dependencies", []),
+                        "inputs": pkg_data.get("inputs", [])
+                    }
+            
+            return result
             
         except Exception as e:
-            logger.warning(f"Failed to fetch package info for {package_name}: {e}")
+            logger.warning(f"Failed to fetch package info for {', '.join(package_names)}: {e}")
+        
+        # Try alternative approach with guix show, which prints one record per package
+        cmd_result = subprocess.run(
+            ["guix", "show", *package_names],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        
+        result = {}
+        for record in re.split(r"\n\s*\n", cmd_result.stdout):
+            name_match = re.search(r"^name: (.+)$", record, re.MULTILINE)
+            name = name_match.group(1).strip() if name_match else None
+            if len(package_names) == 1:
+                name = package_names[0]
+            if name in package_names and name not in result:
+                result[name] = self._parse_guix_show_record(record)
+        
+        return result
+    
+    def _parse_guix_show_record(self, record: str) -> Dict[str, any]:
+        """
+        Parse one package record of the plain guix show output.
+        
+        Args:
+            record: Lines of the record.
             
-            # Try alternative approach with guix show
-            try:
-                cmd_result = subprocess.run(
-                    ["guix", "show", package_name],
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-                
-                # Parse the output
-                pkg_data = {}
-                
-                for line in cmd_result.stdout.splitlines():
-                    line = line.strip()
-                    
-                    if not line:
-                        continue
-                    
-                    # Extract version
-                    version_match = re.match(r'version: ([0-9][0-9a-z_.-]*)', line)
-                    if version_match:
-                        pkg_data["version"] = version_match.group(1)
-                        continue
-                    
-                    # Extract description
-                    if line.startswith("description:"):
-                        pkg_data["description"] = line[12:].strip()
-                        continue
-                    
-                    # Extract license
-                    license_match = re.match(r'license: (.+)', line)
-                    if license_match:
-                        pkg_data["license"] = license_match.group(1)
-                        continue
-                    
-                    # Extract homepage
-                    homepage_match = re.match(r'home page: (.+)', line)
-                    if homepage_match:
-                        pkg_data["homepage"] = homepage_match.group(1)
-                        continue
-                
-                return pkg_data
-                
-            except Exception as e2:
-                logger.warning(f"Failed to fetch package info with alternative approach: {e2}")
-                return None
+        Returns:
+            Dictionary with package metadata.
+        """
+        pkg_data = {}
+        
+        for line in record.splitlines():
+            line = line.strip()
+            
+            if not line:
+                continue
+            
+            # Extract version
+            version_match = re.match(r'version: ([0-9][0-9a-z_.-]*)', line)
+            if version_match:
+                pkg_data["version"] = version_match.group(1)
+                continue
+            
+            # Extract description
+            if line.startswith("description:"):
+                pkg_data["description"] = line[12:].strip()
+                continue
+            
+            # Extract license
+            license_match = re.match(r'license: (.+)', line)
+            if license_match:
+                pkg_data["license"] = license_match.group(1)
+                continue
+            
+            # Extract homepage
+            homepage_match = re.match(r'home page: (.+)', line)
+            if homepage_match:
+                pkg_data["homepage"] = homepage_match.group(1)
+                continue
+        
+        return pkg_data
     
     def _search_packages(self, query: str, max_results: int = 10) -> Dict[str, Dict[str, any]]:
         """
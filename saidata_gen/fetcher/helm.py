@@ -94,6 +94,17 @@ class HelmFetcher(HttpRepositoryFetcher):
         """
         return "helm"
     
+    def get_all_package_names(self) -> List[str]:
+        """
+        Get the names of all charts in the loaded repository data.
+        
+        Returns:
+            Sorted list of unique chart names.
+        """
+        if not self._chart_cache:
+            self.warm_up()
+        return self._collect_package_names(self._chart_cache)
+    
     def fetch_repository_data(self) -> FetchResult:
         """
         Fetch repository data from Helm repositories.
@@ -230,34 +241,8 @@ class HelmFetcher(HttpRepositoryFetcher):
             # Fetch the index.yaml file
             response = self._fetch_text("index.yaml")
             
-            # Parse the YAML
-            index = yaml.safe_load(response)
-            
-            charts = {}
-            for chart_name, chart_versions in index.get("entries", {}).items():
-                if chart_versions:
-                    # Get the latest version
-                    latest_version = chart_versions[0]
-                    
-                    # Extract chart metadata
-                    charts[chart_name] = {
-                        "name": chart_name,
-                        "version": latest_version.get("version"),
-                        "description": latest_version.get("description"),
-                        "app_version": latest_version.get("appVersion"),
-                        "api_version": latest_version.get("apiVersion"),
-                        "home": latest_version.get("home"),
-                        "sources": latest_version.get("sources", []),
-                        "keywords": latest_version.get("keywords", []),
-                        "maintainers": latest_version.get("maintainers", []),
-                        "icon": latest_version.get("icon"),
-                        "urls": latest_version.get("urls", []),
-                        "created": latest_version.get("created"),
-                        "digest": latest_version.get("digest"),
-                        "repository": repo_name
-                    }
-            
-            return charts
+            # Parse the YAML, in a worker process if it is large
+            return self._parse_content(parse_helm_index, response.encode("utf-8"), repo_name)
         
         except Exception as e:
             logger.warning(f"Failed to fetch repository index for {repo_name}: {e}")
@@ -332,4 +317,48 @@ class HelmFetcher(HttpRepositoryFetcher):
                 logger.warning(f"Failed to fetch chart details for {chart_name} from {repo_name}: {e}")
                 return chart_data
         
-        return None
\ No newline at end of file
+        return None
+
+
+def parse_helm_index(content: bytes, repo_name: str) -> Dict[str, Dict[str, any]]:
+    """
+    Parse a Helm repository index.yaml file.
+    
+    Only the latest version of each chart is kept. This is a module-level
+    function so that it can run in a parse worker process.
+    
+    Args:
+        content: Content of the index.yaml file.
+        repo_name: Name of the repository.
+        
+    Returns:
+        Dictionary mapping chart names to their metadata.
+    """
+    # Use the libyaml loader when PyYAML was built with it
+    index = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    
+    charts = {}
+    for chart_name, chart_versions in index.get("entries", {}).items():
+        if chart_versions:
+            # Get the latest version
+            latest_version = chart_versions[0]
+            
+            # Extract chart metadata
+            charts[chart_name] = {
+                "name": chart_name,
+                "version": latest_version.get("version"),
+                "description": latest_version.get("description"),
+                "app_version": latest_version.get("appVersion"),
+                "api_version": latest_version.get("apiVersion"),
+                "home": latest_version.get("home"),
+                "sources": latest_version.get("sources", []),
+                "keywords": latest_version.get("keywords", []),
+                "maintainers": latest_version.get("maintainers", []),
+                "icon": latest_version.get("icon"),
+                "urls": latest_version.get("urls", []),
+                "created": latest_version.get("created"),
+                "digest": latest_version.get("digest"),
+                "repository": repo_name
+            }
+    
+    return charts
@@ -0,0 +1,278 @@
+"""
+In-memory package index for repository fetchers.
+
+This module provides an inverted index over the package names and descriptions
+held in a fetcher's package cache, so that name lookups and searches do not
+have to scan every cached package.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def package_texts(pkg_data: Mapping[str, Any], text_fields: Sequence[str]) -> List[str]:
+    """
+    Collect the searchable text values of a package.
+    
+    Args:
+        pkg_data: Package data.
+        text_fields: Fields to collect.
+    
+    Returns:
+        Non-empty string values of the fields, in field order.
+    """
+    if not isinstance(pkg_data, Mapping):
+        return []
+    
+    texts = []
+    for field_name in text_fields:
+        value = pkg_data.get(field_name)
+        if value and isinstance(value, str):
+            texts.append(value)
+    return texts
+
+
+class PackageIndex:
+    """
+    Inverted index over a fetcher package cache.
+    
+    Every (cache key, package name) pair in the cache gets an integer id in
+    cache iteration order. The index maps name and description tokens to the
+    ids containing them, and keeps a sorted array of package names for
+    prefix lookups. Searches return the same packages, in the same order,
+    as a substring scan over the cache would.
+    """
+    
+    TOKEN_MATCH_CACHE_SIZE = 1024
+    
+    def __init__(
+        self,
+        package_cache: Mapping[str, Mapping[str, Mapping[str, Any]]],
+        text_fields: Sequence[str]
+    ):
+        """
+        Build the index.
+        
+        Args:
+            package_cache: Mapping of cache key to mapping of package name to package data.
+            text_fields: Package data fields whose text is searchable in addition to the name.
+        """
+        self.text_fields = tuple(text_fields)
+        self.signature = self.cache_signature(package_cache)
+        
+        self._entries: List[Tuple[str, str]] = []
+        self._texts: List[Tuple[str, ...]] = []
+        self._names: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        
+        for cache_key, packages in package_cache.items():
+            for pkg_name, values in self._iter_package_texts(packages):
+                entry_id = len(self._entries)
+                self._entries.append((cache_key, pkg_name))
+                self._names.setdefault(pkg_name, entry_id)
+                
+                texts = (pkg_name.lower(),) + tuple(value.lower() for value in values)
+                self._texts.append(texts)
+                
+                for token in set(_TOKEN_PATTERN.findall(" ".join(texts))):
+                    self._postings.setdefault(token, []).append(entry_id)
+        
+        self._sorted_names: List[str] = sorted(self._names)
+        
+        # Trigram index over the token vocabulary, built on the first search
+        self._tokens: List[str] = []
+        self._token_grams: Optional[Dict[str, List[int]]] = None
+        self._token_grams_lock = threading.Lock()
+        
+        # Least recently used token matches
+        self._token_matches: "OrderedDict[str, Set[int]]" = OrderedDict()
+        self._token_matches_lock = threading.Lock()
+    
+    def _iter_package_texts(self, packages: Mapping[str, Any]) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Iterate over the names and searchable text of a cache entry.
+        
+        Snapshot-backed entries provide their text directly, so package data
+        does not have to be decoded to build the index.
+        
+        Args:
+            packages: Mapping of package name to package data.
+        
+        Returns:
+            Iterator of (package name, text values).
+        """
+        index_texts = getattr(packages, "index_texts", None)
+        if index_texts is not None:
+            texts = index_texts(self.text_fields)
+            if texts is not None:
+                return texts
+        
+        return (
+            (pkg_name, package_texts(pkg_data, self.text_fields))
+            for pkg_name, pkg_data in packages.items()
+        )
+    
+    @staticmethod
+    def cache_signature(package_cache: Mapping[str, Mapping[str, Any]]) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Compute a cheap signature used to detect package cache changes.
+        
+        Args:
+            package_cache: Package cache to compute the signature for.
+        
+        Returns:
+            Tuple of (cache key, identity, size) for each cache entry.
+        """
+        return tuple(
+            (cache_key, id(packages), len(packages))
+            for cache_key, packages in package_cache.items()
+        )
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def lookup(self, package_name: str) -> Optional[str]:
+        """
+        Find the first cache key containing a package.
+        
+        Args:
+            package_name: Exact package name.
+        
+        Returns:
+            Cache key of the first entry with that name, or None if not indexed.
+        """
+        entry_id = self._names.get(package_name)
+        if entry_id is None:
+            return None
+        return self._entries[entry_id][0]
+    
+    def names(self) -> List[str]:
+        """
+        Get all indexed package names.
+        
+        Returns:
+            Sorted list of unique package names.
+        """
+        return list(self._sorted_names)
+    
+    def search(self, query: str) -> Iterator[Tuple[str, str]]:
+        """
+        Find packages whose name or indexed text contains the query.
+        
+        Matching is a case-insensitive substring match, like a scan over the
+        cache, but only candidates sharing the query's tokens are checked.
+        
+        Args:
+            query: Search query.
+        
+        Yields:
+            (cache key, package name) pairs in cache order.
+        """
+        query_lower = query.lower()
+        query_tokens = set(_TOKEN_PATTERN.findall(query_lower))
+        
+        if not query_tokens:
+            # Queries without alphanumerics cannot use the index.
+            candidates: Iterable[int] = range(len(self._entries))
+        else:
+            candidate_set: Optional[Set[int]] = None
+            # Resolve the most selective (longest) tokens first.
+            for token in sorted(query_tokens, key=len, reverse=True):
+                ids = self._ids_for_token_substring(token)
+                candidate_set = ids if candidate_set is None else candidate_set & ids
+                if not candidate_set:
+                    return
+            candidates = sorted(candidate_set or ())
+        
+        for entry_id in candidates:
+            if any(query_lower in text for text in self._texts[entry_id]):
+                yield self._entries[entry_id]
+    
+    def _ids_for_token_substring(self, token: str) -> Set[int]:
+        """
+        Get ids of entries with an indexed token containing the given token.
+        
+        Args:
+            token: Lowercase alphanumeric token.
+        
+        Returns:
+            Set of entry ids.
+        """
+        with self._token_matches_lock:
+            ids = self._token_matches.get(token)
+            if ids is not None:
+                self._token_matches.move_to_end(token)
+                return ids
+        
+        # Tokens are maximal alphanumeric runs, so an alphanumeric query token
+        # occurs in a text only if it is a substring of one of its tokens.
+        ids = set()
+        for token_id in self._tokens_containing(token):
+            ids.update(self._postings[self._tokens[token_id]])
+        
+        with self._token_matches_lock:
+            self._token_matches[token] = ids
+            if len(self._token_matches) > self.TOKEN_MATCH_CACHE_SIZE:
+                self._token_matches.popitem(last=False)
+        return ids
+    
+    def _get_token_grams(self) -> Dict[str, List[int]]:
+        """
+        Get the trigram index over the token vocabulary, building it if needed.
+        
+        Each token is padded with "\0" on both sides, so every substring of up
+        to three characters is part of one of its trigrams.
+        
+        Returns:
+            Mapping of padded trigram to the ids of the tokens containing it.
+        """
+        with self._token_grams_lock:
+            if self._token_grams is None:
+                tokens = list(self._postings)
+                token_grams: Dict[str, List[int]] = {}
+                for token_id, token in enumerate(tokens):
+                    padded = f"\0{token}\0"
+                    for gram in {padded[i:i + 3] for i in range(len(padded) - 2)}:
+                        token_grams.setdefault(gram, []).append(token_id)
+                self._tokens = tokens
+                self._token_grams = token_grams
+            return self._token_grams
+    
+    def _tokens_containing(self, token: str) -> Set[int]:
+        """
+        Find the indexed tokens containing a token.
+        
+        Args:
+            token: Lowercase alphanumeric token.
+        
+        Returns:
+            Ids of the indexed tokens containing the token.
+        """
+        token_grams = self._get_token_grams()
+        
+        if len(token) < 3:
+            # A shorter token is part of a padded trigram of every token
+            # containing it, and cannot overlap the padding; there are far
+            # fewer trigrams than tokens
+            found: Set[int] = set()
+            for gram, token_ids in token_grams.items():
+                if token in gram:
+                    found.update(token_ids)
+            return found
+        
+        # Candidates have every trigram of the token; start from the rarest
+        postings = sorted(
+            (token_grams.get(token[i:i + 3], []) for i in range(len(token) - 2)),
+            key=len
+        )
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(other)
+        return {token_id for token_id in candidates if token in self._tokens[token_id]}
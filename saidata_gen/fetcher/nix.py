@@ -12,7 +12,7 @@ import re
 import subprocess
 import tempfile
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
@@ -32,6 +32,9 @@ class NixFetcher(RepositoryFetcher):
     available on the system.
     """
     
+    # Packages are cached by name, without repository keys
+    nested_package_cache = False
+    
     def __init__(self, config: Optional[FetcherConfig] = None):
         """
         Initialize the Nix fetcher.
@@ -55,7 +58,10 @@ class NixFetcher(RepositoryFetcher):
             self.dependency_checker.log_missing_dependency("nix", "nix")
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, any]] = {}
+        self._package_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Package details not in the package list are looked up in batches
+        self._package_info_batcher = self._create_command_batcher("package_info", self._fetch_package_info_batch)
     
     def get_repository_name(self) -> str:
         """
@@ -194,7 +200,7 @@ class NixFetcher(RepositoryFetcher):
         
         return results
     
-    def _create_package_info(self, package_name: str, package_data: Dict[str, any]) -> PackageInfo:
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
         """
         Create a PackageInfo object from package data.
         
@@ -226,7 +232,7 @@ class NixFetcher(RepositoryFetcher):
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
     
-    def _fetch_packages(self) -> Dict[str, Dict[str, any]]:
+    def _fetch_packages(self) -> Dict[str, Dict[str, Any]]:
         """
         Fetch the list of available packages.
         
@@ -248,32 +254,9 @@ class NixFetcher(RepositoryFetcher):
             packages = json.loads(cmd_result.stdout)
             
             for attr_path, pkg_data in packages.items():
-                # Extract package name
-                name = pkg_data.get("name")
+                name, data = self._parse_nix_env_package(attr_path, pkg_data)
                 if name:
-                    # Remove version from name
-                    name_parts = name.split("-")
-                    version = None
-                    
-                    # Find the first part that looks like a version
-                    for i, part in enumerate(name_parts):
-                        if re.match(r'^[0-9]', part):
-                            version = "-".join(name_parts[i:])
-                            name = "-".join(name_parts[:i])
-                            break
-                    
-                    # If no version found, use the original name
-                    if not version:
-                        version = pkg_data.get("version")
-                    
-                    result[name] = {
-                        "version": version,
-                        "description": pkg_data.get("meta", {}).get("description"),
-                        "license": pkg_data.get("meta", {}).get("license"),
-                        "homepage": pkg_data.get("meta", {}).get("homepage"),
-                        "position": pkg_data.get("meta", {}).get("position"),
-                        "attr_path": attr_path
-                    }
+                    result[name] = data
         
         except Exception as e:
             logger.warning(f"Failed to fetch packages: {e}")
@@ -328,94 +311,140 @@ class NixFetcher(RepositoryFetcher):
         
         return result
     
-    def _fetch_package_info(self, package_name: str) -> Optional[Dict[str, any]]:
+    def _fetch_package_info(self, package_name: str) -> Optional[Dict[str, Any]]:
         """
         Fetch information about a specific package.
         
+        Lookups are batched with concurrent lookups of other packages (see
+        ``_fetch_package_info_batch``) and their results are cached.
+        
         Args:
             package_name: Name of the package to get information for.
             
         Returns:
             Dictionary with package metadata if found, None otherwise.
         """
-        try:
-            # Try to find the attribute path for the package
-            attr_path = None
-            
-            # Check if we have the attribute path in the cache
-            for name, data in self._package_cache.items():
-                if name == package_name:
-                    attr_path = data.get("attr_path")
-                    break
-            
-            if not attr_path:
-                # Try to find the attribute path using nix search
-                cmd_result = subprocess.run(
-                    ["nix", "search", "nixpkgs", f"^{package_name}$"],
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-                
-                # Parse the output to find the attribute path
-                for line in cmd_result.stdout.splitlines():
-                    pkg_match = re.match(r'(\S+)\s+\(([^)]+)\)', line)
-                    if pkg_match:
-                        attr_path = pkg_match.group(1)
-                        break
-            
-            if not attr_path:
-                return None
+        return self._package_info_batcher.get(package_name)
+    
+    def _fetch_package_info_batch(self, package_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch information about several packages with one nix-env call.
+        
+        Attribute paths not known from the package list are looked up with a
+        single ``nix search`` for all of the names.
+        
+        Args:
+            package_names: Names of the packages to get information for.
             
-            # Run nix-env -qa --json -A to get package info
-            cmd_result = subprocess.run(
-                ["nix-env", "-qa", "--json", "-A", attr_path],
-                check=True,
-                capture_output=True,
-                text=True
-            )
+        Returns:
+            Dictionary mapping the names of the packages found to their metadata.
+        """
+        attr_paths = {}
+        for package_name in package_names:
+            attr_path = (self._package_cache.get(package_name) or {}).get("attr_path")
+            if attr_path:
+                attr_paths[package_name] = attr_path
+        
+        missing = [package_name for package_name in package_names if package_name not in attr_paths]
+        if missing:
+            attr_paths.update(self._find_attr_paths(missing))
+        
+        if not attr_paths:
+            return {}
+        
+        # Run nix-env -qa --json -A to get the info of all packages at once
+        cmd_result = subprocess.run(
+            ["nix-env", "-qa", "--json", "-A", *sorted(set(attr_paths.values()))],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        
+        # Parse the JSON output
+        packages = json.loads(cmd_result.stdout)
+        
+        result = {}
+        for package_name, attr_path in attr_paths.items():
+            if attr_path in packages:
+                _, result[package_name] = self._parse_nix_env_package(attr_path, packages[attr_path])
+        
+        return result
+    
+    def _find_attr_paths(self, package_names: List[str]) -> Dict[str, str]:
+        """
+        Find the attribute paths of packages with one nix search.
+        
+        Args:
+            package_names: Names of the packages.
             
-            # Parse the JSON output
-            packages = json.loads(cmd_result.stdout)
+        Returns:
+            Dictionary mapping the names of the packages found to their attribute paths.
+        """
+        # nix uses ECMAScript regular expressions, so only escape their syntax
+        escaped = [re.sub(r"([.^$*+?()\[\]{}|\\])", r"\\\1", name) for name in package_names]
+        pattern = "^(" + "|".join(escaped) + ")$"
+        cmd_result = subprocess.run(
+            ["nix", "search", "--json", "nixpkgs", pattern],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        
+        wanted = set(package_names)
+        attr_paths = {}
+        for attr_path, pkg_data in json.loads(cmd_result.stdout).items():
+            # Strip the "legacyPackages.<system>." prefix of flake outputs
+            if attr_path.startswith("legacyPackages."):
+                attr_path = attr_path.split(".", 2)[-1]
             
-            if attr_path in packages:
-                pkg_data = packages[attr_path]
-                
-                # Extract package name and version
-                name = pkg_data.get("name")
-                version = None
-                
-                if name:
-                    # Remove version from name
-                    name_parts = name.split("-")
-                    
-                    # Find the first part that looks like a version
-                    for i, part in enumerate(name_parts):
-                        if re.match(r'^[0-9]', part):
-                            version = "-".join(name_parts[i:])
-                            name = "-".join(name_parts[:i])
-                            break
-                
-                # If no version found, use the original version
-                if not version:
-                    version = pkg_data.get("version")
-                
-                return {
-                    "version": version,
-                    "description": pkg_data.get("meta", {}).get("description"),
-                    "license": pkg_data.get("meta", {}).get("license"),
-                    "homepage": pkg_data.get("meta", {}).get("homepage"),
-                    "position": pkg_data.get("meta", {}).get("position"),
-                    "attr_path": attr_path
-                }
+            attr_name = attr_path.split(".")[-1]
+            for name in (attr_name, pkg_data.get("pname")):
+                # Prefer attributes named like the package over matching pnames
+                if name in wanted and (name not in attr_paths or name == attr_name):
+                    attr_paths[name] = attr_path
+        
+        return attr_paths
+    
+    def _parse_nix_env_package(self, attr_path: str, pkg_data: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Convert a package of the nix-env JSON output.
+        
+        Args:
+            attr_path: Attribute path of the package.
+            pkg_data: Package data from nix-env.
             
-            return None
+        Returns:
+            Tuple of the package name without version and the package metadata.
+        """
+        # Extract package name and version
+        name = pkg_data.get("name")
+        version = None
+        
+        if name:
+            # Remove version from name
+            name_parts = name.split("-")
             
-        except Exception as e:
-            logger.warning(f"Failed to fetch package info for {package_name}: {e}")
-            return None
+            # Find the first part that looks like a version
+            for i, part in enumerate(name_parts):
+                if re.match(r'^[0-9]', part):
+                    version = "-".join(name_parts[i:])
+                    name = "-".join(name_parts[:i])
+                    break
+        
+        # If no version found, use the original version
+        if not version:
+            version = pkg_data.get("version")
+        
+        return name, {
+            "version": version,
+            "description": pkg_data.get("meta", {}).get("description"),
+            "license": pkg_data.get("meta", {}).get("license"),
+            "homepage": pkg_data.get("meta", {}).get("homepage"),
+            "position": pkg_data.get("meta", {}).get("position"),
+            "attr_path": attr_path
+        }
     
-    def _search_packages(self, query: str, max_results: int = 10) -> Dict[str, Dict[str, any]]:
+    def _search_packages(self, query: str, max_results: int = 10) -> Dict[str, Dict[str, Any]]:
         """
         Search for packages matching the query.
         
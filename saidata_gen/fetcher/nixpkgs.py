@@ -7,12 +7,12 @@ collection by cloning the repository and parsing package definitions.
 
 import json
 import logging
-import os
 import re
 import subprocess
 import tempfile
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
@@ -41,6 +41,9 @@ class NixpkgsFetcher(GitRepositoryFetcher):
     the repository and parsing package definitions.
     """
     
+    # Everything evaluating the package set may import, skipping docs and CI
+    SPARSE_PATHS = ("lib", "maintainers", "nixos", "pkgs")
+    
     def __init__(
         self,
         repositories: Optional[List[NixpkgsRepository]] = None,
@@ -69,7 +72,7 @@ class NixpkgsFetcher(GitRepositoryFetcher):
         )
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -199,7 +202,7 @@ class NixpkgsFetcher(GitRepositoryFetcher):
         
         return results
     
-    def _create_package_info(self, package_name: str, package_data: Dict[str, any]) -> PackageInfo:
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
         """
         Create a PackageInfo object from package data.
         
@@ -218,7 +221,7 @@ class NixpkgsFetcher(GitRepositoryFetcher):
             details=package_data
         )
     
-    def _parse_nixpkgs_repository(self) -> Dict[str, Dict[str, any]]:
+    def _parse_nixpkgs_repository(self) -> Dict[str, Dict[str, Any]]:
         """
         Parse a Nixpkgs repository.
         
@@ -228,6 +231,10 @@ class NixpkgsFetcher(GitRepositoryFetcher):
         packages = {}
         
         try:
+            # Evaluating the package set needs a working tree
+            if self._uses_object_database():
+                return self._parse_nixpkgs_repository_fallback()
+            
             # Check if nix is available
             if not self._is_nix_available():
                 logger.warning("nix command not available, using fallback parsing method")
@@ -286,7 +293,7 @@ class NixpkgsFetcher(GitRepositoryFetcher):
         
         return packages
     
-    def _parse_nixpkgs_repository_fallback(self) -> Dict[str, Dict[str, any]]:
+    def _parse_nixpkgs_repository_fallback(self) -> Dict[str, Dict[str, Any]]:
         """
         Parse a Nixpkgs repository using a fallback method.
         
@@ -300,58 +307,55 @@ class NixpkgsFetcher(GitRepositoryFetcher):
         
         try:
             # Find all default.nix files in the pkgs directory
-            pkgs_dir = os.path.join(self.repo_dir, "pkgs")
-            if not os.path.exists(pkgs_dir):
+            if not self._is_directory("pkgs"):
                 logger.warning(f"pkgs directory not found in {self.repo_dir}")
                 return packages
             
-            # Walk through the pkgs directory
-            for root, dirs, files in os.walk(pkgs_dir):
-                if "default.nix" in files:
-                    # Extract relative path from pkgs directory
-                    rel_path = os.path.relpath(root, pkgs_dir)
-                    if rel_path == ".":
-                        continue
-                    
-                    # Convert path to attribute path
-                    attr_path = rel_path.replace(os.path.sep, ".")
-                    
-                    # Extract package name from attribute path
-                    pkg_name = attr_path.split(".")[-1]
-                    
-                    # Read the default.nix file
-                    default_nix_path = os.path.join(root, "default.nix")
-                    with open(default_nix_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Extract basic metadata
-                    pkg_data = {
-                        "name": pkg_name,
-                        "attr_path": attr_path
-                    }
-                    
-                    # Extract version
-                    version_match = re.search(r'version\s*=\s*"([^"]*)"', content)
-                    if version_match:
-                        pkg_data["version"] = version_match.group(1)
-                    
-                    # Extract description
-                    desc_match = re.search(r'description\s*=\s*"([^"]*)"', content)
-                    if desc_match:
-                        pkg_data["description"] = desc_match.group(1)
-                    
-                    # Extract homepage
-                    homepage_match = re.search(r'homepage\s*=\s*"([^"]*)"', content)
-                    if homepage_match:
-                        pkg_data["homepage"] = homepage_match.group(1)
-                    
-                    # Extract license
-                    license_match = re.search(r'license\s*=\s*([^;]*);', content)
-                    if license_match:
-                        pkg_data["license"] = license_match.group(1).strip()
-                    
-                    # Add package to result
-                    packages[attr_path] = pkg_data
+            for default_nix_path in sorted(self._list_files("pkgs", "**/default.nix")):
+                # Extract relative path from pkgs directory
+                rel_path = Path(default_nix_path).parent.relative_to("pkgs")
+                if not rel_path.parts:
+                    continue
+                
+                # Convert path to attribute path
+                attr_path = ".".join(rel_path.parts)
+                
+                # Extract package name from attribute path
+                pkg_name = attr_path.split(".")[-1]
+                
+                # Read the default.nix file
+                content = self._get_file_content(default_nix_path)
+                if content is None:
+                    continue
+                
+                # Extract basic metadata
+                pkg_data = {
+                    "name": pkg_name,
+                    "attr_path": attr_path
+                }
+                
+                # Extract version
+                version_match = re.search(r'version\s*=\s*"([^"]*)"', content)
+                if version_match:
+                    pkg_data["version"] = version_match.group(1)
+                
+                # Extract description
+                desc_match = re.search(r'description\s*=\s*"([^"]*)"', content)
+                if desc_match:
+                    pkg_data["description"] = desc_match.group(1)
+                
+                # Extract homepage
+                homepage_match = re.search(r'homepage\s*=\s*"([^"]*)"', content)
+                if homepage_match:
+                    pkg_data["homepage"] = homepage_match.group(1)
+                
+                # Extract license
+                license_match = re.search(r'license\s*=\s*([^;]*);', content)
+                if license_match:
+                    pkg_data["license"] = license_match.group(1).strip()
+                
+                # Add package to result
+                packages[attr_path] = pkg_data
         
         except Exception as e:
             logger.warning(f"Failed to parse Nixpkgs repository using fallback method: {e}")
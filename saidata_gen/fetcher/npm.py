@@ -234,16 +234,7 @@ class NPMFetcher(HttpRepositoryFetcher):
             "webpack", "babel", "eslint", "jest", "mocha"
         ]
         
-        packages = {}
-        for pkg_name in popular_packages:
-            try:
-                package_data = self._fetch_package_details(pkg_name, registry_name)
-                if package_data:
-                    packages[pkg_name] = package_data
-            except Exception as e:
-                logger.warning(f"Failed to fetch package details for {pkg_name} from {registry_name}: {e}")
-        
-        return packages
+        return self._fetch_package_details_batch(popular_packages, registry_name)
     
     def _fetch_package_details(self, package_name: str, registry_name: str) -> Optional[Dict[str, any]]:
         """
@@ -259,41 +250,76 @@ class NPMFetcher(HttpRepositoryFetcher):
         try:
             # Fetch package details from NPM registry
             response = self._fetch_json(package_name)
-            
-            if "name" in response:
-                # Extract the latest version
-                latest_version = response.get("dist-tags", {}).get("latest")
-                
-                # Get the latest version data
-                version_data = {}
-                if latest_version and latest_version in response.get("versions", {}):
-                    version_data = response["versions"][latest_version]
-                
-                # Combine metadata
-                return {
-                    "name": response.get("name"),
-                    "version": latest_version,
-                    "description": response.get("description") or version_data.get("description", ""),
-                    "author": response.get("author") or version_data.get("author", {}),
-                    "maintainers": response.get("maintainers", []),
-                    "license": response.get("license") or version_data.get("license", ""),
-                    "homepage": response.get("homepage") or version_data.get("homepage", ""),
-                    "repository": response.get("repository") or version_data.get("repository", {}),
-                    "bugs": response.get("bugs") or version_data.get("bugs", {}),
-                    "keywords": response.get("keywords", []) or version_data.get("keywords", []),
-                    "dependencies": version_data.get("dependencies", {}),
-                    "devDependencies": version_data.get("devDependencies", {}),
-                    "peerDependencies": version_data.get("peerDependencies", {}),
-                    "dist": version_data.get("dist", {}),
-                    "dist-tags": response.get("dist-tags", {}),
-                    "time": response.get("time", {}),
-                    "registry": registry_name
-                }
+            return self._parse_package_details(response, registry_name)
         
         except Exception as e:
             logger.warning(f"Failed to fetch package details for {package_name} from {registry_name}: {e}")
             return None
     
+    def _fetch_package_details_batch(self, package_names: List[str], registry_name: str) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch detailed information about many packages concurrently.
+        
+        Args:
+            package_names: Names of the packages.
+            registry_name: Name of the registry.
+            
+        Returns:
+            Dictionary mapping the names of the packages found to their metadata.
+        """
+        responses = self._fetch_json_many(package_names)
+        
+        packages = {}
+        for package_name, response in responses.items():
+            package_data = self._parse_package_details(response, registry_name)
+            if package_data:
+                packages[package_name] = package_data
+        
+        return packages
+    
+    def _parse_package_details(self, response: Dict[str, any], registry_name: str) -> Optional[Dict[str, any]]:
+        """
+        Extract package metadata from an NPM registry package document.
+        
+        Args:
+            response: Package document returned by the registry.
+            registry_name: Name of the registry.
+            
+        Returns:
+            Package metadata, or None if the document has no package name.
+        """
+        if "name" not in response:
+            return None
+        
+        # Extract the latest version
+        latest_version = response.get("dist-tags", {}).get("latest")
+        
+        # Get the latest version data
+        version_data = {}
+        if latest_version and latest_version in response.get("versions", {}):
+            version_data = response["versions"][latest_version]
+        
+        # Combine metadata
+        return {
+            "name": response.get("name"),
+            "version": latest_version,
+            "description": response.get("description") or version_data.get("description", ""),
+            "author": response.get("author") or version_data.get("author", {}),
+            "maintainers": response.get("maintainers", []),
+            "license": response.get("license") or version_data.get("license", ""),
+            "homepage": response.get("homepage") or version_data.get("homepage", ""),
+            "repository": response.get("repository") or version_data.get("repository", {}),
+            "bugs": response.get("bugs") or version_data.get("bugs", {}),
+            "keywords": response.get("keywords", []) or version_data.get("keywords", []),
+            "dependencies": version_data.get("dependencies", {}),
+            "devDependencies": version_data.get("devDependencies", {}),
+            "peerDependencies": version_data.get("peerDependencies", {}),
+            "dist": version_data.get("dist", {}),
+            "dist-tags": response.get("dist-tags", {}),
+            "time": response.get("time", {}),
+            "registry": registry_name
+        }
+    
     def _search_packages_in_registry(self, query: str, registry_name: str, max_results: int = 10) -> Dict[str, Dict[str, any]]:
         """
         Search for packages in a registry.
@@ -326,17 +326,8 @@ class NuGetFetcher(HttpRepositoryFetcher):
         Returns:
             Package metadata if found, None otherwise.
         """
-        # Get the registration endpoint
-        registration_endpoint = self._service_endpoints.get(feed_name, {}).get(
-            "RegistrationsBaseUrl/3.6.0",
-            self._service_endpoints.get(feed_name, {}).get(
-                "RegistrationsBaseUrl",
-                ""
-            )
-        )
-        
+        registration_endpoint = self._get_registration_endpoint(feed_name)
         if not registration_endpoint:
-            logger.warning(f"Registration endpoint not found for {feed_name}")
             return None
         
         try:
@@ -346,44 +337,111 @@ class NuGetFetcher(HttpRepositoryFetcher):
             # Fetch package details
             url = f"{package_name.lower()}/index.json"
             response = self._fetch_json(url)
+            return self._parse_package_details(response, feed_name)
+        
+        except Exception as e:
+            logger.warning(f"Failed to fetch package details for {package_name} from {feed_name}: {e}")
+            return None
+    
+    def _fetch_package_details_batch(self, package_names: List[str], feed_name: str) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch detailed information about many packages concurrently.
+        
+        Args:
+            package_names: Names of the packages.
+            feed_name: Name of the feed.
             
-            # Extract the latest version
-            items = response.get("items", [])
-            if not items:
-                return None
+        Returns:
+            Dictionary mapping the names of the packages found to their metadata.
+        """
+        registration_endpoint = self._get_registration_endpoint(feed_name)
+        if not registration_endpoint:
+            return {}
+        
+        # Set base URL to the registration endpoint
+        self.base_url = registration_endpoint
+        
+        paths = {f"{name.lower()}/index.json": name for name in package_names}
+        responses = self._fetch_json_many(list(paths))
+        
+        packages = {}
+        for path, response in responses.items():
+            package_data = self._parse_package_details(response, feed_name)
+            if package_data:
+                packages[paths[path]] = package_data
+        
+        return packages
+    
+    def _get_registration_endpoint(self, feed_name: str) -> Optional[str]:
+        """
+        Get the package registration endpoint of a feed.
+        
+        Args:
+            feed_name: Name of the feed.
             
-            # Get the latest version
-            latest_item = items[-1]
-            latest_version = None
-            latest_version_data = None
+        Returns:
+            Registration base URL, or None if the feed does not provide one.
+        """
+        registration_endpoint = self._service_endpoints.get(feed_name, {}).get(
+            "RegistrationsBaseUrl/3.6.0",
+            self._service_endpoints.get(feed_name, {}).get(
+                "RegistrationsBaseUrl",
+                ""
+            )
+        )
+        
+        if not registration_endpoint:
+            logger.warning(f"Registration endpoint not found for {feed_name}")
+            return None
+        
+        return registration_endpoint
+    
+    def _parse_package_details(self, response: Dict[str, any], feed_name: str) -> Optional[Dict[str, any]]:
+        """
+        Extract package metadata from a registration index.
+        
+        Args:
+            response: Registration index of the package.
+            feed_name: Name of the feed.
             
-            for item in latest_item.get("items", []):
-                catalog_entry = item.get("catalogEntry", {})
-                version = catalog_entry.get("version")
-                
-                # Skip prerelease versions
-                if version and "-" not in version:
-                    if latest_version is None or version > latest_version:
-                        latest_version = version
-                        latest_version_data = catalog_entry
+        Returns:
+            Metadata of the latest stable version, or None if there is none.
+        """
+        # Extract the latest version
+        items = response.get("items", [])
+        if not items:
+            return None
+        
+        # Get the latest version
+        latest_item = items[-1]
+        latest_version = None
+        latest_version_data = None
+        
+        for item in latest_item.get("items", []):
+            catalog_entry = item.get("catalogEntry", {})
+            version = catalog_entry.get("version")
             
-            if latest_version_data:
-                return {
-                    "id": latest_version_data.get("id"),
-                    "version": latest_version_data.get("version"),
-                    "description": latest_version_data.get("description"),
-                    "authors": latest_version_data.get("authors"),
-                    "tags": latest_version_data.get("tags", "").split(),
-                    "project_url": latest_version_data.get("projectUrl"),
-                    "license_url": latest_version_data.get("licenseUrl"),
-                    "icon_url": latest_version_data.get("iconUrl"),
-                    "dependencies": latest_version_data.get("dependencyGroups", []),
-                    "feed": feed_name
-                }
+            # Skip prerelease versions
+            if version and "-" not in version:
+                if latest_version is None or version > latest_version:
+                    latest_version = version
+                    latest_version_data = catalog_entry
         
-        except Exception as e:
-            logger.warning(f"Failed to fetch package details for {package_name} from {feed_name}: {e}")
+        if not latest_version_data:
             return None
+        
+        return {
+            "id": latest_version_data.get("id"),
+            "version": latest_version_data.get("version"),
+            "description": latest_version_data.get("description"),
+            "authors": latest_version_data.get("authors"),
+            "tags": latest_version_data.get("tags", "").split(),
+            "project_url": latest_version_data.get("projectUrl"),
+            "license_url": latest_version_data.get("licenseUrl"),
+            "icon_url": latest_version_data.get("iconUrl"),
+            "dependencies": latest_version_data.get("dependencyGroups", []),
+            "feed": feed_name
+        }
     
     def _search_packages_in_feed(self, query: str, feed_name: str, max_results: int = 10) -> Dict[str, Dict[str, any]]:
         """
@@ -5,18 +5,17 @@ This module provides functionality to fetch package metadata from embedded Linux
 OPKG repositories.
 """
 
-import gzip
-import io
 import logging
 import os
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Collection, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
 )
 from saidata_gen.fetcher.base import HttpRepositoryFetcher
+from saidata_gen.fetcher.deb_utils import as_lines, iter_lines, parse_control_index
 
 
 logger = logging.getLogger(__name__)
@@ -40,10 +39,13 @@ class OpkgFetcher(HttpRepositoryFetcher):
     and parsing Packages.gz files.
     """
     
+    index_text_fields = ("Description",)
+    
     def __init__(
         self,
         repositories: Optional[List[OpkgRepository]] = None,
-        config: Optional[FetcherConfig] = None
+        config: Optional[FetcherConfig] = None,
+        package_fields: Optional[Collection[str]] = None
     ):
         """
         Initialize the OPKG fetcher.
@@ -51,6 +53,7 @@ class OpkgFetcher(HttpRepositoryFetcher):
         Args:
             repositories: List of OPKG repositories to fetch. If None, uses default repositories.
             config: Configuration for the fetcher.
+            package_fields: Optional whitelist of Packages fields to keep. If None, all fields are kept.
         """
         # Initialize with a dummy base_url, we'll use repository-specific URLs
         super().__init__(base_url="https://example.com", config=config)
@@ -67,8 +70,10 @@ class OpkgFetcher(HttpRepositoryFetcher):
             )
         ]
         
+        self.package_fields = package_fields
+        
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -94,15 +99,15 @@ class OpkgFetcher(HttpRepositoryFetcher):
                 # Check if we have a valid cache
                 cached_data = self._get_from_cache(repo_key)
                 if cached_data:
-                    self._package_cache[repo_key] = cached_data
+                    self._set_package_cache_entry(repo_key, cached_data)
                     result.cache_hits[repo_key] = True
                     continue
                 
                 # Fetch and parse Packages.gz
                 packages_data = self._fetch_packages_file(repo)
                 if packages_data:
-                    self._package_cache[repo_key] = packages_data
-                    self._save_to_cache(repo_key, packages_data)
+                    self._set_package_cache_entry(repo_key, packages_data)
+                    self._save_to_cache(repo_key, packages_data, snapshot=True)
                     result.providers[repo_key] = True
                 else:
                     result.success = False
@@ -115,6 +120,9 @@ class OpkgFetcher(HttpRepositoryFetcher):
                 result.providers[repo_key] = False
                 result.success = False
         
+        # Index the fetched packages for lookups and searches
+        self._build_package_index()
+        
         return result
     
     def get_package_info(self, package_name: str) -> Optional[PackageInfo]:
@@ -127,23 +135,7 @@ class OpkgFetcher(HttpRepositoryFetcher):
         Returns:
             PackageInfo if the package is found, None otherwise.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        # Look for the package in all repositories
-        for repo_name, packages in self._package_cache.items():
-            if package_name in packages:
-                pkg_data = packages[package_name]
-                return PackageInfo(
-                    name=package_name,
-                    provider=self.get_repository_name(),
-                    version=pkg_data.get("Version"),
-                    description=pkg_data.get("Description"),
-                    details=pkg_data
-                )
-        
-        return None
+        return self._get_indexed_package_info(package_name)
     
     def search_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
         """
@@ -156,38 +148,26 @@ class OpkgFetcher(HttpRepositoryFetcher):
         Returns:
             List of PackageInfo objects matching the query.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Search in all repositories
-        for repo_name, packages in self._package_cache.items():
-            for pkg_name, pkg_data in packages.items():
-                # Check if the package name or description contains the query
-                if (query_lower in pkg_name.lower() or 
-                    (pkg_data.get("Description") and query_lower in pkg_data["Description"].lower())):
-                    
-                    # Create PackageInfo object
-                    pkg_info = PackageInfo(
-                        name=pkg_name,
-                        provider=self.get_repository_name(),
-                        version=pkg_data.get("Version"),
-                        description=pkg_data.get("Description"),
-                        details=pkg_data
-                    )
-                    
-                    # Add to results if not already present
-                    if not any(r.name == pkg_name for r in results):
-                        results.append(pkg_info)
-                    
-                    # Stop if we have enough results
-                    if len(results) >= max_results:
-                        return results
+        return self._search_indexed_packages(query, max_results)
+    
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
+        """
+        Create a PackageInfo object from package data.
         
-        return results
+        Args:
+            package_name: Name of the package.
+            package_data: Package data.
+            
+        Returns:
+            PackageInfo object.
+        """
+        return PackageInfo(
+            name=package_name,
+            provider=self.get_repository_name(),
+            version=package_data.get("Version"),
+            description=package_data.get("Description"),
+            details=package_data
+        )
     
     def get_package_details(self, package_name: str, repository: Optional[str] = None) -> Optional[PackageDetails]:
         """
@@ -240,7 +220,7 @@ class OpkgFetcher(HttpRepositoryFetcher):
         
         return None
     
-    def _fetch_packages_file(self, repo: OpkgRepository) -> Dict[str, Dict[str, any]]:
+    def _fetch_packages_file(self, repo: OpkgRepository) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse a Packages.gz file from an OPKG repository.
         
@@ -260,12 +240,8 @@ class OpkgFetcher(HttpRepositoryFetcher):
             # Fetch the Packages.gz file
             response = self._fetch_url("Packages.gz")
             
-            # Decompress the gzipped content
-            with gzip.GzipFile(fileobj=io.BytesIO(response.content)) as f:
-                packages_text = f.read().decode("utf-8")
-            
-            # Parse the Packages file
-            return self._parse_packages_file(packages_text)
+            # Decompress and parse the gzipped content line by line
+            return self._parse_packages_file(iter_lines(response.content, compressed=True))
             
         except Exception as e:
             logger.warning(f"Failed to fetch Packages.gz, trying uncompressed Packages: {e}")
@@ -281,47 +257,19 @@ class OpkgFetcher(HttpRepositoryFetcher):
             # Restore the original base_url
             self.base_url = original_base_url
     
-    def _parse_packages_file(self, packages_text: str) -> Dict[str, Dict[str, any]]:
+    def _parse_packages_file(self, packages_text: Union[str, Iterable[str]]) -> Dict[str, Dict[str, Any]]:
         """
         Parse a Packages file from an OPKG repository.
         
         Args:
-            packages_text: Content of the Packages file.
+            packages_text: Content of the Packages file, or an iterable of its lines.
             
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        result = {}
-        current_package = None
-        current_data = {}
-        
-        for line in packages_text.splitlines():
-            if not line.strip():
-                # Empty line indicates end of a package entry
-                if current_package and current_data:
-                    result[current_package] = current_data
-                current_package = None
-                current_data = {}
-                continue
-                
-            if line.startswith(" "):
-                # Continuation of previous value
-                continue
-                
-            # New key-value pair
-            parts = line.split(":", 1)
-            if len(parts) == 2:
-                key = parts[0].strip()
-                value = parts[1].strip()
-                
-                current_data[key] = value
-                
-                # If this is the Package field, set the current package
-                if key == "Package":
-                    current_package = value
-        
-        # Add the last package (handle case where file doesn't end with empty line)
-        if current_package and current_data:
-            result[current_package] = current_data
-        
-        return result
\ No newline at end of file
+        # OPKG only keeps the first line of multi-line fields
+        return parse_control_index(
+            as_lines(packages_text),
+            fields=self.package_fields,
+            continuation_separator=None
+        )
\ No newline at end of file
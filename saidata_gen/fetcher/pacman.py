@@ -5,13 +5,14 @@ This module provides functionality to fetch package metadata from Arch Linux
 Pacman repositories.
 """
 
+import io
 import logging
 import os
 import re
 import tarfile
 import tempfile
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
@@ -40,6 +41,8 @@ class PacmanFetcher(HttpRepositoryFetcher):
     by downloading and parsing repository databases.
     """
     
+    index_text_fields = ("DESC",)
+    
     def __init__(
         self,
         repositories: Optional[List[PacmanRepository]] = None,
@@ -72,7 +75,7 @@ class PacmanFetcher(HttpRepositoryFetcher):
         ]
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -92,32 +95,41 @@ class PacmanFetcher(HttpRepositoryFetcher):
         """
         result = FetchResult(success=True)
         
+        # Collect the repositories without a valid cache
+        repositories = []
         for repo in self.repositories:
             repo_key = repo.name
-            try:
-                # Check if we have a valid cache
-                cached_data = self._get_from_cache(repo_key)
-                if cached_data:
-                    self._package_cache[repo_key] = cached_data
-                    result.cache_hits[repo_key] = True
-                    continue
-                
-                # Fetch and parse repository database
-                packages_data = self._fetch_repository_database(repo)
-                if packages_data:
-                    self._package_cache[repo_key] = packages_data
-                    self._save_to_cache(repo_key, packages_data)
-                    result.providers[repo_key] = True
-                else:
-                    result.success = False
-                    result.providers[repo_key] = False
-                    result.errors[repo_key] = "Failed to fetch repository database"
             
-            except Exception as e:
-                logger.error(f"Failed to fetch repository data for {repo_key}: {e}")
-                result.errors[repo_key] = str(e)
+            # Check if we have a valid cache
+            cached_data = self._get_from_cache(repo_key)
+            if cached_data:
+                self._set_package_cache_entry(repo_key, cached_data)
+                result.cache_hits[repo_key] = True
+                continue
+            
+            repositories.append(repo)
+        
+        # Fetch and parse the repository databases concurrently
+        for repo, packages_data, error in self._run_concurrently(
+            lambda repo: self._fetch_repository_database(repo, repo.name), repositories
+        ):
+            repo_key = repo.name
+            if error is not None:
+                logger.error(f"Failed to fetch repository data for {repo_key}: {error}")
+                result.errors[repo_key] = str(error)
                 result.providers[repo_key] = False
                 result.success = False
+            elif packages_data:
+                self._set_package_cache_entry(repo_key, packages_data)
+                self._save_to_cache(repo_key, packages_data, snapshot=True)
+                result.providers[repo_key] = True
+            else:
+                result.success = False
+                result.providers[repo_key] = False
+                result.errors[repo_key] = "Failed to fetch repository database"
+        
+        # Index the fetched packages for lookups and searches
+        self._build_package_index()
         
         return result
     
@@ -131,23 +143,7 @@ class PacmanFetcher(HttpRepositoryFetcher):
         Returns:
             PackageInfo if the package is found, None otherwise.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        # Look for the package in all repositories
-        for repo_name, packages in self._package_cache.items():
-            if package_name in packages:
-                pkg_data = packages[package_name]
-                return PackageInfo(
-                    name=package_name,
-                    provider=self.get_repository_name(),
-                    version=pkg_data.get("VERSION"),
-                    description=pkg_data.get("DESC"),
-                    details=pkg_data
-                )
-        
-        return None
+        return self._get_indexed_package_info(package_name)
     
     def search_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
         """
@@ -160,38 +156,26 @@ class PacmanFetcher(HttpRepositoryFetcher):
         Returns:
             List of PackageInfo objects matching the query.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Search in all repositories
-        for repo_name, packages in self._package_cache.items():
-            for pkg_name, pkg_data in packages.items():
-                # Check if the package name or description contains the query
-                if (query_lower in pkg_name.lower() or 
-                    (pkg_data.get("DESC") and query_lower in pkg_data["DESC"].lower())):
-                    
-                    # Create PackageInfo object
-                    pkg_info = PackageInfo(
-                        name=pkg_name,
-                        provider=self.get_repository_name(),
-                        version=pkg_data.get("VERSION"),
-                        description=pkg_data.get("DESC"),
-                        details=pkg_data
-                    )
-                    
-                    # Add to results if not already present
-                    if not any(r.name == pkg_name for r in results):
-                        results.append(pkg_info)
-                    
-                    # Stop if we have enough results
-                    if len(results) >= max_results:
-                        return results
+        return self._search_indexed_packages(query, max_results)
+    
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
+        """
+        Create a PackageInfo object from package data.
         
-        return results
+        Args:
+            package_name: Name of the package.
+            package_data: Package data.
+            
+        Returns:
+            PackageInfo object.
+        """
+        return PackageInfo(
+            name=package_name,
+            provider=self.get_repository_name(),
+            version=package_data.get("VERSION"),
+            description=package_data.get("DESC"),
+            details=package_data
+        )
     
     def get_package_details(self, package_name: str, repository: Optional[str] = None) -> Optional[PackageDetails]:
         """
@@ -243,46 +227,41 @@ class PacmanFetcher(HttpRepositoryFetcher):
         
         return None
     
-    def _fetch_repository_database(self, repo: PacmanRepository) -> Dict[str, Dict[str, any]]:
+    def _fetch_repository_database(
+        self, repo: PacmanRepository, cache_key: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse a Pacman repository database.
         
         Args:
             repo: Repository configuration.
+            cache_key: Optional cache key a parse worker writes the packages to.
             
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        # Save the current base_url
-        original_base_url = self.base_url
-        
-        try:
-            # Set the base_url for this request
-            self.base_url = repo.url
+        # Create a temporary directory for the database
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Download the database file
+            db_file = f"{repo.name}.db.tar.gz"
+            db_path = os.path.join(temp_dir, db_file)
             
-            # Create a temporary directory for the database
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Download the database file
-                db_file = f"{repo.name}.db.tar.gz"
+            try:
+                self._fetch_binary(f"{repo.url}/{db_file}", db_path)
+            except Exception as e:
+                logger.warning(f"Failed to fetch {db_file}, trying {repo.name}.db: {e}")
+                # Some mirrors use .db instead of .db.tar.gz
+                db_file = f"{repo.name}.db"
                 db_path = os.path.join(temp_dir, db_file)
-                
-                try:
-                    self._fetch_binary(db_file, db_path)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch {db_file}, trying {repo.name}.db: {e}")
-                    # Some mirrors use .db instead of .db.tar.gz
-                    db_file = f"{repo.name}.db"
-                    db_path = os.path.join(temp_dir, db_file)
-                    self._fetch_binary(db_file, db_path)
-                
-                # Parse the database
-                return self._parse_pacman_database(db_path)
-                
-        finally:
-            # Restore the original base_url
-            self.base_url = original_base_url
+                self._fetch_binary(f"{repo.url}/{db_file}", db_path)
+            
+            with open(db_path, 'rb') as f:
+                content = f.read()
+        
+        # Parse the database, in a worker process if it is large
+        return self._parse_content(parse_pacman_database, content, snapshot_key=cache_key)
     
-    def _parse_pacman_database(self, db_path: str) -> Dict[str, Dict[str, any]]:
+    def _parse_pacman_database(self, db_path: str) -> Dict[str, Dict[str, Any]]:
         """
         Parse a Pacman repository database.
         
@@ -292,95 +271,111 @@ class PacmanFetcher(HttpRepositoryFetcher):
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        result = {}
+        with open(db_path, 'rb') as f:
+            return parse_pacman_database(f.read())
+
+
+def parse_pacman_database(db_content: bytes) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse the content of a Pacman repository database.
+    
+    This is a module-level function so that it can run in a parse worker process.
+    
+    Args:
+        db_content: Content of the gzipped database tarball.
         
-        try:
-            with tarfile.open(db_path, 'r:gz') as tar:
-                # Group files by directory (package)
-                packages = {}
-                for member in tar.getmembers():
-                    if member.isdir():
-                        continue
-                    
-                    # Extract package name and file name
-                    parts = member.name.split('/')
-                    if len(parts) < 2:
-                        continue
-                    
-                    pkg_dir = parts[0]
-                    file_name = parts[-1]
-                    
-                    # Initialize package entry if needed
-                    if pkg_dir not in packages:
-                        packages[pkg_dir] = {}
-                    
-                    # Extract file content
-                    if member.isfile():
-                        try:
-                            content = tar.extractfile(member).read().decode('utf-8')
-                            packages[pkg_dir][file_name] = content
-                        except Exception as e:
-                            logger.warning(f"Failed to extract {member.name}: {e}")
+    Returns:
+        Dictionary mapping package names to their metadata.
+    """
+    result = {}
+    
+    try:
+        with tarfile.open(fileobj=io.BytesIO(db_content), mode='r:gz') as tar:
+            # Group files by directory (package)
+            packages = {}
+            for member in tar.getmembers():
+                if member.isdir():
+                    continue
                 
-                # Process each package
-                for pkg_dir, files in packages.items():
-                    # Extract package name from directory (remove version)
-                    pkg_name_match = re.match(r'(.+)-[^-]+-\d+', pkg_dir)
-                    if pkg_name_match:
-                        pkg_name = pkg_name_match.group(1)
-                    else:
-                        pkg_name = pkg_dir
-                    
-                    # Create package metadata
-                    pkg_data = {}
-                    
-                    # Process each file
-                    for file_name, content in files.items():
-                        if file_name == 'desc':
-                            # Parse desc file
-                            current_key = None
-                            for line in content.splitlines():
-                                line = line.strip()
-                                if not line:
-                                    continue
-                                
-                                if line.startswith('%') and line.endswith('%'):
-                                    # New key
-                                    current_key = line[1:-1]
-                                    pkg_data[current_key] = ""
-                                elif current_key:
-                                    # Append to current key
-                                    if pkg_data[current_key]:
-                                        pkg_data[current_key] += " " + line
-                                    else:
-                                        pkg_data[current_key] = line
-                        
-                        elif file_name == 'depends':
-                            # Parse depends file
-                            current_key = None
-                            for line in content.splitlines():
-                                line = line.strip()
-                                if not line:
-                                    continue
-                                
-                                if line.startswith('%') and line.endswith('%'):
-                                    # New key
-                                    current_key = line[1:-1]
-                                    if current_key not in pkg_data:
-                                        pkg_data[current_key] = []
-                                elif current_key:
-                                    # Add to current key list
-                                    pkg_data[current_key].append(line)
+                # Extract package name and file name
+                parts = member.name.split('/')
+                if len(parts) < 2:
+                    continue
+                
+                pkg_dir = parts[0]
+                file_name = parts[-1]
+                
+                # Initialize package entry if needed
+                if pkg_dir not in packages:
+                    packages[pkg_dir] = {}
+                
+                # Extract file content
+                if member.isfile():
+                    try:
+                        content = tar.extractfile(member).read().decode('utf-8')
+                        packages[pkg_dir][file_name] = content
+                    except Exception as e:
+                        logger.warning(f"Failed to extract {member.name}: {e}")
+            
+            # Process each package
+            for pkg_dir, files in packages.items():
+                # Extract package name from directory (remove version)
+                pkg_name_match = re.match(r'(.+)-[^-]+-\d+', pkg_dir)
+                if pkg_name_match:
+                    pkg_name = pkg_name_match.group(1)
+                else:
+                    pkg_name = pkg_dir
+                
+                # Create package metadata
+                pkg_data = {}
+                
+                # Process each file
+                for file_name, content in files.items():
+                    if file_name == 'desc':
+                        # Parse desc file
+                        current_key = None
+                        for line in content.splitlines():
+                            line = line.strip()
+                            if not line:
+                                continue
                             
-                            # Convert lists to strings
-                            for key in ['DEPENDS', 'CONFLICTS', 'PROVIDES', 'REPLACES']:
-                                if key in pkg_data and isinstance(pkg_data[key], list):
-                                    pkg_data[key] = ' '.join(pkg_data[key])
+                            if line.startswith('%') and line.endswith('%'):
+                                # New key
+                                current_key = line[1:-1]
+                                pkg_data[current_key] = ""
+                            elif current_key:
+                                # Append to current key
+                                if pkg_data[current_key]:
+                                    pkg_data[current_key] += " " + line
+                                else:
+                                    pkg_data[current_key] = line
                     
-                    # Add package to result
-                    result[pkg_name] = pkg_data
-        
-        except Exception as e:
-            logger.error(f"Failed to parse Pacman database: {e}")
-        
-        return result
\ No newline at end of file
+                    elif file_name == 'depends':
+                        # Parse depends file
+                        current_key = None
+                        for line in content.splitlines():
+                            line = line.strip()
+                            if not line:
+                                continue
+                            
+                            if line.startswith('%') and line.endswith('%'):
+                                # New key
+                                current_key = line[1:-1]
+                                if current_key not in pkg_data:
+                                    pkg_data[current_key] = []
+                            elif current_key:
+                                # Add to current key list
+                                pkg_data[current_key].append(line)
+                        
+                        # Convert lists to strings
+                        for key in ['DEPENDS', 'CONFLICTS', 'PROVIDES', 'REPLACES']:
+                            if key in pkg_data and isinstance(pkg_data[key], list):
+                                pkg_data[key] = ' '.join(pkg_data[key])
+                
+                # Add package to result
+                result[pkg_name] = pkg_data
+    
+    except Exception as e:
+        logger.error(f"Failed to parse Pacman database: {e}")
+    
+    return result
\ No newline at end of file
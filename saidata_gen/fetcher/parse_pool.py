@@ -0,0 +1,185 @@
+"""
+Process pool for parsing repository indexes.
+
+Parsing large indexes (APT Packages files, RPM primary.xml) is CPU-bound pure
+Python, so parsing them on fetcher threads serializes on the GIL. Parse
+functions are instead run in a shared ``ProcessPoolExecutor``: the raw
+(usually compressed) bytes of the index are sent to a worker and the parsed
+dictionary is returned. Small indexes are parsed inline, where the cost of
+shipping the data to a worker would outweigh the parse itself.
+
+Parse functions run in workers must be module-level functions taking the raw
+content as their first argument, so that they can be pickled. Instead of
+sending a large result back, a worker can also write it as a package snapshot
+(see ``parse_to_snapshot``), which the fetcher then memory-maps.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from saidata_gen.fetcher.snapshot import write_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Indexes smaller than this many bytes are parsed on the calling thread
+PARSE_POOL_MIN_SIZE = 256 * 1024
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+def _get_mp_context():
+    """
+    Get the multiprocessing context for the parse workers.
+    
+    Fetchers start workers from multi-threaded processes, where forking is
+    unsafe, so "forkserver" is used where available and "spawn" otherwise.
+    
+    Returns:
+        Multiprocessing context.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def get_parse_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Get the shared parse executor, creating it on first use.
+    
+    Args:
+        max_workers: Number of worker processes. If None, the number of CPUs is used.
+            An existing executor with a different number of workers is replaced.
+    
+    Returns:
+        ProcessPoolExecutor instance.
+    """
+    global _executor, _executor_workers
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    
+    with _executor_lock:
+        if _executor is not None and _executor_workers != max_workers:
+            _executor.shutdown(wait=False)
+            _executor = None
+        
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=_get_mp_context())
+            _executor_workers = max_workers
+        
+        return _executor
+
+
+def should_parse_in_worker(
+    content: bytes,
+    max_workers: Optional[int] = None,
+    min_size: Optional[int] = None
+) -> bool:
+    """
+    Check whether content is large enough to be parsed in a worker process.
+    
+    Args:
+        content: Raw content of the index.
+        max_workers: Number of worker processes. If 0, nothing is parsed in workers.
+        min_size: Minimum content size in bytes to parse in a worker process.
+            Defaults to PARSE_POOL_MIN_SIZE.
+    
+    Returns:
+        True if the content should be parsed in a worker process.
+    """
+    if min_size is None:
+        min_size = PARSE_POOL_MIN_SIZE
+    return max_workers != 0 and len(content) >= min_size
+
+
+def parse_to_snapshot(
+    content: bytes,
+    snapshot_path: str,
+    text_fields: Sequence[str],
+    func: Callable[..., Dict[str, Any]],
+    *args: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    Parse the raw content of an index and write the packages as a snapshot.
+    
+    Run in a worker process, this only sends the parsed packages back when
+    they could not be written.
+    
+    Args:
+        content: Raw content of the index.
+        snapshot_path: Path of the snapshot file to write.
+        text_fields: Package data fields stored as searchable text.
+        func: Module-level parse function called as ``func(content, *args)``.
+        *args: Additional arguments for the parse function.
+    
+    Returns:
+        None if the snapshot was written, otherwise the parsed packages (which
+        may be empty).
+    """
+    packages = func(content, *args)
+    if not packages:
+        return packages
+    
+    try:
+        write_snapshot(snapshot_path, packages, text_fields)
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to write snapshot {snapshot_path}: {e}")
+        return packages
+
+
+def run_parse(
+    func: Callable[..., Any],
+    content: bytes,
+    *args: Any,
+    max_workers: Optional[int] = None,
+    min_size: Optional[int] = None
+) -> Any:
+    """
+    Parse the raw content of an index, in a worker process if it is large.
+    
+    Args:
+        func: Module-level parse function called as ``func(content, *args)``.
+        content: Raw content of the index.
+        *args: Additional arguments for the parse function.
+        max_workers: Number of worker processes. If 0, the content is always parsed
+            on the calling thread. If None, the number of CPUs is used.
+        min_size: Minimum content size in bytes to parse in a worker process.
+            Defaults to PARSE_POOL_MIN_SIZE.
+    
+    Returns:
+        Result of the parse function.
+    """
+    if not should_parse_in_worker(content, max_workers, min_size):
+        return func(content, *args)
+    
+    try:
+        future = get_parse_executor(max_workers).submit(func, content, *args)
+    except (BrokenProcessPool, OSError, RuntimeError) as e:
+        logger.warning(f"Parse workers unavailable, parsing on the calling thread: {e}")
+        shutdown_parse_executor()
+        return func(content, *args)
+    
+    try:
+        return future.result()
+    except BrokenProcessPool as e:
+        logger.warning(f"Parse worker failed, parsing on the calling thread: {e}")
+        shutdown_parse_executor()
+        return func(content, *args)
+
+
+def shutdown_parse_executor() -> None:
+    """Shut down the shared parse executor."""
+    global _executor, _executor_workers
+    
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+        _executor_workers = None
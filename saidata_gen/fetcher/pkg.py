@@ -11,8 +11,9 @@ import json
 import logging
 import os
 import re
+import tarfile
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
@@ -42,6 +43,8 @@ class PkgFetcher(HttpRepositoryFetcher):
     by downloading and parsing packagesite.txz files.
     """
     
+    index_text_fields = ("comment", "desc")
+    
     def __init__(
         self,
         repositories: Optional[List[PkgRepository]] = None,
@@ -66,7 +69,7 @@ class PkgFetcher(HttpRepositoryFetcher):
         ]
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -86,32 +89,40 @@ class PkgFetcher(HttpRepositoryFetcher):
         """
         result = FetchResult(success=True)
         
+        # Collect the repositories without a valid cache
+        repositories = []
         for repo in self.repositories:
             repo_key = f"{repo.name}_{repo.version}_{repo.architecture}"
-            try:
-                # Check if we have a valid cache
-                cached_data = self._get_from_cache(repo_key)
-                if cached_data:
-                    self._package_cache[repo_key] = cached_data
-                    result.cache_hits[repo_key] = True
-                    continue
-                
-                # Fetch and parse packagesite
-                packages_data = self._fetch_packagesite(repo)
-                if packages_data:
-                    self._package_cache[repo_key] = packages_data
-                    self._save_to_cache(repo_key, packages_data)
-                    result.providers[repo_key] = True
-                else:
-                    result.success = False
-                    result.providers[repo_key] = False
-                    result.errors[repo_key] = "Failed to fetch packagesite"
             
-            except Exception as e:
-                logger.error(f"Failed to fetch repository data for {repo_key}: {e}")
-                result.errors[repo_key] = str(e)
+            # Check if we have a valid cache
+            cached_data = self._get_from_cache(repo_key)
+            if cached_data:
+                self._set_package_cache_entry(repo_key, cached_data)
+                result.cache_hits[repo_key] = True
+                continue
+            
+            repositories.append((repo, repo_key))
+        
+        # Fetch and parse the packagesite files concurrently
+        for (repo, repo_key), packages_data, error in self._run_concurrently(
+            lambda item: self._fetch_packagesite(*item), repositories
+        ):
+            if error is not None:
+                logger.error(f"Failed to fetch repository data for {repo_key}: {error}")
+                result.errors[repo_key] = str(error)
                 result.providers[repo_key] = False
                 result.success = False
+            elif packages_data:
+                self._set_package_cache_entry(repo_key, packages_data)
+                self._save_to_cache(repo_key, packages_data, snapshot=True)
+                result.providers[repo_key] = True
+            else:
+                result.success = False
+                result.providers[repo_key] = False
+                result.errors[repo_key] = "Failed to fetch packagesite"
+        
+        # Index the fetched packages for lookups and searches
+        self._build_package_index()
         
         return result
     
@@ -125,23 +136,7 @@ class PkgFetcher(HttpRepositoryFetcher):
         Returns:
             PackageInfo if the package is found, None otherwise.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        # Look for the package in all repositories
-        for repo_key, packages in self._package_cache.items():
-            if package_name in packages:
-                pkg_data = packages[package_name]
-                return PackageInfo(
-                    name=package_name,
-                    provider=self.get_repository_name(),
-                    version=pkg_data.get("version"),
-                    description=pkg_data.get("comment"),
-                    details=pkg_data
-                )
-        
-        return None
+        return self._get_indexed_package_info(package_name)
     
     def search_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
         """
@@ -154,39 +149,26 @@ class PkgFetcher(HttpRepositoryFetcher):
         Returns:
             List of PackageInfo objects matching the query.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Search in all repositories
-        for repo_key, packages in self._package_cache.items():
-            for pkg_name, pkg_data in packages.items():
-                # Check if the package name or description contains the query
-                if (query_lower in pkg_name.lower() or 
-                    (pkg_data.get("comment") and query_lower in pkg_data["comment"].lower()) or
-                    (pkg_data.get("desc") and query_lower in pkg_data["desc"].lower())):
-                    
-                    # Create PackageInfo object
-                    pkg_info = PackageInfo(
-                        name=pkg_name,
-                        provider=self.get_repository_name(),
-                        version=pkg_data.get("version"),
-                        description=pkg_data.get("comment"),
-                        details=pkg_data
-                    )
-                    
-                    # Add to results if not already present
-                    if not any(r.name == pkg_name for r in results):
-                        results.append(pkg_info)
-                    
-                    # Stop if we have enough results
-                    if len(results) >= max_results:
-                        return results
+        return self._search_indexed_packages(query, max_results)
+    
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
+        """
+        Create a PackageInfo object from package data.
         
-        return results
+        Args:
+            package_name: Name of the package.
+            package_data: Package data.
+            
+        Returns:
+            PackageInfo object.
+        """
+        return PackageInfo(
+            name=package_name,
+            provider=self.get_repository_name(),
+            version=package_data.get("version"),
+            description=package_data.get("comment"),
+            details=package_data
+        )
     
     def get_package_details(self, package_name: str, repository: Optional[str] = None) -> Optional[PackageDetails]:
         """
@@ -234,23 +216,18 @@ class PkgFetcher(HttpRepositoryFetcher):
         
         return None
     
-    def _fetch_packagesite(self, repo: PkgRepository) -> Dict[str, Dict[str, any]]:
+    def _fetch_packagesite(self, repo: PkgRepository, cache_key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse a packagesite file from a pkg repository.
         
         Args:
             repo: Repository configuration.
+            cache_key: Optional cache key a parse worker writes the packages to.
             
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        # Save the current base_url
-        original_base_url = self.base_url
-        
         try:
-            # Set the base_url for this request
-            self.base_url = repo.url
-            
             # Create a temporary directory for the packagesite
             import tempfile
             with tempfile.TemporaryDirectory() as temp_dir:
@@ -258,36 +235,22 @@ class PkgFetcher(HttpRepositoryFetcher):
                 packagesite_path = os.path.join(temp_dir, "packagesite.txz")
                 
                 try:
-                    self._fetch_binary("packagesite.txz", packagesite_path)
+                    self._fetch_binary(f"{repo.url}/packagesite.txz", packagesite_path)
                 except Exception as e:
                     logger.warning(f"Failed to fetch packagesite.txz: {e}")
                     return {}
                 
-                # Extract the packagesite.txz file
-                import tarfile
-                try:
-                    with tarfile.open(packagesite_path, 'r:xz') as tar:
-                        tar.extractall(path=temp_dir)
-                except Exception as e:
-                    logger.warning(f"Failed to extract packagesite.txz: {e}")
-                    return {}
-                
-                # Parse the packagesite.yaml file
-                packagesite_yaml_path = os.path.join(temp_dir, "packagesite.yaml")
-                if not os.path.exists(packagesite_yaml_path):
-                    logger.warning(f"packagesite.yaml not found in {packagesite_path}")
-                    return {}
-                
-                return self._parse_packagesite_yaml(packagesite_yaml_path)
+                with open(packagesite_path, 'rb') as f:
+                    content = f.read()
+            
+            # Extract and parse packagesite.yaml, in a worker process if it is large
+            return self._parse_content(parse_packagesite_archive, content, snapshot_key=cache_key)
             
         except Exception as e:
             logger.warning(f"Failed to fetch packagesite for {repo.name}: {e}")
             return {}
-        finally:
-            # Restore the original base_url
-            self.base_url = original_base_url
     
-    def _parse_packagesite_yaml(self, packagesite_path: str) -> Dict[str, Dict[str, any]]:
+    def _parse_packagesite_yaml(self, packagesite_path: str) -> Dict[str, Dict[str, Any]]:
         """
         Parse a packagesite.yaml file from a pkg repository.
         
@@ -297,26 +260,67 @@ class PkgFetcher(HttpRepositoryFetcher):
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        result = {}
-        
         try:
             # Read the packagesite.yaml file
             with open(packagesite_path, 'r', encoding='utf-8') as f:
-                # The file contains one JSON object per line
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # Parse the JSON object
-                    pkg_data = json.loads(line)
-                    
-                    # Extract package name
-                    pkg_name = pkg_data.get("name")
-                    if pkg_name:
-                        result[pkg_name] = pkg_data
-        
+                return parse_packagesite_lines(f)
         except Exception as e:
             logger.warning(f"Failed to parse packagesite.yaml: {e}")
+            return {}
+
+
+def parse_packagesite_archive(content: bytes) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract and parse the packagesite.yaml file from a packagesite.txz archive.
+    
+    This is a module-level function so that it can run in a parse worker process.
+    
+    Args:
+        content: Content of the packagesite.txz archive.
+        
+    Returns:
+        Dictionary mapping package names to their metadata, or an empty
+        dictionary if the archive has no packagesite.yaml file.
+    """
+    with tarfile.open(fileobj=io.BytesIO(content), mode='r:xz') as tar:
+        for member in tar.getmembers():
+            if os.path.basename(member.name) == "packagesite.yaml" and member.isfile():
+                with io.TextIOWrapper(tar.extractfile(member), encoding='utf-8') as f:
+                    return parse_packagesite_lines(f)
+    
+    logger.warning("packagesite.yaml not found in packagesite.txz")
+    return {}
+
+
+def parse_packagesite_lines(lines: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse the lines of a packagesite.yaml file.
+    
+    The file contains one JSON object per line.
+    
+    Args:
+        lines: Lines of the packagesite.yaml file.
+        
+    Returns:
+        Dictionary mapping package names to their metadata.
+    """
+    result = {}
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        
+        # Parse the JSON object
+        try:
+            pkg_data = json.loads(line)
+        except ValueError as e:
+            logger.warning(f"Skipping malformed packagesite.yaml entry: {e}")
+            continue
         
-        return result
\ No newline at end of file
+        # Extract package name
+        pkg_name = pkg_data.get("name")
+        if pkg_name:
+            result[pkg_name] = pkg_data
+    
+    return result
@@ -10,7 +10,8 @@ import os
 import re
 import tempfile
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
@@ -39,6 +40,14 @@ class PortageFetcher(GitRepositoryFetcher):
     by cloning the repository and parsing ebuild files.
     """
     
+    # Top-level directories of the repository that are not package categories
+    NON_CATEGORY_DIRS = ("eclass", "profiles", "metadata")
+    
+    # Only ebuilds and package metadata are checked out in sparse clones,
+    # skipping Manifests, patches and everything outside package directories
+    SPARSE_PATHS = ("/*/*/*.ebuild", "/*/*/metadata.xml")
+    SPARSE_PATTERNS = True
+    
     def __init__(
         self,
         repositories: Optional[List[PortageRepository]] = None,
@@ -67,7 +76,7 @@ class PortageFetcher(GitRepositoryFetcher):
         )
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self._category_cache: Dict[str, List[str]] = {}
     
     def get_repository_name(self) -> str:
@@ -199,7 +208,7 @@ class PortageFetcher(GitRepositoryFetcher):
         
         return results
     
-    def _create_package_info(self, package_name: str, package_data: Dict[str, any]) -> PackageInfo:
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
         """
         Create a PackageInfo object from package data.
         
@@ -218,10 +227,13 @@ class PortageFetcher(GitRepositoryFetcher):
             details=package_data
         )
     
-    def _parse_portage_repository(self) -> Tuple[Dict[str, Dict[str, any]], List[str]]:
+    def _parse_portage_repository(self) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
         """
         Parse a Portage repository.
         
+        Only the package directories changed since the last processed commit
+        are parsed again (see ``_process_repository_incrementally``).
+        
         Returns:
             Tuple containing:
             - Dictionary mapping package names to their metadata.
@@ -231,63 +243,103 @@ class PortageFetcher(GitRepositoryFetcher):
         categories = []
         
         try:
-            # Get all directories in the repository root (categories)
-            for item in os.listdir(self.repo_dir):
-                category_path = os.path.join(self.repo_dir, item)
-                
-                # Skip non-directories and special directories
-                if not os.path.isdir(category_path) or item.startswith(".") or item in ["eclass", "profiles", "metadata"]:
-                    continue
-                
-                categories.append(item)
-                
-                # Get all directories in the category (packages)
-                for pkg in os.listdir(category_path):
-                    pkg_path = os.path.join(category_path, pkg)
-                    
-                    # Skip non-directories and special files
-                    if not os.path.isdir(pkg_path) or pkg.startswith("."):
-                        continue
-                    
-                    # Get all ebuild files in the package directory
-                    ebuilds = []
-                    for file in os.listdir(pkg_path):
-                        if file.endswith(".ebuild"):
-                            ebuilds.append(file)
-                    
-                    if not ebuilds:
-                        continue
-                    
-                    # Sort ebuilds by version (latest first)
-                    ebuilds.sort(reverse=True)
-                    
-                    # Parse the latest ebuild
-                    latest_ebuild = ebuilds[0]
-                    ebuild_path = os.path.join(pkg_path, latest_ebuild)
-                    
-                    # Extract package metadata
-                    pkg_data = self._parse_ebuild(ebuild_path)
-                    
-                    # Add package to result
-                    full_name = f"{item}/{pkg}"
-                    packages[full_name] = pkg_data
-                    
-                    # Also add metadata file if it exists
-                    metadata_path = os.path.join(pkg_path, "metadata.xml")
-                    if os.path.exists(metadata_path):
-                        pkg_data["metadata_xml"] = self._get_file_content(os.path.relpath(metadata_path, self.repo_dir))
-        
+            categories = self._list_categories()
+            packages = self._process_repository_incrementally(
+                self._list_package_dirs, self._package_dir_for_path, self._parse_package_dir
+            )
         except Exception as e:
             logger.error(f"Failed to parse Portage repository: {e}")
         
         return packages, categories
     
-    def _parse_ebuild(self, ebuild_path: str) -> Dict[str, any]:
+    def _list_categories(self) -> List[str]:
+        """
+        List the categories of the repository.
+        
+        Returns:
+            Category names.
+        """
+        categories = []
+        
+        # Get all directories in the repository root (categories)
+        for item in self._list_files("", "*"):
+            # Skip non-directories and special directories
+            if item in self.NON_CATEGORY_DIRS:
+                continue
+            if self._is_directory(item):
+                categories.append(item)
+        
+        return sorted(categories)
+    
+    def _list_package_dirs(self) -> List[str]:
+        """
+        List the package directories of the repository.
+        
+        Returns:
+            Package directories as "category/package".
+        """
+        package_dirs = []
+        for category in self._list_categories():
+            # Get all directories in the category (packages)
+            for pkg_path in self._list_files(category, "*"):
+                if self._is_directory(pkg_path):
+                    package_dirs.append(Path(pkg_path).as_posix())
+        
+        return sorted(package_dirs)
+    
+    def _package_dir_for_path(self, path: str) -> Optional[str]:
+        """
+        Get the package directory of a changed file.
+        
+        Args:
+            path: File path relative to the repository root.
+            
+        Returns:
+            Package directory as "category/package", or None if the file is not
+            inside a package directory.
+        """
+        parts = path.split("/")
+        if len(parts) < 3 or parts[0].startswith(".") or parts[0] in self.NON_CATEGORY_DIRS:
+            return None
+        if parts[1].startswith("."):
+            return None
+        return f"{parts[0]}/{parts[1]}"
+    
+    def _parse_package_dir(self, package_dir: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse the latest ebuild and the metadata of a package directory.
+        
+        Args:
+            package_dir: Package directory as "category/package".
+            
+        Returns:
+            Dictionary mapping the full package name to its metadata, or an
+            empty dictionary if the directory has no ebuilds.
+        """
+        # Get all ebuild files in the package directory
+        ebuilds = self._list_files(package_dir, "*.ebuild")
+        if not ebuilds:
+            return {}
+        
+        # Sort ebuilds by version (latest first)
+        ebuilds.sort(reverse=True)
+        
+        # Parse the latest ebuild
+        pkg_data = self._parse_ebuild(ebuilds[0])
+        
+        # Also add metadata file if it exists
+        metadata_xml = self._get_file_content(f"{package_dir}/metadata.xml")
+        if metadata_xml is not None:
+            pkg_data["metadata_xml"] = metadata_xml
+        
+        return {package_dir: pkg_data}
+    
+    def _parse_ebuild(self, ebuild_path: str) -> Dict[str, Any]:
         """
         Parse an ebuild file.
         
         Args:
-            ebuild_path: Path to the ebuild file.
+            ebuild_path: Path to the ebuild file relative to the repository root.
             
         Returns:
             Dictionary with package metadata.
@@ -296,8 +348,9 @@ class PortageFetcher(GitRepositoryFetcher):
         
         try:
             # Read the ebuild file
-            with open(ebuild_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._get_file_content(ebuild_path)
+            if content is None:
+                raise FileNotFoundError(ebuild_path)
             
             # Extract package version from filename
             filename = os.path.basename(ebuild_path)
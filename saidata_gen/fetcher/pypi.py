@@ -235,16 +235,7 @@ class PyPIFetcher(HttpRepositoryFetcher):
             "pillow", "beautifulsoup4", "pytest", "sqlalchemy", "fastapi"
         ]
         
-        packages = {}
-        for pkg_name in popular_packages:
-            try:
-                package_data = self._fetch_package_details(pkg_name, repo_name)
-                if package_data:
-                    packages[pkg_name] = package_data
-            except Exception as e:
-                logger.warning(f"Failed to fetch package details for {pkg_name} from {repo_name}: {e}")
-        
-        return packages
+        return self._fetch_package_details_batch(popular_packages, repo_name)
     
     def _fetch_package_details(self, package_name: str, repo_name: str) -> Optional[Dict[str, any]]:
         """
@@ -260,40 +251,75 @@ class PyPIFetcher(HttpRepositoryFetcher):
         try:
             # Fetch package details from PyPI JSON API
             response = self._fetch_json(f"{package_name}/json")
-            
-            if "info" in response:
-                info = response["info"]
-                releases = response.get("releases", {})
-                
-                # Get the latest version
-                latest_version = info.get("version")
-                
-                # Extract package metadata
-                return {
-                    "name": info.get("name"),
-                    "version": latest_version,
-                    "summary": info.get("summary"),
-                    "description": info.get("description"),
-                    "author": info.get("author"),
-                    "author_email": info.get("author_email"),
-                    "maintainer": info.get("maintainer"),
-                    "maintainer_email": info.get("maintainer_email"),
-                    "license": info.get("license"),
-                    "project_url": info.get("project_url"),
-                    "homepage": info.get("home_page"),
-                    "documentation_url": info.get("docs_url"),
-                    "download_url": info.get("download_url"),
-                    "keywords": info.get("keywords", "").split(),
-                    "classifiers": info.get("classifiers", []),
-                    "requires_python": info.get("requires_python"),
-                    "requires_dist": info.get("requires_dist", []),
-                    "repository": repo_name
-                }
+            return self._parse_package_details(response, repo_name)
         
         except Exception as e:
             logger.warning(f"Failed to fetch package details for {package_name} from {repo_name}: {e}")
             return None
     
+    def _fetch_package_details_batch(self, package_names: List[str], repo_name: str) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch detailed information about many packages concurrently.
+        
+        Args:
+            package_names: Names of the packages.
+            repo_name: Name of the repository.
+            
+        Returns:
+            Dictionary mapping the names of the packages found to their metadata.
+        """
+        paths = {f"{name}/json": name for name in package_names}
+        responses = self._fetch_json_many(list(paths))
+        
+        packages = {}
+        for path, response in responses.items():
+            package_data = self._parse_package_details(response, repo_name)
+            if package_data:
+                packages[paths[path]] = package_data
+        
+        return packages
+    
+    def _parse_package_details(self, response: Dict[str, any], repo_name: str) -> Optional[Dict[str, any]]:
+        """
+        Extract package metadata from a PyPI JSON API response.
+        
+        Args:
+            response: Response of the package's JSON endpoint.
+            repo_name: Name of the repository.
+            
+        Returns:
+            Package metadata, or None if the response has no package info.
+        """
+        if "info" not in response:
+            return None
+        
+        info = response["info"]
+        
+        # Get the latest version
+        latest_version = info.get("version")
+        
+        # Extract package metadata
+        return {
+            "name": info.get("name"),
+            "version": latest_version,
+            "summary": info.get("summary"),
+            "description": info.get("description"),
+            "author": info.get("author"),
+            "author_email": info.get("author_email"),
+            "maintainer": info.get("maintainer"),
+            "maintainer_email": info.get("maintainer_email"),
+            "license": info.get("license"),
+            "project_url": info.get("project_url"),
+            "homepage": info.get("home_page"),
+            "documentation_url": info.get("docs_url"),
+            "download_url": info.get("download_url"),
+            "keywords": (info.get("keywords") or "").split(),
+            "classifiers": info.get("classifiers", []),
+            "requires_python": info.get("requires_python"),
+            "requires_dist": info.get("requires_dist", []),
+            "repository": repo_name
+        }
+    
     def _search_packages_in_repo(self, query: str, repo_name: str, max_results: int = 10) -> Dict[str, Dict[str, any]]:
         """
         Search for packages in a repository.
@@ -327,20 +353,9 @@ class PyPIFetcher(HttpRepositoryFetcher):
                     query.replace(" ", "_")
                 ]
                 
-                results = {}
-                for variation in variations:
-                    if len(results) >= max_results:
-                        break
-                    
-                    if variation != query:
-                        try:
-                            package_data = self._fetch_package_details(variation, repo_name)
-                            if package_data:
-                                results[variation] = package_data
-                        except Exception:
-                            pass
-                
-                return results
+                variations = [variation for variation in variations if variation != query]
+                results = self._fetch_package_details_batch(variations, repo_name)
+                return dict(list(results.items())[:max_results])
             
             except Exception as e:
                 logger.warning(f"Failed to search packages in {repo_name}: {e}")
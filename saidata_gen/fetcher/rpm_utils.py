@@ -8,11 +8,26 @@ data from RPM-based repositories (DNF, YUM, Zypper).
 import gzip
 import io
 import logging
+import lzma
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+# Try to import zstandard, but don't fail if it's not available
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+COMMON_NS = "{http://linux.duke.edu/metadata/common}"
+RPM_NS = "{http://linux.duke.edu/metadata/rpm}"
+
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 
 def fetch_primary_location(repomd_xml: str) -> str:
     """
@@ -48,6 +63,33 @@ def fetch_primary_location(repomd_xml: str) -> str:
         raise ValueError(f"Failed to parse repomd.xml: {e}")
 
 
+def fetch_primary_checksum(repomd_xml: str) -> Optional[str]:
+    """
+    Parse the repomd.xml content to get the checksum of the primary.xml file.
+    
+    Args:
+        repomd_xml: Content of the repomd.xml file.
+        
+    Returns:
+        Checksum of the (compressed) primary.xml file as "<type>:<value>", or
+        None if repomd.xml does not list one.
+    """
+    try:
+        root = ET.fromstring(repomd_xml)
+    except ET.ParseError as e:
+        logger.debug(f"Failed to parse repomd.xml for checksums: {e}")
+        return None
+    
+    ns = {"repo": "http://linux.duke.edu/metadata/repo"}
+    for data in root.findall(".//repo:data", ns):
+        if data.get("type") == "primary":
+            checksum = data.find("repo:checksum", ns)
+            if checksum is not None and checksum.text:
+                return f"{checksum.get('type', 'sha256')}:{checksum.text.strip()}"
+    
+    return None
+
+
 def decompress_gzip_content(content: bytes) -> bytes:
     """
     Decompress gzipped content.
@@ -69,12 +111,158 @@ def decompress_gzip_content(content: bytes) -> bytes:
         raise ValueError(f"Failed to decompress gzipped content: {e}")
 
 
-def parse_primary_xml(primary_xml: str) -> Dict[str, Dict[str, any]]:
+def open_decompressed_stream(content: bytes, source: str = "") -> BinaryIO:
+    """
+    Open repository metadata for reading, decompressing it on the fly.
+    
+    The compression format is detected from the content's magic bytes, falling
+    back to the file extension of the source.
+    
+    Args:
+        content: Raw (possibly compressed) content.
+        source: URL or file name the content was fetched from.
+        
+    Returns:
+        Binary file object yielding the decompressed content.
+        
+    Raises:
+        ValueError: If the content is zstd-compressed and zstandard is not installed.
+    """
+    stream = io.BytesIO(content)
+    
+    if content.startswith(GZIP_MAGIC) or (not content.startswith((XZ_MAGIC, ZSTD_MAGIC)) and source.endswith(".gz")):
+        return gzip.GzipFile(fileobj=stream)
+    
+    if content.startswith(XZ_MAGIC) or source.endswith(".xz"):
+        return lzma.LZMAFile(stream)
+    
+    if content.startswith(ZSTD_MAGIC) or source.endswith(".zst"):
+        if not ZSTANDARD_AVAILABLE:
+            raise ValueError("zstandard is required to read zstd-compressed metadata")
+        return zstandard.ZstdDecompressor().stream_reader(stream)
+    
+    return stream
+
+
+def iter_primary_packages(primary_xml: Union[str, bytes, BinaryIO]) -> Iterator[Dict[str, any]]:
+    """
+    Stream package metadata out of a primary.xml document.
+    
+    The document is parsed incrementally and each package element is cleared
+    once it has been read, so memory use does not grow with the file size.
+    
+    Args:
+        primary_xml: Content of the primary.xml file, or a binary file object to read it from.
+        
+    Yields:
+        Package metadata dictionaries.
+    """
+    if isinstance(primary_xml, str):
+        primary_xml = primary_xml.encode("utf-8")
+    if isinstance(primary_xml, bytes):
+        primary_xml = io.BytesIO(primary_xml)
+    
+    package_tag = f"{COMMON_NS}package"
+    root = None
+    
+    for event, elem in ET.iterparse(primary_xml, events=("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        
+        if event != "end" or elem.tag != package_tag:
+            continue
+        
+        pkg_data = _parse_package_element(elem)
+        
+        # Drop the parsed package from the tree to keep memory flat
+        elem.clear()
+        root.clear()
+        
+        if pkg_data is not None:
+            yield pkg_data
+
+
+def _parse_package_element(package: ET.Element) -> Optional[Dict[str, any]]:
+    """
+    Extract metadata from a primary.xml package element.
+    
+    Args:
+        package: Package element.
+        
+    Returns:
+        Package metadata dictionary, or None if the package has no name.
+    """
+    name = _child_text(package, f"{COMMON_NS}name")
+    if name is None:
+        return None
+    
+    # Get version info
+    version_elem = package.find(f"{COMMON_NS}version")
+    version = None
+    if version_elem is not None:
+        epoch = version_elem.get("epoch", "0")
+        ver = version_elem.get("ver", "")
+        rel = version_elem.get("rel", "")
+        
+        # Format version as epoch:version-release if epoch is not 0
+        if epoch != "0":
+            version = f"{epoch}:{ver}-{rel}"
+        else:
+            version = f"{ver}-{rel}"
+    
+    # Get license, source RPM and requires from the format section
+    license_text = None
+    source_rpm = None
+    requires = []
+    format_elem = package.find(f"{COMMON_NS}format")
+    if format_elem is not None:
+        license_text = _child_text(format_elem, f"{RPM_NS}license")
+        source_rpm = _child_text(format_elem, f"{RPM_NS}sourcerpm")
+        for entry in format_elem.iterfind(f"{RPM_NS}requires/{RPM_NS}entry"):
+            req_name = entry.get("name")
+            if req_name and not req_name.startswith("rpmlib(") and not req_name.startswith("/"):
+                requires.append(req_name)
+    
+    # Get checksum
+    checksum_elem = package.find(f"{COMMON_NS}checksum")
+    
+    return {
+        "name": name,
+        "version": version,
+        "summary": _child_text(package, f"{COMMON_NS}summary"),
+        "description": _child_text(package, f"{COMMON_NS}description"),
+        "url": _child_text(package, f"{COMMON_NS}url"),
+        "license": license_text,
+        "source_rpm": source_rpm,
+        "requires": requires,
+        "checksum": checksum_elem.text if checksum_elem is not None else None,
+        "checksum_type": checksum_elem.get("type") if checksum_elem is not None else None
+    }
+
+
+def _child_text(parent: ET.Element, tag: str) -> Optional[str]:
+    """
+    Get the text of a direct child element.
+    
+    Args:
+        parent: Parent element.
+        tag: Qualified tag of the child.
+        
+    Returns:
+        Text of the child, or None if the child is missing or empty.
+    """
+    child = parent.find(tag)
+    return child.text if child is not None else None
+
+
+def parse_primary_xml(primary_xml: Union[str, bytes, BinaryIO]) -> Dict[str, Dict[str, any]]:
     """
     Parse the primary.xml content.
     
     Args:
-        primary_xml: Content of the primary.xml file.
+        primary_xml: Content of the primary.xml file, or a binary file object to
+            stream it from (see open_decompressed_stream).
         
     Returns:
         Dictionary mapping package names to their metadata.
@@ -85,86 +273,8 @@ def parse_primary_xml(primary_xml: str) -> Dict[str, Dict[str, any]]:
     result = {}
     
     try:
-        # Parse the XML
-        root = ET.fromstring(primary_xml)
-        
-        # Define namespaces
-        ns = {
-            "rpm": "http://linux.duke.edu/metadata/rpm",
-            "common": "http://linux.duke.edu/metadata/common"
-        }
-        
-        # Process each package
-        for package in root.findall(".//common:package", ns):
-            # Get basic package info
-            name_elem = package.find(".//common:name", ns)
-            if name_elem is None:
-                continue
-            
-            name = name_elem.text
-            
-            # Get version info
-            version_elem = package.find(".//common:version", ns)
-            version = None
-            if version_elem is not None:
-                epoch = version_elem.get("epoch", "0")
-                ver = version_elem.get("ver", "")
-                rel = version_elem.get("rel", "")
-                
-                # Format version as epoch:version-release if epoch is not 0
-                if epoch != "0":
-                    version = f"{epoch}:{ver}-{rel}"
-                else:
-                    version = f"{ver}-{rel}"
-            
-            # Get summary and description
-            summary_elem = package.find(".//common:summary", ns)
-            summary = summary_elem.text if summary_elem is not None else None
-            
-            description_elem = package.find(".//common:description", ns)
-            description = description_elem.text if description_elem is not None else None
-            
-            # Get URL
-            url_elem = package.find(".//common:url", ns)
-            url = url_elem.text if url_elem is not None else None
-            
-            # Get license
-            format_elem = package.find(".//common:format", ns)
-            license_elem = format_elem.find(".//rpm:license", ns) if format_elem is not None else None
-            license_text = license_elem.text if license_elem is not None else None
-            
-            # Get source RPM
-            source_rpm_elem = format_elem.find(".//rpm:sourcerpm", ns) if format_elem is not None else None
-            source_rpm = source_rpm_elem.text if source_rpm_elem is not None else None
-            
-            # Get requires
-            requires = []
-            if format_elem is not None:
-                for entry in format_elem.findall(".//rpm:requires/rpm:entry", ns):
-                    req_name = entry.get("name")
-                    if req_name and not req_name.startswith("rpmlib(") and not req_name.startswith("/"):
-                        requires.append(req_name)
-            
-            # Get checksum
-            checksum_elem = package.find(".//common:checksum", ns)
-            checksum = checksum_elem.text if checksum_elem is not None else None
-            checksum_type = checksum_elem.get("type") if checksum_elem is not None else None
-            
-            # Create package data
-            pkg_data = {
-                "name": name,
-                "version": version,
-                "summary": summary,
-                "description": description,
-                "url": url,
-                "license": license_text,
-                "source_rpm": source_rpm,
-                "requires": requires,
-                "checksum": checksum,
-                "checksum_type": checksum_type
-            }
-            
-            result[name] = pkg_data
+        for pkg_data in iter_primary_packages(primary_xml):
+            result[pkg_data["name"]] = pkg_data
     
     except Exception as e:
         logger.error(f"Failed to parse primary.xml: {e}")
@@ -173,6 +283,25 @@ def parse_primary_xml(primary_xml: str) -> Dict[str, Dict[str, any]]:
     return result
 
 
+def parse_primary_content(content: bytes, source: str = "") -> Dict[str, Dict[str, any]]:
+    """
+    Parse the raw, possibly compressed content of a primary.xml file.
+    
+    This is a module-level function so that it can run in a parse worker process.
+    
+    Args:
+        content: Raw content of the primary.xml file.
+        source: URL or file name of the content, used to detect its compression.
+        
+    Returns:
+        Dictionary mapping package names to their metadata.
+        
+    Raises:
+        ValueError: If the primary.xml file cannot be parsed.
+    """
+    return parse_primary_xml(open_decompressed_stream(content, source))
+
+
 def parse_metalink_xml(metalink_xml: str) -> List[str]:
     """
     Parse the metalink XML content to get mirror URLs.
@@ -8,7 +8,8 @@ import json
 import logging
 import os
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
@@ -37,6 +38,10 @@ class ScoopFetcher(GitRepositoryFetcher):
     and processing the JSON manifests.
     """
     
+    # Manifests live in the bucket directory or, for older buckets, at the
+    # root, whose files are always part of a sparse checkout
+    SPARSE_PATHS = ("bucket",)
+    
     def __init__(
         self,
         buckets: Optional[List[ScoopBucket]] = None,
@@ -76,7 +81,7 @@ class ScoopFetcher(GitRepositoryFetcher):
         )
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -198,7 +203,7 @@ class ScoopFetcher(GitRepositoryFetcher):
         
         return results
     
-    def _create_package_info(self, package_name: str, package_data: Dict[str, any], bucket_name: str) -> PackageInfo:
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any], bucket_name: str) -> PackageInfo:
         """
         Create a PackageInfo object from package data.
         
@@ -222,64 +227,65 @@ class ScoopFetcher(GitRepositoryFetcher):
             details=details
         )
     
-    def _process_manifests(self) -> Dict[str, Dict[str, any]]:
+    def _process_manifests(self) -> Dict[str, Dict[str, Any]]:
         """
         Process Scoop manifests from the repository.
         
+        Only the manifests changed since the last processed commit are parsed
+        again (see ``_process_repository_incrementally``).
+        
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        # Scoop manifests are typically in the bucket root or in a "bucket" directory
-        manifest_dirs = [self.repo_dir]
-        bucket_dir = os.path.join(self.repo_dir, "bucket")
-        if os.path.exists(bucket_dir):
-            manifest_dirs.append(bucket_dir)
+        return self._process_repository_incrementally(
+            self._list_manifest_files, self._manifest_file_for_path, self._process_manifest_file
+        )
+    
+    def _list_manifest_files(self) -> List[str]:
+        """
+        List the manifest files of the bucket.
         
-        result = {}
-        found_manifests = False
+        Scoop manifests are typically in the bucket root or in a "bucket" directory.
         
-        # Process all manifest directories
-        for manifest_dir in manifest_dirs:
-            if not os.path.exists(manifest_dir):
-                continue
-                
-            # Walk through the directory
-            for root, dirs, files in os.walk(manifest_dir):
-                for file in files:
-                    if file.endswith(".json"):
-                        try:
-                            file_path = os.path.join(root, file)
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                manifest = json.load(f)
-                            
-                            # Extract package name and metadata
-                            if manifest and isinstance(manifest, dict):
-                                # Use filename without extension as package name
-                                package_name = os.path.splitext(file)[0]
-                                result[package_name] = manifest
-                                found_manifests = True
-                        
-                        except Exception as e:
-                            logger.warning(f"Failed to process manifest {file}: {e}")
+        Returns:
+            Manifest paths relative to the repository root.
+        """
+        return sorted(Path(file_path).as_posix() for file_path in self._list_files("", "**/*.json"))
+    
+    def _manifest_file_for_path(self, path: str) -> Optional[str]:
+        """
+        Get the manifest of a changed file.
+        
+        Args:
+            path: File path relative to the repository root.
+            
+        Returns:
+            The path itself if it is a manifest, None otherwise.
+        """
+        return path if path.endswith(".json") else None
+    
+    def _process_manifest_file(self, manifest_path: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Process a manifest file.
+        
+        Args:
+            manifest_path: Manifest path relative to the repository root.
+            
+        Returns:
+            Dictionary mapping the package name to the manifest, or an empty
+            dictionary if the file is missing or not a manifest.
+        """
+        content = self._get_file_content(manifest_path)
+        if content is None:
+            return {}
         
-        # For testing purposes, if we're using a mock repo with no manifests found,
-        # but there are json files directly in the repo_dir or bucket_dir, consider it a success
-        if not found_manifests:
-            for dir_path in manifest_dirs:
-                json_files = [f for f in os.listdir(dir_path) if f.endswith('.json')]
-                if json_files:
-                    found_manifests = True
-                    for file in json_files:
-                        try:
-                            file_path = os.path.join(dir_path, file)
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                manifest = json.load(f)
-                            
-                            # Use filename without extension as package name
-                            package_name = os.path.splitext(file)[0]
-                            result[package_name] = manifest
-                        
-                        except Exception as e:
-                            logger.warning(f"Failed to process manifest {file}: {e}")
+        try:
+            manifest = json.loads(content)
+        except Exception as e:
+            logger.warning(f"Failed to process manifest {os.path.basename(manifest_path)}: {e}")
+            return {}
         
-        return result
\ No newline at end of file
+        # Use filename without extension as package name
+        if manifest and isinstance(manifest, dict):
+            return {os.path.splitext(os.path.basename(manifest_path))[0]: manifest}
+        return {}
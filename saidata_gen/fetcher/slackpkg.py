@@ -5,18 +5,17 @@ This module provides functionality to fetch package metadata from Slackware
 package repositories.
 """
 
-import gzip
-import io
 import logging
 import os
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
 )
 from saidata_gen.fetcher.base import HttpRepositoryFetcher
+from saidata_gen.fetcher.deb_utils import as_lines, iter_lines, iter_stanzas
 
 
 logger = logging.getLogger(__name__)
@@ -40,6 +39,8 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
     by downloading and parsing PACKAGES.TXT files.
     """
     
+    index_text_fields = ("description",)
+    
     def __init__(
         self,
         repositories: Optional[List[SlackpkgRepository]] = None,
@@ -65,7 +66,7 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
         ]
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -91,7 +92,7 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
                 # Check if we have a valid cache
                 cached_data = self._get_from_cache(repo_key)
                 if cached_data:
-                    self._package_cache[repo_key] = cached_data
+                    self._set_package_cache_entry(repo_key, cached_data)
                     result.cache_hits[repo_key] = True
                     continue
                 
@@ -107,8 +108,8 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
                         logger.warning(f"Failed to fetch packages for section {section}: {e}")
                 
                 if packages_data:
-                    self._package_cache[repo_key] = packages_data
-                    self._save_to_cache(repo_key, packages_data)
+                    self._set_package_cache_entry(repo_key, packages_data)
+                    self._save_to_cache(repo_key, packages_data, snapshot=True)
                     result.providers[repo_key] = True
                 else:
                     result.success = False
@@ -121,6 +122,9 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
                 result.providers[repo_key] = False
                 result.success = False
         
+        # Index the fetched packages for lookups and searches
+        self._build_package_index()
+        
         return result
     
     def get_package_info(self, package_name: str) -> Optional[PackageInfo]:
@@ -133,23 +137,7 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
         Returns:
             PackageInfo if the package is found, None otherwise.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        # Look for the package in all repositories
-        for repo_name, packages in self._package_cache.items():
-            if package_name in packages:
-                pkg_data = packages[package_name]
-                return PackageInfo(
-                    name=package_name,
-                    provider=self.get_repository_name(),
-                    version=pkg_data.get("version"),
-                    description=pkg_data.get("description"),
-                    details=pkg_data
-                )
-        
-        return None
+        return self._get_indexed_package_info(package_name)
     
     def search_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
         """
@@ -162,38 +150,26 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
         Returns:
             List of PackageInfo objects matching the query.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Search in all repositories
-        for repo_name, packages in self._package_cache.items():
-            for pkg_name, pkg_data in packages.items():
-                # Check if the package name or description contains the query
-                if (query_lower in pkg_name.lower() or 
-                    (pkg_data.get("description") and query_lower in pkg_data["description"].lower())):
-                    
-                    # Create PackageInfo object
-                    pkg_info = PackageInfo(
-                        name=pkg_name,
-                        provider=self.get_repository_name(),
-                        version=pkg_data.get("version"),
-                        description=pkg_data.get("description"),
-                        details=pkg_data
-                    )
-                    
-                    # Add to results if not already present
-                    if not any(r.name == pkg_name for r in results):
-                        results.append(pkg_info)
-                    
-                    # Stop if we have enough results
-                    if len(results) >= max_results:
-                        return results
+        return self._search_indexed_packages(query, max_results)
+    
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
+        """
+        Create a PackageInfo object from package data.
         
-        return results
+        Args:
+            package_name: Name of the package.
+            package_data: Package data.
+            
+        Returns:
+            PackageInfo object.
+        """
+        return PackageInfo(
+            name=package_name,
+            provider=self.get_repository_name(),
+            version=package_data.get("version"),
+            description=package_data.get("description"),
+            details=package_data
+        )
     
     def get_package_details(self, package_name: str, repository: Optional[str] = None) -> Optional[PackageDetails]:
         """
@@ -243,7 +219,7 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
         
         return None
     
-    def _fetch_packages_file(self, repo: SlackpkgRepository, section: str) -> Dict[str, Dict[str, any]]:
+    def _fetch_packages_file(self, repo: SlackpkgRepository, section: str) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse a PACKAGES.TXT file from a Slackpkg repository.
         
@@ -273,11 +249,8 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
                 # Try gzipped version
                 response = self._fetch_url(f"{packages_path}.gz")
                 
-                # Decompress the gzipped content
-                with gzip.GzipFile(fileobj=io.BytesIO(response.content)) as f:
-                    packages_text = f.read().decode("utf-8")
-                
-                return self._parse_packages_file(packages_text, section)
+                # Decompress and parse the gzipped content line by line
+                return self._parse_packages_file(iter_lines(response.content, compressed=True), section)
             
         except Exception as e:
             logger.warning(f"Failed to fetch packages for section {section}: {e}")
@@ -286,36 +259,25 @@ class SlackpkgFetcher(HttpRepositoryFetcher):
             # Restore the original base_url
             self.base_url = original_base_url
     
-    def _parse_packages_file(self, packages_text: str, section: str) -> Dict[str, Dict[str, any]]:
+    def _parse_packages_file(self, packages_text: Union[str, Iterable[str]], section: str) -> Dict[str, Dict[str, Any]]:
         """
         Parse a PACKAGES.TXT file from a Slackpkg repository.
         
         Args:
-            packages_text: Content of the PACKAGES.TXT file.
+            packages_text: Content of the PACKAGES.TXT file, or an iterable of its lines.
             section: Repository section (e.g., "a", "ap", "d").
             
         Returns:
             Dictionary mapping package names to their metadata.
         """
         result = {}
-        current_package = None
-        current_data = {}
-        
-        # Split the file into package entries (separated by blank lines)
-        packages = packages_text.split("\n\n")
         
-        for package_text in packages:
-            if not package_text.strip():
-                continue
-            
-            # Parse package entry
-            lines = package_text.strip().split("\n")
+        # Package entries are separated by blank lines
+        for lines in iter_stanzas(as_lines(packages_text)):
+            lines = [line.strip() for line in lines]
             
-            # First line contains the package filename
-            if not lines:
-                continue
-                
-            # Extract package name, version, and architecture from filename
+            # First line contains the package filename; extract package
+            # name, version, and architecture from it
             filename_match = re.match(r'PACKAGE NAME:\s+(.+)\.t[gx]z$', lines[0])
             if not filename_match:
                 continue
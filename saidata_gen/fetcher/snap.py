@@ -269,28 +269,65 @@ class SnapFetcher(HttpRepositoryFetcher):
             # Fetch snap details
             response = self._fetch_json(f"snaps/details/{snap_name}")
             
-            if "package_name" in response:
-                return {
-                    "name": response.get("package_name"),
-                    "title": response.get("title"),
-                    "summary": response.get("summary"),
-                    "description": response.get("description"),
-                    "version": response.get("version"),
-                    "developer_name": response.get("developer_name"),
-                    "developer_id": response.get("developer_id"),
-                    "publisher": response.get("publisher"),
-                    "icon_url": response.get("icon_url"),
-                    "download_url": response.get("download_url"),
-                    "confinement": response.get("confinement"),
-                    "license": response.get("license"),
-                    "categories": response.get("categories", []),
-                    "store": store_name
-                }
+            return self._parse_snap_details(response, store_name)
         
         except Exception as e:
             logger.warning(f"Failed to fetch snap details for {snap_name} from {store_name}: {e}")
             return None
     
+    def _fetch_snap_details_batch(self, snap_names: List[str], store_name: str) -> Dict[str, Dict[str, any]]:
+        """
+        Fetch detailed information about many snaps concurrently.
+        
+        Args:
+            snap_names: Names of the snaps.
+            store_name: Name of the store.
+            
+        Returns:
+            Dictionary mapping the names of the snaps found to their metadata.
+        """
+        paths = {f"snaps/details/{name}": name for name in snap_names}
+        responses = self._fetch_json_many(list(paths))
+        
+        snaps = {}
+        for path, response in responses.items():
+            snap_data = self._parse_snap_details(response, store_name)
+            if snap_data:
+                snaps[paths[path]] = snap_data
+        
+        return snaps
+    
+    def _parse_snap_details(self, response: Dict[str, any], store_name: str) -> Optional[Dict[str, any]]:
+        """
+        Extract snap metadata from a snap details response.
+        
+        Args:
+            response: Response of the snap details endpoint.
+            store_name: Name of the store.
+            
+        Returns:
+            Snap metadata, or None if the response has no package name.
+        """
+        if "package_name" not in response:
+            return None
+        
+        return {
+            "name": response.get("package_name"),
+            "title": response.get("title"),
+            "summary": response.get("summary"),
+            "description": response.get("description"),
+            "version": response.get("version"),
+            "developer_name": response.get("developer_name"),
+            "developer_id": response.get("developer_id"),
+            "publisher": response.get("publisher"),
+            "icon_url": response.get("icon_url"),
+            "download_url": response.get("download_url"),
+            "confinement": response.get("confinement"),
+            "license": response.get("license"),
+            "categories": response.get("categories", []),
+            "store": store_name
+        }
+    
     def _search_snaps_in_store(self, query: str, store_name: str, max_results: int = 10) -> Dict[str, Dict[str, any]]:
         """
         Search for snaps in a store.
@@ -0,0 +1,294 @@
+"""
+Binary repository snapshots for saidata-gen fetchers.
+
+This module provides a compact on-disk format for repository package caches.
+A snapshot file contains a fixed-width record table, a sorted name index and
+a string table holding package names, searchable text and JSON-encoded
+package data. Snapshots are memory-mapped when loaded, and package data is
+only decoded for the packages that are actually accessed.
+
+File layout (all integers little-endian)::
+
+    header   magic, version, record count and section offsets
+    records  one fixed-width record per package, in original order
+    index    record ids sorted by UTF-8 encoded package name
+    meta     JSON metadata (indexed text fields and content digest)
+    strings  names, searchable text and package data
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import ItemsView, Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from saidata_gen.fetcher.index import package_texts
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"SAIDSNAP"
+SNAPSHOT_VERSION = 1
+
+# magic, version, record count, records offset, index offset, meta offset, meta length, strings offset
+_HEADER = struct.Struct("<8sIIQQQIQ")
+# name offset/length, data offset/length, text offset/length (offsets relative to the string table)
+_RECORD = struct.Struct("<QIQIQI")
+_INDEX_ENTRY = struct.Struct("<I")
+
+# Separator between the indexed text values of a package
+_TEXT_SEPARATOR = "\x00"
+
+# Size in bytes of the content digest stored in the metadata
+_DIGEST_SIZE = 16
+
+
+def _encode_meta(text_fields: Sequence[str], digest: str) -> bytes:
+    """Encode the metadata section of a snapshot."""
+    return json.dumps({"text_fields": list(text_fields), "digest": digest}).encode("utf-8")
+
+
+def write_snapshot(
+    path: str,
+    packages: Mapping[str, Any],
+    text_fields: Sequence[str] = ()
+) -> None:
+    """
+    Write a package mapping to a snapshot file.
+    
+    The file is written to a temporary file first and then moved into place,
+    so readers never see a partially written snapshot.
+    
+    Args:
+        path: Path of the snapshot file.
+        packages: Mapping of package names to JSON-serializable package data.
+        text_fields: Package data fields stored as searchable text.
+    """
+    # The digest is only known once the strings are written; the placeholder
+    # has the same length, so the section offsets do not change
+    meta = _encode_meta(text_fields, "0" * (2 * _DIGEST_SIZE))
+    content_digest = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    count = len(packages)
+    records_offset = _HEADER.size
+    index_offset = records_offset + count * _RECORD.size
+    meta_offset = index_offset + count * _INDEX_ENTRY.size
+    strings_offset = meta_offset + len(meta)
+    
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # The string table is written first, streaming one package at a time
+            f.seek(strings_offset)
+            position = 0
+            records = []
+            names = []
+            for name, pkg_data in packages.items():
+                name_bytes = name.encode("utf-8")
+                data_bytes = json.dumps(pkg_data, separators=(",", ":")).encode("utf-8")
+                texts = [text.replace(_TEXT_SEPARATOR, " ") for text in package_texts(pkg_data, text_fields)]
+                text_bytes = _TEXT_SEPARATOR.join(texts).encode("utf-8")
+                
+                record = []
+                for chunk in (name_bytes, data_bytes, text_bytes):
+                    f.write(chunk)
+                    record.extend((position, len(chunk)))
+                    position += len(chunk)
+                records.append(record)
+                names.append(name_bytes)
+                content_digest.update(name_bytes + b"\x00" + data_bytes + b"\x00")
+            
+            meta = _encode_meta(text_fields, content_digest.hexdigest())
+            
+            f.seek(0)
+            f.write(_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, count,
+                records_offset, index_offset, meta_offset, len(meta), strings_offset
+            ))
+            for record in records:
+                f.write(_RECORD.pack(*record))
+            for record_id in sorted(range(count), key=names.__getitem__):
+                f.write(_INDEX_ENTRY.pack(record_id))
+            f.write(meta)
+        
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class PackageSnapshot(Mapping):
+    """
+    Read-only, memory-mapped view of a snapshot file.
+    
+    The snapshot behaves like the dictionary it was written from: iteration
+    follows the original package order, lookups use the sorted name index,
+    and package data is decoded on first access.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open a snapshot file.
+        
+        Args:
+            path: Path of the snapshot file.
+        
+        Raises:
+            ValueError: If the file is not a valid snapshot.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        # Identifies the file contents: snapshots are replaced, never written in place
+        self.file_version: Tuple[int, int, int] = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        
+        try:
+            if len(self._mmap) < _HEADER.size:
+                raise ValueError("file is too small")
+            
+            (magic, version, self._count, self._records_offset, self._index_offset,
+             meta_offset, meta_length, self._strings_offset) = _HEADER.unpack_from(self._mmap, 0)
+            
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError("bad magic")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported version {version}")
+            
+            meta = json.loads(self._mmap[meta_offset:meta_offset + meta_length].decode("utf-8"))
+            self.text_fields: Tuple[str, ...] = tuple(meta.get("text_fields", ()))
+            # Digest of the package names and data; None for files written before it was stored
+            self.digest: Optional[str] = meta.get("digest")
+        except Exception as e:
+            self._mmap.close()
+            raise ValueError(f"Invalid snapshot {path}: {e}")
+        
+        self._materialized: Dict[int, Any] = {}
+    
+    def close(self) -> None:
+        """Release the memory map and its file handle. Closing twice is harmless."""
+        self._mmap.close()
+    
+    @property
+    def closed(self) -> bool:
+        """Whether the snapshot has been closed."""
+        return self._mmap.closed
+    
+    def __enter__(self) -> "PackageSnapshot":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self) -> Iterator[str]:
+        for record_id in range(self._count):
+            yield self._read_name(record_id).decode("utf-8")
+    
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._find(name) is not None
+    
+    def __getitem__(self, name: str) -> Any:
+        record_id = self._find(name) if isinstance(name, str) else None
+        if record_id is None:
+            raise KeyError(name)
+        return self._read_data(record_id)
+    
+    def items(self) -> ItemsView:
+        return _SnapshotItemsView(self)
+    
+    def iter_sorted_names(self) -> Iterator[str]:
+        """
+        Iterate over package names in sorted order using the name index.
+        
+        Yields:
+            Package names sorted by their UTF-8 encoding.
+        """
+        for position in range(self._count):
+            yield self._read_name(self._index_entry(position)).decode("utf-8")
+    
+    def index_texts(self, text_fields: Sequence[str]) -> Optional[Iterator[Tuple[str, List[str]]]]:
+        """
+        Iterate over package names and searchable text without decoding package data.
+        
+        Args:
+            text_fields: Text fields the caller wants to index.
+        
+        Returns:
+            Iterator of (name, text values) in original order, or None if the
+            snapshot was written with different text fields.
+        """
+        if tuple(text_fields) != self.text_fields:
+            return None
+        return self._iter_index_texts()
+    
+    def _iter_index_texts(self) -> Iterator[Tuple[str, List[str]]]:
+        for record_id in range(self._count):
+            name_off, name_len, _, _, text_off, text_len = self._record(record_id)
+            name = self._read_string(name_off, name_len).decode("utf-8")
+            text = self._read_string(text_off, text_len).decode("utf-8")
+            yield name, text.split(_TEXT_SEPARATOR) if text else []
+    
+    def _iter_items(self) -> Iterator[Tuple[str, Any]]:
+        for record_id in range(self._count):
+            yield self._read_name(record_id).decode("utf-8"), self._read_data(record_id)
+    
+    def _record(self, record_id: int) -> Tuple[int, int, int, int, int, int]:
+        return _RECORD.unpack_from(self._mmap, self._records_offset + record_id * _RECORD.size)
+    
+    def _index_entry(self, position: int) -> int:
+        return _INDEX_ENTRY.unpack_from(self._mmap, self._index_offset + position * _INDEX_ENTRY.size)[0]
+    
+    def _read_string(self, offset: int, length: int) -> bytes:
+        start = self._strings_offset + offset
+        return self._mmap[start:start + length]
+    
+    def _read_name(self, record_id: int) -> bytes:
+        name_off, name_len = self._record(record_id)[:2]
+        return self._read_string(name_off, name_len)
+    
+    def _read_data(self, record_id: int) -> Any:
+        data = self._materialized.get(record_id)
+        if data is None:
+            data_off, data_len = self._record(record_id)[2:4]
+            data = json.loads(self._read_string(data_off, data_len).decode("utf-8"))
+            self._materialized[record_id] = data
+        return data
+    
+    def _find(self, name: str) -> Optional[int]:
+        """
+        Binary search the name index.
+        
+        Args:
+            name: Package name.
+        
+        Returns:
+            Record id of the package, or None if it is not in the snapshot.
+        """
+        target = name.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            record_id = self._index_entry(middle)
+            candidate = self._read_name(record_id)
+            if candidate < target:
+                low = middle + 1
+            elif candidate > target:
+                high = middle
+            else:
+                return record_id
+        return None
+
+
+class _SnapshotItemsView(ItemsView):
+    """Items view that reads records sequentially instead of looking up each name."""
+    
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return self._mapping._iter_items()
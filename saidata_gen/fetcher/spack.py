@@ -12,16 +12,50 @@ import re
 import subprocess
 import tempfile
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
 )
 from saidata_gen.fetcher.base import GitRepositoryFetcher
+from saidata_gen.fetcher.command_batch import CommandBatcher
 
 
 logger = logging.getLogger(__name__)
 
+# Script run by "spack python" to print the details of several packages as JSON
+SPACK_INFO_SCRIPT = """
+import json
+import spack.repo
+
+
+def names_of(entries):
+    # {name: ...} in older Spack versions, {when_spec: {name: ...}} in newer ones
+    names = set()
+    for key, value in entries.items():
+        if isinstance(key, str):
+            names.add(key)
+        else:
+            names.update(value)
+    return sorted(names)
+
+
+result = {}
+for name in json.loads(%r):
+    try:
+        pkg_class = spack.repo.PATH.get_pkg_class(name)
+    except Exception:
+        continue
+    result[name] = {
+        "description": " ".join((pkg_class.__doc__ or "").split()) or None,
+        "homepage": getattr(pkg_class, "homepage", None),
+        "versions": [str(v) for v in sorted(getattr(pkg_class, "versions", {}), reverse=True)],
+        "variants": names_of(getattr(pkg_class, "variants", {})),
+        "dependencies": names_of(getattr(pkg_class, "dependencies", {})),
+    }
+print(json.dumps(result))
+"""
+
 
 @dataclass
 class SpackRepository:
@@ -41,6 +75,12 @@ class SpackFetcher(GitRepositoryFetcher):
     the repository and parsing package definitions.
     """
     
+    # Directory of the builtin package repository, relative to the Spack checkout
+    PACKAGES_DIR = "var/spack/repos/builtin/packages"
+    
+    # The packages plus what the spack command of the checkout needs to run
+    SPARSE_PATHS = (PACKAGES_DIR, "bin", "lib/spack", "etc/spack")
+    
     def __init__(
         self,
         repositories: Optional[List[SpackRepository]] = None,
@@ -69,7 +109,7 @@ class SpackFetcher(GitRepositoryFetcher):
         )
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -190,7 +230,7 @@ class SpackFetcher(GitRepositoryFetcher):
         
         return results
     
-    def _create_package_info(self, package_name: str, package_data: Dict[str, any]) -> PackageInfo:
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
         """
         Create a PackageInfo object from package data.
         
@@ -209,161 +249,184 @@ class SpackFetcher(GitRepositoryFetcher):
             details=package_data
         )
     
-    def _parse_spack_repository(self) -> Dict[str, Dict[str, any]]:
+    def _parse_spack_repository(self) -> Dict[str, Dict[str, Any]]:
         """
         Parse a Spack repository.
         
+        Package details come from the spack command when it is available, and
+        from the package.py files otherwise. Only the packages changed since the
+        last processed commit are parsed again (see
+        ``_process_repository_incrementally``).
+        
         Returns:
             Dictionary mapping package names to their metadata.
         """
-        packages = {}
-        
         try:
-            # Check if spack is available
-            if self._is_spack_available():
-                # Try to use spack command to list packages
-                return self._parse_spack_repository_with_command()
+            batcher = None
+            if self._uses_object_database():
+                # The spack command of the checkout needs a working tree
+                pass
+            elif self._is_spack_available():
+                # Results depend on the checked out commit, so they are not persisted
+                batcher = self._create_command_batcher(
+                    "package_info", self._get_spack_packages_info, persist=False
+                )
             else:
                 logger.warning("spack command not available, using fallback parsing method")
-                return self._parse_spack_repository_fallback()
+            
+            return self._process_repository_incrementally(
+                self._list_spack_packages,
+                self._spack_package_for_path,
+                lambda pkg_name: self._parse_spack_package(pkg_name, batcher),
+                prefetch_units=batcher.prefetch if batcher else None
+            )
         
         except Exception as e:
             logger.warning(f"Failed to parse Spack repository: {e}")
-            # Fallback to parsing the repository manually
-            return self._parse_spack_repository_fallback()
+            return {}
     
-    def _parse_spack_repository_with_command(self) -> Dict[str, Dict[str, any]]:
+    def _list_spack_packages(self) -> List[str]:
         """
-        Parse a Spack repository using the spack command.
+        List the packages of the builtin repository.
         
         Returns:
-            Dictionary mapping package names to their metadata.
+            Package names.
         """
-        packages = {}
+        if not self._is_directory(self.PACKAGES_DIR):
+            logger.warning(f"packages directory not found in {self.repo_dir}")
+            return []
         
-        try:
-            # Set up environment to use the cloned spack repository
-            env = os.environ.copy()
-            env["PATH"] = f"{os.path.join(self.repo_dir, 'bin')}:{env['PATH']}"
+        return sorted(
+            os.path.basename(pkg_dir) for pkg_dir in self._list_files(self.PACKAGES_DIR, "*")
+            if self._is_directory(pkg_dir)
+        )
+    
+    def _spack_package_for_path(self, path: str) -> Optional[str]:
+        """
+        Get the package of a changed file.
+        
+        Args:
+            path: File path relative to the repository root.
             
-            # Run spack list --format=json to get all packages
-            cmd_result = subprocess.run(
-                ["spack", "list", "--format=json"],
-                check=True,
-                capture_output=True,
-                text=True,
-                env=env
-            )
+        Returns:
+            Package name, or None if the file is not inside a package directory.
+        """
+        prefix = f"{self.PACKAGES_DIR}/"
+        if not path.startswith(prefix):
+            return None
+        
+        parts = path[len(prefix):].split("/")
+        return parts[0] if len(parts) >= 2 else None
+    
+    def _parse_spack_package(
+        self,
+        pkg_name: str,
+        batcher: Optional[CommandBatcher] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse the details of a package.
+        
+        Args:
+            pkg_name: Package name.
+            batcher: Batcher getting the details from the spack command. If None,
+                or the command does not know the package, the package.py file is
+                parsed instead.
             
-            # Parse the JSON output
-            pkg_list = json.loads(cmd_result.stdout)
+        Returns:
+            Dictionary mapping the package name to its metadata, or an empty
+            dictionary if the package does not exist.
+        """
+        if batcher is not None:
+            pkg_data = batcher.get(pkg_name)
+            if pkg_data:
+                return {pkg_name: pkg_data}
+        
+        return self._parse_spack_package_file(pkg_name)
+    
+    def _get_spack_packages_info(self, pkg_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the details of several packages with one run of the spack command.
+        
+        Args:
+            pkg_names: Package names.
             
-            # Get details for each package
-            for pkg_name in pkg_list:
-                try:
-                    # Run spack info --json to get package details
-                    info_result = subprocess.run(
-                        ["spack", "info", "--json", pkg_name],
-                        check=True,
-                        capture_output=True,
-                        text=True,
-                        env=env
-                    )
-                    
-                    # Parse the JSON output
-                    pkg_info = json.loads(info_result.stdout)
-                    
-                    if pkg_name in pkg_info:
-                        pkg_data = pkg_info[pkg_name]
-                        
-                        # Extract versions
-                        versions = pkg_data.get("versions", [])
-                        latest_version = versions[0] if versions else None
-                        
-                        packages[pkg_name] = {
-                            "description": pkg_data.get("description"),
-                            "homepage": pkg_data.get("homepage"),
-                            "versions": versions,
-                            "latest_version": latest_version,
-                            "variants": pkg_data.get("variants", {}),
-                            "dependencies": pkg_data.get("dependencies", [])
-                        }
-                except Exception as e:
-                    logger.warning(f"Failed to get info for package {pkg_name}: {e}")
+        Returns:
+            Dictionary mapping the names of the packages found to their metadata.
+        """
+        # Set up environment to use the cloned spack repository
+        env = os.environ.copy()
+        env["PATH"] = f"{os.path.join(self.repo_dir, 'bin')}:{env['PATH']}"
         
-        except Exception as e:
-            logger.warning(f"Failed to parse Spack repository using spack command: {e}")
-            # Fallback to parsing the repository manually
-            return self._parse_spack_repository_fallback()
+        # Load all packages in one Spack process instead of running spack info per package
+        info_result = subprocess.run(
+            ["spack", "python", "-c", SPACK_INFO_SCRIPT % json.dumps(pkg_names)],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env
+        )
+        
+        # Parse the JSON output, printed on the last line
+        lines = info_result.stdout.strip().splitlines()
+        pkg_info = json.loads(lines[-1]) if lines else {}
         
-        return packages
+        result = {}
+        for pkg_name, pkg_data in pkg_info.items():
+            # Extract versions
+            versions = pkg_data.get("versions", [])
+            latest_version = versions[0] if versions else None
+            
+            result[pkg_name] = {
+                "description": pkg_data.get("description"),
+                "homepage": pkg_data.get("homepage"),
+                "versions": versions,
+                "latest_version": latest_version,
+                "variants": pkg_data.get("variants", []),
+                "dependencies": pkg_data.get("dependencies", [])
+            }
+        
+        return result
     
-    def _parse_spack_repository_fallback(self) -> Dict[str, Dict[str, any]]:
+    def _parse_spack_package_file(self, pkg_name: str) -> Dict[str, Dict[str, Any]]:
         """
-        Parse a Spack repository using a fallback method.
-        
-        This method parses the repository by scanning for package.py files
-        and extracting basic metadata from them.
+        Extract basic metadata from the package.py file of a package.
         
+        Args:
+            pkg_name: Package name.
+            
         Returns:
-            Dictionary mapping package names to their metadata.
+            Dictionary mapping the package name to its metadata, or an empty
+            dictionary if the package has no package.py file.
         """
-        packages = {}
+        # Read the package.py file
+        content = self._get_file_content(f"{self.PACKAGES_DIR}/{pkg_name}/package.py")
+        if content is None:
+            return {}
         
-        try:
-            # Find all package.py files in the var/spack/repos/builtin/packages directory
-            packages_dir = os.path.join(self.repo_dir, "var", "spack", "repos", "builtin", "packages")
-            if not os.path.exists(packages_dir):
-                logger.warning(f"packages directory not found in {self.repo_dir}")
-                return packages
-            
-            # Walk through the packages directory
-            for pkg_dir in os.listdir(packages_dir):
-                pkg_path = os.path.join(packages_dir, pkg_dir)
-                
-                # Skip non-directories
-                if not os.path.isdir(pkg_path):
-                    continue
-                
-                # Check for package.py file
-                package_py_path = os.path.join(pkg_path, "package.py")
-                if not os.path.exists(package_py_path):
-                    continue
-                
-                # Read the package.py file
-                with open(package_py_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Extract basic metadata
-                pkg_data = {
-                    "name": pkg_dir
-                }
-                
-                # Extract description
-                desc_match = re.search(r'description\s*=\s*[\'"]([^\'"]*)[\'"]', content)
-                if desc_match:
-                    pkg_data["description"] = desc_match.group(1)
-                
-                # Extract homepage
-                homepage_match = re.search(r'homepage\s*=\s*[\'"]([^\'"]*)[\'"]', content)
-                if homepage_match:
-                    pkg_data["homepage"] = homepage_match.group(1)
-                
-                # Extract versions
-                versions = []
-                for version_match in re.finditer(r'version\([\'"]([^\'"]*)[\'"]', content):
-                    versions.append(version_match.group(1))
-                
-                pkg_data["versions"] = versions
-                pkg_data["latest_version"] = versions[0] if versions else None
-                
-                # Add package to result
-                packages[pkg_dir] = pkg_data
+        # Extract basic metadata
+        pkg_data = {
+            "name": pkg_name
+        }
         
-        except Exception as e:
-            logger.warning(f"Failed to parse Spack repository using fallback method: {e}")
+        # Extract description
+        desc_match = re.search(r'description\s*=\s*[\'"]([^\'"]*)[\'"]', content)
+        if desc_match:
+            pkg_data["description"] = desc_match.group(1)
+        
+        # Extract homepage
+        homepage_match = re.search(r'homepage\s*=\s*[\'"]([^\'"]*)[\'"]', content)
+        if homepage_match:
+            pkg_data["homepage"] = homepage_match.group(1)
+        
+        # Extract versions
+        versions = []
+        for version_match in re.finditer(r'version\([\'"]([^\'"]*)[\'"]', content):
+            versions.append(version_match.group(1))
+        
+        pkg_data["versions"] = versions
+        pkg_data["latest_version"] = versions[0] if versions else None
         
-        return packages
+        return {pkg_name: pkg_data}
     
     def _is_spack_available(self) -> bool:
         """
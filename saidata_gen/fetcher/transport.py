@@ -0,0 +1,292 @@
+"""
+Shared HTTP transport for saidata-gen fetchers.
+
+All fetchers send their requests through one process-wide transport built on
+the components in ``saidata_gen.core.performance``: every host gets its own
+pooled keep-alive session (``ConnectionPool``), a bound on concurrent
+requests (``ConcurrencyController``) and, when configured in
+``repository_urls.yaml``, a token-bucket ``RateLimiter``. Request timings and
+status codes are recorded in a shared ``PerformanceMonitor``.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from saidata_gen.core.performance import (
+    ConcurrencyController, ConnectionPool, PerformanceConfig, PerformanceMonitor, RateLimiter
+)
+from saidata_gen.core.repository_url_manager import get_repository_url_manager
+
+# Try to import requests, but don't fail if it's not available
+try:
+    import requests
+    from requests.sessions import merge_setting
+    from requests.structures import CaseInsensitiveDict
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HostTransport:
+    """
+    Transport components used for requests to a single host.
+    
+    ``retry_pools`` holds the pools of callers that need a retry count other
+    than the one of ``pool``; all pools share the concurrency bound and rate
+    limiter of the host.
+    """
+    pool: ConnectionPool
+    concurrency: ConcurrencyController
+    rate_limiter: Optional[RateLimiter] = None
+    retry_pools: Dict[int, ConnectionPool] = field(default_factory=dict)
+
+
+class FetcherTransport:
+    """
+    Process-wide HTTP transport with per-host pooling and rate limits.
+    """
+    
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, Dict[str, Any]]] = None,
+        config: Optional[PerformanceConfig] = None,
+        monitor: Optional[PerformanceMonitor] = None
+    ):
+        """
+        Initialize the transport.
+        
+        Args:
+            rate_limits: Mapping of host to rate limit settings (``requests_per_second``,
+                ``burst_size`` and optionally ``max_connections``). Hosts without an
+                entry are not rate limited.
+            config: Performance configuration for the per-host connection pools.
+            monitor: Performance monitor receiving request metrics. If None, a new
+                monitor is created.
+        """
+        self.config = config or PerformanceConfig()
+        self.monitor = monitor or PerformanceMonitor(self.config)
+        self.rate_limits = rate_limits or {}
+        self._hosts: Dict[str, HostTransport] = {}
+        self._lock = threading.Lock()
+    
+    def _get_host(self, host: str) -> HostTransport:
+        """
+        Get the transport components for a host, creating them on first use.
+        
+        Args:
+            host: Host (network location) of the request URL.
+        
+        Returns:
+            HostTransport for the host.
+        """
+        with self._lock:
+            host_transport = self._hosts.get(host)
+            if host_transport is not None:
+                return host_transport
+            
+            rate_limit = self.rate_limits.get(host, {})
+            max_connections = int(rate_limit.get("max_connections", self.config.max_connections_per_host))
+            
+            rate_limiter = None
+            if self.config.enable_rate_limiting and "requests_per_second" in rate_limit:
+                rate_limiter = RateLimiter(
+                    float(rate_limit["requests_per_second"]),
+                    int(rate_limit.get("burst_size", 1))
+                )
+            
+            pool_config = replace(self.config, max_connections_per_host=max_connections)
+            host_transport = HostTransport(
+                pool=ConnectionPool(pool_config, self.monitor),
+                concurrency=ConcurrencyController(max_connections),
+                rate_limiter=rate_limiter
+            )
+            self._hosts[host] = host_transport
+            return host_transport
+    
+    def get_rate_limiter(self, url: str) -> Optional[RateLimiter]:
+        """
+        Get the rate limiter for the host of a URL.
+        
+        Args:
+            url: Request URL.
+        
+        Returns:
+            RateLimiter, or None if the host is not rate limited.
+        """
+        return self._get_host(urlsplit(url).netloc).rate_limiter
+    
+    def _get_pool(self, host_transport: HostTransport, max_retries: Optional[int]) -> ConnectionPool:
+        """
+        Get the pool of a host that retries requests the given number of times.
+        
+        Args:
+            host_transport: Transport components of the host.
+            max_retries: Retry count, or None for the configured default.
+        
+        Returns:
+            ConnectionPool for the retry count.
+        """
+        if max_retries is None or max_retries == host_transport.pool.config.max_retries:
+            return host_transport.pool
+        
+        with self._lock:
+            pool = host_transport.retry_pools.get(max_retries)
+            if pool is None:
+                pool_config = replace(host_transport.pool.config, max_retries=max_retries)
+                pool = ConnectionPool(pool_config, self.monitor)
+                host_transport.retry_pools[max_retries] = pool
+            return pool
+    
+    def request(
+        self,
+        method: str,
+        url: str,
+        rate_limit: bool = True,
+        max_retries: Optional[int] = None,
+        **kwargs
+    ) -> "requests.Response":
+        """
+        Send a request through the host's pool.
+        
+        Waits for a rate limit token and a free connection slot of the host first.
+        
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            rate_limit: Whether to acquire a rate limit token. Callers that have
+                already acquired one pass False.
+            max_retries: Number of retries for failed requests, or None for the
+                transport's configured default.
+            **kwargs: Additional request arguments.
+        
+        Returns:
+            Response object.
+        """
+        host = urlsplit(url).netloc
+        host_transport = self._get_host(host)
+        pool = self._get_pool(host_transport, max_retries)
+        
+        if rate_limit and host_transport.rate_limiter is not None:
+            start_time = time.time()
+            host_transport.rate_limiter.acquire()
+            self.monitor.record_histogram("http_rate_limit_wait", time.time() - start_time, {"host": host})
+        
+        with host_transport.concurrency.acquire():
+            return pool.request(method, url, **kwargs)
+    
+    def get(self, url: str, **kwargs) -> "requests.Response":
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get request metrics and the state of the per-host transports.
+        
+        Returns:
+            Dictionary with metrics and per-host concurrency and rate limit state.
+        """
+        with self._lock:
+            hosts = dict(self._hosts)
+        
+        return {
+            "metrics": self.monitor.get_summary(),
+            "hosts": {
+                host: {
+                    "active_requests": host_transport.concurrency.get_active_count(),
+                    "max_connections": host_transport.concurrency.max_concurrent,
+                    "requests_per_second": (
+                        host_transport.rate_limiter.requests_per_second
+                        if host_transport.rate_limiter else None
+                    ),
+                }
+                for host, host_transport in hosts.items()
+            }
+        }
+    
+    def close(self) -> None:
+        """Close the connection pools of all hosts."""
+        with self._lock:
+            hosts = list(self._hosts.values())
+            self._hosts.clear()
+        
+        for host_transport in hosts:
+            host_transport.pool.close()
+            for pool in host_transport.retry_pools.values():
+                pool.close()
+
+
+class TransportSession(requests.Session if REQUESTS_AVAILABLE else object):
+    """
+    Requests session that sends its requests through a FetcherTransport.
+    
+    Fetchers keep one of these as ``self.session``. Settings made on the
+    session (headers, params, proxies, auth, SSL verification and client
+    certificate) are applied to every request like on a regular session.
+    Closing it does not close the shared per-host pools.
+    """
+    
+    def __init__(self, transport: FetcherTransport, max_retries: Optional[int] = None):
+        """
+        Initialize the session.
+        
+        Args:
+            transport: Transport to send requests through.
+            max_retries: Number of retries for failed requests, or None for the
+                transport's configured default.
+        """
+        super().__init__()
+        self.transport = transport
+        self.max_retries = max_retries
+    
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """Send a request through the transport."""
+        kwargs["headers"] = merge_setting(
+            kwargs.get("headers"), self.headers, dict_class=CaseInsensitiveDict
+        )
+        for name in ("params", "proxies"):
+            kwargs[name] = merge_setting(kwargs.get(name), getattr(self, name))
+        for name in ("auth", "verify", "cert"):
+            if kwargs.get(name) is None:
+                kwargs[name] = getattr(self, name)
+        
+        kwargs.setdefault("max_retries", self.max_retries)
+        return self.transport.request(method, url, **kwargs)
+
+
+# Global instance for easy access
+_transport_instance: Optional[FetcherTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_fetcher_transport() -> FetcherTransport:
+    """
+    Get the global fetcher transport.
+    
+    Rate limits are read from the repository URL configuration on first use.
+    
+    Returns:
+        FetcherTransport instance.
+    """
+    global _transport_instance
+    
+    with _transport_lock:
+        if _transport_instance is None:
+            _transport_instance = FetcherTransport(get_repository_url_manager().get_rate_limits())
+        return _transport_instance
+
+
+def reset_fetcher_transport() -> None:
+    """Close and reset the global fetcher transport."""
+    global _transport_instance
+    
+    with _transport_lock:
+        if _transport_instance is not None:
+            _transport_instance.close()
+        _transport_instance = None
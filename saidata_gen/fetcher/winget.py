@@ -11,7 +11,7 @@ import yaml
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
@@ -40,6 +40,9 @@ class WingetFetcher(GitRepositoryFetcher):
     and processing the YAML manifests.
     """
     
+    # Only the manifests are checked out in sparse clones
+    SPARSE_PATHS = ("manifests",)
+    
     def __init__(
         self,
         repositories: Optional[List[WingetRepository]] = None,
@@ -69,7 +72,7 @@ class WingetFetcher(GitRepositoryFetcher):
         )
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -187,7 +190,7 @@ class WingetFetcher(GitRepositoryFetcher):
         
         return results
     
-    def _create_package_info(self, package_name: str, package_data: Dict[str, any]) -> PackageInfo:
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
         """
         Create a PackageInfo object from package data.
         
@@ -206,50 +209,92 @@ class WingetFetcher(GitRepositoryFetcher):
             details=package_data
         )
     
-    def _process_manifests(self) -> Dict[str, Dict[str, any]]:
+    def _process_manifests(self) -> Dict[str, Dict[str, Any]]:
         """
         Process Winget manifests from the repository.
         
+        Only the manifest directories changed since the last processed commit
+        are parsed again (see ``_process_repository_incrementally``).
+        
         Returns:
             Dictionary mapping package IDs to their metadata.
         """
-        manifests_dir = os.path.join(self.repo_dir, "manifests")
-        if not os.path.exists(manifests_dir):
-            logger.warning(f"Manifests directory not found: {manifests_dir}")
+        if not self._is_directory("manifests"):
+            logger.warning(f"Manifests directory not found: {os.path.join(self.repo_dir, 'manifests')}")
             return {}
         
-        result = {}
+        return self._process_repository_incrementally(
+            self._list_manifest_dirs, self._manifest_dir_for_path, self._process_manifest_dir
+        )
+    
+    def _list_manifest_dirs(self) -> List[str]:
+        """
+        List the directories holding manifest files.
+        
+        Returns:
+            Directory paths relative to the repository root.
+        """
+        dirs = set()
+        for pattern in ("**/*.yaml", "**/*.yml"):
+            for file_path in self._list_files("manifests", pattern):
+                dirs.add(Path(file_path).parent.as_posix())
+        
+        return sorted(dirs)
+    
+    def _manifest_dir_for_path(self, path: str) -> Optional[str]:
+        """
+        Get the manifest directory of a changed file.
+        
+        Args:
+            path: File path relative to the repository root.
+            
+        Returns:
+            Manifest directory, or None if the file is not a manifest.
+        """
+        if path.startswith("manifests/") and path.endswith((".yaml", ".yml")):
+            return path.rsplit("/", 1)[0]
+        return None
+    
+    def _process_manifest_dir(self, manifest_dir: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Process the manifest files of a package version directory.
         
-        # Walk through the manifests directory
-        for root, dirs, files in os.walk(manifests_dir):
-            for file in files:
-                if file.endswith(".yaml") or file.endswith(".yml"):
-                    try:
-                        file_path = os.path.join(root, file)
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            manifest = yaml.safe_load(f)
-                        
-                        # Extract package ID and metadata
-                        if manifest and isinstance(manifest, dict):
-                            # Winget manifests typically have PackageIdentifier
-                            package_id = manifest.get("PackageIdentifier")
-                            if not package_id:
-                                # Try to extract from path
-                                path_parts = os.path.relpath(file_path, manifests_dir).split(os.path.sep)
-                                if len(path_parts) >= 3:
-                                    # Format is typically manifests/p/Publisher/PackageName/Version/...
-                                    publisher = path_parts[1]
-                                    package_name = path_parts[2]
-                                    package_id = f"{publisher}.{package_name}"
-                            
-                            if package_id:
-                                # Merge with existing data if present
-                                if package_id in result:
-                                    result[package_id].update(manifest)
-                                else:
-                                    result[package_id] = manifest
+        Args:
+            manifest_dir: Directory path relative to the repository root.
+            
+        Returns:
+            Dictionary mapping package IDs to their merged manifests.
+        """
+        result = {}
+        for file_path in sorted(self._list_files(manifest_dir, "*")):
+            file = Path(file_path).name
+            if not (file.endswith(".yaml") or file.endswith(".yml")):
+                continue
+            
+            try:
+                content = self._get_file_content(file_path)
+                if content is None:
+                    continue
+                manifest = yaml.safe_load(content)
+                
+                # Extract package ID and metadata
+                if manifest and isinstance(manifest, dict):
+                    # Winget manifests typically have PackageIdentifier
+                    package_id = manifest.get("PackageIdentifier")
+                    if not package_id:
+                        # Try to extract from path
+                        path_parts = Path(file_path).parts[1:]
+                        if len(path_parts) >= 3:
+                            # Format is typically manifests/p/Publisher/PackageName/Version/...
+                            publisher = path_parts[1]
+                            package_name = path_parts[2]
+                            package_id = f"{publisher}.{package_name}"
                     
-                    except Exception as e:
-                        logger.warning(f"Failed to process manifest {file}: {e}")
+                    if package_id:
+                        # Merge with existing data if present
+                        result.setdefault(package_id, {}).update(manifest)
+            
+            except Exception as e:
+                logger.warning(f"Failed to process manifest {file}: {e}")
         
-        return result
\ No newline at end of file
+        return result
@@ -12,7 +12,7 @@ import logging
 import os
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
@@ -41,6 +41,8 @@ class XbpsFetcher(HttpRepositoryFetcher):
     by downloading and parsing repository index files.
     """
     
+    index_text_fields = ("short_desc",)
+    
     def __init__(
         self,
         repositories: Optional[List[XbpsRepository]] = None,
@@ -69,7 +71,7 @@ class XbpsFetcher(HttpRepositoryFetcher):
         ]
         
         # Initialize package cache
-        self._package_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._package_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
     def get_repository_name(self) -> str:
         """
@@ -95,15 +97,15 @@ class XbpsFetcher(HttpRepositoryFetcher):
                 # Check if we have a valid cache
                 cached_data = self._get_from_cache(repo_key)
                 if cached_data:
-                    self._package_cache[repo_key] = cached_data
+                    self._set_package_cache_entry(repo_key, cached_data)
                     result.cache_hits[repo_key] = True
                     continue
                 
                 # Fetch and parse repository index
                 packages_data = self._fetch_repository_index(repo)
                 if packages_data:
-                    self._package_cache[repo_key] = packages_data
-                    self._save_to_cache(repo_key, packages_data)
+                    self._set_package_cache_entry(repo_key, packages_data)
+                    self._save_to_cache(repo_key, packages_data, snapshot=True)
                     result.providers[repo_key] = True
                 else:
                     result.success = False
@@ -116,6 +118,9 @@ class XbpsFetcher(HttpRepositoryFetcher):
                 result.providers[repo_key] = False
                 result.success = False
         
+        # Index the fetched packages for lookups and searches
+        self._build_package_index()
+        
         return result
     
     def get_package_info(self, package_name: str) -> Optional[PackageInfo]:
@@ -128,23 +133,7 @@ class XbpsFetcher(HttpRepositoryFetcher):
         Returns:
             PackageInfo if the package is found, None otherwise.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        # Look for the package in all repositories
-        for repo_key, packages in self._package_cache.items():
-            if package_name in packages:
-                pkg_data = packages[package_name]
-                return PackageInfo(
-                    name=package_name,
-                    provider=self.get_repository_name(),
-                    version=pkg_data.get("version"),
-                    description=pkg_data.get("short_desc"),
-                    details=pkg_data
-                )
-        
-        return None
+        return self._get_indexed_package_info(package_name)
     
     def search_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
         """
@@ -157,38 +146,26 @@ class XbpsFetcher(HttpRepositoryFetcher):
         Returns:
             List of PackageInfo objects matching the query.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Search in all repositories
-        for repo_key, packages in self._package_cache.items():
-            for pkg_name, pkg_data in packages.items():
-                # Check if the package name or description contains the query
-                if (query_lower in pkg_name.lower() or 
-                    (pkg_data.get("short_desc") and query_lower in pkg_data["short_desc"].lower())):
-                    
-                    # Create PackageInfo object
-                    pkg_info = PackageInfo(
-                        name=pkg_name,
-                        provider=self.get_repository_name(),
-                        version=pkg_data.get("version"),
-                        description=pkg_data.get("short_desc"),
-                        details=pkg_data
-                    )
-                    
-                    # Add to results if not already present
-                    if not any(r.name == pkg_name for r in results):
-                        results.append(pkg_info)
-                    
-                    # Stop if we have enough results
-                    if len(results) >= max_results:
-                        return results
+        return self._search_indexed_packages(query, max_results)
+    
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
+        """
+        Create a PackageInfo object from package data.
         
-        return results
+        Args:
+            package_name: Name of the package.
+            package_data: Package data.
+            
+        Returns:
+            PackageInfo object.
+        """
+        return PackageInfo(
+            name=package_name,
+            provider=self.get_repository_name(),
+            version=package_data.get("version"),
+            description=package_data.get("short_desc"),
+            details=package_data
+        )
     
     def get_package_details(self, package_name: str, repository: Optional[str] = None) -> Optional[PackageDetails]:
         """
@@ -239,7 +216,7 @@ class XbpsFetcher(HttpRepositoryFetcher):
         
         return None
     
-    def _fetch_repository_index(self, repo: XbpsRepository) -> Dict[str, Dict[str, any]]:
+    def _fetch_repository_index(self, repo: XbpsRepository) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse an XBPS repository index.
         
@@ -290,7 +267,7 @@ class XbpsFetcher(HttpRepositoryFetcher):
             # Restore the original base_url
             self.base_url = original_base_url
     
-    def _parse_xbps_index(self, index_data: Dict[str, any]) -> Dict[str, Dict[str, any]]:
+    def _parse_xbps_index(self, index_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
         Parse an XBPS repository index in plist format.
         
@@ -310,7 +287,7 @@ class XbpsFetcher(HttpRepositoryFetcher):
         
         return result
     
-    def _parse_xbps_meta_index(self, index_data: Dict[str, any]) -> Dict[str, Dict[str, any]]:
+    def _parse_xbps_meta_index(self, index_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
         Parse an XBPS repository index in JSON format.
         
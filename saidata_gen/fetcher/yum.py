@@ -8,14 +8,14 @@ repositories, including legacy CentOS and RHEL versions.
 import logging
 import os
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import (
     FetchResult, FetcherConfig, PackageDetails, PackageInfo, RepositoryData
 )
 from saidata_gen.fetcher.base import HttpRepositoryFetcher, REQUESTS_AVAILABLE
 from saidata_gen.fetcher.rpm_utils import (
-    fetch_primary_location, decompress_gzip_content, parse_primary_xml
+    fetch_primary_checksum, fetch_primary_location, open_decompressed_stream, parse_primary_xml
 )
 
 
@@ -41,6 +41,8 @@ class YumFetcher(HttpRepositoryFetcher):
     including legacy CentOS and RHEL versions.
     """
     
+    index_text_fields = ("summary", "description")
+    
     def __init__(
         self,
         distributions: Optional[List[YumDistribution]] = None,
@@ -95,6 +97,9 @@ class YumFetcher(HttpRepositoryFetcher):
         
         # Initialize package cache
         self._package_cache: Dict[str, Dict[str, PackageInfo]] = {}
+        
+        # Checksums of primary.xml listed in the last fetched repomd.xml, by repomd.xml URL
+        self._primary_checksums: Dict[str, Optional[str]] = {}
         self._mirror_urls: Dict[str, str] = {}
     
     def get_repository_name(self) -> str:
@@ -125,24 +130,25 @@ class YumFetcher(HttpRepositoryFetcher):
                     # Check if we have a valid cache
                     cached_data = self._get_from_cache(cache_key)
                     if cached_data:
-                        self._package_cache[cache_key] = cached_data
+                        self._set_package_cache_entry(cache_key, cached_data)
                         result.cache_hits[cache_key] = True
                         continue
                     
                     # Get the base URL for this distribution
                     base_url = dist.url
                     
-                    # Fetch and parse repodata/repomd.xml to get the primary.xml location
+                    # Fetch and parse repomd.xml and primary.xml, revalidating an expired cache entry
                     try:
-                        repomd_url = f"{base_url}/repodata/repomd.xml"
-                        primary_location = self._fetch_primary_location(repomd_url)
-                        
-                        # Fetch and parse primary.xml
-                        primary_url = f"{base_url}/{primary_location}"
-                        packages_data = self._fetch_primary_xml(primary_url)
+                        packages_data, cached_data = self._fetch_with_revalidation(
+                            cache_key, lambda: self._fetch_repodata(base_url, cache_key)
+                        )
+                        if cached_data is not None:
+                            self._set_package_cache_entry(cache_key, cached_data)
+                            result.cache_hits[cache_key] = True
+                            continue
                         
-                        self._package_cache[cache_key] = packages_data
-                        self._save_to_cache(cache_key, packages_data)
+                        self._set_package_cache_entry(cache_key, packages_data)
+                        self._save_to_cache(cache_key, packages_data, snapshot=True)
                         result.providers[cache_key] = True
                     except Exception as e:
                         logger.error(f"Failed to fetch repository data for {cache_key}: {e}")
@@ -156,6 +162,9 @@ class YumFetcher(HttpRepositoryFetcher):
                 result.providers[dist_key] = False
                 result.success = False
         
+        # Index the fetched packages for lookups and searches
+        self._build_package_index()
+        
         return result
     
     def get_package_info(self, package_name: str) -> Optional[PackageInfo]:
@@ -168,23 +177,7 @@ class YumFetcher(HttpRepositoryFetcher):
         Returns:
             PackageInfo if the package is found, None otherwise.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        # Look for the package in all distributions
-        for cache_key, packages in self._package_cache.items():
-            if package_name in packages:
-                pkg_data = packages[package_name]
-                return PackageInfo(
-                    name=package_name,
-                    provider=self.get_repository_name(),
-                    version=pkg_data.get("version"),
-                    description=pkg_data.get("summary"),
-                    details=pkg_data
-                )
-        
-        return None
+        return self._get_indexed_package_info(package_name)
     
     def search_packages(self, query: str, max_results: int = 10) -> List[PackageInfo]:
         """
@@ -197,39 +190,26 @@ class YumFetcher(HttpRepositoryFetcher):
         Returns:
             List of PackageInfo objects matching the query.
         """
-        # Ensure we have fetched repository data
-        if not self._package_cache:
-            self.fetch_repository_data()
-        
-        results = []
-        query_lower = query.lower()
-        
-        # Search in all distributions
-        for cache_key, packages in self._package_cache.items():
-            for pkg_name, pkg_data in packages.items():
-                # Check if the package name or description contains the query
-                if (query_lower in pkg_name.lower() or 
-                    (pkg_data.get("summary") and query_lower in pkg_data["summary"].lower()) or
-                    (pkg_data.get("description") and query_lower in pkg_data["description"].lower())):
-                    
-                    # Create PackageInfo object
-                    pkg_info = PackageInfo(
-                        name=pkg_name,
-                        provider=self.get_repository_name(),
-                        version=pkg_data.get("version"),
-                        description=pkg_data.get("summary"),
-                        details=pkg_data
-                    )
-                    
-                    # Add to results if not already present
-                    if not any(r.name == pkg_name for r in results):
-                        results.append(pkg_info)
-                    
-                    # Stop if we have enough results
-                    if len(results) >= max_results:
-                        return results
+        return self._search_indexed_packages(query, max_results)
+    
+    def _create_package_info(self, package_name: str, package_data: Dict[str, Any]) -> PackageInfo:
+        """
+        Create a PackageInfo object from package data.
         
-        return results
+        Args:
+            package_name: Name of the package.
+            package_data: Package data.
+            
+        Returns:
+            PackageInfo object.
+        """
+        return PackageInfo(
+            name=package_name,
+            provider=self.get_repository_name(),
+            version=package_data.get("version"),
+            description=package_data.get("summary"),
+            details=package_data
+        )
     
     def get_package_details(self, package_name: str, distribution: Optional[str] = None) -> Optional[PackageDetails]:
         """
@@ -274,6 +254,30 @@ class YumFetcher(HttpRepositoryFetcher):
         
         return None
     
+    def _fetch_repodata(self, base_url: str, cache_key: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch repomd.xml and the primary.xml file it points to.
+        
+        Args:
+            base_url: Base URL of the repository.
+            cache_key: Cache key of the repository data.
+            
+        Returns:
+            Dictionary mapping package names to package data.
+            
+        Raises:
+            NotModifiedError: If primary.xml has the same checksum as the cached data.
+        """
+        repomd_url = f"{base_url}/repodata/repomd.xml"
+        primary_location = self._fetch_primary_location(repomd_url)
+        
+        # Skip primary.xml if repomd.xml lists the checksum of the cached one
+        primary_url = f"{base_url}/{primary_location}"
+        self._revalidate_checksum(cache_key, primary_url, self._primary_checksums.get(repomd_url))
+        
+        # Fetch and parse primary.xml
+        return self._fetch_primary_xml(primary_url)
+    
     def _fetch_primary_location(self, repomd_url: str) -> str:
         """
         Fetch and parse the repomd.xml file to get the primary.xml location.
@@ -294,6 +298,7 @@ class YumFetcher(HttpRepositoryFetcher):
             # Fetch the repomd.xml file
             response = self._fetch_url(repomd_url)
             repomd_xml = response.text
+            self._primary_checksums[repomd_url] = fetch_primary_checksum(repomd_xml)
             
             # Use the common utility to parse the XML
             return fetch_primary_location(repomd_xml)
@@ -302,7 +307,7 @@ class YumFetcher(HttpRepositoryFetcher):
             # Restore the original base_url
             self.base_url = original_base_url
     
-    def _fetch_primary_xml(self, primary_url: str) -> Dict[str, Dict[str, any]]:
+    def _fetch_primary_xml(self, primary_url: str) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse the primary.xml file.
         
@@ -322,13 +327,8 @@ class YumFetcher(HttpRepositoryFetcher):
             # Fetch the primary.xml file
             response = self._fetch_url(primary_url)
             
-            # Check if the file is gzipped
-            content = response.content
-            if primary_url.endswith(".gz"):
-                content = decompress_gzip_content(content)
-            
-            # Parse the XML using the common utility
-            return parse_primary_xml(content.decode("utf-8"))
+            # Decompress and parse the XML incrementally using the common utility
+            return parse_primary_xml(open_decompressed_stream(response.content, primary_url))
             
         finally:
             # Restore the original base_url
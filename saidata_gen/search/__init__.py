@@ -8,14 +8,18 @@ including fuzzy matching, result ranking, and deduplication.
 from .engine import SoftwareSearchEngine
 from .ranking import SearchRanker
 from .fuzzy import FuzzyMatcher
+from .catalog import PackageCatalog
 from .comparison import PackageComparator, PackageComparison, PackageGroup, SelectionCriteria
+from .equivalence import EquivalenceMap
 
 __all__ = [
     'SoftwareSearchEngine',
     'SearchRanker', 
     'FuzzyMatcher',
+    'PackageCatalog',
     'PackageComparator',
     'PackageComparison',
     'PackageGroup',
-    'SelectionCriteria'
+    'SelectionCriteria',
+    'EquivalenceMap'
 ]
\ No newline at end of file
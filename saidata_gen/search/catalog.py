@@ -0,0 +1,159 @@
+"""
+Persistent package-name catalogs for software search.
+
+Fuzzy search and suggestions match queries against every package name of a
+provider. ``PackageCatalog`` keeps these names per provider: it gets them
+from the provider's fetcher once, stores them as a sorted, newline-separated
+UTF-8 file in the cache directory, and keeps the loaded names in memory, so
+later searches (and later processes) do not have to fetch the repository
+again.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PackageCatalog:
+    """
+    Sorted package names per provider, persisted in the cache directory.
+    """
+    
+    def __init__(self, cache_dir: str, ttl: int = 3600):
+        """
+        Initialize the catalog.
+        
+        Args:
+            cache_dir: Cache directory; catalogs are stored in its "catalog" subdirectory.
+            ttl: Seconds after which a catalog file is rebuilt from the fetcher.
+        """
+        self.catalog_dir = os.path.join(os.path.expanduser(cache_dir), "catalog")
+        self.ttl = ttl
+        
+        self._names: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+    
+    def get_names(self, provider: str, load_names: Callable[[], Iterable[str]]) -> List[str]:
+        """
+        Get the sorted package names of a provider.
+        
+        Names are served from memory, then from a fresh catalog file, and
+        otherwise loaded with ``load_names`` and saved. A stale catalog file is
+        still used when loading the names fails.
+        
+        Args:
+            provider: Provider name.
+            load_names: Function returning the package names of the provider,
+                e.g. a fetcher's ``get_all_package_names``.
+        
+        Returns:
+            Sorted list of package names.
+        """
+        with self._lock:
+            names = self._names.get(provider)
+        if names is not None:
+            return names
+        
+        path = self._get_catalog_path(provider)
+        names = self._read_catalog(path) if self._is_fresh(path) else None
+        
+        if names is None:
+            try:
+                names = sorted(set(name for name in load_names() if name and "\n" not in name))
+            except Exception as e:
+                logger.warning(f"Failed to load package names for {provider}: {e}")
+                names = self._read_catalog(path) or []
+            else:
+                if names:
+                    self._write_catalog(path, names)
+        
+        if not names:
+            # Nothing to keep; the fetcher is asked again on the next lookup
+            return names
+        
+        with self._lock:
+            return self._names.setdefault(provider, names)
+    
+    def clear(self, provider: Optional[str] = None) -> None:
+        """
+        Drop catalogs from memory.
+        
+        Args:
+            provider: Provider to drop. If None, all providers are dropped.
+        """
+        with self._lock:
+            if provider is None:
+                self._names.clear()
+            else:
+                self._names.pop(provider, None)
+    
+    def _get_catalog_path(self, provider: str) -> str:
+        """
+        Get the path of a provider's catalog file.
+        
+        Args:
+            provider: Provider name.
+        
+        Returns:
+            Path of the catalog file.
+        """
+        safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in provider)
+        return os.path.join(self.catalog_dir, f"{safe_name}.names")
+    
+    def _is_fresh(self, path: str) -> bool:
+        """
+        Check whether a catalog file exists and is younger than the TTL.
+        
+        Args:
+            path: Path of the catalog file.
+        
+        Returns:
+            True if the file can be used without rebuilding it.
+        """
+        try:
+            return time.time() - os.path.getmtime(path) < self.ttl
+        except OSError:
+            return False
+    
+    def _read_catalog(self, path: str) -> Optional[List[str]]:
+        """
+        Read a catalog file.
+        
+        Args:
+            path: Path of the catalog file.
+        
+        Returns:
+            Sorted list of package names, or None if the file cannot be read.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def _write_catalog(self, path: str, names: List[str]) -> None:
+        """
+        Write a catalog file atomically.
+        
+        Args:
+            path: Path of the catalog file.
+            names: Sorted list of package names.
+        """
+        try:
+            os.makedirs(self.catalog_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.catalog_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write("\n".join(names))
+                    f.write("\n")
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write package catalog {path}: {e}")
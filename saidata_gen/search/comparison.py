@@ -6,13 +6,15 @@ identify alternatives and duplicates, and help users select the best package opt
 """
 
 import logging
+import re
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 
 from saidata_gen.core.interfaces import PackageDetails, SoftwareMatch
 from saidata_gen.fetcher.base import RepositoryFetcher
-from saidata_gen.search.fuzzy import FuzzyMatcher
+from saidata_gen.search.fuzzy import FuzzyMatcher, MinHashLSH, trigrams
+from saidata_gen.search.ranking import SearchRanker
 
 
 logger = logging.getLogger(__name__)
@@ -63,6 +65,10 @@ class PackageComparator:
     Compares packages to identify alternatives, duplicates, and provide selection recommendations.
     """
     
+    # Package lists at least this long are grouped by only comparing packages
+    # that share a block (see _find_candidates)
+    BLOCKING_MIN_PACKAGES = 200
+    
     def __init__(self, fetchers: Dict[str, RepositoryFetcher]):
         """
         Initialize the package comparator.
@@ -72,6 +78,11 @@ class PackageComparator:
         """
         self.fetchers = fetchers
         self.fuzzy_matcher = FuzzyMatcher(min_similarity=0.6)
+        self.ranker = SearchRanker()
+        
+        # Blocking of name trigrams and description words
+        self.name_lsh = MinHashLSH(bands=16, rows=3, seed=1)
+        self.description_lsh = MinHashLSH(bands=12, rows=3, seed=2)
         
         # Provider popularity ranking (higher is better)
         self.provider_popularity = {
@@ -140,22 +151,9 @@ class PackageComparator:
             List of package groups containing duplicates
         """
         duplicates = []
-        processed = set()
         
-        for i, package in enumerate(packages):
-            if i in processed:
-                continue
-            
-            # Find similar packages
-            similar_packages = [package]
-            for j, other_package in enumerate(packages[i+1:], i+1):
-                if j in processed:
-                    continue
-                
-                similarity = self._calculate_package_similarity(package, other_package)
-                if similarity >= similarity_threshold:
-                    similar_packages.append(other_package)
-                    processed.add(j)
+        for i, members in self._find_similar_packages(packages, similarity_threshold):
+            similar_packages = [packages[i]] + [packages[j] for j in members]
             
             if len(similar_packages) > 1:
                 group = PackageGroup(
@@ -166,8 +164,6 @@ class PackageComparator:
                     description=f"Duplicate packages for {similar_packages[0].name}"
                 )
                 duplicates.append(group)
-            
-            processed.add(i)
         
         return duplicates
     
@@ -190,11 +186,16 @@ class PackageComparator:
         """
         alternatives = []
         
-        for candidate in candidate_packages:
-            if candidate.provider == target_package.provider and candidate.name == target_package.name:
-                continue  # Skip the same package
-            
-            similarity = self._calculate_package_similarity(target_package, candidate)
+        # Skip the same package
+        candidate_packages = [
+            candidate for candidate in candidate_packages
+            if not (candidate.provider == target_package.provider and candidate.name == target_package.name)
+        ]
+        similarities = self._calculate_package_similarities(
+            target_package, candidate_packages, similarity_threshold
+        )
+        
+        for candidate, similarity in zip(candidate_packages, similarities):
             if similarity >= similarity_threshold:
                 candidate.score = similarity
                 alternatives.append(candidate)
@@ -302,24 +303,11 @@ class PackageComparator:
             List of package groups
         """
         groups = []
-        processed = set()
         
-        for i, package in enumerate(packages):
-            if i in processed:
-                continue
-            
-            # Start a new group with this package
-            group_packages = [package]
-            
-            # Find similar packages
-            for j, other_package in enumerate(packages[i+1:], i+1):
-                if j in processed:
-                    continue
-                
-                similarity = self._calculate_package_similarity(package, other_package)
-                if similarity >= 0.6:  # Threshold for grouping
-                    group_packages.append(other_package)
-                    processed.add(j)
+        # Threshold for grouping is 0.6
+        for i, members in self._find_similar_packages(packages, 0.6):
+            package = packages[i]
+            group_packages = [package] + [packages[j] for j in members]
             
             # Create group
             group = PackageGroup(
@@ -330,10 +318,89 @@ class PackageComparator:
                 description=f"Related packages for {package.name}"
             )
             groups.append(group)
+        
+        return groups
+    
+    def _find_similar_packages(
+        self,
+        packages: List[SoftwareMatch],
+        threshold: float
+    ) -> List[Tuple[int, List[int]]]:
+        """
+        Greedily group packages by similarity.
+        
+        Each package that is not in a group yet starts a group and takes every
+        later package, not in a group yet, whose similarity to it reaches the
+        threshold. Only candidates from ``_find_candidates`` are compared.
+        
+        Args:
+            packages: List of packages to group
+            threshold: Minimum similarity to join a group
+            
+        Returns:
+            List of the index of each group's first package and the indexes of
+            its other packages
+        """
+        candidates = self._find_candidates(packages)
+        groups = []
+        processed = set()
+        
+        for i, package in enumerate(packages):
+            if i in processed:
+                continue
+            
+            later = range(i + 1, len(packages)) if candidates is None else candidates[i]
+            later = [j for j in later if j not in processed]
+            similarities = self._calculate_package_similarities(
+                package, [packages[j] for j in later], threshold
+            )
+            members = [j for j, similarity in zip(later, similarities) if similarity >= threshold]
+            
+            groups.append((i, members))
+            processed.update(members)
             processed.add(i)
         
         return groups
     
+    def _find_candidates(self, packages: List[SoftwareMatch]) -> Optional[List[List[int]]]:
+        """
+        Find the pairs of packages worth comparing.
+        
+        Packages are blocked by normalized name (``SearchRanker._normalize_package_name``)
+        and by MinHash LSH over name trigrams and description words; only
+        packages sharing a block are compared. Similar packages share a block
+        with high probability, so grouping large lists is sub-quadratic at the
+        cost of rarely missing a weakly similar pair.
+        
+        Args:
+            packages: List of packages
+            
+        Returns:
+            For each package, the sorted indexes of the later packages sharing a
+            block with it, or None if the list is short enough to compare all pairs
+        """
+        if len(packages) < self.BLOCKING_MIN_PACKAGES:
+            return None
+        
+        names = defaultdict(list)
+        for i, package in enumerate(packages):
+            names[self.ranker._normalize_package_name(package.name)].append(i)
+        
+        blocks = [members for members in names.values() if len(members) > 1]
+        blocks.extend(self.name_lsh.buckets([
+            trigrams(package.name.lower().strip()) for package in packages
+        ]))
+        blocks.extend(self.description_lsh.buckets([
+            set(re.findall(r"[a-z0-9]+", (package.description or "").lower())) for package in packages
+        ]))
+        
+        neighbors: List[Set[int]] = [set() for _ in packages]
+        for members in blocks:
+            for i in members:
+                neighbors[i].update(members)
+        
+        return [sorted(j for j in neighbors[i] if j > i) for i in range(len(packages))]
+    
     def _create_package_comparison(
         self,
         group: PackageGroup,
@@ -362,8 +429,8 @@ class PackageComparator:
         
         # Calculate similarity scores
         similarity_scores = {}
-        for alt in alternatives:
-            similarity_scores[f"{alt.provider}:{alt.name}"] = self._calculate_package_similarity(primary, alt)
+        for alt, similarity in zip(alternatives, self._calculate_package_similarities(primary, alternatives)):
+            similarity_scores[f"{alt.provider}:{alt.name}"] = similarity
         
         # Find common features and differences
         common_features, differences = self._analyze_package_features(group.packages)
@@ -418,6 +485,51 @@ class PackageComparator:
         
         return min(similarity, 1.0)
     
+    def _calculate_package_similarities(
+        self,
+        package: SoftwareMatch,
+        others: List[SoftwareMatch],
+        threshold: Optional[float] = None
+    ) -> List[float]:
+        """
+        Calculate the similarity between a package and each of several packages.
+        
+        With a threshold, cheap bounds of the name and description similarity
+        (see ``FuzzyMatcher.similarity_upper_bounds``) rule out most packages
+        before their similarity is calculated.
+        
+        Args:
+            package: Package to compare
+            others: Packages to compare it with
+            threshold: Minimum similarity of interest. Packages that cannot reach
+                it get 0.0. If None, every similarity is calculated.
+            
+        Returns:
+            Similarity scores in the order of the other packages
+        """
+        if threshold is None or not others:
+            return [self._calculate_package_similarity(package, other) for other in others]
+        
+        name_bounds = self.fuzzy_matcher.similarity_upper_bounds(
+            package.name, [other.name for other in others]
+        )
+        desc_bounds = [0.0] * len(others)
+        if package.description:
+            desc_bounds = self.fuzzy_matcher.similarity_upper_bounds(
+                package.description, [other.description or "" for other in others]
+            )
+        
+        similarities = []
+        for other, name_bound, desc_bound in zip(others, name_bounds, desc_bounds):
+            provider_similarity = 1.0 if package.provider == other.provider else 0.3
+            bound = name_bound * 0.6 + desc_bound * 0.3 + provider_similarity * 0.1
+            if bound + 1e-9 < threshold:
+                similarities.append(0.0)
+            else:
+                similarities.append(self._calculate_package_similarity(package, other))
+        
+        return similarities
+    
     def _get_canonical_name(self, packages: List[SoftwareMatch]) -> str:
         """
         Get the canonical name for a group of packages.
@@ -550,10 +662,10 @@ class PackageComparator:
         if descriptions:
             # Check if descriptions are similar
             similarities = []
+            matrix = self.fuzzy_matcher.similarity_matrix(descriptions)
             for i in range(len(descriptions)):
                 for j in range(i+1, len(descriptions)):
-                    sim = self.fuzzy_matcher.calculate_similarity(descriptions[i], descriptions[j])
-                    similarities.append(sim)
+                    similarities.append(matrix[i][j])
             
             if similarities and sum(similarities) / len(similarities) > 0.8:
                 common_features.append("Similar descriptions")
@@ -6,16 +6,22 @@ multiple package repositories and provides unified results.
 """
 
 import asyncio
+import copy
+import hashlib
+import json
 import logging
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Set, Tuple
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
+from saidata_gen.core.cache import CacheBackend, CacheConfig, CacheManager
 from saidata_gen.core.interfaces import (
     FetcherConfig, PackageDetails, PackageInfo, SoftwareMatch
 )
 from saidata_gen.fetcher.factory import fetcher_factory
 from saidata_gen.fetcher.base import RepositoryFetcher
+from saidata_gen.search.catalog import PackageCatalog
 from saidata_gen.search.fuzzy import FuzzyMatcher
 from saidata_gen.search.ranking import SearchRanker
 from saidata_gen.search.comparison import PackageComparator, PackageComparison, PackageGroup, SelectionCriteria
@@ -32,11 +38,29 @@ class SoftwareSearchEngine:
     with fuzzy matching, ranking, and deduplication.
     """
     
+    # Seconds for which search results are reused
+    RESULT_CACHE_TTL = 300
+    
+    # Maximum number of cached search results
+    RESULT_CACHE_SIZE = 256
+    
+    # Score from which a match counts as high-confidence and may end a streaming search early
+    HIGH_CONFIDENCE = 0.8
+    
+    # Seconds within which all providers of a search must answer
+    SEARCH_TIMEOUT = 30.0
+    
+    # Unfinished searches per provider after which the provider is skipped, so that
+    # a hanging provider cannot occupy every worker
+    MAX_PROVIDER_SEARCHES = 2
+    
     def __init__(
         self,
         config: Optional[FetcherConfig] = None,
         providers: Optional[List[str]] = None,
-        max_workers: int = 5
+        max_workers: int = 5,
+        result_cache: Optional[CacheManager] = None,
+        search_timeout: float = SEARCH_TIMEOUT
     ):
         """
         Initialize the software search engine.
@@ -45,9 +69,34 @@ class SoftwareSearchEngine:
             config: Configuration for fetchers
             providers: List of provider names to search. If None, uses all available providers.
             max_workers: Maximum number of concurrent workers for parallel searches
+            result_cache: Cache manager for search results. If None, an in-memory
+                LRU cache of RESULT_CACHE_SIZE results kept for RESULT_CACHE_TTL seconds is
+                used, so results are only reused within the process. A persistent cache
+                shares results between processes once the providers have loaded their data,
+                since the keys include the repository data versions.
+            search_timeout: Seconds within which all providers of a search must answer;
+                providers answering later are left out of the results
         """
         self.config = config or FetcherConfig()
         self.max_workers = max_workers
+        self.search_timeout = search_timeout
+        
+        # Provider searches of all queries run on a long-lived executor; providers
+        # that miss the search deadline are counted per provider
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._provider_searches: Dict[str, Set[Future]] = {}
+        self.provider_timeouts: Dict[str, int] = {}
+        
+        # Ranked results per normalized search, reused until the provider data changes
+        if result_cache is None:
+            result_cache = CacheManager(CacheConfig(
+                backend=CacheBackend.MEMORY,
+                default_ttl=self.RESULT_CACHE_TTL,
+                max_size=self.RESULT_CACHE_SIZE,
+                cleanup_interval=0
+            ))
+        self.result_cache = result_cache
         
         # Initialize search components
         self.fuzzy_matcher = FuzzyMatcher(min_similarity=0.3)
@@ -60,9 +109,8 @@ class SoftwareSearchEngine:
         # Initialize comparator after fetchers are ready
         self.comparator = PackageComparator(self.fetchers)
         
-        # Cache for package lists (to avoid repeated fetching)
-        self._package_cache: Dict[str, List[str]] = {}
-        self._cache_lock = threading.Lock()
+        # Package names per provider, persisted so they are not fetched again
+        self.package_catalog = PackageCatalog(self.config.cache_dir, self.config.cache_ttl)
     
     def _initialize_fetchers(self, providers: Optional[List[str]] = None) -> None:
         """
@@ -107,6 +155,11 @@ class SoftwareSearchEngine:
         """
         Search for software packages across multiple repositories.
         
+        Ranked results are cached per normalized query (case and whitespace are
+        ignored), provider set, fuzzy setting and minimum confidence, and are
+        reused until a provider's repository data changes. Providers that do not
+        answer within ``search_timeout`` seconds are left out.
+        
         Args:
             query: Search query string
             max_results: Maximum number of results to return
@@ -120,8 +173,7 @@ class SoftwareSearchEngine:
         if not query or not query.strip():
             return []
         
-        query = query.strip()
-        logger.info(f"Searching for '{query}' across {len(self.fetchers)} providers")
+        query = " ".join(query.split())
         
         # Determine which providers to search
         search_providers = self._get_search_providers(providers)
@@ -130,17 +182,27 @@ class SoftwareSearchEngine:
             logger.warning("No providers available for search")
             return []
         
-        # Perform parallel searches
-        all_matches = self._parallel_search(query, search_providers, include_fuzzy)
+        cached_matches = self.result_cache.get(
+            self._get_result_cache_key(query, search_providers, include_fuzzy, min_confidence)
+        )
+        if cached_matches is not None:
+            logger.debug(f"Using cached results for '{query}'")
+            return [copy.copy(match) for match in self.ranker.get_top_matches(cached_matches, max_results)]
         
-        # Filter by confidence
-        filtered_matches = self.ranker.filter_by_confidence(all_matches, min_confidence)
+        logger.info(f"Searching for '{query}' across {len(search_providers)} providers")
         
-        # Deduplicate results
-        deduplicated_matches = self.ranker.deduplicate_results(filtered_matches)
+        # Perform parallel searches
+        all_matches, late_providers = self._parallel_search(query, search_providers, include_fuzzy)
         
-        # Rank results
-        ranked_matches = self.ranker.rank_results(deduplicated_matches, query)
+        ranked_matches = self._rank_matches(all_matches, query, min_confidence)
+        
+        # Cache the results under the repository data they were computed from,
+        # unless a provider missed the deadline
+        if not late_providers:
+            self.result_cache.put(
+                self._get_result_cache_key(query, search_providers, include_fuzzy, min_confidence),
+                [copy.copy(match) for match in ranked_matches]
+            )
         
         # Limit results
         final_matches = self.ranker.get_top_matches(ranked_matches, max_results)
@@ -148,6 +210,156 @@ class SoftwareSearchEngine:
         logger.info(f"Found {len(final_matches)} matches for '{query}'")
         return final_matches
     
+    def iter_search(
+        self,
+        query: str,
+        max_results: int = 20,
+        providers: Optional[List[str]] = None,
+        include_fuzzy: bool = True,
+        min_confidence: float = 0.3,
+        stop_confidence: Optional[float] = HIGH_CONFIDENCE
+    ) -> Iterator[List[SoftwareMatch]]:
+        """
+        Search for software packages, yielding provisional results as providers answer.
+        
+        Each time a provider answers, the matches received so far are ranked
+        and the top ``max_results`` are yielded. The search ends early, without
+        waiting for the remaining providers, once ``max_results`` matches score
+        at least ``stop_confidence``, and in any case after ``search_timeout``
+        seconds. Complete results are cached as in ``search``; a cached search
+        yields its results once.
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to yield
+            providers: List of specific providers to search. If None, searches all configured providers.
+            include_fuzzy: Whether to include fuzzy matching results
+            min_confidence: Minimum confidence score for results
+            stop_confidence: Score of the matches that end the search early.
+                If None, all providers are waited for.
+            
+        Yields:
+            Ranked and deduplicated software matches found so far
+        """
+        if not query or not query.strip():
+            return
+        
+        query = " ".join(query.split())
+        
+        search_providers = self._get_search_providers(providers)
+        
+        if not search_providers:
+            logger.warning("No providers available for search")
+            return
+        
+        cached_matches = self.result_cache.get(
+            self._get_result_cache_key(query, search_providers, include_fuzzy, min_confidence)
+        )
+        if cached_matches is not None:
+            logger.debug(f"Using cached results for '{query}'")
+            yield [copy.copy(match) for match in self.ranker.get_top_matches(cached_matches, max_results)]
+            return
+        
+        logger.info(f"Streaming search for '{query}' across {len(search_providers)} providers")
+        
+        all_matches: List[SoftwareMatch] = []
+        ranked_matches: List[SoftwareMatch] = []
+        answered = 0
+        complete = True
+        for _, matches in self._iter_provider_results(query, search_providers, include_fuzzy):
+            answered += 1
+            if matches is None:
+                complete = False
+                continue
+            if not matches:
+                continue
+            
+            all_matches.extend(matches)
+            ranked_matches = self._rank_matches(all_matches, query, min_confidence)
+            top_matches = self.ranker.get_top_matches(ranked_matches, max_results)
+            yield [copy.copy(match) for match in top_matches]
+            
+            if (
+                stop_confidence is not None
+                and answered < len(search_providers)
+                and len(top_matches) >= max_results
+                and top_matches[-1].score >= stop_confidence
+            ):
+                logger.info(
+                    f"Found {max_results} matches for '{query}' after {answered} of "
+                    f"{len(search_providers)} providers, not waiting for the rest"
+                )
+                return
+        
+        if not all_matches:
+            yield []
+        
+        # Only results from all providers are cached
+        if complete:
+            self.result_cache.put(
+                self._get_result_cache_key(query, search_providers, include_fuzzy, min_confidence),
+                [copy.copy(match) for match in ranked_matches]
+            )
+    
+    def _rank_matches(
+        self,
+        matches: List[SoftwareMatch],
+        query: str,
+        min_confidence: float
+    ) -> List[SoftwareMatch]:
+        """
+        Filter, deduplicate and rank search matches.
+        
+        Args:
+            matches: Matches from all searched providers
+            query: Search query
+            min_confidence: Minimum confidence score for results
+            
+        Returns:
+            Ranked and deduplicated matches
+        """
+        # Filter by confidence
+        filtered_matches = self.ranker.filter_by_confidence(matches, min_confidence)
+        
+        # Deduplicate results
+        deduplicated_matches = self.ranker.deduplicate_results(filtered_matches)
+        
+        # Rank results
+        return self.ranker.rank_results(deduplicated_matches, query)
+    
+    def _get_result_cache_key(
+        self,
+        query: str,
+        providers: List[str],
+        include_fuzzy: bool,
+        min_confidence: float
+    ) -> str:
+        """
+        Get the result cache key of a search.
+        
+        Args:
+            query: Search query
+            providers: Providers searched
+            include_fuzzy: Whether fuzzy matching is included
+            min_confidence: Minimum confidence score for results
+            
+        Returns:
+            Cache key, including the repository data version of each provider
+        """
+        versions = []
+        for provider in sorted(providers):
+            try:
+                version = self.fetchers[provider].get_index_version()
+            except Exception:
+                version = None
+            versions.append([provider, version])
+        
+        key_data = json.dumps(
+            [" ".join(query.casefold().split()), include_fuzzy, min_confidence, versions],
+            default=repr
+        )
+        return f"search:{hashlib.sha256(key_data.encode('utf-8')).hexdigest()}"
+    
     def _get_search_providers(self, providers: Optional[List[str]]) -> List[str]:
         """
         Get the list of providers to search.
@@ -176,7 +388,7 @@ class SoftwareSearchEngine:
         query: str,
         providers: List[str],
         include_fuzzy: bool
-    ) -> List[SoftwareMatch]:
+    ) -> Tuple[List[SoftwareMatch], List[str]]:
         """
         Perform parallel searches across multiple providers.
         
@@ -186,29 +398,162 @@ class SoftwareSearchEngine:
             include_fuzzy: Whether to include fuzzy matching
             
         Returns:
-            Combined list of matches from all providers
+            Tuple of the combined matches from all providers and the providers
+            that missed the search deadline
         """
         all_matches = []
+        late_providers = []
+        for provider, matches in self._iter_provider_results(query, providers, include_fuzzy):
+            if matches is None:
+                late_providers.append(provider)
+            else:
+                all_matches.extend(matches)
+        
+        return all_matches, late_providers
+    
+    def _iter_provider_results(
+        self,
+        query: str,
+        providers: List[str],
+        include_fuzzy: bool
+    ) -> Iterator[Tuple[str, Optional[List[SoftwareMatch]]]]:
+        """
+        Search providers in parallel, yielding their matches as they complete.
+        
+        All providers share one deadline of ``search_timeout`` seconds, which
+        includes the time a search waits for a free worker. Providers that have
+        not answered by then are cancelled and reported. Closing the iterator
+        early also cancels the searches that have not started. Providers that
+        still have ``MAX_PROVIDER_SEARCHES`` unfinished searches from earlier
+        queries are not searched and are reported like late providers.
+        
+        Args:
+            query: Search query
+            providers: List of provider names to search
+            include_fuzzy: Whether to include fuzzy matching
+            
+        Yields:
+            Tuples of provider name and its matches; failed providers yield no
+            matches and providers that missed the deadline yield None
+        """
+        deadline = time.monotonic() + self.search_timeout
+        
+        # Submit search tasks
+        pending: Dict[Future, str] = {}
+        busy_providers = []
+        for provider in providers:
+            future = self._submit_search(query, provider, include_fuzzy)
+            if future is None:
+                busy_providers.append(provider)
+            else:
+                pending[future] = provider
+        
+        if busy_providers:
+            logger.warning(
+                f"Skipping providers {', '.join(busy_providers)} for '{query}': "
+                f"{self.MAX_PROVIDER_SEARCHES} earlier searches are still running"
+            )
         
-        # Use ThreadPoolExecutor for parallel searches
-        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(providers))) as executor:
-            # Submit search tasks
-            future_to_provider = {
-                executor.submit(self._search_provider, query, provider, include_fuzzy): provider
-                for provider in providers
-            }
+        try:
+            for provider in busy_providers:
+                yield provider, None
             
             # Collect results as they complete
-            for future in as_completed(future_to_provider):
-                provider = future_to_provider[future]
-                try:
-                    matches = future.result(timeout=30)  # 30 second timeout per provider
-                    all_matches.extend(matches)
-                    logger.debug(f"Provider {provider} returned {len(matches)} matches")
-                except Exception as e:
-                    logger.error(f"Search failed for provider {provider}: {e}")
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=max(0.0, deadline - time.monotonic()),
+                    return_when=FIRST_COMPLETED
+                )
+                
+                if not done:
+                    # Running searches cannot be interrupted; they finish in the background
+                    # and their results are discarded
+                    late_providers = list(pending.values())
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                    
+                    logger.warning(
+                        f"Providers {', '.join(late_providers)} missed the "
+                        f"{self.search_timeout:.1f}s search deadline for '{query}'"
+                    )
+                    with self._executor_lock:
+                        for provider in late_providers:
+                            self.provider_timeouts[provider] = self.provider_timeouts.get(provider, 0) + 1
+                    
+                    for provider in late_providers:
+                        yield provider, None
+                    return
+                
+                for future in done:
+                    provider = pending.pop(future)
+                    try:
+                        matches = future.result()
+                        logger.debug(f"Provider {provider} returned {len(matches)} matches")
+                    except Exception as e:
+                        logger.error(f"Search failed for provider {provider}: {e}")
+                        matches = []
+                    yield provider, matches
+        finally:
+            # Searches of an iterator closed early are cancelled if they have not started
+            for future in pending:
+                future.cancel()
+    
+    def _submit_search(self, query: str, provider: str, include_fuzzy: bool) -> Optional[Future]:
+        """
+        Submit a provider search unless the provider has too many unfinished searches.
         
-        return all_matches
+        Args:
+            query: Search query
+            provider: Provider name
+            include_fuzzy: Whether to include fuzzy matching
+            
+        Returns:
+            Future of the provider's matches, or None if the provider was skipped
+        """
+        executor = self._get_executor()
+        with self._executor_lock:
+            searches = self._provider_searches.setdefault(provider, set())
+            if len(searches) >= self.MAX_PROVIDER_SEARCHES:
+                return None
+            future = executor.submit(self._search_provider, query, provider, include_fuzzy)
+            searches.add(future)
+        
+        def _search_done(done_future: Future) -> None:
+            with self._executor_lock:
+                searches.discard(done_future)
+        
+        future.add_done_callback(_search_done)
+        return future
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the long-lived executor used for provider searches.
+        
+        Returns:
+            Thread pool shared by all searches of this engine
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="saidata-search"
+                )
+            return self._executor
+    
+    def close(self) -> None:
+        """Shut down the search executor; it is recreated by the next search."""
+        with self._executor_lock:
+            executor = self._executor
+            self._executor = None
+            searches = [future for futures in self._provider_searches.values() for future in futures]
+        
+        # Searches that have not started are cancelled; running ones finish in the background
+        for future in searches:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
     
     def _search_provider(
         self,
@@ -323,33 +668,21 @@ class SoftwareSearchEngine:
         """
         Get the list of package names for a provider (with caching).
         
+        Names come from the provider's package catalog, which is built from
+        the fetcher's loaded index once and then kept in memory and on disk.
+        
         Args:
             provider: Provider name
             
         Returns:
-            List of package names
+            Sorted list of package names
         """
-        with self._cache_lock:
-            if provider in self._package_cache:
-                return self._package_cache[provider]
+        fetcher = self.fetchers.get(provider)
+        if not fetcher:
+            return []
         
         try:
-            # Try to get package list from fetcher
-            fetcher = self.fetchers.get(provider)
-            if not fetcher:
-                return []
-            
-            # This is a simplified approach - in practice, fetchers might need
-            # to implement a get_all_package_names method or similar
-            # For now, we'll return an empty list and rely on direct search
-            package_names = []
-            
-            # Cache the result
-            with self._cache_lock:
-                self._package_cache[provider] = package_names
-            
-            return package_names
-            
+            return self.package_catalog.get_names(provider, fetcher.get_all_package_names)
         except Exception as e:
             logger.error(f"Error getting package list for provider {provider}: {e}")
             return []
@@ -436,9 +769,9 @@ class SoftwareSearchEngine:
         return list(self.fetchers.keys())
     
     def clear_cache(self) -> None:
-        """Clear the package name cache."""
-        with self._cache_lock:
-            self._package_cache.clear()
+        """Clear the in-memory package name catalogs and the cached search results."""
+        self.package_catalog.clear()
+        self.result_cache.invalidate_pattern("search:*")
         logger.info("Package cache cleared")
     
     def compare_packages(
@@ -0,0 +1,357 @@
+"""
+Persistent cross-provider package equivalence map.
+
+Generating metadata for a software package needs its package name in every
+provider, e.g. ``nginx`` in APT, Homebrew and DNF and ``nginx.nginx`` in
+Winget. ``EquivalenceMap`` computes these equivalences once from the package
+records of all providers and stores them in the cache directory, so the
+names are resolved with a dictionary lookup instead of a search per provider.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from saidata_gen.core.interfaces import SoftwareMatch
+from saidata_gen.search.comparison import PackageComparator
+from saidata_gen.search.ranking import SearchRanker
+
+logger = logging.getLogger(__name__)
+
+
+class EquivalenceMap:
+    """
+    Classes of equivalent packages across providers, persisted in the cache directory.
+    
+    Packages are equivalent when they have the same normalized name
+    (``SearchRanker._normalize_package_name``), when a ``Publisher.Name`` or
+    ``namespace/name`` identifier repeats the name (``nginx.nginx``,
+    ``library/nginx``), or when they share a homepage and are similar
+    according to ``PackageComparator``.
+    
+    The map records the repository data version (``RepositoryFetcher.get_index_version``)
+    of each provider it was built from, so that callers can tell when it is stale.
+    """
+    
+    # Format version of the map file
+    VERSION = 2
+    
+    # Homepages shared by more packages than this are considered generic
+    # (e.g. a forge or a project umbrella) and do not join packages
+    MAX_HOMEPAGE_GROUP = 50
+    
+    # Minimum PackageComparator similarity of packages joined by homepage
+    HOMEPAGE_SIMILARITY_THRESHOLD = 0.4
+    
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the map.
+        
+        Args:
+            cache_dir: Cache directory holding the map file.
+        """
+        self.path = os.path.join(os.path.expanduser(cache_dir), "equivalence.json")
+        self.providers: List[str] = []
+        self.index_versions: Dict[str, Any] = {}
+        
+        self._keys: Dict[str, int] = {}
+        self._classes: List[Dict[str, str]] = []
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._ranker = SearchRanker()
+    
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._classes)
+    
+    def resolve(self, software_name: str) -> Dict[str, str]:
+        """
+        Get the package names of a software package in each provider.
+        
+        Args:
+            software_name: Name of the software package.
+        
+        Returns:
+            Dictionary mapping provider names to package names; empty if the
+            software package is not in the map.
+        """
+        self._ensure_loaded()
+        class_id = self._keys.get(self._normalize(software_name))
+        if class_id is None:
+            return {}
+        return dict(self._classes[class_id])
+    
+    def is_current(self, index_versions: Mapping[str, Any]) -> bool:
+        """
+        Check whether the map was built from the given repository data.
+        
+        Args:
+            index_versions: Mapping of provider name to the version of its loaded
+                repository data. Providers with no loaded data (an empty version)
+                and providers not in the map are ignored.
+        
+        Returns:
+            False if a provider in the map has different repository data now.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            for provider, index_version in index_versions.items():
+                if not index_version or provider not in self.providers:
+                    continue
+                if self._encode_version(index_version) != self.index_versions.get(provider):
+                    return False
+        return True
+    
+    def build(
+        self,
+        records: Mapping[str, Iterable[Tuple[str, Optional[str], Optional[str]]]],
+        index_versions: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        """
+        Compute the equivalence classes from the packages of all providers.
+        
+        Args:
+            records: Mapping of provider name to (package name, description,
+                homepage) records, e.g. from ``RepositoryFetcher.iter_package_summaries``.
+            index_versions: Mapping of provider name to the version of the
+                repository data the records were read from.
+        """
+        nodes: List[Tuple[str, str, Optional[str]]] = []
+        homepages: Dict[str, List[int]] = defaultdict(list)
+        for provider, provider_records in records.items():
+            for name, description, homepage in provider_records:
+                if homepage:
+                    homepages[self._normalize_url(homepage)].append(len(nodes))
+                nodes.append((provider, name, description))
+        
+        parents = list(range(len(nodes)))
+        
+        def find(node: int) -> int:
+            while parents[node] != node:
+                parents[node] = parents[parents[node]]
+                node = parents[node]
+            return node
+        
+        def union(first: int, second: int) -> None:
+            first, second = find(first), find(second)
+            if first != second:
+                parents[max(first, second)] = min(first, second)
+        
+        # Same normalized name, or an identifier repeating it
+        key_nodes: Dict[str, int] = {}
+        for node, (_, name, _) in enumerate(nodes):
+            for key in self._get_keys(name):
+                union(node, key_nodes.setdefault(key, node))
+        
+        # Same homepage and similar packages
+        comparator = PackageComparator({})
+        for members in homepages.values():
+            if not 1 < len(members) <= self.MAX_HOMEPAGE_GROUP:
+                continue
+            if len({nodes[node][0] for node in members}) < 2:
+                continue
+            
+            matches = [
+                SoftwareMatch(name=nodes[node][1], provider=nodes[node][0], description=nodes[node][2], score=0.0)
+                for node in members
+            ]
+            for i, match in enumerate(matches):
+                # Packages of one provider sharing a homepage are different packages
+                others = [j for j in range(i + 1, len(matches)) if matches[j].provider != match.provider]
+                similarities = comparator._calculate_package_similarities(
+                    match, [matches[j] for j in others], self.HOMEPAGE_SIMILARITY_THRESHOLD
+                )
+                for j, similarity in zip(others, similarities):
+                    if similarity >= self.HOMEPAGE_SIMILARITY_THRESHOLD:
+                        union(members[i], members[j])
+        
+        classes: Dict[int, List[int]] = defaultdict(list)
+        for node in range(len(nodes)):
+            classes[find(node)].append(node)
+        
+        keys: Dict[str, int] = {}
+        class_list: List[Dict[str, str]] = []
+        for members in classes.values():
+            class_id = len(class_list)
+            class_list.append(self._select_names([nodes[node][:2] for node in members]))
+            for node in members:
+                for key in self._get_keys(nodes[node][1]):
+                    keys.setdefault(key, class_id)
+        
+        with self._lock:
+            self.providers = sorted(records)
+            self.index_versions = {
+                provider: self._encode_version(index_version)
+                for provider, index_version in (index_versions or {}).items()
+            }
+            self._keys = keys
+            self._classes = class_list
+            self._loaded = True
+        
+        logger.info(f"Built {len(class_list)} package equivalence classes for {len(self.providers)} providers")
+    
+    def load(self) -> bool:
+        """
+        Load the map file.
+        
+        Returns:
+            True if the map was loaded, False if the file is missing or invalid.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                raise ValueError(f"unsupported version {data.get('version')}")
+            providers = list(data["providers"])
+            index_versions = dict(data["index_versions"])
+            classes = [dict(names) for names in data["classes"]]
+            keys = {key: int(class_id) for key, class_id in data["keys"].items()}
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load package equivalence map {self.path}: {e}")
+            return False
+        
+        with self._lock:
+            self.providers = providers
+            self.index_versions = index_versions
+            self._keys = keys
+            self._classes = classes
+            self._loaded = True
+        return True
+    
+    def save(self) -> None:
+        """Write the map file atomically."""
+        with self._lock:
+            data = {
+                "version": self.VERSION,
+                "providers": self.providers,
+                "index_versions": self.index_versions,
+                "classes": self._classes,
+                "keys": self._keys,
+            }
+        
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write package equivalence map {self.path}: {e}")
+    
+    def _ensure_loaded(self) -> None:
+        """Load the map file on first use."""
+        if self._loaded:
+            return
+        
+        if not self.load():
+            with self._lock:
+                self._loaded = True
+    
+    def _normalize(self, name: str) -> str:
+        """
+        Normalize a package name.
+        
+        Args:
+            name: Package name.
+        
+        Returns:
+            Normalized name (see ``SearchRanker._normalize_package_name``).
+        """
+        return self._ranker._normalize_package_name(name)
+    
+    def _get_keys(self, name: str) -> List[str]:
+        """
+        Get the lookup keys of a package name.
+        
+        Args:
+            name: Package name.
+        
+        Returns:
+            The normalized name, and for identifiers such as ``nginx.nginx`` or
+            ``library/nginx`` the normalized name they repeat.
+        """
+        keys = [self._normalize(name)]
+        
+        segments = [segment for segment in re.split(r"[./]", name.lower()) if segment]
+        if len(segments) > 1:
+            last = segments[-1]
+            if all(segment == last for segment in segments[:-1]) or segments[:-1] == ["library"]:
+                key = self._normalize(last)
+                if key and key not in keys:
+                    keys.append(key)
+        
+        return [key for key in keys if key]
+    
+    def _select_names(self, members: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Select the package name of each provider in an equivalence class.
+        
+        Args:
+            members: (provider, package name) pairs of the class.
+        
+        Returns:
+            Dictionary mapping provider names to the package name closest to
+            the class's most common normalized name.
+        """
+        key_counts: Dict[str, int] = defaultdict(int)
+        for _, name in members:
+            key_counts[self._normalize(name)] += 1
+        canonical = min(key_counts, key=lambda key: (-key_counts[key], len(key), key))
+        
+        names: Dict[str, str] = {}
+        for provider, name in sorted(
+            members,
+            key=lambda member: (
+                member[1].lower() != canonical,
+                canonical not in self._get_keys(member[1]),
+                len(member[1]),
+                member[1],
+            )
+        ):
+            names.setdefault(provider, name)
+        return names
+    
+    @staticmethod
+    def _encode_version(index_version: Any) -> Any:
+        """
+        Convert a repository data version to the form stored in the map file.
+        
+        Args:
+            index_version: Version from ``RepositoryFetcher.get_index_version``.
+        
+        Returns:
+            The version with tuples converted to lists, as read back from JSON.
+        """
+        return json.loads(json.dumps(index_version))
+    
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """
+        Normalize a homepage URL for comparison.
+        
+        Args:
+            url: Homepage URL.
+        
+        Returns:
+            URL without scheme, "www.", query, fragment, ".git" suffix and trailing slashes.
+        """
+        url = re.sub(r"^[a-z][a-z0-9+.-]*://", "", url.strip().lower())
+        url = re.split(r"[?#]", url, 1)[0]
+        if url.startswith("www."):
+            url = url[4:]
+        url = url.rstrip("/")
+        if url.endswith(".git"):
+            url = url[:-4]
+        return url
@@ -5,10 +5,488 @@ This module provides fuzzy matching capabilities for partial name searches
 and suggestion algorithms.
 """
 
+import heapq
+import os
+import random
 import re
-from typing import List, Tuple, Set
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Set
 from difflib import SequenceMatcher
 
+# Try to import numpy, but don't fail if it's not available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Number of buckets of the character count vectors used for score bounds
+_CHAR_BUCKETS = 128
+
+# Number of strings whose character counts are computed at once
+_CHAR_COUNT_CHUNK = 8192
+
+# Mersenne prime modulus of the MinHash permutations; products of two values
+# below it fit in 64 bits
+_MINHASH_PRIME = (1 << 31) - 1
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Get the padded trigrams of a lowercase string.
+    
+    Args:
+        text: Lowercase string
+        
+    Returns:
+        Set of trigrams, including the ones marking the start and end
+    """
+    padded = f"\0\0{text}\0"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _similarity_upper_bound(query_len: int, target_len: int, multi_word: bool) -> float:
+    """
+    Get an upper bound of ``FuzzyMatcher.calculate_similarity`` from string lengths.
+    
+    Each weighted component is bounded by the lengths alone: the sequence
+    ratio by 2*min/(m+n), the substring and prefix scores by min/max, and the
+    word score by 1 only when one of the strings has several words.
+    
+    Args:
+        query_len: Length of the lowercase query
+        target_len: Length of the lowercase target
+        multi_word: Whether the query or the target consists of several words
+        
+    Returns:
+        Upper bound of the similarity score
+    """
+    if query_len == target_len:
+        # The strings may be equal
+        return 1.0
+    
+    shorter, longer = sorted((query_len, target_len))
+    bound = 0.4 * 2 * shorter / (shorter + longer) + 0.1 * shorter / longer
+    if query_len < target_len:
+        bound += 0.3 * query_len / target_len
+    if multi_word:
+        bound += 0.2
+    return bound
+
+
+def _similarity_without_ratio(query_lower: str, query_words: Set[str], target_lower: str) -> float:
+    """
+    Compute the weighted substring, word and prefix scores of ``calculate_similarity``.
+    
+    Args:
+        query_lower: Lowercase, stripped query
+        query_words: Words of the query
+        target_lower: Lowercase, stripped target
+        
+    Returns:
+        Similarity score without the sequence ratio component
+    """
+    score = 0.0
+    if query_lower in target_lower:
+        score += 0.3 * len(query_lower) / len(target_lower)
+    
+    target_words = set(target_lower.split())
+    if query_words and target_words:
+        score += 0.2 * len(query_words & target_words) / len(query_words | target_words)
+    
+    prefix_len = len(os.path.commonprefix((query_lower, target_lower)))
+    score += 0.1 * prefix_len / max(len(query_lower), len(target_lower))
+    return score
+
+
+def _shared_char_counts(query_lower: str, texts: List[str]) -> List[int]:
+    """
+    Count the characters each string has in common with the query.
+    
+    Args:
+        query_lower: Lowercase, stripped query
+        texts: Lowercase, stripped strings
+        
+    Returns:
+        Number of shared characters (multiset intersection size) per string;
+        with NumPy, non-ASCII characters may be overcounted
+    """
+    if NUMPY_AVAILABLE and len(texts) >= 64:
+        query_counts = _char_counts([query_lower])[0]
+        shared: List[int] = []
+        for start in range(0, len(texts), _CHAR_COUNT_CHUNK):
+            chunk = texts[start:start + _CHAR_COUNT_CHUNK]
+            shared.extend(np.minimum(_char_counts(chunk), query_counts).sum(axis=1).tolist())
+        return shared
+    
+    query_counts = Counter(query_lower)
+    return [sum((Counter(text) & query_counts).values()) for text in texts]
+
+
+def _char_counts(texts: List[str]) -> "np.ndarray":
+    """
+    Count the characters of strings into buckets.
+    
+    ASCII characters get a bucket each; other characters share buckets, which
+    can only make the shared character counts larger, so bounds stay valid.
+    
+    Args:
+        texts: Strings to count
+        
+    Returns:
+        Array of shape (len(texts), _CHAR_BUCKETS) with the character counts
+    """
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    codes = np.frombuffer("".join(texts).encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+    rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+    flat = np.bincount(rows * _CHAR_BUCKETS + (codes % _CHAR_BUCKETS), minlength=len(texts) * _CHAR_BUCKETS)
+    return flat.reshape(len(texts), _CHAR_BUCKETS)
+
+
+def _numpy_upper_bounds(query_lower: str, targets: List[Optional[str]]) -> List[float]:
+    """
+    Calculate upper bounds of similarity scores with vectorized character counts.
+    
+    The sequence ratio is at most 2*shared/(m+n), where shared counts the
+    characters the strings have in common (the bound difflib's ``quick_ratio``
+    uses); a substring match needs every query character to be shared, and
+    the prefix score is bounded by the lengths.
+    
+    Args:
+        query_lower: Lowercase, stripped query
+        targets: Lowercase, stripped candidates, None for empty candidates
+        
+    Returns:
+        Upper bounds of the similarity scores
+    """
+    query_len = len(query_lower)
+    query_counts = _char_counts([query_lower])[0]
+    query_multi_word = len(query_lower.split()) > 1
+    
+    bounds: List[float] = []
+    for start in range(0, len(targets), _CHAR_COUNT_CHUNK):
+        chunk = targets[start:start + _CHAR_COUNT_CHUNK]
+        texts = [target or "" for target in chunk]
+        
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        shared = np.minimum(_char_counts(texts), query_counts).sum(axis=1)
+        total = lengths + query_len
+        shorter = np.minimum(lengths, query_len)
+        longer = np.maximum(lengths, query_len)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bound = 0.4 * np.where(total > 0, 2 * shared / total, 0.0)
+            bound += 0.3 * np.where((query_len <= lengths) & (shared >= query_len) & (lengths > 0), query_len / lengths, 0.0)
+            bound += 0.1 * np.where(longer > 0, shorter / longer, 0.0)
+        
+        multi_word = np.fromiter((len(text.split()) > 1 for text in texts), dtype=bool, count=len(texts))
+        bound += 0.2 * (multi_word | query_multi_word)
+        
+        # Strings that may be equal score 1.0
+        bound[(lengths == query_len) & (shared >= query_len)] = 1.0
+        bound[np.fromiter((target is None for target in chunk), dtype=bool, count=len(chunk))] = 0.0
+        bounds.extend(bound.tolist())
+    
+    return bounds
+
+
+class FuzzyIndex:
+    """
+    Trigram index over a list of candidate strings.
+    
+    Selects the candidates worth scoring for a query: candidates sharing
+    trigrams with the query, ranked by trigram overlap, whose length allows a
+    similarity above the threshold. Candidates sharing no trigram have no
+    substring or prefix score, but may still have a high sequence ratio
+    (``tmux`` for ``utmx``); they are selected when the characters they share
+    with the query allow a similarity above the threshold. Queries shorter
+    than a trigram consider every candidate of a feasible length instead.
+    
+    With NumPy, the character counts of the candidates are computed when the
+    index is built, in rows ordered by length, so the shared characters of
+    every candidate of a feasible length are bounded in one vectorized pass
+    and only the candidates passing the bound are enumerated.
+    """
+    
+    def __init__(self, candidates: List[str]):
+        """
+        Build the index.
+        
+        Args:
+            candidates: Candidate strings; must not be modified while indexed
+        """
+        self.candidates = candidates
+        self.size = len(candidates)
+        
+        self._lengths: List[int] = []
+        self._multi_word: Set[int] = set()
+        self._by_length: Dict[int, List[int]] = {}
+        self._postings: Dict[str, List[int]] = {}
+        
+        for candidate_id, candidate in enumerate(candidates):
+            text = candidate.lower().strip() if candidate else ""
+            self._lengths.append(len(text))
+            if not text:
+                continue
+            
+            self._by_length.setdefault(len(text), []).append(candidate_id)
+            if len(text.split()) > 1:
+                self._multi_word.add(candidate_id)
+            for gram in trigrams(text):
+                self._postings.setdefault(gram, []).append(candidate_id)
+        
+        # Character count rows of the non-empty candidates, ordered by length
+        self._char_rows = None
+        if NUMPY_AVAILABLE:
+            self._build_char_rows()
+    
+    def _build_char_rows(self) -> None:
+        """Compute the character counts of the candidates, ordered by length."""
+        order = [
+            candidate_id
+            for length in sorted(self._by_length)
+            for candidate_id in self._by_length[length]
+        ]
+        self._row_ids = np.array(order, dtype=np.int64)
+        self._row_lengths = np.array([self._lengths[candidate_id] for candidate_id in order], dtype=np.int64)
+        self._row_multi_word = np.array([candidate_id in self._multi_word for candidate_id in order], dtype=bool)
+        
+        # Counts are clipped to fit a byte; see _select_without_trigrams for
+        # how bounds stay valid
+        self._char_rows = np.zeros((len(order), _CHAR_BUCKETS), dtype=np.uint8)
+        for start in range(0, len(order), _CHAR_COUNT_CHUNK):
+            texts = [self.candidates[candidate_id].lower().strip() for candidate_id in order[start:start + _CHAR_COUNT_CHUNK]]
+            self._char_rows[start:start + len(texts)] = np.minimum(_char_counts(texts), 255)
+    
+    def _select_without_trigrams(
+        self,
+        query_lower: str,
+        min_length: int,
+        max_length: int,
+        min_similarity: float,
+        shared_trigrams: Dict[int, int]
+    ) -> Dict[int, float]:
+        """
+        Bound the sequence ratio of candidates sharing no trigram with the query.
+        
+        Args:
+            query_lower: Lowercase, stripped query
+            min_length: Minimum feasible candidate length
+            max_length: Maximum feasible candidate length
+            min_similarity: Minimum similarity score of a match
+            shared_trigrams: Candidates sharing trigrams with the query, skipped
+            
+        Returns:
+            Weighted sequence ratio bound of each candidate whose bound, with the
+            word score, reaches the minimum similarity
+        """
+        query_len = len(query_lower)
+        query_multi_word = len(query_lower.split()) > 1
+        ratio_bounds: Dict[int, float] = {}
+        
+        if self._char_rows is None:
+            others = [
+                candidate_id
+                for length in range(min_length, max_length + 1)
+                for candidate_id in self._by_length.get(length, ())
+                if candidate_id not in shared_trigrams
+            ]
+            texts = [self.candidates[candidate_id].lower().strip() for candidate_id in others]
+            for candidate_id, text, shared in zip(others, texts, _shared_char_counts(query_lower, texts)):
+                ratio_bound = 0.4 * 2 * shared / (query_len + len(text))
+                word_bound = 0.2 if query_multi_word or candidate_id in self._multi_word else 0.0
+                if ratio_bound + word_bound + 1e-9 >= min_similarity:
+                    ratio_bounds[candidate_id] = ratio_bound
+            return ratio_bounds
+        
+        # A clipped count is still at least the query count unless the query
+        # has more than 255 of a character; such characters count as shared
+        full_query_counts = _char_counts([query_lower])[0]
+        saturated = full_query_counts > 255
+        query_counts = np.minimum(full_query_counts, 255).astype(np.uint8)
+        query_counts[saturated] = 0
+        saturated_shared = int(full_query_counts[saturated].sum())
+        
+        start = int(np.searchsorted(self._row_lengths, min_length, side="left"))
+        stop = int(np.searchsorted(self._row_lengths, max_length, side="right"))
+        for chunk_start in range(start, stop, _CHAR_COUNT_CHUNK):
+            chunk = slice(chunk_start, min(stop, chunk_start + _CHAR_COUNT_CHUNK))
+            shared = np.minimum(self._char_rows[chunk], query_counts).sum(axis=1, dtype=np.int64) + saturated_shared
+            
+            ratio_bound = 0.4 * 2 * shared / (query_len + self._row_lengths[chunk])
+            word_bound = np.where(self._row_multi_word[chunk] | query_multi_word, 0.2, 0.0)
+            passing = np.nonzero(ratio_bound + word_bound + 1e-9 >= min_similarity)[0]
+            
+            for candidate_id, bound in zip(self._row_ids[chunk][passing].tolist(), ratio_bound[passing].tolist()):
+                if candidate_id not in shared_trigrams:
+                    ratio_bounds[candidate_id] = bound
+        
+        return ratio_bounds
+    
+    def select(self, query: str, min_similarity: float, max_candidates: int) -> List[int]:
+        """
+        Select the candidates to score for a query.
+        
+        Args:
+            query: Search query
+            min_similarity: Minimum similarity score of a match
+            max_candidates: Maximum number of candidates to select
+            
+        Returns:
+            Ids of the selected candidates in candidate order
+        """
+        query_lower = query.lower().strip()
+        query_len = len(query_lower)
+        query_multi_word = len(query_lower.split()) > 1
+        query_grams = trigrams(query_lower)
+        
+        counts: Dict[int, int] = {}
+        for gram in query_grams:
+            for candidate_id in self._postings.get(gram, ()):
+                counts[candidate_id] = counts.get(candidate_id, 0) + 1
+        
+        # The length bound falls as the lengths diverge, so feasible lengths
+        # form a range
+        feasible_lengths = [
+            length for length in self._by_length
+            if _similarity_upper_bound(query_len, length, True) >= min_similarity
+        ]
+        
+        # Weighted sequence ratio bounds of candidates sharing no trigram
+        ratio_bounds: Dict[int, float] = {}
+        if not feasible_lengths:
+            pool = []
+        elif query_len < 3:
+            # Short queries share few trigrams with their matches, so every
+            # candidate of a feasible length is considered
+            pool = [
+                candidate_id
+                for length in feasible_lengths
+                for candidate_id in self._by_length[length]
+            ]
+        else:
+            # Only the sequence ratio, bounded by the shared characters, and
+            # the word score can be positive
+            ratio_bounds = self._select_without_trigrams(
+                query_lower, min(feasible_lengths), max(feasible_lengths), min_similarity, counts
+            )
+            pool = list(counts) + list(ratio_bounds)
+        
+        bounds = {}
+        for candidate_id in pool:
+            bound = _similarity_upper_bound(
+                query_len,
+                self._lengths[candidate_id],
+                query_multi_word or candidate_id in self._multi_word
+            )
+            if bound >= min_similarity:
+                bounds[candidate_id] = bound
+        
+        if len(bounds) > max_candidates:
+            # Estimate the score of each candidate, exactly except for the
+            # sequence ratio, which is estimated by the trigram overlap
+            query_words = set(query_lower.split())
+            estimates = {}
+            for candidate_id in bounds:
+                text = self.candidates[candidate_id].lower().strip()
+                rest = _similarity_without_ratio(query_lower, query_words, text)
+                # The sequence ratio is at most 2*min/(m+n)
+                shorter, longer = sorted((query_len, len(text)))
+                if rest + 0.4 * 2 * shorter / (shorter + longer) < min_similarity:
+                    continue
+                
+                if candidate_id in ratio_bounds:
+                    estimates[candidate_id] = rest + ratio_bounds[candidate_id]
+                    continue
+                
+                shared = counts.get(candidate_id, 0)
+                dice = 2 * shared / (len(query_grams) + len(text) + 1)
+                estimates[candidate_id] = rest + 0.4 * dice
+            
+            return sorted(heapq.nlargest(max_candidates, estimates, key=estimates.__getitem__))
+        
+        return sorted(bounds)
+
+
+class MinHashLSH:
+    """
+    Locality-sensitive hashing of token sets with MinHash signatures.
+    
+    Each token set gets ``bands * rows`` MinHash values; sets agreeing on all
+    values of at least one band share a bucket. Two sets with Jaccard
+    similarity J share a bucket with probability ``1 - (1 - J ** rows) ** bands``,
+    so similar sets are found without comparing every pair.
+    """
+    
+    def __init__(self, bands: int = 8, rows: int = 2, seed: int = 1):
+        """
+        Initialize the hash functions.
+        
+        Args:
+            bands: Number of bands; more bands find less similar sets
+            rows: Number of MinHash values per band; more rows make buckets more selective
+            seed: Seed of the hash functions
+        """
+        self.bands = bands
+        self.rows = rows
+        
+        generator = random.Random(seed)
+        self._permutations = [
+            (generator.randrange(1, _MINHASH_PRIME), generator.randrange(0, _MINHASH_PRIME))
+            for _ in range(bands * rows)
+        ]
+        
+        if NUMPY_AVAILABLE:
+            self._multipliers = np.array([a for a, _ in self._permutations], dtype=np.uint64)[:, None]
+            self._offsets = np.array([b for _, b in self._permutations], dtype=np.uint64)[:, None]
+    
+    def signature(self, tokens: Set[str]) -> Optional[List[int]]:
+        """
+        Calculate the MinHash signature of a token set.
+        
+        Args:
+            tokens: Token set
+            
+        Returns:
+            List of ``bands * rows`` MinHash values, or None for an empty set
+        """
+        if not tokens:
+            return None
+        
+        hashes = [zlib.crc32(token.encode("utf-8")) % _MINHASH_PRIME for token in tokens]
+        
+        if NUMPY_AVAILABLE:
+            values = np.array(hashes, dtype=np.uint64)
+            return ((self._multipliers * values + self._offsets) % _MINHASH_PRIME).min(axis=1).tolist()
+        
+        return list(map(min, zip(*[
+            [(a * value + b) % _MINHASH_PRIME for a, b in self._permutations]
+            for value in hashes
+        ])))
+    
+    def buckets(self, token_sets: Sequence[Set[str]]) -> List[List[int]]:
+        """
+        Group token sets into buckets of likely similar sets.
+        
+        Args:
+            token_sets: Token sets to group
+            
+        Returns:
+            Buckets with at least two members, as lists of indexes into ``token_sets``
+        """
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for set_id, tokens in enumerate(token_sets):
+            signature = self.signature(tokens)
+            if signature is None:
+                continue
+            for band in range(self.bands):
+                key = (band, *signature[band * self.rows:(band + 1) * self.rows])
+                buckets.setdefault(key, []).append(set_id)
+        
+        return [members for members in buckets.values() if len(members) > 1]
+
 
 class FuzzyMatcher:
     """
@@ -18,14 +496,26 @@ class FuzzyMatcher:
     and generate suggestions for partial searches.
     """
     
-    def __init__(self, min_similarity: float = 0.3):
+    # Candidate lists at least this long are matched through a FuzzyIndex
+    INDEX_MIN_CANDIDATES = 2000
+    
+    # Number of candidate lists whose index is kept
+    INDEX_CACHE_SIZE = 16
+    
+    def __init__(self, min_similarity: float = 0.3, max_candidates: int = 500):
         """
         Initialize the fuzzy matcher.
         
         Args:
             min_similarity: Minimum similarity score to consider a match (0.0 to 1.0)
+            max_candidates: Maximum number of candidates scored per query when
+                matching against an indexed candidate list
         """
         self.min_similarity = min_similarity
+        self.max_candidates = max_candidates
+        
+        self._indexes: "OrderedDict[int, FuzzyIndex]" = OrderedDict()
+        self._index_lock = threading.Lock()
     
     def calculate_similarity(self, query: str, target: str) -> float:
         """
@@ -47,9 +537,27 @@ class FuzzyMatcher:
         if not query or not target:
             return 0.0
         
-        query_lower = query.lower().strip()
-        target_lower = target.lower().strip()
+        return self._lowered_similarity(query.lower().strip(), target.lower().strip())
+    
+    def _lowered_similarity(
+        self,
+        query_lower: str,
+        target_lower: str,
+        sequence_matcher: Optional[SequenceMatcher] = None
+    ) -> float:
+        """
+        Calculate the similarity of lowercase, stripped strings.
         
+        Args:
+            query_lower: Lowercase, stripped query
+            target_lower: Lowercase, stripped target
+            sequence_matcher: SequenceMatcher reused across comparisons; a
+                sequence that is the same object as in the previous comparison
+                is not prepared again
+            
+        Returns:
+            Similarity score between 0.0 and 1.0
+        """
         # Exact match gets highest score
         if query_lower == target_lower:
             return 1.0
@@ -58,7 +566,11 @@ class FuzzyMatcher:
         scores = []
         
         # 1. Sequence similarity using difflib
-        seq_similarity = SequenceMatcher(None, query_lower, target_lower).ratio()
+        if sequence_matcher is None:
+            seq_similarity = SequenceMatcher(None, query_lower, target_lower).ratio()
+        else:
+            sequence_matcher.set_seqs(query_lower, target_lower)
+            seq_similarity = sequence_matcher.ratio()
         scores.append(seq_similarity * 0.4)  # 40% weight
         
         # 2. Substring matching
@@ -98,13 +610,24 @@ class FuzzyMatcher:
             query: Search query
             candidates: List of candidate strings to search in
             
+        Large candidate lists are indexed on first use (see ``FuzzyIndex``), and
+        only the candidates selected by the index are scored. Their scores are
+        the same as without the index.
+        
         Returns:
             List of tuples (candidate, similarity_score) sorted by score descending
         """
         matches = []
         
-        for candidate in candidates:
-            similarity = self.calculate_similarity(query, candidate)
+        index = self.get_index(candidates)
+        if index is not None:
+            candidates = [
+                candidates[candidate_id]
+                for candidate_id in index.select(query, self.min_similarity, self.max_candidates)
+            ]
+        
+        similarities = self.calculate_similarities(query, candidates, self.min_similarity)
+        for candidate, similarity in zip(candidates, similarities):
             if similarity >= self.min_similarity:
                 matches.append((candidate, similarity))
         
@@ -112,6 +635,155 @@ class FuzzyMatcher:
         matches.sort(key=lambda x: x[1], reverse=True)
         return matches
     
+    def calculate_similarities(
+        self,
+        query: str,
+        candidates: Sequence[str],
+        min_similarity: Optional[float] = None
+    ) -> List[float]:
+        """
+        Calculate the similarity between a query and each of several candidates.
+        
+        Scores are the same as ``calculate_similarity`` returns. With a minimum
+        similarity, candidates whose score bound (see
+        ``similarity_upper_bounds``) is below it are not scored exactly and get
+        0.0 instead.
+        
+        Exact scoring still runs one SequenceMatcher comparison per candidate;
+        only the query is prepared once. It is meant for candidates that have
+        already been filtered, by ``min_similarity`` or by a ``FuzzyIndex``
+        (see ``find_matches``), not for scoring whole catalogs.
+        
+        Args:
+            query: Search query string
+            candidates: Candidate strings
+            min_similarity: Minimum similarity of interest, or None to score every candidate
+            
+        Returns:
+            Similarity scores in candidate order
+        """
+        if not query:
+            return [0.0] * len(candidates)
+        
+        bounds = None
+        if min_similarity is not None:
+            bounds = self.similarity_upper_bounds(query, candidates)
+        
+        # The sequence ratio depends on the order of the strings, so the query stays
+        # the first sequence; one SequenceMatcher is reused and only the candidate
+        # side is prepared for each comparison
+        query_lower = query.lower().strip()
+        sequence_matcher = SequenceMatcher(None, query_lower, "")
+        scores = []
+        for i, candidate in enumerate(candidates):
+            if not candidate or (bounds is not None and bounds[i] + 1e-9 < min_similarity):
+                scores.append(0.0)
+            else:
+                scores.append(self._lowered_similarity(query_lower, candidate.lower().strip(), sequence_matcher))
+        return scores
+    
+    def similarity_upper_bounds(self, query: str, candidates: Sequence[str]) -> List[float]:
+        """
+        Calculate cheap upper bounds of the similarity of a query to candidates.
+        
+        The bounds skip the SequenceMatcher: its ratio is bounded by the
+        characters the strings share (with NumPy, from vectorized character
+        counts) or by their lengths, the other components are computed
+        exactly or bounded by the lengths.
+        
+        Args:
+            query: Search query string
+            candidates: Candidate strings
+            
+        Returns:
+            Upper bounds of the similarity scores in candidate order
+        """
+        if not query:
+            return [0.0] * len(candidates)
+        
+        query_lower = query.lower().strip()
+        targets = [candidate.lower().strip() if candidate else None for candidate in candidates]
+        
+        if NUMPY_AVAILABLE and len(targets) >= 64:
+            return _numpy_upper_bounds(query_lower, targets)
+        
+        query_words = set(query_lower.split())
+        bounds = []
+        for target_lower in targets:
+            if target_lower is None:
+                bounds.append(0.0)
+            elif target_lower == query_lower:
+                bounds.append(1.0)
+            else:
+                # The sequence ratio is at most 2*min/(m+n)
+                shorter, longer = sorted((len(query_lower), len(target_lower)))
+                bounds.append(
+                    _similarity_without_ratio(query_lower, query_words, target_lower)
+                    + 0.4 * 2 * shorter / (shorter + longer)
+                )
+        return bounds
+    
+    def similarity_matrix(self, strings: Sequence[str]) -> List[List[float]]:
+        """
+        Calculate the similarity of every pair of strings.
+        
+        Each column shares one SequenceMatcher whose target is prepared once,
+        instead of preparing the target for every pair. The ratio itself is
+        still computed for every pair, so the matrix is meant for the small
+        groups of strings being compared, not for whole catalogs.
+        
+        Args:
+            strings: Strings to compare
+            
+        Returns:
+            Matrix where ``matrix[i][j]`` is ``calculate_similarity(strings[i], strings[j])``
+        """
+        lowered = [string.lower().strip() if string else None for string in strings]
+        matrix = [[0.0] * len(strings) for _ in strings]
+        
+        for j, target_lower in enumerate(lowered):
+            if target_lower is None:
+                continue
+            
+            sequence_matcher = SequenceMatcher(None, "", target_lower)
+            for i, query_lower in enumerate(lowered):
+                if query_lower is not None:
+                    matrix[i][j] = self._lowered_similarity(query_lower, target_lower, sequence_matcher)
+        
+        return matrix
+    
+    def get_index(self, candidates: List[str]) -> Optional[FuzzyIndex]:
+        """
+        Get the index of a candidate list, building it on first use.
+        
+        Indexes are cached per list object, so candidate lists that are
+        searched repeatedly (such as package catalogs) are indexed once.
+        
+        Args:
+            candidates: List of candidate strings
+            
+        Returns:
+            FuzzyIndex, or None if the list is too short to be worth indexing
+        """
+        if len(candidates) < self.INDEX_MIN_CANDIDATES:
+            return None
+        
+        key = id(candidates)
+        with self._index_lock:
+            index = self._indexes.get(key)
+            if index is not None and index.candidates is candidates and index.size == len(candidates):
+                self._indexes.move_to_end(key)
+                return index
+        
+        index = FuzzyIndex(candidates)
+        
+        with self._index_lock:
+            self._indexes[key] = index
+            while len(self._indexes) > self.INDEX_CACHE_SIZE:
+                self._indexes.popitem(last=False)
+        
+        return index
+    
     def generate_suggestions(self, query: str, candidates: List[str], max_suggestions: int = 5) -> List[str]:
         """
         Generate suggestions for a query based on fuzzy matching.
@@ -5,6 +5,7 @@ This module contains tests for the additional Linux package manager fetchers
 implemented in task 3.8.
 """
 
+import json
 import os
 import pytest
 from unittest.mock import patch, MagicMock
@@ -244,6 +245,32 @@ class TestNixFetcher:
         assert mock_is_nix_available.called is True
         assert mock_fetch_packages.called is True
 
+    @patch('saidata_gen.fetcher.nix.subprocess.run')
+    def test_fetch_package_info_batch(self, mock_run, tmp_path):
+        """Test that package lookups are resolved with one nix search and one nix-env call."""
+        search_output = json.dumps({
+            "legacyPackages.x86_64-linux.hello": {"pname": "hello"},
+            "legacyPackages.x86_64-linux.gnused": {"pname": "sed"}
+        })
+        env_output = json.dumps({
+            "hello": {"name": "hello-2.12", "meta": {"description": "Hello"}},
+            "gnused": {"name": "gnused-4.9", "meta": {"description": "Sed"}}
+        })
+        mock_run.side_effect = [MagicMock(stdout=search_output), MagicMock(stdout=env_output)]
+        
+        fetcher = NixFetcher(FetcherConfig(cache_dir=str(tmp_path)))
+        result = fetcher._package_info_batcher.get_many(["hello", "sed", "missing"])
+        
+        assert result["hello"]["version"] == "2.12"
+        assert result["sed"]["attr_path"] == "gnused"
+        assert result["missing"] is None
+        assert mock_run.call_count == 2
+        assert mock_run.call_args_list[1][0][0] == ["nix-env", "-qa", "--json", "-A", "gnused", "hello"]
+        
+        # Results are cached
+        assert fetcher._fetch_package_info("hello")["description"] == "Hello"
+        assert mock_run.call_count == 2
+
 
 class TestNixpkgsFetcher:
     """Tests for the NixpkgsFetcher class."""
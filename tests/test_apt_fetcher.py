@@ -2,12 +2,18 @@
 Unit tests for the APT fetcher.
 """
 
+import gzip
+import hashlib
 import os
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
 from saidata_gen.core.interfaces import FetcherConfig
 from saidata_gen.fetcher import APTFetcher, APTDistribution
+from saidata_gen.fetcher.base import NotModifiedError
+from saidata_gen.fetcher.deb_utils import parse_release_file
 
 
 class TestAPTFetcher(unittest.TestCase):
@@ -84,9 +90,153 @@ class TestAPTFetcher(unittest.TestCase):
         # Check that the mock was called with the correct arguments
         mock_fetch_packages.assert_called_once_with(
             self.test_dist.url,
-            "main/binary-amd64/Packages.gz"
+            "main/binary-amd64/Packages.gz",
+            cache_key="test_test_main_amd64"
         )
     
+    @patch("saidata_gen.fetcher.apt.APTFetcher._fetch_release_file", return_value={})
+    @patch("saidata_gen.fetcher.apt.APTFetcher._fetch_packages_file")
+    def test_fetch_repository_data_revalidates_expired_cache(self, mock_fetch_packages, mock_fetch_release):
+        """Test that an unchanged Packages file refreshes the expired cache entry."""
+        mock_fetch_packages.return_value = {
+            "test-package": {"Package": "test-package", "Version": "1.0.0"}
+        }
+        self.fetcher.fetch_repository_data()
+        
+        cache_key = "test_test_main_amd64"
+        snapshot_path = self.fetcher._get_snapshot_path(cache_key)
+        expired = os.path.getmtime(snapshot_path) - self.config.cache_ttl - 60
+        os.utime(snapshot_path, (expired, expired))
+        
+        mock_fetch_packages.side_effect = NotModifiedError("Packages.gz", cache_key)
+        result = self.fetcher.fetch_repository_data()
+        
+        self.assertTrue(result.success)
+        self.assertTrue(result.cache_hits[cache_key])
+        self.assertEqual(self.fetcher._package_cache[cache_key]["test-package"]["Version"], "1.0.0")
+        self.assertTrue(self.fetcher._is_cache_valid(snapshot_path))
+        mock_fetch_release.assert_called_once_with(self.test_dist.url)
+    
+    def test_fetch_repository_data_concurrently(self):
+        """Test that the Packages files of several distributions are fetched concurrently."""
+        self.fetcher.distributions = [
+            APTDistribution(
+                name="test",
+                version=version,
+                url=f"https://example.com/{version}",
+                components=["main", "universe"],
+                architectures=["amd64"]
+            )
+            for version in ("one", "two")
+        ]
+        
+        lock = threading.Lock()
+        state = {"active": 0, "max_active": 0}
+        
+        def fetch_packages(base_url, packages_path, cache_key=None):
+            with lock:
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            
+            if base_url.endswith("/two") and packages_path.startswith("universe"):
+                raise ValueError("broken index")
+            name = f"{base_url.rsplit('/', 1)[1]}-{packages_path.split('/')[0]}"
+            return {name: {"Package": name, "Version": "1.0"}}
+        
+        with patch.object(APTFetcher, "_fetch_packages_file", side_effect=fetch_packages):
+            result = self.fetcher.fetch_repository_data()
+        
+        self.assertGreater(state["max_active"], 1)
+        self.assertFalse(result.success)
+        self.assertIn("broken index", result.errors["test_two_universe_amd64"])
+        self.assertEqual(
+            list(self.fetcher._package_cache),
+            ["test_one_main_amd64", "test_one_universe_amd64", "test_two_main_amd64"]
+        )
+        self.assertIsNotNone(self.fetcher.get_package_info("two-main"))
+    
+    def _release_data(self, packages, extra=""):
+        """Build parsed Release data listing the checksums of a Packages file."""
+        compressed = gzip.compress(packages)
+        release_text = (
+            "Acquire-By-Hash: yes\n"
+            "SHA256:\n"
+            f" {hashlib.sha256(packages).hexdigest()} {len(packages)} main/binary-amd64/Packages\n"
+            f" {hashlib.sha256(compressed).hexdigest()} {len(compressed)} main/binary-amd64/Packages.gz\n"
+            + extra
+        )
+        return parse_release_file(release_text), compressed
+    
+    @patch("saidata_gen.fetcher.apt.APTFetcher._fetch_url")
+    def test_fetch_packages_index_skips_unchanged_checksum(self, mock_fetch_url):
+        """Test that an index listed with the cached checksum is not downloaded again."""
+        packages = b"Package: test-package\nVersion: 1.0.0\n"
+        release_data, compressed = self._release_data(packages)
+        mock_fetch_url.return_value = MagicMock(content=compressed)
+        cache_key = "test_test_main_amd64"
+        
+        packages_data = self.fetcher._fetch_packages_index(
+            self.test_dist.url, "main", "amd64", cache_key, release_data
+        )
+        self.fetcher._save_to_cache(cache_key, packages_data, snapshot=True)
+        
+        # The full download used the by-hash path of Packages.gz
+        by_hash = hashlib.sha256(compressed).hexdigest()
+        mock_fetch_url.assert_called_once_with(
+            f"{self.test_dist.url}/main/binary-amd64/by-hash/SHA256/{by_hash}"
+        )
+        
+        with self.assertRaises(NotModifiedError):
+            self.fetcher._fetch_packages_index(self.test_dist.url, "main", "amd64", cache_key, release_data)
+        self.assertEqual(mock_fetch_url.call_count, 1)
+    
+    @patch("saidata_gen.fetcher.apt.APTFetcher._fetch_url")
+    def test_fetch_packages_index_applies_pdiffs(self, mock_fetch_url):
+        """Test updating a changed index with pdiffs instead of a full download."""
+        old_packages = b"Package: a\nVersion: 1.0\n\nPackage: b\nVersion: 2.0\n"
+        new_packages = b"Package: a\nVersion: 1.1\n\nPackage: b\nVersion: 2.0\n"
+        patch_content = b"2c\nVersion: 1.1\n.\n"
+        patch_gz = gzip.compress(patch_content)
+        cache_key = "test_test_main_amd64"
+        
+        index_text = (
+            f"SHA256-Current: {hashlib.sha256(new_packages).hexdigest()} {len(new_packages)}\n"
+            "SHA256-History:\n"
+            f" {hashlib.sha256(old_packages).hexdigest()} {len(old_packages)} T-1\n"
+            "SHA256-Patches:\n"
+            f" {hashlib.sha256(patch_content).hexdigest()} {len(patch_content)} T-1\n"
+            "SHA256-Download:\n"
+            f" {hashlib.sha256(patch_gz).hexdigest()} {len(patch_gz)} T-1.gz\n"
+            "X-Patch-Precedence: merged\n"
+        )
+        release_data, _ = self._release_data(
+            new_packages, extra=" 0123 100 main/binary-amd64/Packages.diff/Index\n"
+        )
+        
+        # The cache entry and the kept Packages file are from the old index
+        self.fetcher._save_to_cache(cache_key, {"a": {"Package": "a", "Version": "1.0"}}, snapshot=True)
+        with open(self.fetcher._get_raw_packages_path(cache_key), "wb") as f:
+            f.write(gzip.compress(old_packages))
+        
+        responses = {
+            f"{self.test_dist.url}/main/binary-amd64/Packages.diff/Index": MagicMock(text=index_text),
+            f"{self.test_dist.url}/main/binary-amd64/Packages.diff/T-1.gz": MagicMock(content=patch_gz),
+        }
+        mock_fetch_url.side_effect = lambda url, **kwargs: responses[url]
+        
+        packages_data = self.fetcher._fetch_packages_index(
+            self.test_dist.url, "main", "amd64", cache_key, release_data
+        )
+        
+        self.assertEqual(packages_data["a"]["Version"], "1.1")
+        self.assertEqual(packages_data["b"]["Version"], "2.0")
+        self.assertEqual(mock_fetch_url.call_count, 2)
+        with gzip.open(self.fetcher._get_raw_packages_path(cache_key), "rb") as f:
+            self.assertEqual(f.read(), new_packages)
+    
     @patch("saidata_gen.fetcher.apt.APTFetcher._fetch_packages_file")
     def test_get_package_info(self, mock_fetch_packages):
         """Test getting package information."""
@@ -140,6 +290,30 @@ class TestAPTFetcher(unittest.TestCase):
         self.assertEqual(results[0].name, "test-package")
         self.assertEqual(results[1].name, "another-package")
     
+    @patch("saidata_gen.fetcher.apt.APTFetcher._fetch_packages_file")
+    def test_search_packages_uses_index(self, mock_fetch_packages):
+        """Test that fetching repository data builds the package index."""
+        mock_fetch_packages.return_value = {
+            "nginx": {"Package": "nginx", "Version": "1.22", "Description": "Web server"},
+            "apache2": {"Package": "apache2", "Version": "2.4", "Description": "Apache HTTP web server"},
+        }
+        
+        self.fetcher.fetch_repository_data()
+        index = self.fetcher._package_index
+        self.assertIsNotNone(index)
+        self.assertEqual(len(index), 2)
+        
+        results = self.fetcher.search_packages("web serv")
+        self.assertEqual([r.name for r in results], ["nginx", "apache2"])
+        self.assertIs(self.fetcher._package_index, index)
+        
+        # Changes to the package cache are picked up by rebuilding the index
+        self.fetcher._package_cache["test_test_main_amd64"] = {
+            "lighttpd": {"Package": "lighttpd", "Version": "1.4", "Description": "Light web server"}
+        }
+        self.assertEqual(self.fetcher.get_package_info("lighttpd").version, "1.4")
+        self.assertIsNone(self.fetcher.get_package_info("nginx"))
+    
     @patch("saidata_gen.fetcher.apt.APTFetcher._fetch_packages_file")
     def test_get_package_details(self, mock_fetch_packages):
         """Test getting detailed package information."""
@@ -179,6 +353,28 @@ class TestAPTFetcher(unittest.TestCase):
         self.assertEqual(details.dependencies[0], "lib1")
         self.assertEqual(details.dependencies[1], "lib2")
     
+    @patch("saidata_gen.fetcher.apt.APTFetcher._fetch_url")
+    def test_fetch_packages_file_streams_gzip(self, mock_fetch_url):
+        """Test parsing a gzipped Packages file with a field whitelist."""
+        packages_text = """Package: test-package
+Version: 1.0.0
+Maintainer: Test Maintainer <test@example.com>
+Description: Test package description
+ This is a multiline description
+"""
+        mock_fetch_url.return_value = MagicMock(content=gzip.compress(packages_text.encode("utf-8")))
+        self.fetcher.package_fields = ["Version", "Description"]
+        
+        result = self.fetcher._fetch_packages_file("https://example.com/test", "main/binary-amd64/Packages.gz")
+        
+        self.assertEqual(result, {
+            "test-package": {
+                "Package": "test-package",
+                "Version": "1.0.0",
+                "Description": "Test package description\\nThis is a multiline description"
+            }
+        })
+    
     def test_parse_packages_file(self):
         """Test parsing a Packages file."""
         # Sample Packages file content
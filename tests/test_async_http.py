@@ -0,0 +1,188 @@
+"""
+Tests for the asynchronous HTTP fetch engine.
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from saidata_gen.core.interfaces import FetcherConfig
+from saidata_gen.fetcher.async_http import AsyncFetchEngine, get_async_fetch_engine
+from saidata_gen.fetcher.pypi import PyPIFetcher
+
+
+class _StubRegistryHandler(BaseHTTPRequestHandler):
+    """Serves JSON documents for /<name>/json and tracks concurrent requests."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        
+        try:
+            time.sleep(server.delay)
+            name = self.path.strip("/").split("/")[0]
+            if name.startswith("flaky") and self.path not in server.failed:
+                # Fails once with a server error
+                with server.lock:
+                    server.failed.add(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            
+            if name.startswith("missing"):
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            
+            body = json.dumps({"info": {"name": name, "version": "1.0", "summary": f"{name} summary"}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubRegistryServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def __init__(self, delay=0.0):
+        super().__init__(("127.0.0.1", 0), _StubRegistryHandler)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.requests = []
+        self.failed = set()
+        self.active = 0
+        self.max_active = 0
+    
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class TestAsyncFetchEngine(unittest.TestCase):
+    """
+    Test cases for the async fetch engine against a local stub server.
+    """
+    
+    def _start_server(self, delay=0.0):
+        server = _StubRegistryServer(delay=delay)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+    
+    def _engine(self, **kwargs):
+        engine = AsyncFetchEngine(**kwargs)
+        self.addCleanup(engine.close)
+        return engine
+    
+    def test_fetch_json_batch(self):
+        """Test that a batch returns parsed JSON per URL and exceptions for failures."""
+        server = self._start_server()
+        engine = self._engine(max_connections_per_host=4, timeout=5)
+        
+        urls = [f"{server.url}/pkg{i}/json" for i in range(200)] + [f"{server.url}/missing/json"]
+        results = engine.fetch_json_batch(urls + urls[:10])
+        
+        self.assertEqual(len(results), 201)
+        self.assertEqual(results[f"{server.url}/pkg7/json"]["info"]["name"], "pkg7")
+        self.assertIsInstance(results[f"{server.url}/missing/json"], Exception)
+        # Duplicate URLs are only requested once
+        self.assertEqual(len(server.requests), 201)
+    
+    def test_per_host_concurrency_limit(self):
+        """Test that concurrent requests to a host never exceed the per-host limit."""
+        server = self._start_server(delay=0.02)
+        engine = self._engine(max_connections_per_host=3, timeout=5)
+        
+        results = engine.fetch_json_batch(f"{server.url}/pkg{i}/json" for i in range(30))
+        
+        self.assertEqual(len(results), 30)
+        self.assertLessEqual(server.max_active, 3)
+        self.assertGreater(server.max_active, 1)
+    
+    def test_close_and_restart(self):
+        """Test that a closed engine starts again on the next batch."""
+        server = self._start_server()
+        engine = self._engine(timeout=5)
+        
+        self.assertEqual(engine.fetch_json_batch([]), {})
+        engine.fetch_json_batch([f"{server.url}/a/json"])
+        engine.close()
+        results = engine.fetch_json_batch([f"{server.url}/b/json"])
+        
+        self.assertEqual(results[f"{server.url}/b/json"]["info"]["name"], "b")
+    
+    def test_get_async_fetch_engine_is_shared(self):
+        """Test that engines are shared per connection settings."""
+        self.assertIs(get_async_fetch_engine(5, 30), get_async_fetch_engine(5, 30))
+        self.assertIsNot(get_async_fetch_engine(5, 30), get_async_fetch_engine(6, 30))
+
+
+class TestFetcherBatchLookups(unittest.TestCase):
+    """
+    Test cases for batched registry detail lookups.
+    """
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.server = _StubRegistryServer()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        
+        self.fetcher = PyPIFetcher(config=FetcherConfig(cache_dir=self.cache_dir))
+        self.fetcher.base_url = self.server.url
+    
+    def test_fetch_package_details_batch(self):
+        """Test fetching package details in one batch and serving repeats from the cache."""
+        names = [f"pkg{i}" for i in range(50)] + ["missing-pkg"]
+        
+        packages = self.fetcher._fetch_package_details_batch(names, "pypi")
+        
+        self.assertEqual(len(packages), 50)
+        self.assertEqual(packages["pkg3"]["summary"], "pkg3 summary")
+        self.assertEqual(packages["pkg3"]["repository"], "pypi")
+        self.assertNotIn("missing-pkg", packages)
+        
+        request_count = len(self.server.requests)
+        packages = self.fetcher._fetch_package_details_batch(["pkg1", "pkg2"], "pypi")
+        
+        self.assertEqual(set(packages), {"pkg1", "pkg2"})
+        self.assertEqual(len(self.server.requests), request_count)
+    
+    def test_fetch_package_details_batch_retries_server_errors(self):
+        """Test that lookups failing with server errors are retried and client errors are not."""
+        names = [f"flaky{i}" for i in range(5)] + ["pkg1", "missing-pkg"]
+        
+        packages = self.fetcher._fetch_package_details_batch(names, "pypi")
+        
+        self.assertEqual(set(packages), {f"flaky{i}" for i in range(5)} | {"pkg1"})
+        self.assertEqual(self.server.requests.count("/flaky0/json"), 2)
+        self.assertEqual(self.server.requests.count("/missing-pkg/json"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
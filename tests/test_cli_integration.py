@@ -247,7 +247,7 @@ class TestSearchCommand:
             SoftwareMatch(name='nginx', provider='apt', version='1.18.0', description='Web server', score=0.95),
             SoftwareMatch(name='nginx', provider='brew', version='1.19.0', description='HTTP server', score=0.90),
         ]
-        mock_engine.search_software.return_value = mock_matches
+        mock_engine.iter_search_software.return_value = iter([mock_matches])
         
         result = runner.invoke(cli, ['search', 'nginx'])
         
@@ -256,23 +256,24 @@ class TestSearchCommand:
         assert 'nginx' in result.output
         assert 'apt' in result.output
         assert 'brew' in result.output
-        mock_engine.search_software.assert_called_once_with('nginx')
+        mock_engine.iter_search_software.assert_called_once_with('nginx', max_results=20, providers=None)
     
     def test_search_with_providers(self, runner, mock_engine):
         """Test search command with specific providers."""
         mock_matches = [
             SoftwareMatch(name='nginx', provider='apt', version='1.18.0', description='Web server', score=0.95),
         ]
-        mock_engine.search_software.return_value = mock_matches
+        mock_engine.iter_search_software.return_value = iter([mock_matches])
         
         result = runner.invoke(cli, ['search', 'nginx', '--providers', 'apt,brew'])
         
         assert result.exit_code == 0
         assert 'nginx' in result.output
+        mock_engine.iter_search_software.assert_called_once_with('nginx', max_results=20, providers=['apt', 'brew'])
     
     def test_search_no_results(self, runner, mock_engine):
         """Test search command with no results."""
-        mock_engine.search_software.return_value = []
+        mock_engine.iter_search_software.return_value = iter([[]])
         
         result = runner.invoke(cli, ['search', 'nonexistent'])
         
@@ -285,7 +286,7 @@ class TestSearchCommand:
             SoftwareMatch(name=f'package{i}', provider='apt', score=0.8 - i*0.1) 
             for i in range(25)
         ]
-        mock_engine.search_software.return_value = mock_matches
+        mock_engine.iter_search_software.return_value = iter([mock_matches])
         
         result = runner.invoke(cli, ['search', 'package', '--limit', '5', '--min-score', '0.7'])
         
@@ -294,6 +295,17 @@ class TestSearchCommand:
         assert 'package0' in result.output
         assert 'package1' in result.output
         assert 'package2' not in result.output  # score would be 0.6
+    
+    def test_search_incremental_results(self, runner, mock_engine):
+        """Test that the search command shows the last provisional results."""
+        first = [SoftwareMatch(name='nginx', provider='apt', score=0.95)]
+        second = first + [SoftwareMatch(name='nginx-full', provider='brew', score=0.85)]
+        mock_engine.iter_search_software.return_value = iter([first, second])
+        
+        result = runner.invoke(cli, ['search', 'nginx'])
+        
+        assert result.exit_code == 0
+        assert 'nginx-full' in result.output
 
 
 class TestBatchCommand:
@@ -452,6 +464,42 @@ class TestFetchCommand:
         
         assert result.exit_code == 1
         assert '❌ Failed' in result.output
+    
+    def test_fetch_equivalence_map(self, runner, monkeypatch):
+        """Test that fetch --equivalence-map fetches and builds the map with a real engine."""
+        def make_fetcher(provider, names):
+            fetcher = Mock()
+            fetcher.fetch_repository_data.return_value = FetchResult(
+                success=True, providers={"main": True}, cache_hits={"main": True}
+            )
+            fetcher.iter_package_summaries.side_effect = lambda: iter(
+                [(name, "Web server", "https://nginx.org") for name in names]
+            )
+            fetcher.get_index_version.return_value = ((provider, 1),)
+            return fetcher
+        
+        fetchers = {
+            "apt": make_fetcher("apt", ["nginx", "curl"]),
+            "winget": make_fetcher("winget", ["nginx.nginx"]),
+        }
+        
+        with tempfile.TemporaryDirectory() as home:
+            monkeypatch.setenv("HOME", home)
+            with patch('saidata_gen.core.engine.fetcher_factory') as mock_factory:
+                mock_factory.get_fetcher.side_effect = lambda provider, config: fetchers[provider]
+                result = runner.invoke(cli, ['fetch', '--providers', 'apt,winget', '--equivalence-map'])
+            
+            map_exists = os.path.exists(os.path.join(home, ".saidata-gen", "cache", "equivalence.json"))
+        
+        assert result.exit_code == 0, result.output
+        assert '✅ Success' in result.output
+        assert '(cached)' in result.output
+        assert 'Package equivalence map:' in result.output
+        assert 'across 2 providers' in result.output
+        assert map_exists
+        for fetcher in fetchers.values():
+            fetcher.fetch_repository_data.assert_called_once_with()
+            fetcher.iter_package_summaries.assert_called_once_with()
 
 
 class TestGlobalOptions:
@@ -0,0 +1,111 @@
+"""
+Tests for batched command execution.
+"""
+
+import threading
+import unittest
+
+from saidata_gen.fetcher.command_batch import CommandBatcher
+
+
+class TestCommandBatcher(unittest.TestCase):
+    """
+    Test cases for CommandBatcher.
+    """
+    
+    def setUp(self):
+        self.batches = []
+        self.fail_keys = set()
+    
+    def run_batch(self, keys):
+        self.batches.append(list(keys))
+        if self.fail_keys.intersection(keys):
+            raise RuntimeError("command failed")
+        return {key: key.upper() for key in keys if not key.startswith("missing")}
+    
+    def test_get_many_chunks_batches(self):
+        """Test that lookups run one command per batch of keys."""
+        batcher = CommandBatcher(self.run_batch, batch_size=2, linger=0)
+        
+        result = batcher.get_many(["a", "b", "c", "missing"])
+        
+        self.assertEqual(result, {"a": "A", "b": "B", "c": "C", "missing": None})
+        self.assertEqual(self.batches, [["a", "b"], ["c", "missing"]])
+        
+        # Results, including missing keys, are not looked up again
+        self.assertEqual(batcher.get("a"), "A")
+        self.assertIsNone(batcher.get("missing"))
+        self.assertEqual(len(self.batches), 2)
+    
+    def test_concurrent_lookups_share_batch(self):
+        """Test that lookups from several threads are resolved together."""
+        batcher = CommandBatcher(self.run_batch, linger=0.2)
+        results = {}
+        
+        def lookup(key):
+            results[key] = batcher.get(key)
+        
+        threads = [threading.Thread(target=lookup, args=(key,)) for key in ("a", "b", "c", "d")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results, {"a": "A", "b": "B", "c": "C", "d": "D"})
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(sorted(self.batches[0]), ["a", "b", "c", "d"])
+    
+    def test_failed_batch_is_split(self):
+        """Test that a failing key is isolated and not cached."""
+        self.fail_keys = {"c"}
+        batcher = CommandBatcher(self.run_batch, linger=0)
+        
+        result = batcher.get_many(["a", "b", "c", "d"])
+        
+        self.assertEqual(result, {"a": "A", "b": "B", "c": None, "d": "D"})
+        self.assertIn(["c"], self.batches)
+        self.assertEqual(batcher.commands_run, len(self.batches))
+        
+        # Failures are looked up again
+        self.fail_keys = set()
+        self.assertEqual(batcher.get("c"), "C")
+        self.assertEqual(self.batches[-1], ["c"])
+    
+    def test_cached_results(self):
+        """Test restoring and saving results."""
+        saved = []
+        batcher = CommandBatcher(
+            self.run_batch,
+            linger=0,
+            cached_results={"a": "cached"},
+            save_results=saved.append
+        )
+        
+        self.assertEqual(batcher.get_many(["a", "b"]), {"a": "cached", "b": "B"})
+        self.assertEqual(self.batches, [["b"]])
+        self.assertEqual(saved, [{"a": "cached", "b": "B"}])
+    
+    def test_saves_are_amortized(self):
+        """Test that single lookups do not rewrite the saved results every time."""
+        saved = []
+        batcher = CommandBatcher(self.run_batch, linger=0, save_results=saved.append)
+        
+        keys = [f"key{i}" for i in range(200)]
+        for key in keys:
+            batcher.get(key)
+        
+        self.assertEqual(len(self.batches), 200)
+        self.assertLess(len(saved), 30)
+        self.assertLess(sum(len(results) for results in saved), 5 * len(keys))
+        
+        batcher.flush()
+        self.assertEqual(set(saved[-1]), set(keys))
+        
+        # Nothing is rewritten without new results
+        saves = len(saved)
+        batcher.flush()
+        self.assertEqual(len(saved), saves)
+
+
+if __name__ == "__main__":
+    unittest.main()
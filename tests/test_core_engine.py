@@ -4,15 +4,18 @@ Unit tests for the core engine.
 
 import os
 import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
 from saidata_gen.core.engine import SaidataEngine
 from saidata_gen.core.interfaces import (
     GenerationOptions, BatchOptions, ValidationResult, 
-    MetadataResult, BatchResult, SoftwareMatch
+    MetadataResult, BatchResult, SoftwareMatch, PackageInfo, FetchResult
 )
 from saidata_gen.core.models import EnhancedSaidataMetadata
+from saidata_gen.search.equivalence import EquivalenceMap
 from tests.fixtures.sample_data import SAMPLE_SAIDATA_METADATA, EXPECTED_NGINX_METADATA
 
 
@@ -250,6 +253,246 @@ class TestSaidataEngine(unittest.TestCase):
         self.assertEqual(result.successful, 1)
         self.assertEqual(result.failed, 1)
     
+    def test_batch_process_runs_concurrently(self):
+        """Test that batch processing fans packages out over max_concurrent workers."""
+        software_list = [f"package-{i}" for i in range(8)]
+        active = []
+        peak = []
+        lock = threading.Lock()
+        
+        def mock_generate(software, options):
+            with lock:
+                active.append(software)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(software)
+            return MetadataResult(success=True, software_name=software)
+        
+        progress = []
+        with patch.object(self.engine, 'generate_metadata', side_effect=mock_generate):
+            options = BatchOptions(output_dir=self.temp_dir, providers=["apt"], max_concurrent=3)
+            result = self.engine.batch_process(software_list, options, progress_callback=progress.append)
+        
+        self.assertEqual(result.successful, 8)
+        self.assertEqual(list(result.results.keys()), software_list)
+        self.assertEqual(max(peak), 3)
+        self.assertEqual(sorted(item.software_name for item in progress), sorted(software_list))
+    
+    def test_batch_process_fail_fast_stops_scheduling(self):
+        """Test that fail-fast mode stops submitting packages after a failure."""
+        software_list = [f"package-{i}" for i in range(20)]
+        
+        def mock_generate(software, options):
+            if software == "package-0":
+                raise RuntimeError("boom")
+            time.sleep(0.01)
+            return MetadataResult(success=True, software_name=software)
+        
+        with patch.object(self.engine, 'generate_metadata', side_effect=mock_generate):
+            options = BatchOptions(
+                output_dir=self.temp_dir,
+                providers=["apt"],
+                max_concurrent=1,
+                continue_on_error=False
+            )
+            result = self.engine.batch_process(software_list, options)
+        
+        self.assertEqual(result.failed, 1)
+        self.assertLess(result.total_processed, len(software_list))
+        self.assertEqual(result.summary["skipped"], len(software_list) - result.total_processed)
+        self.assertIn("package-0", result.errors[0])
+    
+    def test_iter_batch_process_streams_results(self):
+        """Test that iter_batch_process yields results as packages complete."""
+        def mock_generate(software, options):
+            if software == "slow":
+                time.sleep(0.2)
+            return MetadataResult(success=True, software_name=software)
+        
+        with patch.object(self.engine, 'generate_metadata', side_effect=mock_generate):
+            options = BatchOptions(output_dir=self.temp_dir, providers=["apt"], max_concurrent=2)
+            items = list(self.engine.iter_batch_process(["slow", "fast"], options))
+        
+        self.assertEqual([item.software_name for item in items], ["fast", "slow"])
+        self.assertTrue(all(item.success for item in items))
+    
+    def _make_provider_fetcher(self, provider, delay):
+        """Create a fake fetcher that answers after a delay."""
+        fetcher = Mock()
+        
+        def search_packages(query, max_results=10):
+            time.sleep(delay)
+            return [PackageInfo(name=query, provider=provider, version="1.0")]
+        
+        fetcher.search_packages.side_effect = search_packages
+        return fetcher
+    
+    def test_collect_package_sources_queries_providers_concurrently(self):
+        """Test that provider lookups run concurrently rather than one after another."""
+        fetchers = {
+            provider: self._make_provider_fetcher(provider, 0.2)
+            for provider in ["apt", "brew", "dnf"]
+        }
+        
+        with patch("saidata_gen.core.engine.fetcher_factory") as mock_factory:
+            mock_factory.get_fetcher.side_effect = lambda provider, config: fetchers[provider]
+            start = time.monotonic()
+            sources = self.engine._collect_package_sources(
+                "nginx", ["apt", "brew", "dnf"], GenerationOptions()
+            )
+            elapsed = time.monotonic() - start
+        
+        self.assertEqual([source.provider for source in sources], ["apt", "brew", "dnf"])
+        self.assertLess(elapsed, 0.5)
+        for fetcher in fetchers.values():
+            fetcher.warm_up.assert_called_once()
+    
+    def test_collect_package_sources_provider_deadline(self):
+        """Test that a provider missing its deadline is skipped and recorded as degraded."""
+        fetchers = {
+            "apt": self._make_provider_fetcher("apt", 0.0),
+            "docker": self._make_provider_fetcher("docker", 1.0),
+        }
+        options = GenerationOptions(provider_timeout=5.0, provider_timeouts={"docker": 0.1})
+        
+        with patch("saidata_gen.core.engine.fetcher_factory") as mock_factory:
+            mock_factory.get_fetcher.side_effect = lambda provider, config: fetchers[provider]
+            start = time.monotonic()
+            sources = self.engine._collect_package_sources("nginx", ["apt", "docker"], options)
+            elapsed = time.monotonic() - start
+        
+        self.assertEqual([source.provider for source in sources], ["apt"])
+        self.assertLess(elapsed, 0.8)
+        
+        status = self.engine.degradation_manager.get_provider_status("docker")
+        self.assertEqual(status["recent_failures"], 1)
+        self.assertEqual(status["last_failure"]["error_type"], "timeout")
+        self.assertTrue(self.engine.degradation_manager.is_provider_available("apt"))
+    
+    def test_collect_package_sources_deadline_excludes_warm_up(self):
+        """Test that loading repository data does not count against the provider deadline."""
+        fetchers = {
+            "apt": self._make_provider_fetcher("apt", 0.0),
+            "docker": self._make_provider_fetcher("docker", 0.0),
+        }
+        fetchers["docker"].warm_up.side_effect = lambda: time.sleep(0.3)
+        options = GenerationOptions(provider_timeout=5.0, provider_timeouts={"docker": 0.1})
+        
+        with patch("saidata_gen.core.engine.fetcher_factory") as mock_factory:
+            mock_factory.get_fetcher.side_effect = lambda provider, config: fetchers[provider]
+            sources = self.engine._collect_package_sources("nginx", ["apt", "docker"], options)
+        
+        self.assertEqual([source.provider for source in sources], ["apt", "docker"])
+        self.assertEqual(self.engine.degradation_manager.get_provider_status("docker")["recent_failures"], 0)
+        self.assertEqual(self.engine._count_abandoned_lookups("docker"), 0)
+    
+    def test_collect_package_sources_caps_abandoned_lookups(self):
+        """Test that a provider whose lookups keep hanging stops being queried."""
+        release = threading.Event()
+        
+        def hanging_search(query, max_results=10):
+            release.wait(5)
+            return []
+        
+        fetcher = Mock()
+        fetcher.search_packages.side_effect = hanging_search
+        options = GenerationOptions(provider_timeout=0.1)
+        
+        try:
+            with patch("saidata_gen.core.engine.fetcher_factory") as mock_factory, \
+                    patch.object(self.engine, "_is_provider_usable", return_value=True):
+                mock_factory.get_fetcher.return_value = fetcher
+                for software in ["nginx", "apache", "caddy"]:
+                    self.engine._collect_package_sources(software, ["docker"], options)
+        finally:
+            release.set()
+        
+        self.assertEqual(fetcher.search_packages.call_count, self.engine.max_abandoned_lookups)
+    
+    def test_collect_package_sources_skips_unavailable_provider(self):
+        """Test that providers marked unavailable are not queried."""
+        fetcher = self._make_provider_fetcher("apt", 0.0)
+        self.engine.degradation_manager.mark_provider_unavailable("apt", "down", permanent=True)
+        
+        with patch("saidata_gen.core.engine.fetcher_factory") as mock_factory:
+            mock_factory.get_fetcher.return_value = fetcher
+            sources = self.engine._collect_package_sources("nginx", ["apt"], GenerationOptions())
+        
+        fetcher.search_packages.assert_not_called()
+        self.assertEqual(sources[0].provider, "default")
+    
+    def test_collect_package_sources_uses_equivalence_map(self):
+        """Test that package names from the equivalence map are looked up instead of searched."""
+        fetchers = {
+            provider: self._make_provider_fetcher(provider, 0.0)
+            for provider in ["apt", "winget", "npm", "pypi"]
+        }
+        fetchers["winget"].get_package_info.return_value = PackageInfo(
+            name="nginx.nginx", provider="winget", version="1.25"
+        )
+        fetchers["apt"].get_package_info.return_value = None
+        
+        for provider, fetcher in fetchers.items():
+            fetcher.get_index_version.return_value = ((provider, 1, 1),)
+        
+        self.engine.equivalence_map = EquivalenceMap(self.temp_dir)
+        self.engine.equivalence_map.build({
+            "apt": [("nginx", None, None)],
+            "winget": [("nginx.nginx", None, None)],
+            "npm": [("express", None, None)],
+        }, {provider: fetchers[provider].get_index_version() for provider in ["apt", "winget", "npm"]})
+        
+        with patch("saidata_gen.core.engine.fetcher_factory") as mock_factory:
+            mock_factory.get_fetcher.side_effect = lambda provider, config: fetchers[provider]
+            sources = self.engine._collect_package_sources(
+                "nginx", ["apt", "winget", "npm", "pypi"], GenerationOptions()
+            )
+        
+        self.assertEqual([source.provider for source in sources], ["apt", "winget", "npm", "pypi"])
+        self.assertEqual(sources[1].name, "nginx.nginx")
+        fetchers["winget"].search_packages.assert_not_called()
+        # Stale map entries fall back to a search
+        fetchers["apt"].get_package_info.assert_called_once_with("nginx")
+        fetchers["apt"].search_packages.assert_called_once()
+        # Providers without a recorded package are searched
+        fetchers["npm"].get_package_info.assert_not_called()
+        fetchers["npm"].search_packages.assert_called_once()
+        fetchers["pypi"].search_packages.assert_called_once()
+    
+    def test_collect_package_sources_rebuilds_stale_equivalence_map(self):
+        """Test that a stale equivalence map is served and rebuilt in the background."""
+        fetchers = {provider: self._make_provider_fetcher(provider, 0.0) for provider in ["apt", "winget"]}
+        fetchers["apt"].get_index_version.return_value = (("apt", 1, 1),)
+        fetchers["winget"].get_index_version.return_value = (("winget", 1, 1),)
+        fetchers["apt"].iter_package_summaries.side_effect = lambda: iter([("nginx", None, None)])
+        fetchers["winget"].iter_package_summaries.side_effect = lambda: iter([("nginx.nginx", None, None)])
+        fetchers["winget"].get_package_info.return_value = None
+        
+        self.engine.equivalence_map = EquivalenceMap(self.temp_dir)
+        self.engine.equivalence_map.build(
+            {"apt": [("nginx", None, None)], "winget": [("NGINX.nginx", None, None)]},
+            {"apt": (("apt", 1, 1),), "winget": (("winget", 1, 0),)}
+        )
+        
+        with patch("saidata_gen.core.engine.fetcher_factory") as mock_factory:
+            mock_factory.get_fetcher.side_effect = lambda provider, config: fetchers[provider]
+            self.engine._collect_package_sources("nginx", ["apt", "winget"], GenerationOptions())
+            
+            # The lookup used the stale map and fell back to a search
+            fetchers["winget"].get_package_info.assert_called_once_with("NGINX.nginx")
+            fetchers["winget"].search_packages.assert_called_once()
+            
+            self.engine._equivalence_rebuild.join(5)
+            self.assertEqual(self.engine.equivalence_map.resolve("nginx")["winget"], "nginx.nginx")
+            self.assertTrue(self.engine.equivalence_map.is_current({"winget": (("winget", 1, 1),)}))
+            
+            # A current map is not rebuilt again
+            self.engine._collect_package_sources("nginx", ["apt", "winget"], GenerationOptions())
+            fetchers["winget"].get_package_info.assert_called_with("nginx.nginx")
+        
+        self.assertEqual(fetchers["winget"].iter_package_summaries.call_count, 1)
+    
     def test_search_software(self):
         """Test software search functionality."""
         mock_matches = [
@@ -279,18 +522,24 @@ class TestSaidataEngine(unittest.TestCase):
     
     def test_fetch_repository_data(self):
         """Test repository data fetching."""
-        providers = ["apt", "brew"]
-        mock_fetch_result = {
-            "apt": {"status": "success", "packages_count": 1000},
-            "brew": {"status": "success", "packages_count": 500}
-        }
-        self.mock_fetcher.fetch_repositories.return_value = mock_fetch_result
+        fetchers = {"apt": Mock(), "brew": Mock(), "dnf": Mock()}
+        fetchers["apt"].fetch_repository_data.return_value = FetchResult(
+            success=True, providers={"main": True}, cache_hits={"main": True}
+        )
+        fetchers["brew"].fetch_repository_data.return_value = FetchResult(
+            success=False, providers={"formula": False}, errors={"formula": "timeout"}
+        )
+        fetchers["dnf"].fetch_repository_data.side_effect = RuntimeError("unreachable")
         
-        result = self.engine.fetch_repository_data(providers)
+        with patch("saidata_gen.core.engine.fetcher_factory") as mock_factory:
+            mock_factory.get_fetcher.side_effect = lambda provider, config: fetchers[provider]
+            result = self.engine.fetch_repository_data(["apt", "brew", "dnf"])
         
-        self.assertEqual(result["apt"]["status"], "success")
-        self.assertEqual(result["brew"]["status"], "success")
-        self.mock_fetcher.fetch_repositories.assert_called_once_with(providers)
+        self.assertIsInstance(result, FetchResult)
+        self.assertFalse(result.success)
+        self.assertEqual(result.providers, {"apt": True, "brew": False, "dnf": False})
+        self.assertTrue(result.cache_hits["apt"])
+        self.assertEqual(result.errors, {"brew": "formula: timeout", "dnf": "unreachable"})
     
     def test_get_supported_providers(self):
         """Test getting supported providers."""
@@ -0,0 +1,142 @@
+"""
+Unit tests for the Debian index utilities module.
+"""
+
+import gzip
+import unittest
+
+from saidata_gen.fetcher.deb_utils import (
+    apply_ed_patch, iter_control_stanzas, iter_lines, iter_stanzas, parse_control_index,
+    parse_pdiff_index, parse_release_file
+)
+
+
+PACKAGES_TEXT = """Package: nginx
+Version: 1.22.1
+Depends: libc6 (>= 2.34), libssl3
+Description: small, powerful, scalable web/proxy server
+ Nginx ("engine X") is a high-performance web and reverse proxy server.
+ .
+ This package provides the nginx binary.
+
+Package: curl
+Version: 7.88.1
+Description: command line tool for transferring data with URL syntax
+
+Version: 0.1
+Description: stanza without a package name
+"""
+
+
+class TestDebUtils(unittest.TestCase):
+    """
+    Test cases for the Debian index utilities module.
+    """
+    
+    def test_iter_lines_gzip(self):
+        """Test streaming lines from gzipped content."""
+        content = gzip.compress(PACKAGES_TEXT.replace("\n", "\r\n").encode("utf-8"))
+        
+        lines = list(iter_lines(content, compressed=True))
+        
+        self.assertEqual(lines, PACKAGES_TEXT.splitlines())
+    
+    def test_iter_stanzas(self):
+        """Test grouping lines into blank-line separated stanzas."""
+        stanzas = list(iter_stanzas(["a", "b", "", "  ", "c", ""]))
+        
+        self.assertEqual(stanzas, [["a", "b"], ["c"]])
+    
+    def test_iter_control_stanzas(self):
+        """Test parsing control stanzas with continuation lines."""
+        stanzas = list(iter_control_stanzas(PACKAGES_TEXT.splitlines()))
+        
+        self.assertEqual(len(stanzas), 3)
+        self.assertEqual(stanzas[0]["Depends"], "libc6 (>= 2.34), libssl3")
+        self.assertEqual(
+            stanzas[0]["Description"],
+            "small, powerful, scalable web/proxy server\\n"
+            "Nginx (\"engine X\") is a high-performance web and reverse proxy server.\\n"
+            ".\\n"
+            "This package provides the nginx binary."
+        )
+    
+    def test_iter_control_stanzas_without_continuations(self):
+        """Test that continuation lines can be ignored."""
+        stanzas = list(iter_control_stanzas(PACKAGES_TEXT.splitlines(), continuation_separator=None))
+        
+        self.assertEqual(stanzas[0]["Description"], "small, powerful, scalable web/proxy server")
+    
+    def test_parse_control_index_with_field_whitelist(self):
+        """Test keeping only whitelisted fields."""
+        result = parse_control_index(PACKAGES_TEXT.splitlines(), fields=["Version"])
+        
+        self.assertEqual(list(result), ["nginx", "curl"])
+        self.assertEqual(result["nginx"], {"Package": "nginx", "Version": "1.22.1"})
+        self.assertEqual(result["curl"], {"Package": "curl", "Version": "7.88.1"})
+    
+    def test_parse_release_file_inrelease(self):
+        """Test parsing a clearsigned InRelease file with its checksum list."""
+        inrelease = """-----BEGIN PGP SIGNED MESSAGE-----
+Hash: SHA512
+
+Origin: Debian
+Components: main contrib
+Architectures: amd64 arm64
+Acquire-By-Hash: yes
+SHA256:
+ 0f3a 1234 main/binary-amd64/Packages
+ 9b2c 567 main/binary-amd64/Packages.gz
+-----BEGIN PGP SIGNATURE-----
+
+iQIzBAEBCgAdFiEE
+-----END PGP SIGNATURE-----
+"""
+        release = parse_release_file(inrelease)
+        
+        self.assertEqual(release["Origin"], "Debian")
+        self.assertEqual(release["components"], ["main", "contrib"])
+        self.assertEqual(release["architectures"], ["amd64", "arm64"])
+        self.assertTrue(release["acquire_by_hash"])
+        self.assertEqual(release["sha256"], {
+            "main/binary-amd64/Packages": {"sha256": "0f3a", "size": 1234},
+            "main/binary-amd64/Packages.gz": {"sha256": "9b2c", "size": 567},
+        })
+    
+    def test_parse_pdiff_index(self):
+        """Test parsing a Packages.diff/Index file."""
+        index = parse_pdiff_index("""SHA256-Current: cccc 300
+SHA256-History:
+ aaaa 100 T-1
+ bbbb 200 T-2
+SHA256-Patches:
+ 1111 10 T-1
+ 2222 20 T-2
+SHA256-Download:
+ 3333 30 T-1.gz
+ 4444 40 T-2.gz
+X-Patch-Precedence: merged
+""")
+        
+        self.assertEqual(index["current"], {"sha256": "cccc", "size": 300})
+        self.assertEqual(index["history"], [("aaaa", "T-1"), ("bbbb", "T-2")])
+        self.assertEqual(index["patches"], {"T-1": "1111", "T-2": "2222"})
+        self.assertEqual(index["downloads"], {"T-1.gz": "3333", "T-2.gz": "4444"})
+        self.assertTrue(index["merged"])
+    
+    def test_apply_ed_patch(self):
+        """Test applying an ed-style pdiff with change, delete and append commands."""
+        lines = [b"one\n", b"two\n", b"three\n", b"four\n", b"five\n"]
+        patch = b"5a\nsix\n.\n3,4d\n1c\nONE\nuno\n.\n"
+        
+        self.assertEqual(
+            apply_ed_patch(lines, patch),
+            [b"ONE\n", b"uno\n", b"two\n", b"five\n", b"six\n"]
+        )
+        
+        with self.assertRaises(ValueError):
+            apply_ed_patch([b"one\n"], b"s/one/two/\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
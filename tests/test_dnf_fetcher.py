@@ -3,6 +3,7 @@ Unit tests for the DNF fetcher.
 """
 
 import os
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -87,7 +88,32 @@ class TestDNFFetcher(unittest.TestCase):
         
         # Check that the mocks were called with the correct arguments
         mock_fetch_primary_location.assert_called_once_with("https://example.com/test/repodata/repomd.xml")
-        mock_fetch_primary_xml.assert_called_once_with("https://example.com/test/repodata/primary.xml.gz")
+        mock_fetch_primary_xml.assert_called_once_with(
+            "https://example.com/test/repodata/primary.xml.gz", "test_test_x86_64"
+        )
+    
+    @patch("saidata_gen.fetcher.dnf.DNFFetcher._fetch_primary_location")
+    @patch("saidata_gen.fetcher.dnf.DNFFetcher._fetch_primary_xml")
+    def test_fetch_repository_data_concurrently(self, mock_fetch_primary_xml, mock_fetch_primary_location):
+        """Test that the repositories of several architectures are fetched concurrently."""
+        self.test_dist.architectures = ["x86_64", "aarch64", "ppc64le"]
+        mock_fetch_primary_location.return_value = "repodata/primary.xml.gz"
+        
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def fetch_primary_xml(primary_url, cache_key=None):
+            # Every fetch waits for the others, so this only passes when they run at once
+            barrier.wait()
+            return {"test-package": {"name": "test-package", "version": "1.0.0-1"}}
+        
+        mock_fetch_primary_xml.side_effect = fetch_primary_xml
+        result = self.fetcher.fetch_repository_data()
+        
+        self.assertTrue(result.success)
+        self.assertEqual(
+            sorted(result.providers), ["test_test_aarch64", "test_test_ppc64le", "test_test_x86_64"]
+        )
+        self.assertEqual(mock_fetch_primary_xml.call_count, 3)
     
     @patch("saidata_gen.fetcher.dnf.DNFFetcher._fetch_primary_location")
     @patch("saidata_gen.fetcher.dnf.DNFFetcher._fetch_primary_xml")
@@ -3,26 +3,31 @@ Unit tests for the fetcher base classes.
 """
 
 import os
+import subprocess
 import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 
 import requests
 
-from saidata_gen.core.interfaces import FetcherConfig
+from saidata_gen.core.interfaces import FetcherConfig, FetchResult
 from saidata_gen.fetcher.base import (
     GitRepositoryFetcher, HttpRepositoryFetcher, RepositoryFetcher
 )
+from saidata_gen.fetcher.snapshot import PackageSnapshot
 
 
 class MockResponse:
     """Mock response for requests."""
     
-    def __init__(self, status_code=200, content=b"", text="", json_data=None):
+    def __init__(self, status_code=200, content=b"", text="", json_data=None, headers=None):
         self.status_code = status_code
         self.content = content
         self.text = text
         self._json_data = json_data
+        self.headers = headers or {}
     
     def json(self):
         """Return JSON data."""
@@ -90,6 +95,53 @@ class TestRepositoryFetcher(unittest.TestCase):
         cached_data = self.fetcher._get_from_cache(key)
         self.assertEqual(cached_data, data)
     
+    def test_snapshot_cache_operations(self):
+        """Test saving package maps as binary snapshots."""
+        key = "test-packages"
+        data = {
+            "nginx": {"Version": "1.22", "Description": "Web server"},
+            "curl": {"Version": "7.88", "Depends": ["libc6"]},
+        }
+        
+        self.fetcher._save_to_cache(key, data, snapshot=True)
+        
+        self.assertTrue(os.path.exists(self.fetcher._get_snapshot_path(key)))
+        self.assertFalse(os.path.exists(self.fetcher._get_cache_path(key)))
+        
+        cached_data = self.fetcher._get_from_cache(key)
+        self.assertIsInstance(cached_data, PackageSnapshot)
+        self.assertEqual(dict(cached_data), data)
+        cached_data.close()
+    
+    def test_replaced_snapshot_is_closed(self):
+        """Test that a snapshot replaced in the package cache is closed."""
+        self.fetcher._save_to_cache("test-packages", {"nginx": {"Version": "1.22"}}, snapshot=True)
+        snapshot = self.fetcher._get_from_cache("test-packages")
+        self.addCleanup(snapshot.close)
+        self.fetcher._package_cache = {}
+        
+        self.fetcher._set_package_cache_entry("main", snapshot)
+        self.fetcher._set_package_cache_entry("main", snapshot)
+        self.assertFalse(snapshot.closed)
+        
+        # A reload of the unchanged file keeps the open snapshot
+        reloaded = self.fetcher._get_from_cache("test-packages")
+        self.fetcher._set_package_cache_entry("main", reloaded)
+        self.assertIs(self.fetcher._package_cache["main"], snapshot)
+        self.assertTrue(reloaded.closed)
+        self.assertFalse(snapshot.closed)
+        
+        # A rewritten snapshot replaces and closes the old one
+        self.fetcher._save_to_cache("test-packages", {"curl": {"Version": "7.88"}}, snapshot=True)
+        rewritten = self.fetcher._get_from_cache("test-packages")
+        self.addCleanup(rewritten.close)
+        self.fetcher._set_package_cache_entry("main", rewritten)
+        self.assertIs(self.fetcher._package_cache["main"], rewritten)
+        self.assertTrue(snapshot.closed)
+        
+        self.fetcher._set_package_cache_entry("main", {"curl": {}})
+        self.assertTrue(rewritten.closed)
+    
     @mock.patch("requests.Session.get")
     def test_fetch_url(self, mock_get):
         """Test fetching a URL."""
@@ -114,6 +166,161 @@ class TestRepositoryFetcher(unittest.TestCase):
         response = self.fetcher._fetch_url("https://example.com")
         self.assertEqual(response.text, "test content")
         self.assertEqual(mock_get.call_count, 2)
+    
+    def test_warm_up_loads_repository_once(self):
+        """Test that concurrent warm-up calls load the repository only once."""
+        calls = []
+        
+        def slow_fetch():
+            calls.append(threading.current_thread().name)
+            time.sleep(0.05)
+            return "loaded"
+        
+        self.fetcher.fetch_repository_data = slow_fetch
+        
+        threads = [threading.Thread(target=self.fetcher.warm_up) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(self.fetcher.warm_up())
+    
+    def test_warm_up_retried_after_failure(self):
+        """Test that a warm-up that loads nothing is retried after the backoff delay."""
+        results = [RuntimeError("unreachable"), FetchResult(success=False), FetchResult(success=True)]
+        
+        def fetch():
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        
+        self.fetcher.fetch_repository_data = fetch
+        self.fetcher.warm_up_retry_delay = 60
+        
+        with self.assertRaises(RuntimeError):
+            self.fetcher.warm_up()
+        
+        # Calls during the backoff delay do not load again
+        self.assertIsNone(self.fetcher.warm_up())
+        self.assertEqual(len(results), 2)
+        
+        self.fetcher._warm_up_retry_at = 0
+        self.assertFalse(self.fetcher.warm_up().success)
+        self.assertEqual(self.fetcher.get_warm_up_errors(), {})
+        
+        self.fetcher._warm_up_retry_at = 0
+        self.assertTrue(self.fetcher.warm_up().success)
+        self.assertIsNone(self.fetcher.warm_up())
+    
+    def test_partial_warm_up_retries_failed_parts_in_background(self):
+        """Test that a partly loaded fetcher is warm and retries failed parts off the lookup path."""
+        calls = []
+        retried = threading.Event()
+        
+        def fetch():
+            calls.append(threading.current_thread().name)
+            if len(calls) == 1:
+                return FetchResult(
+                    success=False,
+                    providers={"main": True, "updates": False},
+                    errors={"updates": "mirror unreachable"}
+                )
+            retried.set()
+            return FetchResult(success=True, providers={"main": True, "updates": True})
+        
+        self.fetcher.fetch_repository_data = fetch
+        self.fetcher.warm_up_retry_delay = 60
+        
+        self.assertFalse(self.fetcher.warm_up().success)
+        self.assertEqual(self.fetcher.get_warm_up_errors(), {"updates": "mirror unreachable"})
+        
+        # Warm despite the failed part; no reload before the delay has passed
+        for _ in range(5):
+            self.assertIsNone(self.fetcher.warm_up())
+        self.assertEqual(len(calls), 1)
+        
+        self.fetcher._warm_up_retry_at = 0
+        self.assertIsNone(self.fetcher.warm_up())
+        self.assertTrue(retried.wait(5))
+        
+        for _ in range(50):
+            if not self.fetcher._warm_up_retrying:
+                break
+            time.sleep(0.01)
+        
+        self.assertEqual(len(calls), 2)
+        self.assertNotEqual(calls[1], threading.current_thread().name)
+        self.assertEqual(self.fetcher.get_warm_up_errors(), {})
+        self.assertIsNone(self.fetcher.warm_up())
+        self.assertEqual(len(calls), 2)
+    
+    def test_get_all_package_names(self):
+        """Test listing package names from nested and flat package caches."""
+        def load():
+            self.fetcher._package_cache = {
+                "main": {"nginx": {}, "curl": {}},
+                "updates": {"curl": {}, "bash": {}},
+            }
+        
+        self.fetcher.fetch_repository_data = load
+        self.assertEqual(self.fetcher.get_all_package_names(), ["bash", "curl", "nginx"])
+        
+        # An up-to-date package index is used
+        self.fetcher._build_package_index()
+        self.assertEqual(self.fetcher.get_all_package_names(), ["bash", "curl", "nginx"])
+        
+        self.fetcher.nested_package_cache = False
+        self.fetcher._package_cache = {"zsh": {}, "bash": {}}
+        self.assertEqual(self.fetcher.get_all_package_names(), ["bash", "zsh"])
+    
+    def test_iter_package_summaries(self):
+        """Test collecting package descriptions and homepages."""
+        self.fetcher.index_text_fields = ("Description",)
+        self.fetcher._package_cache = {
+            "main": {
+                "nginx": {"Description": "Web server", "Homepage": "https://nginx.org"},
+                "curl": {"Description": "", "url": "ftp://example.com", "www": "https://curl.se/"},
+            },
+            "updates": {"nginx": {"Description": "Newer web server"}, "bash": "invalid"},
+        }
+        
+        self.assertEqual(sorted(self.fetcher.iter_package_summaries()), [
+            ("bash", None, None),
+            ("curl", None, "https://curl.se/"),
+            ("nginx", "Web server", "https://nginx.org"),
+        ])
+    
+    def test_get_index_version(self):
+        """Test that the index version is derived from the package data."""
+        self.assertEqual(self.fetcher.get_index_version(), ())
+        
+        self.fetcher._save_to_cache("test-packages", {"nginx": {"Version": "1.22"}}, snapshot=True)
+        snapshot = self.fetcher._get_from_cache("test-packages")
+        self.addCleanup(snapshot.close)
+        self.fetcher._package_cache = {"main": snapshot, "updates": {"curl": {"Version": "7.88"}}}
+        
+        version = self.fetcher.get_index_version()
+        self.assertEqual(version, self.fetcher.get_index_version())
+        self.assertEqual(version[0], ("main", snapshot.digest))
+        
+        # Another fetcher, as in a new process, loading the same data reports the same version
+        other = type(self.fetcher)()
+        other.cache_dir = self.temp_dir.name
+        reloaded = other._get_from_cache("test-packages")
+        self.addCleanup(reloaded.close)
+        other._package_cache = {"main": reloaded, "updates": {"curl": {"Version": "7.88"}}}
+        self.assertEqual(other.get_index_version(), version)
+        
+        # Refreshing the TTL of an unchanged snapshot keeps its version
+        os.utime(snapshot.path, (time.time() + 10, time.time() + 10))
+        self.assertEqual(self.fetcher.get_index_version(), version)
+        
+        self.fetcher._package_cache["updates"] = {"curl": {"Version": "8.0"}}
+        self.assertNotEqual(self.fetcher.get_index_version()[1], version[1])
+        self.assertEqual(self.fetcher.get_index_version()[0], version[0])
 
 
 class TestHttpRepositoryFetcher(unittest.TestCase):
@@ -203,6 +410,72 @@ class TestHttpRepositoryFetcher(unittest.TestCase):
                 self.assertEqual(f.read(), b"test content")
         
         mock_fetch_url.assert_called_once()
+    
+    def _expire(self, path):
+        """Move a cache file's mtime past the cache TTL."""
+        expired = time.time() - self.fetcher.config.cache_ttl - 60
+        os.utime(path, (expired, expired))
+    
+    def test_fetch_json_revalidates_expired_cache(self):
+        """Test that an expired JSON entry is revalidated with its ETag and Last-Modified."""
+        url = "https://example.com/api/test.json"
+        validators = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        
+        with mock.patch.object(self.fetcher.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(json_data={"test": "data"}, headers=validators)
+            self.assertEqual(self.fetcher._fetch_json("test.json"), {"test": "data"})
+            self.assertNotIn("If-None-Match", mock_get.call_args.kwargs["headers"])
+        
+        cache_path = self.fetcher._get_cache_path(f"json:{url}")
+        self._expire(cache_path)
+        self.assertIsNone(self.fetcher._get_from_cache(f"json:{url}"))
+        
+        with mock.patch.object(self.fetcher.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(status_code=304)
+            self.assertEqual(self.fetcher._fetch_json("test.json"), {"test": "data"})
+            
+            headers = mock_get.call_args.kwargs["headers"]
+            self.assertEqual(headers["If-None-Match"], '"v1"')
+            self.assertEqual(headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        
+        # The 304 refreshed the TTL of the cached entry
+        self.assertEqual(self.fetcher._get_from_cache(f"json:{url}"), {"test": "data"})
+    
+    def test_fetch_text_replaces_changed_entry(self):
+        """Test that a changed resource replaces the expired entry and its validators."""
+        url = "https://example.com/api/test.txt"
+        
+        with mock.patch.object(self.fetcher.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(text="old", headers={"ETag": '"v1"'})
+            self.fetcher._fetch_text("test.txt")
+        
+        self._expire(self.fetcher._get_cache_path(f"text:{url}"))
+        
+        with mock.patch.object(self.fetcher.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(text="new", headers={"ETag": '"v2"'})
+            self.assertEqual(self.fetcher._fetch_text("test.txt"), "new")
+            self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        
+        self.assertEqual(self.fetcher._load_validators(f"text:{url}"), {url: {"etag": '"v2"'}})
+    
+    def test_fetch_binary_revalidates_expired_file(self):
+        """Test that an expired binary file is kept when the server reports it unchanged."""
+        output_path = os.path.join(self.temp_dir.name, "downloads", "test.bin")
+        
+        with mock.patch.object(self.fetcher.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(content=b"test content", headers={"ETag": '"v1"'})
+            self.fetcher._fetch_binary("test.bin", output_path)
+        
+        self._expire(output_path)
+        
+        with mock.patch.object(self.fetcher.session, "get") as mock_get:
+            mock_get.return_value = MockResponse(status_code=304)
+            self.assertEqual(self.fetcher._fetch_binary("test.bin", output_path), output_path)
+            self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        
+        self.assertTrue(self.fetcher._is_cache_valid(output_path))
+        with open(output_path, "rb") as f:
+            self.assertEqual(f.read(), b"test content")
 
 
 class TestGitRepositoryFetcher(unittest.TestCase):
@@ -253,7 +526,7 @@ class TestGitRepositoryFetcher(unittest.TestCase):
     
     @mock.patch("subprocess.run")
     def test_pull_repository(self, mock_run):
-        """Test pulling a repository."""
+        """Test updating a repository with a shallow fetch."""
         mock_run.return_value.returncode = 0
         
         # Create the repo directory to simulate an existing repo
@@ -261,9 +534,92 @@ class TestGitRepositoryFetcher(unittest.TestCase):
         
         result = self.fetcher._clone_or_pull_repository()
         self.assertTrue(result)
-        mock_run.assert_called_once()
-        self.assertIn("git", mock_run.call_args[0][0])
-        self.assertIn("pull", mock_run.call_args[0][0])
+        commands = [call[0][0] for call in mock_run.call_args_list]
+        self.assertEqual(commands, [
+            ["git", "-C", self.fetcher.repo_dir, "fetch", "--depth", "1", "origin", "main"],
+            ["git", "-C", self.fetcher.repo_dir, "reset", "--hard", "FETCH_HEAD"],
+        ])
+    
+    def test_sparse_clone_and_update(self):
+        """Test that sparse clones only check out the declared paths."""
+        def git(cwd, *args):
+            subprocess.run(
+                ["git", "-C", cwd, "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                check=True, capture_output=True
+            )
+        
+        def write(path, content):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+        
+        upstream = os.path.join(self.temp_dir.name, "upstream")
+        os.makedirs(upstream)
+        git(upstream, "init", "-q", "-b", "main")
+        git(upstream, "config", "uploadpack.allowFilter", "true")
+        write(os.path.join(upstream, "README"), "readme")
+        write(os.path.join(upstream, "packages", "a.txt"), "a")
+        write(os.path.join(upstream, "docs", "big.txt"), "docs")
+        git(upstream, "add", "-A")
+        git(upstream, "commit", "-q", "-m", "initial")
+        
+        self.fetcher.SPARSE_PATHS = ("packages",)
+        self.fetcher.repository_url = f"file://{upstream}"
+        
+        self.assertTrue(self.fetcher._clone_or_pull_repository())
+        self.assertTrue(os.path.exists(os.path.join(self.fetcher.repo_dir, "README")))
+        self.assertTrue(os.path.exists(os.path.join(self.fetcher.repo_dir, "packages", "a.txt")))
+        self.assertFalse(os.path.exists(os.path.join(self.fetcher.repo_dir, "docs")))
+        
+        write(os.path.join(upstream, "packages", "b.txt"), "b")
+        git(upstream, "add", "-A")
+        git(upstream, "commit", "-q", "-m", "add b")
+        
+        self.assertTrue(self.fetcher._clone_or_pull_repository())
+        self.assertEqual(self.fetcher._get_file_content("packages/b.txt"), "b")
+        self.assertFalse(os.path.exists(os.path.join(self.fetcher.repo_dir, "docs")))
+        
+        # The update is shallow
+        self.assertEqual(self.fetcher._run_git("rev-list", "--count", "HEAD").strip(), "1")
+        
+        # Disabling sparse checkouts restores the whole tree
+        self.fetcher.config.git_sparse_checkout = False
+        self.assertTrue(self.fetcher._clone_or_pull_repository())
+        self.assertEqual(self.fetcher._get_file_content("docs/big.txt"), "docs")
+    
+    def test_bare_clone_reads_object_database(self):
+        """Test reading files from a bare clone without a working tree."""
+        def git(cwd, *args):
+            subprocess.run(
+                ["git", "-C", cwd, "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                check=True, capture_output=True
+            )
+        
+        upstream = os.path.join(self.temp_dir.name, "upstream")
+        os.makedirs(os.path.join(upstream, "dir"))
+        git(upstream, "init", "-q", "-b", "main")
+        with open(os.path.join(upstream, "dir", "test.txt"), "w") as f:
+            f.write("v1")
+        git(upstream, "add", "-A")
+        git(upstream, "commit", "-q", "-m", "initial")
+        
+        self.fetcher.config.git_worktree = False
+        self.fetcher.repository_url = f"file://{upstream}"
+        
+        self.assertTrue(self.fetcher._clone_or_pull_repository())
+        self.assertFalse(os.path.exists(os.path.join(self.fetcher.repo_dir, "dir")))
+        self.assertEqual(self.fetcher._get_file_content("dir/test.txt"), "v1")
+        self.assertEqual(self.fetcher._list_files("dir", "*.txt"), ["dir/test.txt"])
+        self.assertTrue(self.fetcher._is_directory("dir"))
+        first_commit = self.fetcher._get_head_commit()
+        
+        with open(os.path.join(upstream, "dir", "test.txt"), "w") as f:
+            f.write("v2")
+        git(upstream, "commit", "-q", "-am", "update")
+        
+        self.assertTrue(self.fetcher._clone_or_pull_repository())
+        self.assertEqual(self.fetcher._get_file_content("dir/test.txt"), "v2")
+        self.assertEqual(self.fetcher._get_changed_paths(first_commit), ["dir/test.txt"])
     
     def test_get_file_content(self):
         """Test getting file content."""
@@ -2,7 +2,10 @@
 Unit tests for the fetcher factory.
 """
 
+import threading
+import time
 import unittest
+from unittest.mock import Mock
 
 from saidata_gen.core.interfaces import FetcherConfig
 from saidata_gen.fetcher.base import RepositoryFetcher
@@ -83,6 +86,93 @@ class TestFetcherFactory(unittest.TestCase):
         self.factory.register_fetcher("test", self.TestFetcher)
         self.assertTrue(self.factory.is_fetcher_available("test"))
 
+    
+    def test_get_fetcher_reuses_instance(self):
+        """Test that pooled fetchers are reused for equivalent requests."""
+        self.factory.register_fetcher("test", self.TestFetcher)
+        config = FetcherConfig(cache_ttl=60)
+        
+        first = self.factory.get_fetcher("test", config)
+        second = self.factory.get_fetcher("test", FetcherConfig(cache_ttl=60))
+        self.assertIs(first, second)
+        
+        # A different config or constructor argument yields a separate instance
+        other_config = self.factory.get_fetcher("test", FetcherConfig(cache_ttl=120))
+        other_arg = self.factory.get_fetcher("test", config, test_arg="value")
+        self.assertIsNot(first, other_config)
+        self.assertIsNot(first, other_arg)
+        self.assertEqual(other_arg.test_arg, "value")
+        
+        stats = self.factory.get_pool_stats()
+        self.assertEqual(stats["size"], 3)
+        self.assertEqual(stats["providers"]["test"]["instances"], 3)
+        self.assertEqual(stats["providers"]["test"]["uses"], 4)
+    
+    def test_get_fetcher_unregistered(self):
+        """Test getting a pooled fetcher that is not registered."""
+        self.assertIsNone(self.factory.get_fetcher("nonexistent"))
+        self.assertEqual(self.factory.get_pool_stats()["size"], 0)
+    
+    def test_get_fetcher_thread_safe(self):
+        """Test that concurrent callers share a single pooled fetcher."""
+        self.factory.register_fetcher("test", self.TestFetcher)
+        fetchers = []
+        
+        def worker():
+            fetchers.append(self.factory.get_fetcher("test"))
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(fetchers), 8)
+        self.assertTrue(all(f is fetchers[0] for f in fetchers))
+    
+    def test_evict_idle_fetchers(self):
+        """Test idle eviction of pooled fetchers."""
+        self.factory.register_fetcher("test", self.TestFetcher)
+        fetcher = self.factory.get_fetcher("test")
+        fetcher.session = Mock()
+        
+        self.assertEqual(self.factory.evict_idle_fetchers(idle_timeout=3600), 0)
+        
+        time.sleep(0.01)
+        self.assertEqual(self.factory.evict_idle_fetchers(idle_timeout=0.001), 1)
+        fetcher.session.close.assert_called_once()
+        
+        self.assertIsNot(self.factory.get_fetcher("test"), fetcher)
+    
+    def test_pool_size_limit(self):
+        """Test that the least recently used fetcher is evicted when the pool is full."""
+        factory = FetcherFactory(max_pool_size=2)
+        factory.register_fetcher("test", self.TestFetcher)
+        
+        first = factory.get_fetcher("test", test_arg="a")
+        time.sleep(0.01)
+        factory.get_fetcher("test", test_arg="b")
+        time.sleep(0.01)
+        factory.get_fetcher("test", test_arg="c")
+        
+        self.assertEqual(factory.get_pool_stats()["size"], 2)
+        self.assertIsNot(factory.get_fetcher("test", test_arg="a"), first)
+    
+    def test_reregister_drops_pooled_instances(self):
+        """Test that registering a new class for a name evicts old pooled instances."""
+        self.factory.register_fetcher("test", self.TestFetcher)
+        fetcher = self.factory.get_fetcher("test")
+        
+        # Re-registering the same class keeps the pool warm
+        self.factory.register_fetcher("test", self.TestFetcher)
+        self.assertIs(self.factory.get_fetcher("test"), fetcher)
+        
+        class OtherFetcher(self.TestFetcher):
+            pass
+        
+        self.factory.register_fetcher("test", OtherFetcher)
+        self.assertIsInstance(self.factory.get_fetcher("test"), OtherFetcher)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""
+Tests for the shared fetcher transport.
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+
+from saidata_gen.core.interfaces import FetcherConfig
+from saidata_gen.fetcher.base import HttpRepositoryFetcher
+from saidata_gen.fetcher.transport import (
+    FetcherTransport, TransportSession, get_fetcher_transport, reset_fetcher_transport
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a small JSON body and tracks concurrent requests."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            server.last_headers = dict(self.headers)
+        
+        try:
+            time.sleep(server.delay)
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def __init__(self, delay=0.0):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.last_headers = {}
+    
+    @property
+    def host(self):
+        return f"127.0.0.1:{self.server_address[1]}"
+
+
+class _TestFetcher(HttpRepositoryFetcher):
+    def fetch_repository_data(self):
+        pass
+    
+    def get_package_info(self, package_name):
+        pass
+    
+    def search_packages(self, query, max_results=10):
+        pass
+    
+    def get_repository_name(self):
+        return "test"
+
+
+class TestFetcherTransport(unittest.TestCase):
+    """
+    Test cases for the fetcher transport against a local stub server.
+    """
+    
+    def _start_server(self, delay=0.0):
+        server = _StubServer(delay=delay)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+    
+    def test_rate_limit_per_host(self):
+        """Test that configured hosts are rate limited and metrics are recorded."""
+        server = self._start_server()
+        transport = FetcherTransport({server.host: {"requests_per_second": 20, "burst_size": 1}})
+        self.addCleanup(transport.close)
+        
+        start = time.time()
+        for _ in range(5):
+            transport.get(f"http://{server.host}/", timeout=5).raise_for_status()
+        
+        self.assertGreaterEqual(time.time() - start, 0.15)
+        self.assertIsNotNone(transport.get_rate_limiter(f"http://{server.host}/x"))
+        self.assertIsNone(transport.get_rate_limiter("http://other.example/"))
+        
+        summary = transport.get_summary()
+        counter = f"http_requests_total:host={server.host}:method=GET:status_code=200"
+        self.assertEqual(summary["metrics"]["counters"][counter], 5)
+        self.assertEqual(summary["hosts"][server.host]["requests_per_second"], 20)
+    
+    def test_max_connections_per_host(self):
+        """Test that concurrent requests to a host are bounded."""
+        server = self._start_server(delay=0.05)
+        transport = FetcherTransport({server.host: {"max_connections": 2}})
+        self.addCleanup(transport.close)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(
+                lambda _: transport.get(f"http://{server.host}/", timeout=5), range(8)
+            ))
+        
+        self.assertTrue(all(response.status_code == 200 for response in responses))
+        self.assertLessEqual(server.max_active, 2)
+    
+    def test_transport_session(self):
+        """Test that fetcher sessions share the global transport."""
+        server = self._start_server()
+        reset_fetcher_transport()
+        self.addCleanup(reset_fetcher_transport)
+        
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        config = FetcherConfig(cache_dir=cache_dir)
+        
+        fetcher = _TestFetcher(base_url=f"http://{server.host}", config=config)
+        other = _TestFetcher(base_url=f"http://{server.host}", config=config)
+        
+        self.assertIsInstance(fetcher.session, TransportSession)
+        self.assertIsInstance(fetcher.session, requests.Session)
+        self.assertIs(fetcher.session.transport, get_fetcher_transport())
+        self.assertIs(other.session.transport, fetcher.session.transport)
+        
+        self.assertEqual(fetcher._fetch_json("data", use_cache=False), {"ok": True})
+        
+        # Closing a fetcher's session leaves the shared pools usable
+        fetcher.session.close()
+        self.assertEqual(other._fetch_json("data", use_cache=False), {"ok": True})
+    
+    def test_transport_session_settings(self):
+        """Test that session settings and the fetcher retry count reach the transport."""
+        server = self._start_server()
+        reset_fetcher_transport()
+        self.addCleanup(reset_fetcher_transport)
+        
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        fetcher = _TestFetcher(
+            base_url=f"http://{server.host}",
+            config=FetcherConfig(cache_dir=cache_dir, retry_count=1)
+        )
+        fetcher.session.headers["User-Agent"] = "saidata-gen-test"
+        fetcher.session.headers["X-Session"] = "1"
+        
+        fetcher.session.get(f"http://{server.host}/", headers={"X-Request": "2"}, timeout=5)
+        self.assertEqual(server.last_headers["User-Agent"], "saidata-gen-test")
+        self.assertEqual(server.last_headers["X-Session"], "1")
+        self.assertEqual(server.last_headers["X-Request"], "2")
+        
+        host_transport = get_fetcher_transport()._get_host(server.host)
+        self.assertEqual(list(host_transport.retry_pools), [1])
+        self.assertEqual(host_transport.retry_pools[1].config.max_retries, 1)
+        
+        fetcher.session.verify = False
+        with mock.patch.object(FetcherTransport, "request") as request:
+            fetcher.session.get("https://example.com/", verify=None)
+            fetcher.session.get("https://example.com/", verify="/tmp/ca.pem")
+        
+        self.assertIs(request.call_args_list[0].kwargs["verify"], False)
+        self.assertEqual(request.call_args_list[1].kwargs["verify"], "/tmp/ca.pem")
+        self.assertEqual(request.call_args_list[0].kwargs["max_retries"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests for reading files from the Git object database.
+"""
+
+import os
+import subprocess
+import tempfile
+import unittest
+
+from saidata_gen.fetcher.git_objects import GitObjectReader, _glob_to_regex
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", "-C", cwd, "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        check=True, capture_output=True, text=True
+    ).stdout
+
+
+class TestGitObjectReader(unittest.TestCase):
+    """
+    Test cases for GitObjectReader.
+    """
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.repo_dir = self.temp_dir.name
+        
+        _git(self.repo_dir, "init", "-q")
+        files = {
+            "README": "readme",
+            "manifests/a/App/1.0/App.yaml": "PackageIdentifier: App\n",
+            "manifests/a/App/1.0/App.locale.yaml": "Description: An app\n",
+            "manifests/.hidden/x.yaml": "hidden",
+            "bucket/tool with space.json": '{"version": "1"}',
+        }
+        for path, content in files.items():
+            full_path = os.path.join(self.repo_dir, *path.split("/"))
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as f:
+                f.write(content)
+        _git(self.repo_dir, "add", "-A")
+        _git(self.repo_dir, "commit", "-q", "-m", "initial")
+        
+        self.reader = GitObjectReader(self.repo_dir)
+        self.addCleanup(self.reader.close)
+    
+    def test_read(self):
+        """Test reading files through one cat-file process."""
+        self.assertEqual(self.reader.read("README"), b"readme")
+        self.assertEqual(self.reader.read("bucket/tool with space.json"), b'{"version": "1"}')
+        self.assertIsNone(self.reader.read("missing"))
+        self.assertIsNone(self.reader.read("manifests"))
+        self.assertEqual(self.reader.read("manifests/a/App/1.0/App.yaml"), b"PackageIdentifier: App\n")
+    
+    def test_list_files(self):
+        """Test listing paths with glob patterns."""
+        self.assertEqual(self.reader.list_files("", "*"), ["README", "bucket", "manifests"])
+        self.assertEqual(
+            self.reader.list_files("manifests", "**/*.yaml"),
+            ["manifests/a/App/1.0/App.locale.yaml", "manifests/a/App/1.0/App.yaml"]
+        )
+        self.assertEqual(self.reader.list_files("manifests/a/App/1.0", "App.y?ml"), ["manifests/a/App/1.0/App.yaml"])
+        self.assertEqual(self.reader.list_files("missing", "*"), [])
+        
+        self.assertTrue(self.reader.is_dir("manifests/a"))
+        self.assertTrue(self.reader.is_dir(""))
+        self.assertFalse(self.reader.is_dir("README"))
+        self.assertTrue(self.reader.exists("README"))
+        self.assertFalse(self.reader.exists("missing"))
+    
+    def test_pinned_to_commit(self):
+        """Test that a reader keeps reading the commit it was created for."""
+        with open(os.path.join(self.repo_dir, "README"), "w") as f:
+            f.write("changed")
+        _git(self.repo_dir, "commit", "-q", "-am", "change")
+        
+        self.assertEqual(self.reader.read("README"), b"readme")
+        self.assertEqual(GitObjectReader(self.repo_dir).read("README"), b"changed")
+    
+    def test_glob_to_regex(self):
+        """Test the translation of glob patterns."""
+        self.assertTrue(_glob_to_regex("*/*/*.ebuild").match("app-misc/foo/foo-1.ebuild"))
+        self.assertFalse(_glob_to_regex("*/*/*.ebuild").match("app-misc/foo/files/foo-1.ebuild"))
+        self.assertTrue(_glob_to_regex("**/default.nix").match("default.nix"))
+        self.assertTrue(_glob_to_regex("[!a]*.txt").match("b.txt"))
+        self.assertFalse(_glob_to_regex("[!a]*.txt").match("a.txt"))
+        self.assertFalse(_glob_to_regex("*.txt").match("a.txtx"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -298,6 +298,49 @@ class TestPackageComparator:
         assert 0 <= score <= 1
         assert score > 0.5  # Should be high for good package
     
+    def test_calculate_package_similarities(self, comparator, sample_packages):
+        """Test that batch similarities match single comparisons above the threshold."""
+        packages = sample_packages + [
+            SoftwareMatch(name="nginx-full", provider="apt", score=0.5),
+            SoftwareMatch(name="httpd", provider="dnf", description="Apache HTTP Server", score=0.5),
+        ]
+        
+        for package in packages:
+            exact = [comparator._calculate_package_similarity(package, other) for other in packages]
+            assert comparator._calculate_package_similarities(package, packages) == exact
+            
+            pruned = comparator._calculate_package_similarities(package, packages, 0.6)
+            assert [value for value, score in zip(pruned, exact) if score >= 0.6] == \
+                [score for score in exact if score >= 0.6]
+            assert all(value in (score, 0.0) for value, score in zip(pruned, exact))
+    
+    def test_group_similar_packages_blocking(self, comparator):
+        """Test that grouping with blocking finds the groups of an all-pairs comparison."""
+        bases = [
+            ("nginx", "High-performance web server and reverse proxy"),
+            ("redis", "Persistent key-value database with network interface"),
+            ("curl", "Command line tool for transferring data with URL syntax"),
+            ("python3-requests", "Elegant and simple HTTP library for Python"),
+            ("libssl-dev", "Secure Sockets Layer toolkit - development files"),
+        ]
+        packages = []
+        for number in range(40):
+            for name, description in bases:
+                packages.append(SoftwareMatch(
+                    name=f"{name}{number}", provider="apt", description=f"{description} {number}", score=0.5
+                ))
+                packages.append(SoftwareMatch(
+                    name=f"{name}{number}-full", provider="brew", description=description, score=0.5
+                ))
+        
+        comparator.BLOCKING_MIN_PACKAGES = len(packages)
+        blocked = comparator._group_similar_packages(packages)
+        comparator.BLOCKING_MIN_PACKAGES = len(packages) + 1
+        all_pairs = comparator._group_similar_packages(packages)
+        
+        assert [group.packages for group in blocked] == [group.packages for group in all_pairs]
+        assert any(len(group.packages) > 1 for group in blocked)
+    
     def test_get_canonical_name(self, comparator):
         """Test getting canonical name for package group."""
         packages = [
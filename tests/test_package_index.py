@@ -0,0 +1,90 @@
+"""
+Unit tests for the fetcher package index.
+"""
+
+import unittest
+
+from saidata_gen.fetcher.index import PackageIndex
+
+
+class TestPackageIndex(unittest.TestCase):
+    """
+    Test cases for the package index.
+    """
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.package_cache = {
+            "debian_main": {
+                "nginx": {"Description": "small, powerful, scalable web/proxy server"},
+                "nginx-extras": {"Description": "nginx web/proxy server (extended version)"},
+                "libnginx-mod-http-echo": {"Description": "Bring echo and more shell style goodies to Nginx"},
+                "apache2": {"Description": "Apache HTTP Server"},
+                "curl": {"Description": None},
+            },
+            "ubuntu_universe": {
+                "nginx": {"Description": "small, powerful, scalable web/proxy server"},
+                "python3-requests": {"Description": "elegant and simple HTTP library for Python3"},
+            },
+        }
+        self.index = PackageIndex(self.package_cache, ("Description",))
+    
+    def _scan(self, query):
+        """Reference linear scan matching the fetchers' original search."""
+        query_lower = query.lower()
+        matches = []
+        for cache_key, packages in self.package_cache.items():
+            for pkg_name, pkg_data in packages.items():
+                if (query_lower in pkg_name.lower() or
+                    (pkg_data.get("Description") and query_lower in pkg_data["Description"].lower())):
+                    matches.append((cache_key, pkg_name))
+        return matches
+    
+    def test_search_matches_linear_scan(self):
+        """Test that index searches return the same results as a substring scan."""
+        queries = [
+            "nginx", "NGINX", "ngin", "ginx", "web/proxy", "proxy server", "http",
+            "python3-req", "echo and", "-", "", "missing", "x s",
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertEqual(list(self.index.search(query)), self._scan(query))
+    
+    def test_lookup(self):
+        """Test exact name lookups return the first cache key."""
+        self.assertEqual(self.index.lookup("nginx"), "debian_main")
+        self.assertEqual(self.index.lookup("python3-requests"), "ubuntu_universe")
+        self.assertIsNone(self.index.lookup("Nginx"))
+        self.assertEqual(len(self.index), 7)
+    
+    def test_token_substring_matches_vocabulary_scan(self):
+        """Test that the trigram index finds the tokens a vocabulary scan would."""
+        for token in ["nginx", "gin", "ng", "x", "3", "python3", "ttp", "zz", "echoo"]:
+            with self.subTest(token=token):
+                expected = set()
+                for indexed_token, postings in self.index._postings.items():
+                    if token in indexed_token:
+                        expected.update(postings)
+                self.assertEqual(self.index._ids_for_token_substring(token), expected)
+    
+    def test_token_matches_evict_least_recently_used(self):
+        """Test that cached token matches are evicted one at a time, least recently used first."""
+        self.index.TOKEN_MATCH_CACHE_SIZE = 2
+        self.index._ids_for_token_substring("nginx")
+        self.index._ids_for_token_substring("http")
+        self.index._ids_for_token_substring("nginx")
+        self.index._ids_for_token_substring("web")
+        
+        self.assertEqual(list(self.index._token_matches), ["nginx", "web"])
+    
+    def test_cache_signature_changes(self):
+        """Test that the signature reflects changes to the package cache."""
+        signature = PackageIndex.cache_signature(self.package_cache)
+        self.assertEqual(signature, self.index.signature)
+        
+        self.package_cache["debian_main"]["vim"] = {"Description": "Vi IMproved"}
+        self.assertNotEqual(PackageIndex.cache_signature(self.package_cache), signature)
+
+
+if __name__ == "__main__":
+    unittest.main()
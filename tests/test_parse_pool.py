@@ -0,0 +1,205 @@
+"""
+Tests for the repository index parse pool.
+"""
+
+import gzip
+import io
+import json
+import shutil
+import tarfile
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from saidata_gen.core.interfaces import FetcherConfig
+from saidata_gen.fetcher import APTFetcher, ApkFetcher, ApkRepository, DNFFetcher, ZypperFetcher, parse_pool
+from saidata_gen.fetcher.apk import parse_apkindex_archive
+from saidata_gen.fetcher.deb_utils import parse_packages_content
+from saidata_gen.fetcher.helm import parse_helm_index
+from saidata_gen.fetcher.pacman import parse_pacman_database
+from saidata_gen.fetcher.parse_pool import run_parse, shutdown_parse_executor
+from saidata_gen.fetcher.pkg import parse_packagesite_archive
+from saidata_gen.fetcher.snapshot import PackageSnapshot
+
+
+PACKAGES = (
+    b"Package: test-package\n"
+    b"Version: 1.0.0\n"
+    b"Description: Test package\n"
+    b"\n"
+    b"Package: other-package\n"
+    b"Version: 2.0.0\n"
+)
+
+
+def _tarball(files, mode="w:gz"):
+    """Build a tar archive from a mapping of member names to contents."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode=mode) as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+class TestParsePool(unittest.TestCase):
+    """
+    Test cases for parsing repository indexes in worker processes.
+    """
+    
+    def tearDown(self):
+        """Shut down the parse workers."""
+        shutdown_parse_executor()
+    
+    def test_small_content_parsed_inline(self):
+        """Test that small indexes do not start worker processes."""
+        with patch.object(parse_pool, "get_parse_executor") as mock_executor:
+            result = run_parse(parse_packages_content, PACKAGES)
+        
+        mock_executor.assert_not_called()
+        self.assertEqual(result["test-package"]["Version"], "1.0.0")
+    
+    def test_parse_in_worker(self):
+        """Test that large indexes are parsed in a worker process."""
+        content = gzip.compress(PACKAGES)
+        result = run_parse(
+            parse_packages_content, content, True, ["Version"], max_workers=1, min_size=0
+        )
+        
+        self.assertEqual(result, {
+            "test-package": {"Package": "test-package", "Version": "1.0.0"},
+            "other-package": {"Package": "other-package", "Version": "2.0.0"},
+        })
+        self.assertIsNotNone(parse_pool._executor)
+    
+    def test_parse_inline_when_disabled(self):
+        """Test that max_workers=0 always parses on the calling thread."""
+        with patch.object(parse_pool, "get_parse_executor") as mock_executor:
+            result = run_parse(parse_packages_content, PACKAGES, max_workers=0, min_size=0)
+        
+        mock_executor.assert_not_called()
+        self.assertEqual(len(result), 2)
+    
+    def test_fallback_when_workers_unavailable(self):
+        """Test that the content is parsed inline when worker processes cannot start."""
+        with patch.object(parse_pool, "get_parse_executor", side_effect=OSError("no processes")):
+            result = run_parse(parse_packages_content, PACKAGES, max_workers=1, min_size=0)
+        
+        self.assertEqual(len(result), 2)
+
+
+class TestParseToSnapshot(unittest.TestCase):
+    """
+    Test cases for parse workers writing package snapshots.
+    """
+    
+    def setUp(self):
+        """Set up a fetcher with a temporary cache."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.addCleanup(shutdown_parse_executor)
+        
+        self.fetcher = ApkFetcher(
+            repositories=[ApkRepository(name="main", url="https://example.com/main")],
+            config=FetcherConfig(cache_dir=self.cache_dir, parse_workers=1)
+        )
+    
+    @patch("saidata_gen.fetcher.apk.ApkFetcher._fetch_url")
+    def test_worker_writes_snapshot(self, mock_fetch_url):
+        """Test that a parse worker writes the snapshot the fetcher then maps."""
+        apkindex = b"P:test-package\nV:1.0-r0\nT:Test package\n\nP:other\nV:2.0-r0\nT:Other package\n"
+        mock_fetch_url.return_value = MagicMock(content=_tarball({"APKINDEX": apkindex}))
+        
+        with patch.object(parse_pool, "PARSE_POOL_MIN_SIZE", 0):
+            result = self.fetcher.fetch_repository_data()
+        
+        self.assertTrue(result.success)
+        packages = self.fetcher._package_cache["main_v3.16_x86_64"]
+        self.assertIsInstance(packages, PackageSnapshot)
+        self.assertEqual(packages["test-package"]["V"], "1.0-r0")
+        self.assertEqual(self.fetcher.get_package_info("other").version, "2.0-r0")
+        self.assertEqual(len(self.fetcher.search_packages("Other")), 1)
+
+    @patch("saidata_gen.fetcher.base.RepositoryFetcher._fetch_url")
+    def test_apt_dnf_zypper_workers_write_snapshots(self, mock_fetch_url):
+        """Test that APT, DNF and Zypper index parses write the snapshot of their cache key."""
+        packages_index = b"Package: curl\nVersion: 8.0.1-1\nDescription: URL tool\n"
+        primary_xml = (
+            b'<metadata xmlns="http://linux.duke.edu/metadata/common" packages="1">'
+            b'<package type="rpm"><name>curl</name><arch>x86_64</arch>'
+            b'<version epoch="0" ver="8.0.1" rel="1"/><summary>URL tool</summary></package>'
+            b'</metadata>'
+        )
+        config = FetcherConfig(cache_dir=self.cache_dir, parse_workers=1)
+        
+        with patch.object(parse_pool, "PARSE_POOL_MIN_SIZE", 0):
+            mock_fetch_url.return_value = MagicMock(content=gzip.compress(packages_index))
+            apt = APTFetcher(config=config)
+            packages = apt._fetch_packages_file("https://example.com", "main/Packages.gz", cache_key="apt_main")
+            self.assertIsInstance(packages, PackageSnapshot)
+            self.assertEqual(packages.path, apt._get_snapshot_path("apt_main"))
+            self.assertEqual(packages["curl"]["Version"], "8.0.1-1")
+            packages.close()
+            
+            mock_fetch_url.return_value = MagicMock(content=gzip.compress(primary_xml))
+            for fetcher in (DNFFetcher(config=config), ZypperFetcher(config=config)):
+                packages = fetcher._fetch_primary_xml("https://example.com/primary.xml.gz", "rpm_main")
+                self.assertIsInstance(packages, PackageSnapshot)
+                self.assertEqual(packages.path, fetcher._get_snapshot_path("rpm_main"))
+                self.assertIn("curl", packages)
+                packages.close()
+
+
+class TestIndexParsers(unittest.TestCase):
+    """
+    Test cases for the module-level index parsers run in parse workers.
+    """
+    
+    def test_parse_apkindex_archive(self):
+        """Test parsing an APKINDEX.tar.gz archive."""
+        content = _tarball({".SIGN.RSA.key": b"sig", "APKINDEX": b"P:curl\nV:8.0-r0\n"})
+        self.assertEqual(parse_apkindex_archive(content), {"curl": {"P": "curl", "V": "8.0-r0"}})
+        self.assertEqual(parse_apkindex_archive(_tarball({"DESCRIPTION": b"x"})), {})
+    
+    def test_parse_pacman_database(self):
+        """Test parsing a Pacman database tarball."""
+        content = _tarball({
+            "curl-8.0.1-1/desc": b"%NAME%\ncurl\n\n%VERSION%\n8.0.1-1\n\n%DESC%\nURL tool\n",
+            "curl-8.0.1-1/depends": b"%DEPENDS%\nopenssl\nzlib\n",
+        })
+        packages = parse_pacman_database(content)
+        
+        self.assertEqual(packages["curl"]["VERSION"], "8.0.1-1")
+        self.assertEqual(packages["curl"]["DEPENDS"], "openssl zlib")
+    
+    def test_parse_packagesite_archive(self):
+        """Test parsing a packagesite.txz archive."""
+        lines = [json.dumps({"name": "curl", "version": "8.0.1"}), "{broken", json.dumps({"name": "git"})]
+        content = _tarball({"packagesite.yaml": "\n".join(lines).encode("utf-8")}, mode="w:xz")
+        
+        packages = parse_packagesite_archive(content)
+        
+        self.assertEqual(sorted(packages), ["curl", "git"])
+        self.assertEqual(packages["curl"]["version"], "8.0.1")
+    
+    def test_parse_helm_index(self):
+        """Test parsing a Helm index.yaml file."""
+        content = (
+            b"apiVersion: v1\n"
+            b"entries:\n"
+            b"  nginx:\n"
+            b"  - version: 15.0.0\n"
+            b"    appVersion: 1.25.0\n"
+            b"    description: NGINX\n"
+            b"  - version: 14.0.0\n"
+        )
+        charts = parse_helm_index(content, "bitnami")
+        
+        self.assertEqual(charts["nginx"]["version"], "15.0.0")
+        self.assertEqual(charts["nginx"]["app_version"], "1.25.0")
+        self.assertEqual(charts["nginx"]["repository"], "bitnami")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -299,6 +299,51 @@ class TestRepositoryUrlManager(unittest.TestCase):
         finally:
             os.unlink(config_path)
     
+    def test_get_rate_limits(self):
+        """Test resolving provider rate limits to hosts."""
+        config = {
+            'version': 0.1,
+            'pypi': {
+                'rate_limit': {'requests_per_second': 20, 'burst_size': 50},
+                'default': {
+                    'api_url': 'https://pypi.org/pypi',
+                    'fallback_urls': ['https://pypi.python.org/pypi'],
+                },
+            },
+            'winget': {
+                'rate_limit': {'requests_per_second': 1, 'burst_size': 60, 'hosts': ['api.github.com']},
+                'default': {'primary_url': 'https://github.com/microsoft/winget-pkgs.git'},
+            },
+            'scoop': {
+                'rate_limit': {'requests_per_second': 5, 'burst_size': 5},
+                'default': {'api_url': 'https://api.github.com/repos/ScoopInstaller/Main'},
+            },
+            'apt': {
+                'default': {'primary_url': 'https://deb.debian.org/debian/dists/{{ version }}'},
+            },
+            'mirror': {
+                'rate_limit': {'requests_per_second': 2},
+                'default': {'primary_url': 'https://{{ mirror }}/repo'},
+            },
+        }
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(config, f)
+            config_path = f.name
+        
+        try:
+            manager = RepositoryUrlManager(config_path=config_path)
+            rate_limits = manager.get_rate_limits()
+            
+            self.assertEqual(rate_limits['pypi.org'], {'requests_per_second': 20, 'burst_size': 50})
+            self.assertIn('pypi.python.org', rate_limits)
+            # The lowest rate wins for hosts shared between providers
+            self.assertEqual(rate_limits['api.github.com']['requests_per_second'], 1)
+            self.assertNotIn('github.com', rate_limits)
+            self.assertNotIn('deb.debian.org', rate_limits)
+            self.assertEqual(set(rate_limits), {'pypi.org', 'pypi.python.org', 'api.github.com'})
+        finally:
+            os.unlink(config_path)
+    
     @patch('platform.system')
     @patch('builtins.open', mock_open(read_data='ID=ubuntu\nVERSION_CODENAME=jammy\n'))
     def test_detect_os_linux(self, mock_system):
@@ -4,11 +4,13 @@ Unit tests for the RPM utilities module.
 
 import gzip
 import io
+import lzma
 import unittest
 from unittest.mock import MagicMock, patch
 
 from saidata_gen.fetcher.rpm_utils import (
-    fetch_primary_location, decompress_gzip_content, parse_primary_xml, parse_metalink_xml
+    fetch_primary_checksum, fetch_primary_location, decompress_gzip_content, parse_primary_xml, parse_metalink_xml,
+    open_decompressed_stream
 )
 
 
@@ -55,6 +57,26 @@ class TestRPMUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             fetch_primary_location(repomd_xml)
     
+    def test_fetch_primary_checksum(self):
+        """Test fetching the primary.xml checksum from repomd.xml."""
+        repomd_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<repomd xmlns="http://linux.duke.edu/metadata/repo">
+  <data type="filelists">
+    <checksum type="sha256">0987654321fedcba</checksum>
+    <location href="repodata/filelists.xml.gz"/>
+  </data>
+  <data type="primary">
+    <checksum type="sha256">abcdef1234567890</checksum>
+    <open-checksum type="sha256">1111111111111111</open-checksum>
+    <location href="repodata/primary.xml.gz"/>
+  </data>
+</repomd>
+"""
+        
+        self.assertEqual(fetch_primary_checksum(repomd_xml), "sha256:abcdef1234567890")
+        self.assertIsNone(fetch_primary_checksum(repomd_xml.replace('type="primary"', 'type="other"')))
+        self.assertIsNone(fetch_primary_checksum("not xml"))
+    
     def test_decompress_gzip_content(self):
         """Test decompressing gzipped content."""
         # Create some gzipped content
@@ -144,6 +166,42 @@ class TestRPMUtils(unittest.TestCase):
         self.assertEqual(len(result["another-package"]["requires"]), 1)
         self.assertEqual(result["another-package"]["requires"][0], "lib3")
     
+    def test_parse_primary_xml_compressed_stream(self):
+        """Test streaming primary.xml from compressed content."""
+        primary_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+<metadata xmlns="http://linux.duke.edu/metadata/common" xmlns:rpm="http://linux.duke.edu/metadata/rpm" packages="2">
+  <package type="rpm">
+    <name>test-package</name>
+    <version epoch="0" ver="1.0.0" rel="1"/>
+    <summary>Test package summary</summary>
+    <description/>
+  </package>
+  <package type="rpm">
+    <name>another-package</name>
+    <version epoch="0" ver="2.0.0" rel="1"/>
+  </package>
+</metadata>
+"""
+        
+        for compress, source in [
+            (gzip.compress, "repodata/primary.xml.gz"),
+            (lzma.compress, "repodata/primary.xml.xz"),
+            (lambda data: data, "repodata/primary.xml"),
+        ]:
+            with self.subTest(source=source):
+                result = parse_primary_xml(open_decompressed_stream(compress(primary_xml), source))
+                
+                self.assertEqual(list(result), ["test-package", "another-package"])
+                self.assertEqual(result["test-package"]["version"], "1.0.0-1")
+                self.assertEqual(result["test-package"]["summary"], "Test package summary")
+                self.assertIsNone(result["test-package"]["description"])
+                self.assertEqual(result["another-package"]["requires"], [])
+    
+    def test_parse_primary_xml_invalid(self):
+        """Test that malformed primary.xml raises ValueError."""
+        with self.assertRaises(ValueError):
+            parse_primary_xml("<metadata><package>")
+    
     def test_parse_metalink_xml(self):
         """Test parsing metalink XML content."""
         # Sample metalink XML content (v3)
@@ -5,6 +5,7 @@ Unit tests for the Scoop fetcher.
 import os
 import json
 import pytest
+import subprocess
 import tempfile
 from unittest.mock import patch, MagicMock
 
@@ -305,4 +306,59 @@ class TestScoopFetcher:
             
             # Verify that the package cache contains the expected packages
             assert "git" in multi_fetcher._package_cache["main"]
-            assert "vscode" in multi_fetcher._package_cache["extras"]
\ No newline at end of file
+            assert "vscode" in multi_fetcher._package_cache["extras"]
+
+    def test_incremental_manifest_processing(self, fetcher):
+        """Test that only manifests changed since the last processed commit are parsed."""
+        def git(*args):
+            subprocess.run(
+                ["git", "-C", repo_dir, "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                check=True, capture_output=True
+            )
+        
+        def write_manifest(name, manifest):
+            with open(os.path.join(repo_dir, "bucket", f"{name}.json"), "w") as f:
+                json.dump(manifest, f)
+        
+        with tempfile.TemporaryDirectory() as repo_dir:
+            os.makedirs(os.path.join(repo_dir, "bucket"))
+            git("init", "-q")
+            write_manifest("git", {"version": "2.33.0"})
+            write_manifest("vscode", {"version": "1.60.0"})
+            git("add", "-A")
+            git("commit", "-q", "-m", "initial")
+            
+            fetcher.repo_dir = repo_dir
+            parsed = []
+            process_manifest_file = fetcher._process_manifest_file
+            
+            def track(manifest_path):
+                parsed.append(manifest_path)
+                return process_manifest_file(manifest_path)
+            
+            with patch.object(fetcher, "_process_manifest_file", side_effect=track):
+                packages = fetcher._process_manifests()
+                assert packages == {"git": {"version": "2.33.0"}, "vscode": {"version": "1.60.0"}}
+                assert sorted(parsed) == ["bucket/git.json", "bucket/vscode.json"]
+                
+                # Nothing changed since the processed commit
+                parsed.clear()
+                assert fetcher._process_manifests() == packages
+                assert parsed == []
+                
+                # Update, remove and add manifests
+                write_manifest("git", {"version": "2.34.0"})
+                os.remove(os.path.join(repo_dir, "bucket", "vscode.json"))
+                write_manifest("firefox", {"version": "90.0"})
+                git("add", "-A")
+                git("commit", "-q", "-m", "update")
+                
+                packages = fetcher._process_manifests()
+                assert packages == {"git": {"version": "2.34.0"}, "firefox": {"version": "90.0"}}
+                assert sorted(parsed) == ["bucket/firefox.json", "bucket/git.json", "bucket/vscode.json"]
+                
+                # State written by another parser version is not used
+                parsed.clear()
+                with patch.object(type(fetcher), "PARSER_VERSION", fetcher.PARSER_VERSION + 1):
+                    assert fetcher._process_manifests() == packages
+                assert sorted(parsed) == ["bucket/firefox.json", "bucket/git.json"]
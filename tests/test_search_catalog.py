@@ -0,0 +1,76 @@
+"""
+Unit tests for persistent package-name catalogs.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock
+
+from saidata_gen.core.interfaces import FetcherConfig
+from saidata_gen.search.catalog import PackageCatalog
+from saidata_gen.search.engine import SoftwareSearchEngine
+
+
+class TestPackageCatalog(unittest.TestCase):
+    """Test cases for PackageCatalog class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.catalog = PackageCatalog(self.temp_dir.name, ttl=3600)
+        self.load_names = Mock(return_value=["nginx", "curl", "nginx", "bad\nname"])
+    
+    def test_names_are_sorted_and_persisted(self):
+        """Test that names are loaded once, sorted and written to disk."""
+        self.assertEqual(self.catalog.get_names("apt", self.load_names), ["curl", "nginx"])
+        self.assertEqual(self.catalog.get_names("apt", self.load_names), ["curl", "nginx"])
+        self.assertEqual(self.load_names.call_count, 1)
+        
+        with open(os.path.join(self.temp_dir.name, "catalog", "apt.names"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "curl\nnginx\n")
+        
+        # A new catalog reads the file instead of loading the names again
+        catalog = PackageCatalog(self.temp_dir.name, ttl=3600)
+        self.assertEqual(catalog.get_names("apt", self.load_names), ["curl", "nginx"])
+        self.assertEqual(self.load_names.call_count, 1)
+    
+    def test_stale_catalog(self):
+        """Test that stale catalogs are rebuilt, and used when loading fails."""
+        self.catalog.get_names("apt", self.load_names)
+        path = os.path.join(self.temp_dir.name, "catalog", "apt.names")
+        old_time = time.time() - 7200
+        os.utime(path, (old_time, old_time))
+        
+        failing = Mock(side_effect=RuntimeError("offline"))
+        self.assertEqual(PackageCatalog(self.temp_dir.name).get_names("apt", failing), ["curl", "nginx"])
+        
+        reloaded = Mock(return_value=["wget"])
+        self.assertEqual(PackageCatalog(self.temp_dir.name).get_names("apt", reloaded), ["wget"])
+        reloaded.assert_called_once()
+    
+    def test_empty_names_are_not_kept(self):
+        """Test that empty name lists are looked up again."""
+        load_names = Mock(return_value=[])
+        self.assertEqual(self.catalog.get_names("apt", load_names), [])
+        self.assertEqual(self.catalog.get_names("apt", load_names), [])
+        self.assertEqual(load_names.call_count, 2)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, "catalog", "apt.names")))
+    
+    def test_search_engine_uses_catalog(self):
+        """Test that the search engine gets fuzzy search names from fetchers."""
+        fetcher = Mock()
+        fetcher.get_all_package_names.return_value = ["nginx", "nginx-full", "apache2"]
+        
+        engine = SoftwareSearchEngine(config=FetcherConfig(cache_dir=self.temp_dir.name), providers=[])
+        engine.fetchers = {"apt": fetcher}
+        
+        self.assertEqual(engine._get_package_list("apt"), ["apache2", "nginx", "nginx-full"])
+        self.assertIn("nginx-full", engine.suggest("nginx"))
+        fetcher.get_all_package_names.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for the package equivalence map.
+"""
+
+import os
+import tempfile
+import unittest
+
+from saidata_gen.search.equivalence import EquivalenceMap
+
+
+class TestEquivalenceMap(unittest.TestCase):
+    """Test cases for EquivalenceMap."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.equivalence_map = EquivalenceMap(self.temp_dir.name)
+        
+        self.records = {
+            "apt": [
+                ("nginx", "small, powerful, scalable web/proxy server", "https://nginx.org"),
+                ("python3-requests", "elegant and simple HTTP library for Python3", "https://requests.readthedocs.io"),
+                ("libssl-dev", "Secure Sockets Layer toolkit - development files", "https://www.openssl.org/"),
+                ("openssl", "Secure Sockets Layer toolkit - cryptographic utility", "https://www.openssl.org/"),
+                ("git", "fast, scalable, distributed revision control system", "https://git-scm.com/"),
+            ],
+            "brew": [
+                ("nginx", "HTTP(S) server and reverse proxy", "https://nginx.org/"),
+                ("openssl@3", "Cryptography and SSL/TLS Toolkit", "https://openssl.org"),
+            ],
+            "winget": [
+                ("nginx.nginx", "nginx web server", None),
+                ("Git.Git", "Git distributed version control", "https://git-scm.com"),
+            ],
+            "docker": [("library/nginx", "Official build of Nginx", None)],
+            "pypi": [("requests", "Python HTTP for Humans.", "https://requests.readthedocs.io/")],
+        }
+        self.equivalence_map.build(self.records)
+    
+    def test_resolve(self):
+        """Test resolving package names across providers."""
+        self.assertEqual(self.equivalence_map.resolve("nginx"), {
+            "apt": "nginx", "brew": "nginx", "winget": "nginx.nginx", "docker": "library/nginx"
+        })
+        self.assertEqual(self.equivalence_map.resolve("NGINX.nginx"), self.equivalence_map.resolve("nginx"))
+        self.assertEqual(self.equivalence_map.resolve("requests"), {"apt": "python3-requests", "pypi": "requests"})
+        self.assertEqual(self.equivalence_map.resolve("git"), {"apt": "git", "winget": "Git.Git"})
+        self.assertEqual(self.equivalence_map.resolve("unknown"), {})
+        self.assertEqual(self.equivalence_map.providers, ["apt", "brew", "docker", "pypi", "winget"])
+    
+    def test_homepage_join(self):
+        """Test that packages sharing a homepage are only joined when they are similar."""
+        resolved = self.equivalence_map.resolve("openssl")
+        self.assertEqual(resolved, {"apt": "openssl", "brew": "openssl@3"})
+        self.assertNotIn("libssl-dev", resolved.values())
+    
+    def test_save_and_load(self):
+        """Test that the map is persisted in the cache directory."""
+        self.equivalence_map.save()
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, "equivalence.json")))
+        
+        loaded = EquivalenceMap(self.temp_dir.name)
+        self.assertEqual(loaded.resolve("nginx"), self.equivalence_map.resolve("nginx"))
+        self.assertEqual(loaded.providers, self.equivalence_map.providers)
+        self.assertEqual(len(loaded), len(self.equivalence_map))
+    
+    def test_is_current(self):
+        """Test that the map is stale once a provider's repository data changes."""
+        self.equivalence_map.build(self.records, {"apt": (("main", "/cache/apt.snap", 1, 2),), "brew": ()})
+        self.equivalence_map.save()
+        loaded = EquivalenceMap(self.temp_dir.name)
+        
+        self.assertTrue(loaded.is_current({"apt": (("main", "/cache/apt.snap", 1, 2),)}))
+        # Providers without loaded data or outside the map are ignored
+        self.assertTrue(loaded.is_current({"apt": (), "npm": (("", 1, 2),)}))
+        self.assertFalse(loaded.is_current({"apt": (("main", "/cache/apt.snap", 3, 2),)}))
+        self.assertFalse(loaded.is_current({"brew": (("", 1, 2),)}))
+    
+    def test_missing_or_invalid_file(self):
+        """Test that a missing or invalid map file resolves nothing."""
+        self.assertEqual(EquivalenceMap(os.path.join(self.temp_dir.name, "missing")).resolve("nginx"), {})
+        
+        with open(os.path.join(self.temp_dir.name, "equivalence.json"), "w") as f:
+            f.write("{")
+        self.assertEqual(EquivalenceMap(self.temp_dir.name).resolve("nginx"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
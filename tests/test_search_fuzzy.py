@@ -3,7 +3,7 @@ Unit tests for fuzzy matching functionality.
 """
 
 import unittest
-from saidata_gen.search.fuzzy import FuzzyMatcher
+from saidata_gen.search.fuzzy import FuzzyIndex, FuzzyMatcher, MinHashLSH
 
 
 class TestFuzzyMatcher(unittest.TestCase):
@@ -90,6 +90,117 @@ class TestFuzzyMatcher(unittest.TestCase):
         prefix_score = self.matcher.calculate_similarity("ngin", "nginx")
         non_prefix_score = self.matcher.calculate_similarity("ginx", "nginx")
         self.assertGreater(prefix_score, non_prefix_score)
+    
+    def test_indexed_matches(self):
+        """Test that indexed matching returns the scores of a full scan."""
+        parts = ["lib", "py", "nginx", "ssl", "dev", "web", "server", "x", "-", " "]
+        candidates = sorted({a + b + c for a in parts for b in parts for c in parts})
+        self.matcher.INDEX_MIN_CANDIDATES = 10
+        
+        for query in ["nginx", "libssl-dev", "web server", "py", "x"]:
+            expected = [
+                (candidate, score) for candidate in candidates
+                for score in [self.matcher.calculate_similarity(query, candidate)]
+                if score >= self.matcher.min_similarity
+            ]
+            expected.sort(key=lambda x: x[1], reverse=True)
+            
+            matches = self.matcher.find_matches(query, candidates)
+            self.assertEqual(matches, expected[:len(matches)])
+            self.assertEqual(len(matches), min(len(expected), self.matcher.max_candidates))
+    
+    def test_indexed_matches_without_shared_trigrams(self):
+        """Test that indexed matching finds matches sharing no trigram with the query."""
+        candidates = [f"pkg{i:05d}" for i in range(self.matcher.INDEX_MIN_CANDIDATES)]
+        candidates += ["tmux", "make", "cmake", "automake", "emacs"]
+        
+        for query in ["utmx", "akme"]:
+            self.assertIsNotNone(self.matcher.get_index(candidates))
+            expected = [
+                (candidate, score) for candidate in candidates
+                for score in [self.matcher.calculate_similarity(query, candidate)]
+                if score >= self.matcher.min_similarity
+            ]
+            expected.sort(key=lambda x: x[1], reverse=True)
+            
+            self.assertEqual(self.matcher.find_matches(query, candidates), expected)
+        
+        self.assertIn("tmux", [name for name, _ in self.matcher.find_matches("utmx", candidates)])
+        self.assertIn("make", [name for name, _ in self.matcher.find_matches("akme", candidates)])
+    
+    def test_index_selection_without_character_rows(self):
+        """Test that precomputed character counts select the same candidates as counting per query."""
+        candidates = [f"pkg{i:05d}" for i in range(500)]
+        candidates += ["tmux", "make", "cmake", "automake", "emacs", "x" * 300, "web server x"]
+        index = FuzzyIndex(candidates)
+        fallback = FuzzyIndex(candidates)
+        fallback._char_rows = None
+        
+        for query in ["utmx", "akme", "server web", "x" * 280, "pkg"]:
+            self.assertEqual(index.select(query, 0.3, 50), fallback.select(query, 0.3, 50))
+        self.assertIn(candidates.index("x" * 300), index.select("x" * 280, 0.3, 50))
+    
+    def test_index_reused(self):
+        """Test that candidate lists are indexed once."""
+        candidates = [f"package-{i}" for i in range(50)]
+        self.matcher.INDEX_MIN_CANDIDATES = 10
+        
+        index = self.matcher.get_index(candidates)
+        self.assertIs(self.matcher.get_index(candidates), index)
+        self.assertIsNone(self.matcher.get_index(candidates[:5]))
+        
+        candidates.append("package-new")
+        self.assertIsNot(self.matcher.get_index(candidates), index)
+    
+    def test_batch_similarities(self):
+        """Test that batch scoring returns the scores of single comparisons."""
+        parts = ["lib", "py", "nginx", "ssl", "dev", "web", "server", "x", "-", " ", ""]
+        candidates = sorted({a + b + c for a in parts for b in parts for c in parts})
+        
+        for query in ["nginx", "libssl-dev", "web server", "py", "x", ""]:
+            exact = [self.matcher.calculate_similarity(query, candidate) for candidate in candidates]
+            
+            self.assertEqual(self.matcher.calculate_similarities(query, candidates), exact)
+            for bound, score in zip(self.matcher.similarity_upper_bounds(query, candidates), exact):
+                self.assertGreaterEqual(bound + 1e-9, score)
+            
+            pruned = self.matcher.calculate_similarities(query, candidates, min_similarity=0.5)
+            self.assertEqual(
+                [value for value, score in zip(pruned, exact) if score >= 0.5],
+                [score for score in exact if score >= 0.5]
+            )
+            self.assertTrue(all(value in (score, 0.0) for value, score in zip(pruned, exact)))
+    
+    def test_similarity_matrix(self):
+        """Test that the similarity matrix holds the pairwise scores."""
+        strings = ["nginx", "nginx-full", "apache2", "Apache HTTP Server", ""]
+        matrix = self.matcher.similarity_matrix(strings)
+        
+        for i, first in enumerate(strings):
+            for j, second in enumerate(strings):
+                self.assertEqual(matrix[i][j], self.matcher.calculate_similarity(first, second))
+
+
+class TestMinHashLSH(unittest.TestCase):
+    """Test cases for MinHashLSH."""
+    
+    def test_buckets(self):
+        """Test that similar token sets share a bucket and dissimilar ones do not."""
+        lsh = MinHashLSH(bands=16, rows=3)
+        token_sets = [
+            {"web", "server", "and", "reverse", "proxy"},
+            {"web", "server", "and", "reverse", "proxy", "http"},
+            {"python", "library"},
+            set(),
+            {"compression", "tool"},
+        ]
+        
+        buckets = lsh.buckets(token_sets)
+        self.assertIn([0, 1], buckets)
+        self.assertTrue(all(set(bucket) <= {0, 1} for bucket in buckets))
+        self.assertIsNone(lsh.signature(set()))
+        self.assertEqual(len(lsh.signature({"a", "b"})), 48)
+        self.assertEqual(lsh.signature({"a", "b"}), MinHashLSH(bands=16, rows=3).signature({"b", "a"}))
 
 
 if __name__ == '__main__':
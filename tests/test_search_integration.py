@@ -2,9 +2,13 @@
 Integration tests for search engine with package comparison functionality.
 """
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, MagicMock
 
+from saidata_gen.core.cache import CacheBackend, CacheConfig, CacheManager
 from saidata_gen.core.interfaces import FetcherConfig, PackageInfo, SoftwareMatch
 from saidata_gen.search.engine import SoftwareSearchEngine
 from saidata_gen.search.comparison import SelectionCriteria
@@ -125,4 +129,183 @@ class TestSearchEngineIntegration:
         assert search_engine.find_alternatives(
             SoftwareMatch(name="test", provider="apt"), []
         ) == []
-        assert search_engine.select_best_package([]) is None
\ No newline at end of file
+        assert search_engine.select_best_package([]) is None
+    
+    def test_search_results_cached(self, search_engine, mock_fetcher):
+        """Test that repeated searches are answered from the result cache."""
+        mock_fetcher.get_index_version.return_value = (("main", 1, 2),)
+        
+        results = search_engine.search("nginx", include_fuzzy=False)
+        assert search_engine.search("  NGINX ", include_fuzzy=False, max_results=1) == results[:1]
+        
+        # Returned matches are copies of the cached ones
+        results[0].score = -1.0
+        assert search_engine.search("nginx", include_fuzzy=False)[0].score != -1.0
+        assert mock_fetcher.search_packages.call_count == 1
+        
+        # Different options and changed repository data are searched again
+        search_engine.search("nginx", include_fuzzy=False, min_confidence=0.5)
+        assert mock_fetcher.search_packages.call_count == 2
+        
+        mock_fetcher.get_index_version.return_value = (("main", 1, 3),)
+        search_engine.search("nginx", include_fuzzy=False)
+        assert mock_fetcher.search_packages.call_count == 3
+        
+        search_engine.clear_cache()
+        search_engine.search("nginx", include_fuzzy=False)
+        assert mock_fetcher.search_packages.call_count == 4
+    
+    def test_search_results_shared_through_persistent_cache(self, mock_fetcher, tmp_path, monkeypatch):
+        """Test that a persistent result cache answers searches of another engine."""
+        mock_fetcher.get_index_version.return_value = (("main", "0f1e2d3c"),)
+        mock_factory = Mock()
+        mock_factory.get_available_fetchers.return_value = ["apt"]
+        mock_factory.create_fetcher.return_value = mock_fetcher
+        monkeypatch.setattr("saidata_gen.search.engine.fetcher_factory", mock_factory)
+        
+        def make_engine():
+            result_cache = CacheManager(CacheConfig(
+                backend=CacheBackend.FILESYSTEM, cache_dir=str(tmp_path / "results"), cleanup_interval=0
+            ))
+            config = FetcherConfig(cache_dir=str(tmp_path / "cache"))
+            return SoftwareSearchEngine(config=config, providers=["apt"], result_cache=result_cache)
+        
+        results = make_engine().search("nginx", include_fuzzy=False)
+        cached = make_engine().search("nginx", include_fuzzy=False)
+        
+        assert [(match.name, match.score) for match in cached] == [(match.name, match.score) for match in results]
+        assert mock_fetcher.search_packages.call_count == 1
+    
+    def test_iter_search_stops_early(self, search_engine, mock_fetcher):
+        """Test that streaming search does not wait for slow providers once enough good matches exist."""
+        release = threading.Event()
+        
+        def slow_search(query, max_results=50):
+            release.wait(5)
+            return [PackageInfo(name="nginx-full", provider="brew", description="Web server")]
+        
+        slow_fetcher = Mock()
+        slow_fetcher.search_packages.side_effect = slow_search
+        search_engine.fetchers["brew"] = slow_fetcher
+        
+        try:
+            updates = list(search_engine.iter_search("nginx", max_results=1, include_fuzzy=False))
+        finally:
+            release.set()
+        
+        assert len(updates) == 1
+        assert [(match.name, match.provider) for match in updates[0]] == [("nginx", "apt")]
+        
+        # Partial results are not cached
+        search_engine.search("nginx", include_fuzzy=False)
+        assert mock_fetcher.search_packages.call_count == 2
+    
+    def test_iter_search_yields_provisional_results(self, search_engine, mock_fetcher):
+        """Test that streaming search yields updated rankings as providers answer."""
+        other_fetcher = Mock()
+        other_fetcher.search_packages.return_value = [
+            PackageInfo(name="nginx-light", provider="brew", description="Small web server")
+        ]
+        search_engine.fetchers["brew"] = other_fetcher
+        
+        updates = list(search_engine.iter_search("nginx", include_fuzzy=False, stop_confidence=None))
+        
+        assert len(updates) == 2
+        assert len(updates[0]) < len(updates[1])
+        assert {match.name for match in updates[-1]} >= {"nginx", "nginx-light"}
+        assert updates[-1] == search_engine.search("nginx", include_fuzzy=False)
+        assert mock_fetcher.search_packages.call_count == 1
+        
+        assert list(search_engine.iter_search("   ")) == []
+    
+    def test_closing_provider_results_cancels_queued_searches(self, search_engine, mock_fetcher):
+        """Test that closing the provider iterator early cancels searches that have not started."""
+        release = threading.Event()
+        
+        def slow_search(query, max_results=50):
+            release.wait(5)
+            return []
+        
+        slow_fetcher = Mock()
+        slow_fetcher.search_packages.side_effect = slow_search
+        queued_fetcher = Mock()
+        queued_fetcher.search_packages.return_value = []
+        search_engine.fetchers["brew"] = slow_fetcher
+        search_engine.fetchers["dnf"] = queued_fetcher
+        search_engine.max_workers = 1
+        
+        try:
+            results = search_engine._iter_provider_results("nginx", ["apt", "brew", "dnf"], False)
+            provider, matches = next(results)
+            results.close()
+        finally:
+            release.set()
+            search_engine.close()
+        
+        assert provider == "apt"
+        assert len(matches) == 2
+        queued_fetcher.search_packages.assert_not_called()
+    
+    def test_search_deadline(self, search_engine, mock_fetcher):
+        """Test that providers missing the search deadline are cancelled and reported."""
+        release = threading.Event()
+        
+        def slow_search(query, max_results=50):
+            release.wait(5)
+            return [PackageInfo(name="nginx-full", provider="brew", description="Web server")]
+        
+        slow_fetcher = Mock()
+        slow_fetcher.search_packages.side_effect = slow_search
+        search_engine.fetchers["brew"] = slow_fetcher
+        search_engine.search_timeout = 0.2
+        
+        try:
+            started = time.monotonic()
+            results = search_engine.search("nginx", include_fuzzy=False)
+            elapsed = time.monotonic() - started
+            
+            # Results without the late provider are not cached
+            search_engine.search("nginx", include_fuzzy=False)
+        finally:
+            release.set()
+        
+        assert elapsed < 2
+        assert {match.provider for match in results} == {"apt"}
+        assert search_engine.provider_timeouts == {"brew": 2}
+        assert mock_fetcher.search_packages.call_count == 2
+    
+    def test_hanging_provider_skipped(self, search_engine, mock_fetcher):
+        """Test that a provider with too many unfinished searches is not searched again."""
+        release = threading.Event()
+        
+        def hanging_search(query, max_results=50):
+            release.wait(5)
+            return []
+        
+        hanging_fetcher = Mock()
+        hanging_fetcher.search_packages.side_effect = hanging_search
+        search_engine.fetchers["brew"] = hanging_fetcher
+        search_engine.search_timeout = 0.1
+        
+        try:
+            for query in ("nginx", "apache", "caddy"):
+                results = search_engine.search(query, include_fuzzy=False)
+                assert {match.provider for match in results} == {"apt"}
+        finally:
+            release.set()
+            search_engine.close()
+        
+        assert hanging_fetcher.search_packages.call_count == search_engine.MAX_PROVIDER_SEARCHES
+        assert search_engine.provider_timeouts == {"brew": search_engine.MAX_PROVIDER_SEARCHES}
+        assert mock_fetcher.search_packages.call_count == 3
+    
+    def test_executor_reused(self, search_engine):
+        """Test that searches share one long-lived executor."""
+        search_engine.search("nginx", include_fuzzy=False)
+        executor = search_engine._get_executor()
+        search_engine.search("apache", include_fuzzy=False)
+        assert search_engine._get_executor() is executor
+        
+        search_engine.close()
+        assert search_engine._get_executor() is not executor
+        search_engine.close()
@@ -0,0 +1,104 @@
+"""
+Unit tests for binary repository snapshots.
+"""
+
+import os
+import tempfile
+import unittest
+
+from saidata_gen.fetcher.snapshot import PackageSnapshot, write_snapshot
+
+
+class TestPackageSnapshot(unittest.TestCase):
+    """
+    Test cases for binary repository snapshots.
+    """
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "packages.snap")
+        self.packages = {
+            "zsh": {"Version": "5.9", "Description": "shell with lots of features"},
+            "bash": {"Version": "5.2", "Description": "GNU Bourne Again SHell"},
+            "curl": {"Version": "7.88", "Description": None, "Depends": ["libc6", "libcurl4"]},
+            "python3-é": {"Version": "1.0", "Description": "non-ASCII name", "Size": 1024},
+        }
+        write_snapshot(self.path, self.packages, ("Description",))
+        self.snapshot = PackageSnapshot(self.path)
+    
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.snapshot.close()
+        self.temp_dir.cleanup()
+    
+    def test_mapping_interface(self):
+        """Test that a snapshot reads like the dictionary it was written from."""
+        self.assertEqual(len(self.snapshot), 4)
+        self.assertEqual(list(self.snapshot), list(self.packages))
+        self.assertEqual(list(self.snapshot.items()), list(self.packages.items()))
+        self.assertEqual(self.snapshot["curl"], self.packages["curl"])
+        self.assertEqual(self.snapshot.get("python3-é"), self.packages["python3-é"])
+        self.assertIn("bash", self.snapshot)
+        self.assertNotIn("fish", self.snapshot)
+        self.assertIsNone(self.snapshot.get("fish"))
+        with self.assertRaises(KeyError):
+            self.snapshot["fish"]
+    
+    def test_package_data_is_materialized_once(self):
+        """Test that package data is decoded lazily and reused."""
+        self.assertEqual(self.snapshot._materialized, {})
+        
+        first = self.snapshot["zsh"]
+        
+        self.assertIs(self.snapshot["zsh"], first)
+        self.assertEqual(len(self.snapshot._materialized), 1)
+    
+    def test_sorted_names(self):
+        """Test iterating over the sorted name index."""
+        self.assertEqual(list(self.snapshot.iter_sorted_names()), sorted(self.packages))
+    
+    def test_index_texts(self):
+        """Test reading searchable text without decoding package data."""
+        texts = dict(self.snapshot.index_texts(("Description",)))
+        
+        self.assertEqual(texts["zsh"], ["shell with lots of features"])
+        self.assertEqual(texts["curl"], [])
+        self.assertIsNone(self.snapshot.index_texts(("Summary",)))
+        self.assertEqual(self.snapshot._materialized, {})
+    
+    def test_content_digest(self):
+        """Test that the stored digest identifies the package data."""
+        self.assertEqual(len(self.snapshot.digest), 32)
+        
+        same_path = os.path.join(self.temp_dir.name, "same.snap")
+        changed_path = os.path.join(self.temp_dir.name, "changed.snap")
+        write_snapshot(same_path, self.packages, ("Description",))
+        write_snapshot(changed_path, dict(self.packages, zsh={"Version": "5.9.1"}), ("Description",))
+        
+        with PackageSnapshot(same_path) as same, PackageSnapshot(changed_path) as changed:
+            self.assertEqual(same.digest, self.snapshot.digest)
+            self.assertNotEqual(changed.digest, self.snapshot.digest)
+            self.assertEqual(changed["zsh"], {"Version": "5.9.1"})
+    
+    def test_context_manager(self):
+        """Test that leaving the context closes the memory map."""
+        with PackageSnapshot(self.path) as snapshot:
+            self.assertEqual(snapshot["bash"], self.packages["bash"])
+        
+        self.assertTrue(snapshot.closed)
+        self.assertFalse(self.snapshot.closed)
+        snapshot.close()
+    
+    def test_invalid_snapshot(self):
+        """Test that files in another format are rejected."""
+        path = os.path.join(self.temp_dir.name, "invalid.snap")
+        with open(path, "wb") as f:
+            f.write(b'{"not": "a snapshot", "padding": "' + b"x" * 64 + b'"}')
+        
+        with self.assertRaises(ValueError):
+            PackageSnapshot(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ Unit tests for the Winget fetcher.
 
 import os
 import pytest
+import subprocess
 import tempfile
 import yaml
 from unittest.mock import patch, MagicMock
@@ -166,4 +167,42 @@ class TestWingetFetcher:
         assert "winget-pkgs" in result.providers
         assert result.providers["winget-pkgs"] is False
         assert "winget-pkgs" in result.errors
-        assert result.errors["winget-pkgs"] == "Failed to clone or pull repository"
\ No newline at end of file
+        assert result.errors["winget-pkgs"] == "Failed to clone or pull repository"
+    
+    def test_incremental_manifest_processing(self, fetcher):
+        """Test that packages with several manifest directories are rebuilt from all of them."""
+        def git(*args):
+            subprocess.run(
+                ["git", "-C", repo_dir, "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                check=True, capture_output=True
+            )
+        
+        def write_manifest(version, manifest):
+            version_dir = os.path.join(repo_dir, "manifests", "m", "Mozilla", "Firefox", version)
+            os.makedirs(version_dir, exist_ok=True)
+            with open(os.path.join(version_dir, "Mozilla.Firefox.yaml"), "w") as f:
+                yaml.dump({"PackageIdentifier": "Mozilla.Firefox", **manifest}, f)
+        
+        with tempfile.TemporaryDirectory() as repo_dir:
+            git("init", "-q")
+            write_manifest("89.0", {"PackageVersion": "89.0", "License": "MPL-2.0"})
+            write_manifest("90.0", {"PackageVersion": "90.0"})
+            git("add", "-A")
+            git("commit", "-q", "-m", "initial")
+            
+            fetcher.repo_dir = repo_dir
+            packages = fetcher._process_manifests()
+            assert packages["Mozilla.Firefox"] == {
+                "PackageIdentifier": "Mozilla.Firefox", "PackageVersion": "90.0", "License": "MPL-2.0"
+            }
+            
+            write_manifest("90.0", {"PackageVersion": "90.0.1"})
+            git("add", "-A")
+            git("commit", "-q", "-m", "update")
+            
+            with patch.object(fetcher, "_list_manifest_dirs", side_effect=AssertionError("full scan")):
+                packages = fetcher._process_manifests()
+            
+            assert packages["Mozilla.Firefox"] == {
+                "PackageIdentifier": "Mozilla.Firefox", "PackageVersion": "90.0.1", "License": "MPL-2.0"
+            }
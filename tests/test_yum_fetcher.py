@@ -89,6 +89,35 @@ class TestYumFetcher(unittest.TestCase):
         mock_fetch_primary_location.assert_called_once_with("http://mirror.centos.org/centos/7/os/x86_64/repodata/repomd.xml")
         mock_fetch_primary_xml.assert_called_once_with("http://mirror.centos.org/centos/7/os/x86_64/repodata/primary.xml.gz")
     
+    @patch("saidata_gen.fetcher.yum.YumFetcher._fetch_url")
+    @patch("saidata_gen.fetcher.yum.YumFetcher._fetch_primary_xml")
+    def test_fetch_repository_data_skips_unchanged_primary(self, mock_fetch_primary_xml, mock_fetch_url):
+        """Test that an expired entry is refreshed when repomd.xml lists the same primary.xml checksum."""
+        mock_fetch_url.return_value = MagicMock(text="""<?xml version="1.0" encoding="UTF-8"?>
+<repomd xmlns="http://linux.duke.edu/metadata/repo">
+  <data type="primary">
+    <checksum type="sha256">abcdef1234567890</checksum>
+    <location href="repodata/abcdef-primary.xml.gz"/>
+  </data>
+</repomd>
+""")
+        mock_fetch_primary_xml.return_value = {
+            "test-package": {"name": "test-package", "version": "1.0.0-1"}
+        }
+        self.fetcher.fetch_repository_data()
+        
+        cache_key = "centos_7_x86_64"
+        snapshot_path = self.fetcher._get_snapshot_path(cache_key)
+        expired = os.path.getmtime(snapshot_path) - self.config.cache_ttl - 60
+        os.utime(snapshot_path, (expired, expired))
+        
+        result = self.fetcher.fetch_repository_data()
+        
+        self.assertTrue(result.cache_hits[cache_key])
+        mock_fetch_primary_xml.assert_called_once()
+        self.assertEqual(mock_fetch_url.call_count, 2)
+        self.assertTrue(self.fetcher._is_cache_valid(snapshot_path))
+    
     @patch("saidata_gen.fetcher.yum.YumFetcher._fetch_primary_location")
     @patch("saidata_gen.fetcher.yum.YumFetcher._fetch_primary_xml")
     def test_get_package_info(self, mock_fetch_primary_xml, mock_fetch_primary_location):
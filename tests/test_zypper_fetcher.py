@@ -87,7 +87,10 @@ class TestZypperFetcher(unittest.TestCase):
         
         # Check that the mocks were called with the correct arguments
         mock_fetch_primary_location.assert_called_once_with("http://download.opensuse.org/distribution/leap/15.4/repo/oss/repodata/repomd.xml")
-        mock_fetch_primary_xml.assert_called_once_with("http://download.opensuse.org/distribution/leap/15.4/repo/oss/repodata/primary.xml.gz")
+        mock_fetch_primary_xml.assert_called_once_with(
+            "http://download.opensuse.org/distribution/leap/15.4/repo/oss/repodata/primary.xml.gz",
+            "opensuse_15.4_x86_64"
+        )
     
     @patch("saidata_gen.fetcher.zypper.ZypperFetcher._fetch_primary_location")
     @patch("saidata_gen.fetcher.zypper.ZypperFetcher._fetch_primary_xml")